@@ -0,0 +1,73 @@
+# Runs the frequent pattern miners on a synthetic transactional database and optionally compares the results with a
+# baseline. The exit status is 1 when a run regressed, so that the command can be used in a CI job.
+#
+#     python -m PAMI.benchmarks --size 10000 --avg 10 --items 500 --minSup 0.05 0.02 --repeat 3 --output results.csv
+#
+#     python -m PAMI.benchmarks --size 10000 --avg 10 --items 500 --minSup 0.05 0.02 --baseline results.csv
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import sys
+from PAMI.benchmarks.benchmark import Benchmark, frequentPatternMiners
+from PAMI.benchmarks.datasets import Dataset
+
+_description = """Runs the frequent pattern miners on a synthetic transactional database and optionally compares the
+results with a baseline. The exit status is 1 when a run regressed.
+
+examples:
+  python -m PAMI.benchmarks --size 10000 --avg 10 --items 500 --minSup 0.05 0.02 --repeat 3 --output results.csv
+  python -m PAMI.benchmarks --size 10000 --avg 10 --items 500 --minSup 0.05 0.02 --baseline results.csv
+"""
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m PAMI.benchmarks', description=_description,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--algorithms', nargs='+', default=frequentPatternMiners)
+    parser.add_argument('--size', type=int, default=10000, help='number of transactions')
+    parser.add_argument('--avg', type=int, default=10, help='average number of items per transaction')
+    parser.add_argument('--items', type=int, default=500, help='number of distinct items')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--minSup', nargs='+', type=float, default=[0.05, 0.02, 0.01])
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--timeout', type=float, default=None)
+    parser.add_argument('--workDir', default='benchmarkData')
+    parser.add_argument('--output', default='benchmarkResults.csv')
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    bench = Benchmark(args.workDir, args.repeat, args.timeout)
+    # integral values are counts, as in the miners
+    grid = [int(m) if m >= 1 and m.is_integer() else m for m in args.minSup]
+    bench.add(args.algorithms, Dataset('transactional', args.size, args.avg, args.items, args.seed), grid)
+    results = bench.run(verbose=True)
+    bench.save(args.output)
+    print(results.to_string(index=False))
+    if args.baseline is None:
+        return 0
+    report = bench.compare(args.baseline, args.tolerance)
+    print(report.to_string(index=False))
+    return 1 if report['regression'].any() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+# Runs a single benchmark job in a fresh interpreter. The job is read from the JSON file given as the only argument and
+# the measurements are written as JSON to the file named in the job:
+#
+#     python -m PAMI.benchmarks._worker job.json
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import importlib
+import json
+import sys
+import time
+import warnings
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def loadAlgorithm(name):
+    """
+    Finds the class of an algorithm. The name is the module path below PAMI, such as 'frequentPattern.basic.FPGrowth',
+    whose class has the name of the module. A different class is named after a colon: 'module.path:ClassName'.
+
+    :param name: name of the algorithm
+    :type name: str
+    :return: the class of the algorithm
+    :rtype: type
+    """
+    moduleName, _, className = name.partition(':')
+    if not moduleName.startswith('PAMI.'):
+        moduleName = 'PAMI.' + moduleName
+    module = importlib.import_module(moduleName)
+    return getattr(module, className or moduleName.rsplit('.', 1)[-1])
+
+
+def _peakRSS():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def runJob(job) -> dict:
+    """
+    Mines the database of a job and returns the measurements reported by the algorithm
+
+    :param job: the algorithm, iFile, thresholds and options of the run
+    :type job: dict
+    :return: runtime, wallTime, memoryUSS, memoryRSS, peakRSS and patterns
+    :rtype: dict
+    """
+    warnings.filterwarnings("ignore")
+    algorithm = loadAlgorithm(job['algorithm'])
+    obj = algorithm(job['iFile'], *job['thresholds'], **job.get('options', {}))
+    start = time.time()
+    if hasattr(obj, 'mine'):
+        obj.mine()
+    else:
+        obj.startMine()
+    wallTime = time.time() - start
+    return {
+        'runtime': obj.getRuntime(),
+        'wallTime': wallTime,
+        'memoryUSS': obj.getMemoryUSS(),
+        'memoryRSS': obj.getMemoryRSS(),
+        'peakRSS': _peakRSS(),
+        'patterns': len(obj.getPatterns()),
+    }
+
+
+if __name__ == "__main__":
+    with open(sys.argv[1]) as f:
+        _job = json.load(f)
+    _result = runJob(_job)
+    with open(_job['output'], 'w') as f:
+        json.dump(_result, f)
@@ -0,0 +1,282 @@
+# Benchmark runs PAMI algorithms over grids of thresholds and records the runtime, memory and number of patterns of every
+# run in one table. Every run takes place in a fresh Python process, so that the memory of one run, and the modules it
+# imported, do not affect the measurements of the next one. The table can be saved, and compared with a table saved
+# earlier to find the runs that became slower.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.benchmarks.benchmark import Benchmark
+#
+#     from PAMI.benchmarks.datasets import Dataset
+#
+#     bench = Benchmark('benchmarkData', repeat=3, timeout=600)
+#
+#     data = Dataset('transactional', databaseSize=10000, avgItemsPerTransaction=10, numItems=500, seed=1)
+#
+#     bench.add(['frequentPattern.basic.FPGrowth', 'frequentPattern.basic.ECLAT'], data, [0.05, 0.02, 0.01])
+#
+#     bench.add('periodicFrequentPattern.basic.PFPGrowth', Dataset('temporal', 10000, 10, 500), [(0.05, 0.01)])
+#
+#     results = bench.run()
+#
+#     bench.save('results.csv')
+#
+#     report = bench.compare('baseline.csv', tolerance=0.2)
+#
+#     print(report[report['regression']])
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json as _json
+import os as _os
+import shutil as _shutil
+import subprocess as _subprocess
+import sys as _sys
+import tempfile as _tempfile
+import pandas as _pd
+from PAMI.benchmarks.datasets import Dataset
+
+#: the five frequent pattern miners compared by default
+frequentPatternMiners = [
+    'frequentPattern.basic.Apriori',
+    'frequentPattern.basic.ECLAT',
+    'frequentPattern.basic.ECLATbitset',
+    'frequentPattern.basic.ECLATDiffset',
+    'frequentPattern.basic.FPGrowth',
+]
+
+_keys = ['algorithm', 'dataset', 'thresholds']
+_measurements = ['runtime', 'wallTime', 'memoryUSS', 'memoryRSS', 'peakRSS', 'patterns']
+_columns = _keys + ['repeat', 'status'] + _measurements + ['error']
+
+
+def _readTable(table) -> _pd.DataFrame:
+    if isinstance(table, _pd.DataFrame):
+        return table
+    if str(table).endswith('.json'):
+        return _pd.read_json(table, orient='records')
+    return _pd.read_csv(table, keep_default_na=False, na_values=[''])
+
+
+def compare(results, baseline, tolerance=0.2, minDelta=0.05, metric='runtime') -> _pd.DataFrame:
+    """
+    Compares the results of a benchmark with a baseline. The repeats of every run are summarised by their median, and a
+    run is flagged as a regression when its metric grew by more than the tolerance and by more than minDelta, which
+    keeps very short runs from being flagged because of noise, or when it no longer completes. Runs missing from either
+    table are left out.
+
+    :param results: the results, or the name of a CSV or JSON file holding them
+    :type results: pandas.DataFrame or str
+    :param baseline: the baseline, or the name of a CSV or JSON file holding it
+    :type baseline: pandas.DataFrame or str
+    :param tolerance: allowed relative growth of the metric
+    :type tolerance: float
+    :param minDelta: allowed absolute growth of the metric, in the unit of the metric
+    :type minDelta: float
+    :param metric: the measurement compared, 'runtime' by default
+    :type metric: str
+    :return: one row per run with the metric, its baseline value, their ratio, whether the number of patterns changed
+             and whether the run regressed
+    :rtype: pandas.DataFrame
+    """
+
+    def summarise(table):
+        table = _readTable(table)
+        table = table.assign(failed=table['status'] != 'ok')
+        completed = table[~table['failed']].groupby(_keys).agg({metric: 'median', 'patterns': 'first'})
+        failed = table.groupby(_keys)['failed'].any()
+        return completed.join(failed, how='outer').reset_index()
+
+    report = summarise(baseline).merge(summarise(results), on=_keys, suffixes=('Baseline', ''))
+    report['ratio'] = report[metric] / report[metric + 'Baseline']
+    report['patternsChanged'] = ~report['failed'] & (report['patterns'] != report['patternsBaseline'])
+    slower = (report[metric] > report[metric + 'Baseline'] * (1 + tolerance)) & \
+             (report[metric] - report[metric + 'Baseline'] > minDelta)
+    report['regression'] = (report['failed'] & ~report['failedBaseline']) | slower
+    return report[_keys + [metric + 'Baseline', metric, 'ratio', 'patternsBaseline', 'patterns', 'patternsChanged',
+                           'regression']]
+
+
+class Benchmark:
+    """
+    :Description:   Runs algorithms over grids of thresholds on synthetic or given databases. Every run is a separate
+                    Python process that imports the algorithm, mines the database and reports getRuntime(),
+                    getMemoryUSS(), getMemoryRSS(), the peak resident memory of the process and the number of patterns.
+                    A run that raises an error or exceeds the timeout is recorded with the status 'error' or 'timeout'
+                    instead of stopping the benchmark.
+
+    :Attributes:
+
+        workDir : str
+            Directory of the generated datasets. The algorithms also run in it, so that files they write land there
+        repeat : int
+            Number of runs of every configuration
+        timeout : float
+            Seconds after which a run is stopped, or None
+
+    :Methods:
+
+        add(algorithms, dataset, thresholds, **options)
+            Adds the runs of the algorithms on a dataset for every threshold of the grid
+        run()
+            Runs every added configuration and returns the results table
+        getResults()
+            The results table of the last run
+        save(oFile)
+            Saves the results table as CSV, or as JSON when the file name ends with .json
+        compare(baseline, tolerance, minDelta, metric)
+            Compares the results with a baseline
+    """
+
+    def __init__(self, workDir='benchmarkData', repeat=1, timeout=None) -> None:
+        """
+        :param workDir: directory of the generated datasets
+        :type workDir: str
+        :param repeat: number of runs of every configuration
+        :type repeat: int
+        :param timeout: seconds after which a run is stopped
+        :type timeout: float
+        """
+        if repeat < 1:
+            raise ValueError("repeat should be at least 1")
+        self.workDir = workDir
+        self.repeat = int(repeat)
+        self.timeout = timeout
+        self._configurations = []
+        self._results = _pd.DataFrame(columns=_columns)
+
+    def add(self, algorithms, dataset, thresholds, **options) -> None:
+        """
+        Adds the runs of the algorithms on a dataset for every threshold of the grid. An algorithm is named by its module
+        path below PAMI, such as 'frequentPattern.basic.FPGrowth', and is created as algorithm(iFile, *threshold,
+        **options).
+
+        :param algorithms: one algorithm or a list of algorithms
+        :type algorithms: str or list
+        :param dataset: a synthetic dataset or the name of an existing database file
+        :type dataset: Dataset or str
+        :param thresholds: the grid; every entry is a value, such as minSup, or a tuple such as (minSup, maxPer)
+        :type thresholds: list
+        :param options: keyword arguments of the algorithms, such as sep
+        :type options: dict
+        """
+        if isinstance(algorithms, str):
+            algorithms = [algorithms]
+        grid = [list(t) if isinstance(t, (list, tuple)) else [t] for t in thresholds]
+        for algorithm in algorithms:
+            for threshold in grid:
+                self._configurations.append((algorithm, dataset, threshold, options))
+
+    def _datasetFile(self, dataset):
+        if isinstance(dataset, Dataset):
+            return dataset.getName(), _os.path.abspath(dataset.create(self.workDir))
+        return _os.path.basename(dataset), _os.path.abspath(dataset)
+
+    def _runOnce(self, job, scratch) -> dict:
+        jobFile = _os.path.join(scratch, 'job.json')
+        job['output'] = _os.path.join(scratch, 'result.json')
+        if _os.path.exists(job['output']):
+            _os.remove(job['output'])
+        with open(jobFile, 'w') as f:
+            _json.dump(job, f)
+        # the child imports the same PAMI as this process
+        root = _os.path.dirname(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
+        env = dict(_os.environ)
+        env['PYTHONPATH'] = _os.pathsep.join([root] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else []))
+        try:
+            process = _subprocess.run([_sys.executable, '-m', 'PAMI.benchmarks._worker', jobFile],
+                                      cwd=self.workDir, env=env, stdout=_subprocess.DEVNULL,
+                                      stderr=_subprocess.PIPE, timeout=self.timeout, text=True)
+        except _subprocess.TimeoutExpired:
+            return {'status': 'timeout', 'error': 'exceeded %s seconds' % self.timeout}
+        if process.returncode != 0 or not _os.path.exists(job['output']):
+            lines = process.stderr.strip().splitlines()
+            return {'status': 'error', 'error': lines[-1] if lines else 'exit code %d' % process.returncode}
+        with open(job['output']) as f:
+            result = _json.load(f)
+        result['status'] = 'ok'
+        return result
+
+    def run(self, verbose=False) -> _pd.DataFrame:
+        """
+        Runs every added configuration repeat times and returns the results table, one row per run
+
+        :param verbose: print every run as it completes
+        :type verbose: bool
+        :return: the results table
+        :rtype: pandas.DataFrame
+        """
+        _os.makedirs(self.workDir, exist_ok=True)
+        rows = []
+        scratch = _tempfile.mkdtemp(prefix='pamiBenchmark')
+        try:
+            for algorithm, dataset, threshold, options in self._configurations:
+                name, iFile = self._datasetFile(dataset)
+                job = {'algorithm': algorithm, 'iFile': iFile, 'thresholds': threshold, 'options': options}
+                for repeat in range(self.repeat):
+                    row = {'algorithm': algorithm, 'dataset': name, 'thresholds': _json.dumps(threshold),
+                           'repeat': repeat}
+                    row.update(self._runOnce(job, scratch))
+                    rows.append(row)
+                    if verbose:
+                        print(algorithm, name, row['thresholds'], row['status'], row.get('runtime', ''))
+        finally:
+            _shutil.rmtree(scratch, ignore_errors=True)
+        self._results = _pd.DataFrame(rows).reindex(columns=_columns)
+        return self._results
+
+    def getResults(self) -> _pd.DataFrame:
+        """
+        The results table of the last run
+
+        :return: the results table
+        :rtype: pandas.DataFrame
+        """
+        return self._results
+
+    def save(self, oFile) -> None:
+        """
+        Saves the results table as CSV, or as JSON when the file name ends with .json
+
+        :param oFile: name of the output file
+        :type oFile: str
+        """
+        if oFile.endswith('.json'):
+            self._results.to_json(oFile, orient='records', indent=1)
+        else:
+            self._results.to_csv(oFile, index=False)
+
+    def compare(self, baseline, tolerance=0.2, minDelta=0.05, metric='runtime') -> _pd.DataFrame:
+        """
+        Compares the results of the last run with a baseline, see compare()
+
+        :param baseline: the baseline, or the name of a CSV or JSON file holding it
+        :type baseline: pandas.DataFrame or str
+        :param tolerance: allowed relative growth of the metric
+        :type tolerance: float
+        :param minDelta: allowed absolute growth of the metric, in the unit of the metric
+        :type minDelta: float
+        :param metric: the measurement compared
+        :type metric: str
+        :return: the comparison
+        :rtype: pandas.DataFrame
+        """
+        return compare(self._results, baseline, tolerance, minDelta, metric)
@@ -0,0 +1,167 @@
+# Dataset describes a reproducible synthetic database for the benchmarks. The database is generated with the generators
+# of PAMI.extras.syntheticDataGenerator from a fixed seed, so that the same description always produces the same file.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.benchmarks.datasets import Dataset
+#
+#     data = Dataset('transactional', databaseSize=10000, avgItemsPerTransaction=10, numItems=500, seed=1)
+#
+#     path = data.create('benchmarkData')  # benchmarkData/transactional_10000_10_500_s1.txt
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os as _os
+import random as _random
+import numpy as _np
+
+
+def _transactional(spec, outputFile) -> None:
+    from PAMI.extras.syntheticDataGenerator.TransactionalDatabase import TransactionalDatabase
+    db = TransactionalDatabase(spec.databaseSize, spec.avgItemsPerTransaction, spec.numItems, spec.sep)
+    db.create()
+    db.save(outputFile)
+
+
+def _temporal(spec, outputFile) -> None:
+    from PAMI.extras.syntheticDataGenerator.TemporalDatabase import TemporalDatabase
+    db = TemporalDatabase(spec.databaseSize, spec.avgItemsPerTransaction, spec.numItems, spec.sep)
+    db.create()
+    db.save(outputFile)
+
+
+def _uncertain(spec, outputFile) -> None:
+    from PAMI.extras.syntheticDataGenerator.UncertainTransactionalDatabase import UncertainTransactionalDatabase
+    db = UncertainTransactionalDatabase(spec.databaseSize, spec.avgItemsPerTransaction, spec.numItems, spec.sep)
+    db.create()
+    db.save(outputFile)
+
+
+def _utility(spec, outputFile) -> None:
+    # UtilityDatabase writes one utility per item and transaction, which the utility miners cannot read, so the
+    # generator writing the items:total:utilities format is used instead
+    from PAMI.extras.syntheticDataGenerator.generateUtilityTransactional import generateUtilityTransactional
+    db = generateUtilityTransactional(spec.databaseSize, spec.numItems, spec.avgItemsPerTransaction, 1, 100, 1, 10)
+    db.generate()
+    db.save(outputFile, sep=spec.sep)
+
+
+_generators = {
+    'transactional': _transactional,
+    'temporal': _temporal,
+    'uncertain': _uncertain,
+    'utility': _utility,
+}
+
+
+class Dataset:
+    """
+    :Description:   A synthetic database of a given kind and scale. The numpy and random generators are seeded before the
+                    database is generated and restored afterwards, so that a description always gives the same file and
+                    the random state of the caller is left untouched.
+
+    :Attributes:
+
+        kind : str
+            One of 'transactional', 'temporal', 'uncertain' and 'utility'
+        databaseSize : int
+            Number of transactions
+        avgItemsPerTransaction : int
+            Average number of items per transaction
+        numItems : int
+            Number of distinct items
+        seed : int
+            Seed of the random generators
+        sep : str
+            Separator of the items in the generated file
+
+    :Methods:
+
+        create(directory)
+            Generates the database in the directory, unless it is already there, and returns the name of the file
+        getName()
+            Name of the dataset, derived from its parameters
+    """
+
+    def __init__(self, kind, databaseSize, avgItemsPerTransaction, numItems, seed=0, sep='\t') -> None:
+        """
+        :param kind: one of 'transactional', 'temporal', 'uncertain' and 'utility'
+        :type kind: str
+        :param databaseSize: number of transactions
+        :type databaseSize: int
+        :param avgItemsPerTransaction: average number of items per transaction
+        :type avgItemsPerTransaction: int
+        :param numItems: number of distinct items
+        :type numItems: int
+        :param seed: seed of the random generators
+        :type seed: int
+        :param sep: separator of the items in the generated file
+        :type sep: str
+        """
+        if kind not in _generators:
+            raise ValueError("Unknown dataset kind " + repr(kind) + ", expected one of " + ", ".join(_generators))
+        if avgItemsPerTransaction > numItems:
+            raise ValueError("avgItemsPerTransaction cannot be larger than numItems")
+        self.kind = kind
+        self.databaseSize = int(databaseSize)
+        self.avgItemsPerTransaction = int(avgItemsPerTransaction)
+        self.numItems = int(numItems)
+        self.seed = int(seed)
+        self.sep = sep
+
+    def getName(self) -> str:
+        """
+        Name of the dataset, derived from its parameters
+
+        :return: the name of the dataset
+        :rtype: str
+        """
+        return "%s_%d_%d_%d_s%d" % (self.kind, self.databaseSize, self.avgItemsPerTransaction, self.numItems, self.seed)
+
+    def create(self, directory='.') -> str:
+        """
+        Generates the database in the directory and returns the name of the file. A file generated earlier from the
+        same description is reused.
+
+        :param directory: directory of the generated file
+        :type directory: str
+        :return: the name of the generated file
+        :rtype: str
+        """
+        _os.makedirs(directory, exist_ok=True)
+        outputFile = _os.path.join(directory, self.getName() + ".txt")
+        if _os.path.exists(outputFile):
+            return outputFile
+        numpyState = _np.random.get_state()
+        randomState = _random.getstate()
+        _np.random.seed(self.seed)
+        _random.seed(self.seed)
+        try:
+            # written under a temporary name, so that an interrupted run does not leave a truncated dataset behind
+            _generators[self.kind](self, outputFile + ".part")
+            _os.replace(outputFile + ".part", outputFile)
+        finally:
+            _np.random.set_state(numpyState)
+            _random.setstate(randomState)
+        return outputFile
+
+    def __repr__(self) -> str:
+        return "Dataset(" + self.getName() + ")"
@@ -0,0 +1,602 @@
+# EncodedDatabase parses a transactional or temporal database once and stores it in a compact integer-encoded columnar (CSR) layout.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.encodedDatabase import EncodedDatabase
+#
+#     from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#     db = EncodedDatabase.load('sampleDB.txt', sep='\t')
+#
+#     for minSup in [100, 80, 60]:
+#
+#         obj = alg.FPGrowth(db, minSup)
+#
+#         obj.mine()
+#
+#         print(minSup, len(obj.getPatterns()))
+#
+#     # optionally, keep a memory-mappable copy of every parsed file on disk
+#
+#     from PAMI.extras import encodedDatabase
+#
+#     encodedDatabase.enableCache(maxBytes=4 * 1024 ** 3)
+#
+#     obj = alg.FPGrowth('sampleDB.txt', 100)  # parses the file and writes the cache entry
+#
+#     obj = alg.FPGrowth('sampleDB.txt', 80)  # maps the cache entry instead of parsing the file
+#
+#     # the entries stay on disk, in PAMI_CACHE_DIR or ~/.cache/PAMI, until they are evicted or cleared
+#
+#     encodedDatabase.clearCache()
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from array import array as _array
+from typing import Dict, Iterator, List, Optional
+import hashlib as _hashlib
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import numpy as _np
+import pandas as _pd
+import validators as _validators
+from urllib.request import urlopen as _urlopen
+
+
+class EncodedDatabase:
+    """
+    :Description:   EncodedDatabase stores a transactional or temporal database in a compressed sparse row (CSR) layout.
+                    Every distinct item is mapped to an integer id. The transactions are stored in a single int32 item-id
+                    array, and an int64 offsets array marks where every transaction begins and ends. Temporal databases
+                    additionally keep an int64 timestamps array.
+
+                    The object can be passed to the miners in place of ``iFile``. It behaves like the list of
+                    transactions the miners build in ``_creatingItemSets``: ``len(db)`` is the number of transactions and
+                    iterating or indexing it yields one decoded transaction at a time, with the timestamp as the first
+                    element for temporal databases. Only one transaction is decoded at a time, so a database can be
+                    parsed once and reused by many miners without keeping lists of Python strings in memory.
+
+    :Attributes:
+
+        offsets : numpy.ndarray
+            int64 array of length numberOfTransactions + 1. Transaction i occupies items[offsets[i]:offsets[i + 1]]
+        items : numpy.ndarray
+            int32 array storing the item ids of all transactions one after another
+        itemNames : list
+            itemNames[i] is the original item of the item id i. Ids are given in the order of first appearance
+        timestamps : numpy.ndarray or None
+            int64 array storing the timestamp of every transaction. None for transactional databases
+
+    :Methods:
+
+        load(iFile, sep, temporal, cache)
+            Parse a file, URL or DataFrame into an EncodedDatabase, or map it from the parse cache
+        save(directory)
+            Store the arrays and the item table in a directory
+        open(directory, mmap)
+            Read a database stored with save(), memory-mapping the arrays by default
+        isTemporal()
+            Returns True if the database stores timestamps
+        transaction(index)
+            Returns the item ids of a transaction as a zero-copy array view
+        encodedTransactions()
+            Iterates over the item-id arrays of all transactions
+        decode(ids)
+            Converts item ids into the original items
+        itemSupports()
+            Returns the support of every item as a dictionary
+        tidLists()
+            Returns the vertical representation (item to transaction indices) of the database
+        getMemory()
+            Returns the number of bytes used by the arrays
+
+    **Importing this algorithm into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras.encodedDatabase import EncodedDatabase
+
+            from PAMI.frequentPattern.basic import ECLAT as alg
+
+            db = EncodedDatabase.load('sampleDB.txt', sep='\\t')
+
+            obj = alg.ECLAT(db, 10)
+
+            obj.mine()
+
+            print(len(obj.getPatterns()))
+
+    """
+
+    def __init__(self, offsets, items, itemNames, timestamps=None) -> None:
+        """
+        :param offsets: start offset of every transaction followed by the total number of items
+        :type offsets: numpy.ndarray
+        :param items: item ids of all transactions
+        :type items: numpy.ndarray
+        :param itemNames: original item of every item id
+        :type itemNames: list
+        :param timestamps: timestamp of every transaction, or None for transactional databases
+        :type timestamps: numpy.ndarray or None
+        """
+        self.offsets = _np.asarray(offsets, dtype=_np.int64)
+        self.items = _np.asarray(items, dtype=_np.int32)
+        self.itemNames = list(itemNames)
+        self.timestamps = None if timestamps is None else _np.asarray(timestamps, dtype=_np.int64)
+        self._itemIds = None
+
+    @classmethod
+    def load(cls, iFile, sep: str = '\t', temporal: bool = False, cache=None) -> 'EncodedDatabase':
+        """
+        Parse the input database into an EncodedDatabase
+
+        :param iFile: path or URL of the input file, or a DataFrame with a 'Transactions' column (and a 'TS' column for temporal databases)
+        :type iFile: str or pd.DataFrame
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param temporal: set to True if the first element of every line is a timestamp
+        :type temporal: bool
+        :param cache: parse cache used for local files. None uses the cache enabled with enableCache(), False disables caching
+        :type cache: ParseCache or None or bool
+        :return: the encoded database
+        :rtype: EncodedDatabase
+        """
+        if isinstance(iFile, cls):
+            return iFile
+        if cache is None:
+            cache = _parseCache
+        if cache and cache.handles(iFile):
+            return cache.load(iFile, sep, temporal)
+        if isinstance(iFile, _pd.DataFrame):
+            return cls._fromDataFrame(iFile, sep, temporal)
+        if isinstance(iFile, str):
+            if _validators.url(iFile):
+                lines = (line.decode("utf-8") for line in _urlopen(iFile))
+                return cls._fromLines(lines, sep, temporal)
+            with open(iFile, 'r', encoding='utf-8') as f:
+                return cls._fromLines(f, sep, temporal)
+        raise TypeError("iFile must be a file path, URL or DataFrame")
+
+    @classmethod
+    def _fromLines(cls, lines, sep: str, temporal: bool) -> 'EncodedDatabase':
+        """
+        Encode the lines of a file. Empty items are dropped in the same way as the miners do it.
+
+        :param lines: iterable over the lines of the database
+        :type lines: Iterable[str]
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param temporal: set to True if the first element of every line is a timestamp
+        :type temporal: bool
+        :return: the encoded database
+        :rtype: EncodedDatabase
+        """
+        itemIds = {}
+        itemNames = []
+        items = _array('i')
+        offsets = _array('q', [0])
+        timestamps = _array('q')
+        for line in lines:
+            temp = [i.rstrip() for i in line.split(sep)]
+            temp = [x for x in temp if x]
+            if temporal:
+                if not temp:
+                    continue
+                timestamps.append(int(temp[0]))
+                temp = temp[1:]
+            for item in temp:
+                index = itemIds.get(item)
+                if index is None:
+                    index = len(itemNames)
+                    itemIds[item] = index
+                    itemNames.append(item)
+                items.append(index)
+            offsets.append(len(items))
+        db = cls(_np.frombuffer(offsets, dtype=_np.int64), _np.frombuffer(items, dtype=_np.int32), itemNames,
+                 _np.frombuffer(timestamps, dtype=_np.int64) if temporal else None)
+        db._itemIds = itemIds
+        return db
+
+    @classmethod
+    def _fromDataFrame(cls, dataFrame, sep: str, temporal: bool) -> 'EncodedDatabase':
+        """
+        Encode a DataFrame with a 'Transactions' column and, for temporal databases, a 'TS' column
+
+        :param dataFrame: the input database
+        :type dataFrame: pd.DataFrame
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param temporal: set to True to read the timestamps from the 'TS' column
+        :type temporal: bool
+        :return: the encoded database
+        :rtype: EncodedDatabase
+        """
+        columns = dataFrame.columns.values.tolist()
+        if 'Transactions' not in columns:
+            raise ValueError("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
+        data = dataFrame['Transactions'].tolist()
+        if temporal:
+            if 'TS' not in columns:
+                raise ValueError("Temporal databases need a TS column")
+            data = [sep.join([str(ts), x]) if x else str(ts) for ts, x in zip(dataFrame['TS'].tolist(), data)]
+        return cls._fromLines(data, sep, temporal)
+
+    def save(self, directory: str) -> None:
+        """
+        Store the database in a directory as .npy arrays plus a text item table, so that it can be memory-mapped by open()
+
+        :param directory: the directory to write, created if it does not exist
+        :type directory: str
+        """
+        _os.makedirs(directory, exist_ok=True)
+        _np.save(_os.path.join(directory, 'offsets.npy'), self.offsets)
+        _np.save(_os.path.join(directory, 'items.npy'), self.items)
+        if self.timestamps is not None:
+            _np.save(_os.path.join(directory, 'timestamps.npy'), self.timestamps)
+        with open(_os.path.join(directory, 'itemNames.txt'), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.itemNames))
+
+    @classmethod
+    def open(cls, directory: str, mmap: bool = True) -> 'EncodedDatabase':
+        """
+        Read a database stored with save()
+
+        :param directory: the directory written by save()
+        :type directory: str
+        :param mmap: map the arrays read-only instead of reading them into memory
+        :type mmap: bool
+        :return: the encoded database
+        :rtype: EncodedDatabase
+        """
+        mode = 'r' if mmap else None
+        offsets = _np.load(_os.path.join(directory, 'offsets.npy'), mmap_mode=mode)
+        items = _np.load(_os.path.join(directory, 'items.npy'), mmap_mode=mode)
+        timestamps = None
+        if _os.path.exists(_os.path.join(directory, 'timestamps.npy')):
+            timestamps = _np.load(_os.path.join(directory, 'timestamps.npy'), mmap_mode=mode)
+        with open(_os.path.join(directory, 'itemNames.txt'), 'r', encoding='utf-8') as f:
+            text = f.read()
+        itemNames = text.split('\n') if text else []
+        return cls(offsets, items, itemNames, timestamps)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> List[str]:
+        """
+        Decode a single transaction
+
+        :param index: index of the transaction
+        :type index: int
+        :return: the items of the transaction, preceded by its timestamp for temporal databases
+        :rtype: list
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transaction index out of range")
+        transaction = self.decode(self.transaction(index))
+        if self.timestamps is not None:
+            transaction.insert(0, str(self.timestamps[index]))
+        return transaction
+
+    def __iter__(self) -> Iterator[List[str]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def isTemporal(self) -> bool:
+        """
+        :return: True if the database stores a timestamp for every transaction
+        :rtype: bool
+        """
+        return self.timestamps is not None
+
+    def transaction(self, index: int) -> _np.ndarray:
+        """
+        Item ids of a transaction. The returned array is a view on the items array.
+
+        :param index: index of the transaction
+        :type index: int
+        :return: the item ids of the transaction
+        :rtype: numpy.ndarray
+        """
+        return self.items[self.offsets[index]:self.offsets[index + 1]]
+
+    def encodedTransactions(self) -> Iterator[_np.ndarray]:
+        """
+        Iterate over the item ids of all transactions
+
+        :return: generator over the item-id arrays of the transactions
+        :rtype: Iterator[numpy.ndarray]
+        """
+        for index in range(len(self)):
+            yield self.items[self.offsets[index]:self.offsets[index + 1]]
+
+    def decode(self, ids) -> List[str]:
+        """
+        Convert item ids into the original items
+
+        :param ids: item ids
+        :type ids: Iterable[int]
+        :return: the original items
+        :rtype: list
+        """
+        if isinstance(ids, _np.ndarray):
+            ids = ids.tolist()
+        return [self.itemNames[i] for i in ids]
+
+    def itemId(self, item: str) -> Optional[int]:
+        """
+        :param item: an original item
+        :type item: str
+        :return: the id of the item or None if the item does not occur in the database
+        :rtype: int or None
+        """
+        if self._itemIds is None:
+            self._itemIds = {name: index for index, name in enumerate(self.itemNames)}
+        return self._itemIds.get(item)
+
+    def itemSupports(self) -> Dict[str, int]:
+        """
+        Count the occurrences of every item with a single pass over the items array
+
+        :return: dictionary of items and their supports, in the order of item ids
+        :rtype: dict
+        """
+        counts = _np.bincount(self.items, minlength=len(self.itemNames)).tolist()
+        return dict(zip(self.itemNames, counts))
+
+    def tidLists(self) -> Dict[str, List[int]]:
+        """
+        Build the vertical representation of the database. For temporal databases the timestamps are used in place of
+        the transaction indices.
+
+        :return: dictionary of items and the list of transactions (or timestamps) containing them, in the order of item ids
+        :rtype: dict
+        """
+        tids = _np.repeat(_np.arange(len(self), dtype=_np.int64), _np.diff(self.offsets))
+        order = _np.argsort(self.items, kind='stable')
+        items = self.items[order]
+        tids = tids[order]
+        # an item repeated inside a transaction is counted once
+        keep = _np.ones(len(items), dtype=bool)
+        keep[1:] = (items[1:] != items[:-1]) | (tids[1:] != tids[:-1])
+        items = items[keep]
+        tids = tids[keep]
+        if self.timestamps is not None:
+            tids = self.timestamps[tids]
+        bounds = _np.concatenate(([0], _np.cumsum(_np.bincount(items, minlength=len(self.itemNames)))))
+        return {self.itemNames[i]: tids[bounds[i]:bounds[i + 1]].tolist() for i in range(len(self.itemNames))}
+
+    def getMemory(self) -> int:
+        """
+        :return: number of bytes used by the offsets, items and timestamps arrays
+        :rtype: int
+        """
+        total = self.offsets.nbytes + self.items.nbytes
+        if self.timestamps is not None:
+            total += self.timestamps.nbytes
+        return total
+
+
+class ParseCache:
+    """
+    :Description:   ParseCache keeps the parsed form of local input files on disk. The first parse of a file writes its
+                    EncodedDatabase into the cache directory; later loads of the same file memory-map the stored arrays
+                    instead of reading and tokenizing the text again. An entry is identified by the absolute path,
+                    modification time and size of the file together with the separator and the temporal flag, so
+                    editing the file or changing the separator creates a new entry. When the entries use more than
+                    maxBytes, the least recently used entries are removed.
+
+                    The entries persist across runs until they are evicted or removed with clear(). An entry is written
+                    in a hidden .tmp directory that is renamed once complete; clear() also removes the .tmp directories
+                    left behind by a process that was killed while writing.
+
+    :Attributes:
+
+        directory : str
+            the directory storing the cache entries
+        maxBytes : int
+            upper bound on the total size of the cache entries
+
+    :Methods:
+
+        handles(iFile)
+            Returns True if iFile is a local file that can be cached
+        load(iFile, sep, temporal)
+            Map the cache entry of the file, parsing the file and writing the entry first if needed
+        getSize()
+            Returns the total size of the cache entries in bytes
+        clear()
+            Removes all cache entries and the unfinished entries left by killed processes
+    """
+
+    def __init__(self, directory: Optional[str] = None, maxBytes: int = 1024 ** 3) -> None:
+        """
+        :param directory: the directory storing the cache entries. By default the PAMI_CACHE_DIR environment variable or ~/.cache/PAMI is used
+        :type directory: str
+        :param maxBytes: upper bound on the total size of the cache entries
+        :type maxBytes: int
+        """
+        if directory is None:
+            directory = _os.environ.get('PAMI_CACHE_DIR', _os.path.join(_os.path.expanduser('~'), '.cache', 'PAMI'))
+        self.directory = directory
+        self.maxBytes = maxBytes
+
+    def handles(self, iFile) -> bool:
+        """
+        :param iFile: the input of a miner
+        :type iFile: str or pd.DataFrame or EncodedDatabase
+        :return: True if iFile is the path of a local file
+        :rtype: bool
+        """
+        return isinstance(iFile, str) and not _validators.url(iFile) and _os.path.isfile(iFile)
+
+    def _key(self, iFile: str, sep: str, temporal: bool) -> str:
+        """
+        :return: the name of the cache entry of a file
+        :rtype: str
+        """
+        stat = _os.stat(iFile)
+        key = '|'.join([_os.path.abspath(iFile), str(stat.st_mtime_ns), str(stat.st_size), repr(sep), str(temporal)])
+        return _hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def load(self, iFile: str, sep: str = '\t', temporal: bool = False) -> EncodedDatabase:
+        """
+        Map the cache entry of a file. On a miss the file is parsed and the entry is written before mapping it.
+
+        :param iFile: path of the input file
+        :type iFile: str
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param temporal: set to True if the first element of every line is a timestamp
+        :type temporal: bool
+        :return: the encoded database
+        :rtype: EncodedDatabase
+        """
+        entry = _os.path.join(self.directory, self._key(iFile, sep, temporal))
+        if _os.path.isdir(entry):
+            # the modification time of an entry records its last use
+            _os.utime(entry)
+            return EncodedDatabase.open(entry)
+        db = EncodedDatabase.load(iFile, sep, temporal, cache=False)
+        if db.getMemory() > self.maxBytes:
+            return db
+        _os.makedirs(self.directory, exist_ok=True)
+        temp = _tempfile.mkdtemp(dir=self.directory, prefix='.tmp')
+        try:
+            db.save(temp)
+            _os.replace(temp, entry)
+        except OSError:
+            # another process wrote the same entry first
+            pass
+        finally:
+            # the entry is written in a temporary directory that is not kept once the write ends, even by an error
+            _shutil.rmtree(temp, ignore_errors=True)
+        self._evict()
+        if _os.path.isdir(entry):
+            return EncodedDatabase.open(entry)
+        return db
+
+    def _entries(self) -> List[List]:
+        """
+        :return: [path, size, last use] of every cache entry, least recently used first
+        :rtype: list
+        """
+        entries = []
+        if not _os.path.isdir(self.directory):
+            return entries
+        for name in _os.listdir(self.directory):
+            path = _os.path.join(self.directory, name)
+            if name.startswith('.') or not _os.path.isdir(path):
+                continue
+            size = sum(entry.stat().st_size for entry in _os.scandir(path) if entry.is_file())
+            entries.append([path, size, _os.stat(path).st_mtime])
+        return sorted(entries, key=lambda x: x[2])
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in maxBytes
+        """
+        entries = self._entries()
+        total = sum(entry[1] for entry in entries)
+        for path, size, _ in entries:
+            if total <= self.maxBytes:
+                break
+            _shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def getSize(self) -> int:
+        """
+        :return: total size of the cache entries in bytes
+        :rtype: int
+        """
+        return sum(entry[1] for entry in self._entries())
+
+    def clear(self) -> None:
+        """
+        Remove all cache entries, and the .tmp directories of entries whose writing was interrupted
+        """
+        for path, _, _ in self._entries():
+            _shutil.rmtree(path, ignore_errors=True)
+        if _os.path.isdir(self.directory):
+            for name in _os.listdir(self.directory):
+                if name.startswith('.tmp'):
+                    _shutil.rmtree(_os.path.join(self.directory, name), ignore_errors=True)
+
+
+_parseCache = None
+
+
+def enableCache(directory: Optional[str] = None, maxBytes: int = 1024 ** 3) -> ParseCache:
+    """
+    Make every EncodedDatabase.load() of a local file, and every miner reading a local file, go through a parse cache
+
+    :param directory: the directory storing the cache entries
+    :type directory: str
+    :param maxBytes: upper bound on the total size of the cache entries
+    :type maxBytes: int
+    :return: the enabled cache
+    :rtype: ParseCache
+    """
+    global _parseCache
+    _parseCache = ParseCache(directory, maxBytes)
+    return _parseCache
+
+
+def disableCache() -> None:
+    """
+    Stop using the parse cache. The entries on disk are kept.
+    """
+    global _parseCache
+    _parseCache = None
+
+
+def getCache() -> Optional[ParseCache]:
+    """
+    :return: the enabled parse cache, or None
+    :rtype: ParseCache or None
+    """
+    return _parseCache
+
+
+def clearCache(directory: Optional[str] = None) -> None:
+    """
+    Remove all entries of the enabled cache, or of the cache stored in the given directory
+
+    :param directory: the cache directory. By default the directory of the enabled cache is used
+    :type directory: str
+    """
+    if directory is None and _parseCache is not None:
+        _parseCache.clear()
+    else:
+        ParseCache(directory).clear()
+
+
+def usesCache(iFile) -> bool:
+    """
+    :param iFile: the input of a miner
+    :type iFile: str or pd.DataFrame or EncodedDatabase
+    :return: True if a parse cache is enabled and iFile is a local file it can store
+    :rtype: bool
+    """
+    return _parseCache is not None and _parseCache.handles(iFile)
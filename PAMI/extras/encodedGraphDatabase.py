@@ -0,0 +1,515 @@
+# EncodedGraphDatabase stores a graph database in a compact binary layout: label arrays plus compressed sparse row (CSR)
+# adjacency arrays, saved as .npy files that are memory-mapped when they are opened. A database in the text format
+# ("t # id", "v id label", "e v1 v2 label [probability]") is converted once, and the graph miners then read the converted
+# directory in place of the text file.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.encodedGraphDatabase import EncodedGraphDatabase, convertGraphDatabase
+#
+#     from PAMI.subgraphMining.basic import gspan as alg
+#
+#     convertGraphDatabase('chemical.txt', 'chemicalDB')
+#
+#     for minSup in [0.5, 0.4, 0.3]:
+#
+#         obj = alg.GSpan('chemicalDB', minSup)
+#
+#         obj.mine()
+#
+#         print(minSup, len(obj.getFrequentSubgraphs()))
+#
+#     db = EncodedGraphDatabase.open('chemicalDB')
+#
+#     print(len(db), db.numberOfVertices(), db.numberOfEdges())
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from array import array as _array
+from typing import Callable, Iterator, List, Optional
+import os as _os
+import numpy as _np
+
+_arrays = ['graphIds', 'vertexOffsets', 'vertexIds', 'vertexLabels', 'edgeOffsets', 'edgeSources', 'edgeTargets',
+           'edgeLabels', 'adjacencyOffsets', 'adjacencyVertices', 'adjacencyEdges']
+
+
+class EncodedGraphDatabase:
+    """
+    :Description:   EncodedGraphDatabase stores a database of labelled, undirected graphs in flat arrays. The vertices of
+                    all graphs are stored one graph after another, and vertexOffsets marks where every graph begins and
+                    ends. The edges are stored in the same way with edgeOffsets, their end points being vertex positions
+                    inside their graph. The adjacency of every vertex is kept in CSR form: the neighbours of the vertex
+                    at position v of the vertex arrays are adjacencyVertices[adjacencyOffsets[v]:adjacencyOffsets[v + 1]],
+                    in the order of the edges of the input. Labels are stored as ids into the label tables, which keep
+                    the label strings of the input in the order of first appearance, so that the miners can map them to
+                    their own label values exactly as they do when reading the text format.
+
+                    save() writes every array as a .npy file and open() memory-maps them, so that a converted database
+                    is read without parsing and only the pages of the graphs that are used are loaded from disk.
+
+    :Attributes:
+
+        graphIds : numpy.ndarray
+            int64 id of every graph, as given by its "t # id" line
+        vertexOffsets : numpy.ndarray
+            int64 array of length numberOfGraphs + 1. The vertices of graph i are at positions vertexOffsets[i] to vertexOffsets[i + 1]
+        vertexIds : numpy.ndarray
+            int64 id of every vertex inside its graph
+        vertexLabels : numpy.ndarray
+            int32 label id of every vertex
+        edgeOffsets : numpy.ndarray
+            int64 array of length numberOfGraphs + 1. The edges of graph i are at positions edgeOffsets[i] to edgeOffsets[i + 1]
+        edgeSources : numpy.ndarray
+            int32 position of the first end point of every edge inside its graph
+        edgeTargets : numpy.ndarray
+            int32 position of the second end point of every edge inside its graph
+        edgeLabels : numpy.ndarray
+            int32 label id of every edge
+        edgeProbabilities : numpy.ndarray or None
+            float64 existence probability of every edge of an uncertain graph database, None for exact databases
+        adjacencyOffsets : numpy.ndarray
+            int64 CSR row pointers, of length numberOfVertices + 1
+        adjacencyVertices : numpy.ndarray
+            int32 position of every neighbour inside its graph
+        adjacencyEdges : numpy.ndarray
+            int32 position of the edge leading to every neighbour inside its graph
+        vertexLabelNames : list
+            vertexLabelNames[i] is the label string of the label id i
+        edgeLabelNames : list
+            edgeLabelNames[i] is the label string of the edge label id i
+
+    :Methods:
+
+        load(iFile)
+            Parse a graph database in the text format
+        save(directory)
+            Store the arrays and the label tables in a directory
+        open(directory, mmap)
+            Read a database stored with save(), memory-mapping the arrays by default
+        isEncoded(path)
+            Returns True if path is a directory written by save()
+        neighbours(graph, vertex)
+            Returns the neighbour positions and edge label ids of a vertex
+        toGraphs(graphClass, vertexClass, edgeClass, vertexLabel, edgeLabel, probabilities)
+            Builds the graph objects of a miner
+        write(oFile)
+            Writes the database back in the text format
+        getMemory()
+            Returns the number of bytes used by the arrays
+
+    **Importing this algorithm into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras.encodedGraphDatabase import EncodedGraphDatabase
+
+            from PAMI.subgraphMining.topK import tkg as alg
+
+            EncodedGraphDatabase.load('chemical.txt').save('chemicalDB')
+
+            obj = alg.TKG('chemicalDB', 10)
+
+            obj.mine()
+
+    """
+
+    def __init__(self, graphIds, vertexOffsets, vertexIds, vertexLabels, edgeOffsets, edgeSources, edgeTargets,
+                 edgeLabels, vertexLabelNames, edgeLabelNames, edgeProbabilities=None, adjacency=None) -> None:
+        """
+        :param graphIds: id of every graph
+        :type graphIds: numpy.ndarray
+        :param vertexOffsets: start of the vertices of every graph followed by the total number of vertices
+        :type vertexOffsets: numpy.ndarray
+        :param vertexIds: id of every vertex inside its graph
+        :type vertexIds: numpy.ndarray
+        :param vertexLabels: label id of every vertex
+        :type vertexLabels: numpy.ndarray
+        :param edgeOffsets: start of the edges of every graph followed by the total number of edges
+        :type edgeOffsets: numpy.ndarray
+        :param edgeSources: position of the first end point of every edge inside its graph
+        :type edgeSources: numpy.ndarray
+        :param edgeTargets: position of the second end point of every edge inside its graph
+        :type edgeTargets: numpy.ndarray
+        :param edgeLabels: label id of every edge
+        :type edgeLabels: numpy.ndarray
+        :param vertexLabelNames: label string of every vertex label id
+        :type vertexLabelNames: list
+        :param edgeLabelNames: label string of every edge label id
+        :type edgeLabelNames: list
+        :param edgeProbabilities: existence probability of every edge, or None
+        :type edgeProbabilities: numpy.ndarray or None
+        :param adjacency: the adjacencyOffsets, adjacencyVertices and adjacencyEdges arrays, built from the edges if None
+        :type adjacency: tuple or None
+        """
+        self.graphIds = _np.asarray(graphIds, dtype=_np.int64)
+        self.vertexOffsets = _np.asarray(vertexOffsets, dtype=_np.int64)
+        self.vertexIds = _np.asarray(vertexIds, dtype=_np.int64)
+        self.vertexLabels = _np.asarray(vertexLabels, dtype=_np.int32)
+        self.edgeOffsets = _np.asarray(edgeOffsets, dtype=_np.int64)
+        self.edgeSources = _np.asarray(edgeSources, dtype=_np.int32)
+        self.edgeTargets = _np.asarray(edgeTargets, dtype=_np.int32)
+        self.edgeLabels = _np.asarray(edgeLabels, dtype=_np.int32)
+        self.vertexLabelNames = list(vertexLabelNames)
+        self.edgeLabelNames = list(edgeLabelNames)
+        self.edgeProbabilities = None if edgeProbabilities is None else _np.asarray(edgeProbabilities, dtype=_np.float64)
+        if adjacency is None:
+            adjacency = self._buildAdjacency()
+        self.adjacencyOffsets = _np.asarray(adjacency[0], dtype=_np.int64)
+        self.adjacencyVertices = _np.asarray(adjacency[1], dtype=_np.int32)
+        self.adjacencyEdges = _np.asarray(adjacency[2], dtype=_np.int32)
+
+    def _buildAdjacency(self):
+        """
+        Build the CSR adjacency from the edge arrays. Every edge is listed at both of its end points, a self loop twice
+        at its vertex, and the neighbours of a vertex follow the order of the edges.
+
+        :return: the adjacencyOffsets, adjacencyVertices and adjacencyEdges arrays
+        :rtype: tuple
+        """
+        edgeGraph = _np.repeat(_np.arange(len(self.graphIds), dtype=_np.int64), _np.diff(self.edgeOffsets))
+        base = self.vertexOffsets[edgeGraph]
+        localEdges = _np.arange(len(self.edgeLabels), dtype=_np.int64) - self.edgeOffsets[edgeGraph]
+        owners = _np.concatenate((base + self.edgeSources, base + self.edgeTargets))
+        others = _np.concatenate((self.edgeTargets, self.edgeSources))
+        edges = _np.concatenate((localEdges, localEdges))
+        order = _np.lexsort((_np.concatenate((_np.arange(len(localEdges)),) * 2), owners))
+        counts = _np.bincount(owners, minlength=len(self.vertexIds))
+        offsets = _np.concatenate(([0], _np.cumsum(counts)))
+        return offsets, others[order], edges[order]
+
+    @classmethod
+    def load(cls, iFile: str) -> 'EncodedGraphDatabase':
+        """
+        Parse a graph database in the text format. Every graph starts with a "t # id" line, followed by "v id label"
+        lines and "e v1 v2 label" lines; an edge line may carry the existence probability of the edge as a fifth field.
+
+        :param iFile: name of the text file
+        :type iFile: str
+        :return: the encoded database
+        :rtype: EncodedGraphDatabase
+        """
+        with open(iFile, 'r') as f:
+            return cls._fromLines(f)
+
+    @classmethod
+    def _fromLines(cls, lines) -> 'EncodedGraphDatabase':
+        """
+        Encode the lines of a graph database
+
+        :param lines: iterable over the lines of the database
+        :type lines: Iterable[str]
+        :return: the encoded database
+        :rtype: EncodedGraphDatabase
+        """
+        vertexLabelIds, vertexLabelNames = {}, []
+        edgeLabelIds, edgeLabelNames = {}, []
+        graphIds = _array('q')
+        vertexOffsets, vertexIds, vertexLabels = _array('q', [0]), _array('q'), _array('i')
+        edgeOffsets, edgeSources, edgeTargets, edgeLabels = _array('q', [0]), _array('i'), _array('i'), _array('i')
+        probabilities = _array('d')
+        uncertain = False
+        positions = {}
+        for line in lines:
+            items = line.split()
+            if not items:
+                continue
+            if items[0] == 't':
+                if graphIds:
+                    vertexOffsets.append(len(vertexIds))
+                    edgeOffsets.append(len(edgeLabels))
+                graphIds.append(int(items[2]))
+                positions = {}
+            elif items[0] == 'v':
+                vId = int(items[1])
+                if vId in positions:
+                    raise ValueError("vertex %d of graph %d is defined twice" % (vId, graphIds[-1]))
+                positions[vId] = len(positions)
+                label = vertexLabelIds.get(items[2])
+                if label is None:
+                    label = vertexLabelIds[items[2]] = len(vertexLabelNames)
+                    vertexLabelNames.append(items[2])
+                vertexIds.append(vId)
+                vertexLabels.append(label)
+            elif items[0] == 'e':
+                v1, v2 = int(items[1]), int(items[2])
+                if v1 not in positions or v2 not in positions:
+                    raise ValueError("edge %d %d of graph %d joins an undefined vertex" % (v1, v2, graphIds[-1]))
+                label = edgeLabelIds.get(items[3])
+                if label is None:
+                    label = edgeLabelIds[items[3]] = len(edgeLabelNames)
+                    edgeLabelNames.append(items[3])
+                edgeSources.append(positions[v1])
+                edgeTargets.append(positions[v2])
+                edgeLabels.append(label)
+                if len(items) > 4:
+                    uncertain = True
+                    probabilities.append(float(items[4]))
+                else:
+                    probabilities.append(1.0)
+        if graphIds:
+            vertexOffsets.append(len(vertexIds))
+            edgeOffsets.append(len(edgeLabels))
+        return cls(_np.frombuffer(graphIds, dtype=_np.int64), _np.frombuffer(vertexOffsets, dtype=_np.int64),
+                   _np.frombuffer(vertexIds, dtype=_np.int64), _np.frombuffer(vertexLabels, dtype=_np.int32),
+                   _np.frombuffer(edgeOffsets, dtype=_np.int64), _np.frombuffer(edgeSources, dtype=_np.int32),
+                   _np.frombuffer(edgeTargets, dtype=_np.int32), _np.frombuffer(edgeLabels, dtype=_np.int32),
+                   vertexLabelNames, edgeLabelNames,
+                   _np.frombuffer(probabilities, dtype=_np.float64) if uncertain else None)
+
+    def save(self, directory: str) -> None:
+        """
+        Store the database in a directory as .npy arrays plus two text label tables, so that it can be memory-mapped by
+        open()
+
+        :param directory: the directory to write, created if it does not exist
+        :type directory: str
+        """
+        _os.makedirs(directory, exist_ok=True)
+        for name in _arrays:
+            _np.save(_os.path.join(directory, name + '.npy'), getattr(self, name))
+        probabilities = _os.path.join(directory, 'edgeProbabilities.npy')
+        if self.edgeProbabilities is not None:
+            _np.save(probabilities, self.edgeProbabilities)
+        elif _os.path.exists(probabilities):
+            _os.remove(probabilities)
+        for name in ['vertexLabelNames', 'edgeLabelNames']:
+            with open(_os.path.join(directory, name + '.txt'), 'w', encoding='utf-8') as f:
+                f.write('\n'.join(getattr(self, name)))
+
+    @classmethod
+    def open(cls, directory: str, mmap: bool = True) -> 'EncodedGraphDatabase':
+        """
+        Read a database stored with save()
+
+        :param directory: the directory written by save()
+        :type directory: str
+        :param mmap: map the arrays read-only instead of reading them into memory
+        :type mmap: bool
+        :return: the encoded database
+        :rtype: EncodedGraphDatabase
+        """
+        mode = 'r' if mmap else None
+        arrays = {name: _np.load(_os.path.join(directory, name + '.npy'), mmap_mode=mode) for name in _arrays}
+        probabilities = None
+        if _os.path.exists(_os.path.join(directory, 'edgeProbabilities.npy')):
+            probabilities = _np.load(_os.path.join(directory, 'edgeProbabilities.npy'), mmap_mode=mode)
+        names = []
+        for name in ['vertexLabelNames', 'edgeLabelNames']:
+            with open(_os.path.join(directory, name + '.txt'), 'r', encoding='utf-8') as f:
+                text = f.read()
+            names.append(text.split('\n') if text else [])
+        return cls(arrays['graphIds'], arrays['vertexOffsets'], arrays['vertexIds'], arrays['vertexLabels'],
+                   arrays['edgeOffsets'], arrays['edgeSources'], arrays['edgeTargets'], arrays['edgeLabels'],
+                   names[0], names[1], probabilities,
+                   (arrays['adjacencyOffsets'], arrays['adjacencyVertices'], arrays['adjacencyEdges']))
+
+    @staticmethod
+    def isEncoded(path) -> bool:
+        """
+        :param path: the input of a graph miner
+        :type path: str or EncodedGraphDatabase
+        :return: True if path is an EncodedGraphDatabase or a directory written by save()
+        :rtype: bool
+        """
+        if isinstance(path, EncodedGraphDatabase):
+            return True
+        return isinstance(path, str) and _os.path.isfile(_os.path.join(path, 'vertexOffsets.npy'))
+
+    @classmethod
+    def fromInput(cls, path) -> 'EncodedGraphDatabase':
+        """
+        :param path: an EncodedGraphDatabase or a directory written by save()
+        :type path: str or EncodedGraphDatabase
+        :return: the database, memory-mapped if it is read from a directory
+        :rtype: EncodedGraphDatabase
+        """
+        if isinstance(path, cls):
+            return path
+        return cls.open(path)
+
+    def __len__(self) -> int:
+        return len(self.graphIds)
+
+    def numberOfVertices(self, graph: Optional[int] = None) -> int:
+        """
+        :param graph: position of a graph, or None for the whole database
+        :type graph: int
+        :return: the number of vertices of the graph or of the database
+        :rtype: int
+        """
+        if graph is None:
+            return len(self.vertexIds)
+        return int(self.vertexOffsets[graph + 1] - self.vertexOffsets[graph])
+
+    def numberOfEdges(self, graph: Optional[int] = None) -> int:
+        """
+        :param graph: position of a graph, or None for the whole database
+        :type graph: int
+        :return: the number of edges of the graph or of the database
+        :rtype: int
+        """
+        if graph is None:
+            return len(self.edgeLabels)
+        return int(self.edgeOffsets[graph + 1] - self.edgeOffsets[graph])
+
+    def neighbours(self, graph: int, vertex: int):
+        """
+        Neighbours of a vertex. The returned arrays are views on the adjacency arrays.
+
+        :param graph: position of the graph
+        :type graph: int
+        :param vertex: position of the vertex inside the graph
+        :type vertex: int
+        :return: the positions of the neighbours inside the graph and the label ids of the edges leading to them
+        :rtype: tuple
+        """
+        row = self.vertexOffsets[graph] + vertex
+        start, end = self.adjacencyOffsets[row], self.adjacencyOffsets[row + 1]
+        edges = self.edgeOffsets[graph] + self.adjacencyEdges[start:end]
+        return self.adjacencyVertices[start:end], self.edgeLabels[edges]
+
+    def toGraphs(self, graphClass, vertexClass, edgeClass, vertexLabel: Callable = int, edgeLabel: Callable = int,
+                 probabilities: bool = False) -> List:
+        """
+        Build the graph objects of a miner. The label strings are converted by vertexLabel and edgeLabel once per label,
+        in the order in which they first appear in the input, so that labels mapped to integers by a miner get the same
+        values as when the miner reads the text file. Graphs without vertices are skipped, as the text readers do.
+
+        :param graphClass: called as graphClass(graphId, vertexMap)
+        :type graphClass: type
+        :param vertexClass: called as vertexClass(vertexId, label), must provide addEdge(edge)
+        :type vertexClass: type
+        :param edgeClass: called as edgeClass(v1, v2, label), or edgeClass(v1, v2, label, probability)
+        :type edgeClass: type
+        :param vertexLabel: converts a vertex label string into the label of the miner
+        :type vertexLabel: Callable
+        :param edgeLabel: converts an edge label string into the label of the miner
+        :type edgeLabel: Callable
+        :param probabilities: pass the existence probability of every edge to edgeClass
+        :type probabilities: bool
+        :return: the graphs
+        :rtype: list
+        """
+        vertexLabels = [vertexLabel(name) for name in self.vertexLabelNames]
+        edgeLabels = [edgeLabel(name) for name in self.edgeLabelNames]
+        vertexIds = self.vertexIds.tolist()
+        vertexLabelIds = self.vertexLabels.tolist()
+        sources, targets, labelIds = self.edgeSources.tolist(), self.edgeTargets.tolist(), self.edgeLabels.tolist()
+        edgeProbabilities = None
+        if probabilities:
+            edgeProbabilities = [1.0] * len(labelIds) if self.edgeProbabilities is None else self.edgeProbabilities.tolist()
+        adjacencyOffsets = self.adjacencyOffsets.tolist()
+        adjacencyEdges = self.adjacencyEdges.tolist()
+        vertexOffsets, edgeOffsets = self.vertexOffsets.tolist(), self.edgeOffsets.tolist()
+        graphs = []
+        for graph, gId in enumerate(self.graphIds.tolist()):
+            first, last = vertexOffsets[graph], vertexOffsets[graph + 1]
+            if first == last:
+                continue
+            ids = vertexIds[first:last]
+            edges = []
+            for e in range(edgeOffsets[graph], edgeOffsets[graph + 1]):
+                if probabilities:
+                    edges.append(edgeClass(ids[sources[e]], ids[targets[e]], edgeLabels[labelIds[e]], edgeProbabilities[e]))
+                else:
+                    edges.append(edgeClass(ids[sources[e]], ids[targets[e]], edgeLabels[labelIds[e]]))
+            vMap = {}
+            for v in range(first, last):
+                vertex = vertexClass(vertexIds[v], vertexLabels[vertexLabelIds[v]])
+                for e in adjacencyEdges[adjacencyOffsets[v]:adjacencyOffsets[v + 1]]:
+                    vertex.addEdge(edges[e])
+                vMap[vertexIds[v]] = vertex
+            graphs.append(graphClass(gId, vMap))
+        return graphs
+
+    def graphs(self) -> Iterator[dict]:
+        """
+        Iterate over the graphs as dictionaries with 'id', 'vertices' (a list of (id, label string)) and 'edges' (a list
+        of (v1, v2, label string)) entries
+
+        :return: generator over the graphs
+        :rtype: Iterator[dict]
+        """
+        for graph in range(len(self)):
+            first, last = self.vertexOffsets[graph], self.vertexOffsets[graph + 1]
+            ids = self.vertexIds[first:last].tolist()
+            vertices = [(vId, self.vertexLabelNames[label]) for vId, label in zip(ids, self.vertexLabels[first:last].tolist())]
+            first, last = self.edgeOffsets[graph], self.edgeOffsets[graph + 1]
+            edges = [(ids[s], ids[t], self.edgeLabelNames[label]) for s, t, label in
+                     zip(self.edgeSources[first:last].tolist(), self.edgeTargets[first:last].tolist(),
+                         self.edgeLabels[first:last].tolist())]
+            yield {'id': int(self.graphIds[graph]), 'vertices': vertices, 'edges': edges}
+
+    def write(self, oFile: str) -> None:
+        """
+        Write the database in the text format
+
+        :param oFile: name of the output file
+        :type oFile: str
+        """
+        with open(oFile, 'w') as f:
+            for graph, data in enumerate(self.graphs()):
+                f.write("t # %d\n" % data['id'])
+                for vId, label in data['vertices']:
+                    f.write("v %d %s\n" % (vId, label))
+                first = self.edgeOffsets[graph]
+                for index, (v1, v2, label) in enumerate(data['edges']):
+                    if self.edgeProbabilities is None:
+                        f.write("e %d %d %s\n" % (v1, v2, label))
+                    else:
+                        f.write("e %d %d %s %r\n" % (v1, v2, label, float(self.edgeProbabilities[first + index])))
+
+    def getMemory(self) -> int:
+        """
+        :return: number of bytes used by the arrays
+        :rtype: int
+        """
+        total = sum(getattr(self, name).nbytes for name in _arrays)
+        if self.edgeProbabilities is not None:
+            total += self.edgeProbabilities.nbytes
+        return total
+
+
+def convertGraphDatabase(iFile: str, oDirectory: str) -> EncodedGraphDatabase:
+    """
+    Convert a graph database from the text format into the binary format read by the graph miners
+
+    :param iFile: name of the text file
+    :type iFile: str
+    :param oDirectory: the directory to write
+    :type oDirectory: str
+    :return: the converted database
+    :rtype: EncodedGraphDatabase
+    """
+    db = EncodedGraphDatabase.load(iFile)
+    db.save(oDirectory)
+    return db
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) != 3:
+        print("Usage: python encodedGraphDatabase.py <text graph database> <output directory>")
+        sys.exit(1)
+    converted = convertGraphDatabase(sys.argv[1], sys.argv[2])
+    print("graphs:", len(converted), "vertices:", converted.numberOfVertices(), "edges:", converted.numberOfEdges())
@@ -0,0 +1,141 @@
+# FuzzyTidList is the vertical layout of a fuzzy transactional database: for every item, the sorted ids of the
+# transactions that contain it and the fuzzy values of the item in those transactions, stored as an int64 array and a
+# float32 array. Intersecting two tidlists is a vectorized sorted merge that keeps the minimum of the two fuzzy values,
+# which is the fuzzy value of the joined pattern, and computes its scalar cardinality in the same pass. The resting
+# values used by the list based miners for pruning are carried as a third aligned array.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.fuzzyTidLists import FuzzyTidList
+#
+#     transactions = [[('a', 0.8), ('b', 0.5)], [('a', 0.4)], [('a', 0.9), ('b', 0.6)]]
+#
+#     tidLists = FuzzyTidList.fromTransactions(transactions)
+#
+#     ab = tidLists['a'].intersect(tidLists['b'])
+#
+#     print(ab.tids, ab.values, ab.support)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, Iterable, Tuple
+import numpy as _np
+from PAMI.extras import valueTidLists as _vtl
+
+
+class FuzzyTidList:
+    """
+    :Description:   FuzzyTidList stores the transactions of a fuzzy pattern as aligned arrays, the sorted transaction ids
+                    and the fuzzy value of the pattern in each of them. The fuzzy value of a pattern in a transaction is
+                    the minimum of the values of its items, so the tidlist of a longer pattern is obtained by
+                    intersecting the tidlists of its parts. Values are kept in single precision to halve the memory of
+                    the lists, while the sums are accumulated in double precision.
+
+    :Attributes:
+
+        tids : numpy.ndarray
+            int64 array of the sorted ids of the transactions that contain the pattern
+        values : numpy.ndarray
+            float32 array with the fuzzy value of the pattern in each transaction of tids
+        remaining : numpy.ndarray
+            float32 array with the resting value of the last item of the pattern in each transaction, or None
+        support : float
+            Sum of the fuzzy values, which is the scalar cardinality of the pattern
+        remainingSupport : float
+            Sum of the resting values, 0 when the list has none
+
+    :Methods:
+
+        intersect(other)
+            Tidlist of the union of the two patterns
+        periods(start)
+            Gaps between the consecutive transactions of the pattern
+        fromTransactions(transactions)
+            Tidlists of all items of a fuzzy database
+    """
+
+    __slots__ = ['tids', 'values', 'remaining', 'support', 'remainingSupport']
+
+    def __init__(self, tids, values, remaining=None) -> None:
+        """
+        :param tids: sorted transaction ids
+        :type tids: numpy.ndarray or list
+        :param values: fuzzy value of the pattern in each transaction of tids
+        :type values: numpy.ndarray or list
+        :param remaining: resting value of the pattern in each transaction of tids
+        :type remaining: numpy.ndarray or list
+        """
+        self.tids = _np.asarray(tids, dtype=_np.int64)
+        self.values = _np.asarray(values, dtype=_np.float32)
+        self.remaining = None if remaining is None else _np.asarray(remaining, dtype=_np.float32)
+        self.support = _vtl.orderedSum(self.values)
+        self.remainingSupport = 0.0 if self.remaining is None else _vtl.orderedSum(self.remaining)
+
+    def __len__(self) -> int:
+        return len(self.tids)
+
+    def intersect(self, other: 'FuzzyTidList') -> 'FuzzyTidList':
+        """
+        Joins two tidlists: every tid of this list is located in the other one with a binary search, the fuzzy values
+        of the common transactions are combined with the minimum and the resting values are taken from the other list,
+        which holds the extension item
+
+        :param other: tidlist of the extension
+        :type other: FuzzyTidList
+        :return: tidlist of the joined pattern
+        :rtype: FuzzyTidList
+        """
+        remaining = None if other.remaining is None else other.remaining[:0]
+        if len(self) == 0 or len(other) == 0:
+            return FuzzyTidList(self.tids[:0], self.values[:0], remaining)
+        positions = _np.searchsorted(other.tids, self.tids)
+        _np.minimum(positions, len(other) - 1, out=positions)
+        common = other.tids[positions] == self.tids
+        positions = positions[common]
+        if remaining is not None:
+            remaining = other.remaining[positions]
+        return FuzzyTidList(self.tids[common], _np.minimum(self.values[common], other.values[positions]), remaining)
+
+    def periods(self, start: int = 0) -> _np.ndarray:
+        """
+        Gaps between consecutive transactions of the pattern, the first one measured from start
+
+        :param start: id the first gap is measured from
+        :type start: int
+        :return: periods of the pattern
+        :rtype: numpy.ndarray
+        """
+        return _np.diff(self.tids, prepend=start)
+
+    @staticmethod
+    def fromTransactions(transactions: Iterable[Iterable[Tuple[str, float]]], start: int = 0) -> Dict[str, 'FuzzyTidList']:
+        """
+        Builds the tidlist of every item. When an item occurs twice in a transaction its last value is kept.
+
+        :param transactions: transactions given as lists of (item, fuzzy value) pairs
+        :type transactions: list
+        :param start: id of the first transaction
+        :type start: int
+        :return: tidlist of every item, in the order of the first appearance of the items
+        :rtype: dict
+        """
+        tids, values = _vtl.itemColumns(transactions, start)
+        return {item: FuzzyTidList(tids[item], values[item]) for item in tids}
@@ -0,0 +1,195 @@
+# NeighbourhoodIndex stores the neighbourhood file of a georeferenced database as bitsets: every item is mapped to an
+# integer id and the neighbours of an item are kept as a Python integer whose set bits are the ids of the neighbours.
+# The common neighbours of an itemSet are the AND of the masks of its items, and they are cached per prefix, so that
+# checking whether a candidate extends a prefix spatially is a single AND and bit test.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.neighbourhoodIndex import NeighbourhoodIndex
+#
+#     index = NeighbourhoodIndex({'a': ['b', 'c'], 'b': ['a', 'c'], 'c': ['a', 'b', 'd']})
+#
+#     mask = index.commonMask(('a', 'b'))
+#
+#     print(index.contains(mask, 'c'), index.members(mask))
+#
+#     print(index.isNeighbour('c', 'd'))
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+
+class NeighbourhoodIndex:
+    """
+    :Description:   NeighbourhoodIndex maps the items of a neighbourhood file to integer ids and stores the neighbours of
+                    every item as a bitset. Items that only appear as neighbours get an id but no entry of their own,
+                    and an item without an entry has no neighbours. Masks of itemSets are built from the mask of their
+                    prefix, so the miners that extend a prefix item by item pay one AND per extension.
+
+    :Attributes:
+
+        keysMask : int
+            Bitset of the items that have an entry in the neighbourhood file
+        cacheSize : int
+            Number of itemSet masks kept before the cache is cleared
+
+    :Methods:
+
+        id(item)
+            Integer id of an item, or None for an unknown item
+        neighbourMask(item)
+            Bitset of the neighbours of an item
+        commonMask(itemSet)
+            Bitset of the common neighbours of an itemSet that have an entry of their own
+        contains(mask, item)
+            Whether the bit of an item is set in a mask
+        isNeighbour(item, other)
+            Whether other is listed as a neighbour of item
+        members(mask)
+            Items of a mask in the order of their ids
+        select(items, mask)
+            Items of a list whose bits are set in a mask
+    """
+
+    def __init__(self, neighbours: Dict[Hashable, Iterable[Hashable]], cacheSize: int = 1 << 16) -> None:
+        """
+        :param neighbours: neighbours of every item, as read from the neighbourhood file
+        :type neighbours: dict
+        :param cacheSize: number of itemSet masks kept before the cache is cleared
+        :type cacheSize: int
+        """
+        self._ids = {}
+        self._items = []
+        self._masks = {}
+        self.keysMask = 0
+        self.cacheSize = cacheSize
+        self._prefixMasks = {}
+        for item, itemNeighbours in neighbours.items():
+            self.keysMask |= 1 << self._addItem(item)
+            mask = 0
+            for neighbour in itemNeighbours:
+                mask |= 1 << self._addItem(neighbour)
+            self._masks[item] = mask
+
+    def _addItem(self, item: Hashable) -> int:
+        """
+        Returns the id of an item, giving it the next id when it is new
+        """
+        itemId = self._ids.get(item)
+        if itemId is None:
+            itemId = len(self._items)
+            self._ids[item] = itemId
+            self._items.append(item)
+        return itemId
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._masks
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def id(self, item: Hashable):
+        """
+        :param item: an item of the neighbourhood file
+        :type item: str or int
+        :return: id of the item, None when the item is unknown
+        :rtype: int
+        """
+        return self._ids.get(item)
+
+    def neighbourMask(self, item: Hashable) -> int:
+        """
+        :param item: an item
+        :type item: str or int
+        :return: bitset of the neighbours of the item, 0 when it has no entry
+        :rtype: int
+        """
+        return self._masks.get(item, 0)
+
+    def commonMask(self, itemSet: Tuple) -> int:
+        """
+        Common neighbours of the items of an itemSet, restricted to the items that have an entry. The mask of the
+        empty itemSet is keysMask, and the mask of an itemSet is the mask of its prefix AND the neighbours of its last
+        item, so the masks of all prefixes are cached on the way.
+
+        :param itemSet: items in the order they were added to the pattern
+        :type itemSet: tuple
+        :return: bitset of the common neighbours
+        :rtype: int
+        """
+        if len(itemSet) == 0:
+            return self.keysMask
+        mask = self._prefixMasks.get(itemSet)
+        if mask is None:
+            mask = self.commonMask(itemSet[:-1]) & self._masks.get(itemSet[-1], 0)
+            if len(self._prefixMasks) >= self.cacheSize:
+                self._prefixMasks.clear()
+            self._prefixMasks[itemSet] = mask
+        return mask
+
+    def contains(self, mask: int, item: Hashable) -> bool:
+        """
+        :param mask: bitset of items
+        :type mask: int
+        :param item: an item
+        :type item: str or int
+        :return: True when the item is known and its bit is set in the mask
+        :rtype: bool
+        """
+        itemId = self._ids.get(item)
+        return itemId is not None and (mask >> itemId) & 1 == 1
+
+    def isNeighbour(self, item: Hashable, other: Hashable) -> bool:
+        """
+        :param item: an item
+        :type item: str or int
+        :param other: a candidate neighbour of item
+        :type other: str or int
+        :return: True when other is listed among the neighbours of item
+        :rtype: bool
+        """
+        return self.contains(self._masks.get(item, 0), other)
+
+    def members(self, mask: int) -> List[Hashable]:
+        """
+        :param mask: bitset of items
+        :type mask: int
+        :return: items whose bits are set, in the order of their ids
+        :rtype: list
+        """
+        members = []
+        while mask:
+            low = mask & -mask
+            members.append(self._items[low.bit_length() - 1])
+            mask ^= low
+        return members
+
+    def select(self, items: Iterable[Hashable], mask: int) -> List[Hashable]:
+        """
+        :param items: items to filter
+        :type items: list
+        :param mask: bitset of items
+        :type mask: int
+        :return: the items whose bits are set in the mask, in their given order
+        :rtype: list
+        """
+        return [item for item in items if self.contains(mask, item)]
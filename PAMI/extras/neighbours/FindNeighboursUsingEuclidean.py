@@ -29,12 +29,12 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import re
-from math import sqrt
 from tqdm import tqdm
 import time
 import sys, psutil, os
 import pandas as pd
 import numpy as np
+from PAMI.extras.neighbours.spatialGrid import SpatialGrid
 
 
 class FindNeighboursUsingEuclidean:
@@ -51,6 +51,8 @@ class FindNeighboursUsingEuclidean:
             and store the pairs.
         :param  sep: str :
                     This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+        :param chunkSize: int
+            Number of points whose neighbours are searched and written at once.
 
     :Methods:
 
@@ -70,17 +72,24 @@ class FindNeighboursUsingEuclidean:
             obj.save()
     """
 
-    def __init__(self, iFile: str, maxDist: int, sep='\t', DBtype="temp") -> None:
+    def __init__(self, iFile: str, maxDist: int, sep='\t', DBtype="temp", chunkSize: int = 1024) -> None:
         self.iFile = iFile
-        self.maxEucledianDistance = maxDist
+        self.maxEucledianDistance = float(maxDist)
         self.seperator = sep
-        self.result = []
         self.DBtype = DBtype
+        self.chunkSize = int(chunkSize)
+        self.coords = None
+        self._grid = None
         self._startTime = float()
         self._endTime = float()
         self._memoryUSS = float()
         self._memoryRSS = float()
+
     def create(self):
+        """
+        Loads the coordinates and indexes them in a uniform grid, the pairs within maxDist are searched by save() and
+        getNeighboringInformationAsDataFrame() a chunk of points at a time
+        """
         self._startTime = time.time()
         # Load coordinates
         if self.DBtype == "csv":
@@ -107,40 +116,45 @@ class FindNeighboursUsingEuclidean:
             print("No coordinates found.")
             return
 
-        # Compute Euclidean distances
-        dists = np.linalg.norm(self.coords[:, None, :] - self.coords[None, :, :], axis=2)
-        self.within_dist = (dists <= self.maxEucledianDistance) & (dists > 0)
-
+        self._grid = SpatialGrid(self.coords, self.maxEucledianDistance)
         print(f"Number of points: {self.coords.shape[0]}")
-        print(f"Number of neighbors: {self.within_dist.sum()}")
-
-        self.result = []
-        for i in range(self.coords.shape[0]):
-            neighbors = self.coords[self.within_dist[i]]
-            self.result.append([(self.coords[i][0], self.coords[i][1])] + [(n[0], n[1]) for n in neighbors])
-
         self._endTime = time.time()
 
+    def _neighbours(self):
+        """
+        Yields the neighbours of the points chunk by chunk, a point at distance 0 is not a neighbour
+        """
+        for chunk in self._grid.neighbours(self.chunkSize):
+            yield [(i, neighbours[distances > 0]) for i, neighbours, distances in chunk]
+
     def save(self, oFile: str) -> None:
-        if self.coords is None or self.within_dist is None:
+        if self._grid is None:
             raise ValueError("Run create() before calling save().")
 
+        total = -(-self.coords.shape[0] // self.chunkSize)
         with open(oFile, "w") as f:
-            for i in tqdm(range(self.coords.shape[0]), desc="Saving"):
-                point = self.coords[i]
-                neighbor_mask = self.within_dist[i]
-                if neighbor_mask.any():
-                    line = f"Point({point[0]}, {point[1]})"
-                    neighbors = self.coords[neighbor_mask]
-                    for neighbor in neighbors:
-                        line += f"\tPoint({int(neighbor[0])}, {int(neighbor[1])})"
-                    f.write(line + "\n")
+            for chunk in tqdm(self._neighbours(), total=total, desc="Saving"):
+                lines = []
+                for i, neighbours in chunk:
+                    if len(neighbours):
+                        point = self.coords[i]
+                        line = f"Point({point[0]}, {point[1]})"
+                        for neighbor in self.coords[neighbours]:
+                            line += f"\tPoint({int(neighbor[0])}, {int(neighbor[1])})"
+                        lines.append(line + "\n")
+                f.write("".join(lines))
+        self._endTime = time.time()
 
     def getNeighboringInformationAsDataFrame(self):
+        if self._grid is None:
+            raise ValueError("Run create() before calling getNeighboringInformationAsDataFrame().")
+
         data = []
-        for line in self.result:
-            formatted = self.seperator.join([f"Point({int(x)}, {int(y)})" for x, y in line])
-            data.append([formatted])
+        for chunk in self._neighbours():
+            for i, neighbours in chunk:
+                points = self.coords[np.concatenate(([i], neighbours))]
+                formatted = self.seperator.join([f"Point({int(x)}, {int(y)})" for x, y in points])
+                data.append([formatted])
 
         return pd.DataFrame(data, columns=['Neighbors'])
 
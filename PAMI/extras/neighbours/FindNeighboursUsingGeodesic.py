@@ -29,11 +29,11 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import re
-from geopy.distance import geodesic
 import time
 import sys
 import psutil,os,tqdm
 import pandas as pd
+from PAMI.extras.neighbours.spatialGrid import SpatialGrid
 
 
 class FindNeighboursUsingGeodesic:
@@ -47,9 +47,11 @@ class FindNeighboursUsingGeodesic:
         :param maxDist : float
             The user can specify maxDist in Km(Kilometers).
             This program find pairs of values whose Geodesic distance is less than or equal to maxDistace
-            and store the pairs.
+            and store the pairs. The distance is the haversine distance on a sphere of the mean radius of the earth.
         :param  sep: str :
                     This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+        :param chunkSize: int
+            Number of points whose neighbours are searched and written at once.
 
 
     :Methods:
@@ -70,69 +72,68 @@ class FindNeighboursUsingGeodesic:
             obj.save()
     """
 
-    def __init__(self, iFile: str, maxDist: float, sep='\t',DBtype="temp"):
+    def __init__(self, iFile: str, maxDist: float, sep='\t',DBtype="temp", chunkSize: int = 1024):
         self.iFile = iFile
         self.maxGeodesicDistance = maxDist
         self.seperator = sep
-        self.result = {}
         self.DBtype = DBtype
+        self.chunkSize = int(chunkSize)
+        self.coordinates = []
+        self._grid = None
         self._startTime = float()
         self._endTime = float()
         self._memoryUSS = float()
         self._memoryRSS = float()
 
-
-
     def create(self) -> None:
+        """
+        Loads the (longitude, latitude) points and indexes them in a grid on the unit sphere, the pairs within maxDist
+        are searched by save() and getNeighboringInformation() a chunk of points at a time
+        """
         self._startTime = time.time()
-        coordinates = []
+        self.coordinates = []
+        seen = set()
         with open(self.iFile, "r") as f:
-            if self.DBtype == "temp":
-                for line in f:
-                    l = line.rstrip().split(self.seperator)
-                    for i in l[1:]:
-                        i = re.sub(r'[^0-9. ]', '', i)
-                        if i not in coordinates:
-                            coordinates.append(i.rstrip().split(' '))
-            else:
-                for line in f:
-                    l = line.rstrip().split(self.seperator)
-                    for i in l:
-                        i = re.sub(r'[^0-9. ]', '', i)
-                        if i not in coordinates:
-                            coordinates.append(i.rstrip().split(' '))
-        for i in tqdm.tqdm(range(len(coordinates))):
-            for j in range(len(coordinates - i - 1)):
-                    j = j + i + 1
-                    firstCoordinate = coordinates[i]
-                    secondCoordinate = coordinates[j]
-                    long1 = float(firstCoordinate[0])
-                    lat1 = float(firstCoordinate[1])
-                    long2 = float(secondCoordinate[0])
-                    lat2 = float(secondCoordinate[1])
-
-                    dist = geodesic((lat1, long1), (lat2, long2)).kilometers
-
-                    if dist <= float(self.maxGeodesicDistance):
-                        self.result[tuple(firstCoordinate)] = self.result.get(tuple(firstCoordinate), [])
-                        self.result[tuple(firstCoordinate)].append(secondCoordinate)
-                        self.result[tuple(secondCoordinate)] = self.result.get(tuple(secondCoordinate), [])
-                        self.result[tuple(secondCoordinate)].append(firstCoordinate)
+            for line in f:
+                l = line.rstrip().split(self.seperator)
+                if self.DBtype == "temp":
+                    l = l[1:]
+                for i in l:
+                    i = re.sub(r'[^0-9. ]', '', i).strip()
+                    if i and i not in seen:
+                        seen.add(i)
+                        self.coordinates.append(i.split())
+        points = [[float(longitude), float(latitude)] for longitude, latitude in self.coordinates]
+        self._grid = SpatialGrid(points, float(self.maxGeodesicDistance), 'haversine')
         self._endTime = time.time()
 
+    def _lines(self):
+        """
+        Yields the lines of the neighbourhood file chunk by chunk, a line for every point that has neighbours
+        """
+        for chunk in self._grid.neighbours(self.chunkSize):
+            lines = []
+            for i, neighbours, _ in chunk:
+                if len(neighbours):
+                    points = [self.coordinates[i]] + [self.coordinates[j] for j in neighbours.tolist()]
+                    lines.append([f"Point({x} {y})" for x, y in points])
+            yield lines
+
     def save(self, oFile: str) -> None:
+        if self._grid is None:
+            raise ValueError("Run create() before calling save().")
+        total = -(-len(self.coordinates) // self.chunkSize)
         with open(oFile, "w+") as f:
-            for i in self.result:
-                string = "Point(" + i[0] + " " + i[1] + ")" + self.seperator
-                f.write(string)
-                for j in self.result[i]:
-                    string = "Point(" + j[0] + " " + j[1] + ")" + self.seperator
-                    f.write(string)
-                f.write("\n")
+            for lines in tqdm.tqdm(self._lines(), total=total, desc="Saving"):
+                f.write("".join(self.seperator.join(line) + self.seperator + "\n" for line in lines))
+        self._endTime = time.time()
 
     def getNeighboringInformation(self):
-        df = pd.DataFrame(['\t'.join(map(str, line)) for line in self.result], columns=['Neighbors'])
+        if self._grid is None:
+            raise ValueError("Run create() before calling getNeighboringInformation().")
+        df = pd.DataFrame([self.seperator.join(line) for lines in self._lines() for line in lines], columns=['Neighbors'])
         return df
+
     def getRuntime(self) -> float:
         """
         Get the runtime of the transactional database
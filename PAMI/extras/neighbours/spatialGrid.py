@@ -0,0 +1,199 @@
+# SpatialGrid finds all pairs of points that lie within a maximum distance of each other without building the n x n
+# distance matrix. Points are hashed into a uniform grid whose cells are as wide as the maximum distance, so the
+# neighbours of a point can only lie in its own cell or in the adjacent ones. Distances are computed only against those
+# candidates, a chunk of points at a time, and the neighbours are yielded chunk by chunk in the order of the points.
+# Euclidean distance is computed on the coordinates. Haversine distance is computed on (longitude, latitude) pairs in
+# degrees, with the grid built on the points of the unit sphere.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.neighbours.spatialGrid import SpatialGrid
+#
+#     grid = SpatialGrid([[0, 0], [1, 1], [5, 5]], 2)
+#
+#     for chunk in grid.neighbours(1024):
+#
+#         for index, neighbours, distances in chunk:
+#
+#             print(index, neighbours, distances)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from itertools import product
+from typing import Iterator, List, Tuple
+import numpy as np
+
+earthRadius = 6371.0088
+
+
+def haversine(first: np.ndarray, second: np.ndarray, radius: float = earthRadius) -> np.ndarray:
+    """
+    Great-circle distances between two sets of points given as (longitude, latitude) in degrees
+
+    :param first: points of the rows, shape (m, 2)
+    :type first: numpy.ndarray
+    :param second: points of the columns, shape (c, 2)
+    :type second: numpy.ndarray
+    :param radius: radius of the sphere, in the unit of the returned distances
+    :type radius: float
+    :return: m x c matrix of distances
+    :rtype: numpy.ndarray
+    """
+    first = np.radians(first)
+    second = np.radians(second)
+    lat1, lat2 = first[:, 1:2], second[None, :, 1]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((second[None, :, 0] - first[:, 0:1]) / 2) ** 2
+    return 2 * radius * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _euclidean(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Euclidean distances between two sets of points
+
+    :param first: points of the rows, shape (m, k)
+    :type first: numpy.ndarray
+    :param second: points of the columns, shape (c, k)
+    :type second: numpy.ndarray
+    :return: m x c matrix of distances
+    :rtype: numpy.ndarray
+    """
+    return np.sqrt(((first[:, None, :] - second[None, :, :]) ** 2).sum(axis=2))
+
+
+class SpatialGrid:
+    """
+    :Description:   SpatialGrid is a uniform grid over a set of points used to find the neighbours of every point within
+                    maxDist. Only the points of the adjacent cells are compared, so for data that is not concentrated in
+                    a few cells the search is close to linear in the number of points, and the memory used at any time
+                    is bounded by the chunk being processed.
+
+    :Attributes:
+
+        points : numpy.ndarray
+            Coordinates of the points, (longitude, latitude) in degrees for the haversine metric
+        maxDist : float
+            Maximum distance between two neighbours, in the unit of radius for the haversine metric
+        metric : str
+            'euclidean' or 'haversine'
+        radius : float
+            Radius of the sphere used by the haversine metric, the mean radius of the earth in km by default
+
+    :Methods:
+
+        neighbours(chunkSize)
+            Yields the neighbours of the points chunk by chunk
+    """
+
+    _blockSize = 1 << 22
+
+    def __init__(self, points, maxDist: float, metric: str = 'euclidean', radius: float = earthRadius) -> None:
+        """
+        :param points: coordinates of the points, one row per point
+        :type points: numpy.ndarray or list
+        :param maxDist: maximum distance between two neighbours
+        :type maxDist: float
+        :param metric: 'euclidean' or 'haversine'
+        :type metric: str
+        :param radius: radius of the sphere used by the haversine metric
+        :type radius: float
+        """
+        self.points = np.asarray(points, dtype=np.float64)
+        if self.points.ndim != 2:
+            self.points = self.points.reshape(len(self.points), -1)
+        self.maxDist = float(maxDist)
+        self.metric = metric
+        self.radius = radius
+        if metric == 'euclidean':
+            keys, cellSize = self.points, self.maxDist
+        elif metric == 'haversine':
+            keys = self._unitVectors(self.points)
+            cellSize = 2 * np.sin(min(self.maxDist / radius, np.pi) / 2)
+        else:
+            raise ValueError("metric must be 'euclidean' or 'haversine'")
+        if cellSize <= 0:
+            cellSize = 1.0
+        self._cells = np.floor(keys / (cellSize * (1 + 1e-9))).astype(np.int64)
+        self._order = np.lexsort(self._cells.T[::-1]) if len(self._cells) else np.zeros(0, dtype=np.int64)
+        self._ranges = {}
+        sortedCells = self._cells[self._order]
+        if len(sortedCells):
+            starts = np.flatnonzero(np.concatenate(([True], (sortedCells[1:] != sortedCells[:-1]).any(axis=1))))
+            ends = np.append(starts[1:], len(sortedCells))
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self._ranges[tuple(sortedCells[start].tolist())] = (start, end)
+        self._offsets = [np.array(offset) for offset in product((-1, 0, 1), repeat=self._cells.shape[1])]
+
+    @staticmethod
+    def _unitVectors(points: np.ndarray) -> np.ndarray:
+        """
+        Points of the unit sphere for (longitude, latitude) pairs in degrees
+        """
+        lon, lat = np.radians(points[:, 0]), np.radians(points[:, 1])
+        return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+    def _distances(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """
+        Distances between the points of rows and the points of columns
+        """
+        if self.metric == 'haversine':
+            return haversine(self.points[rows], self.points[columns], self.radius)
+        return _euclidean(self.points[rows], self.points[columns])
+
+    def _candidates(self, cell: np.ndarray) -> np.ndarray:
+        """
+        Sorted indices of the points of a cell and of its adjacent cells
+        """
+        slices = []
+        for offset in self._offsets:
+            bounds = self._ranges.get(tuple((cell + offset).tolist()))
+            if bounds is not None:
+                slices.append(self._order[bounds[0]:bounds[1]])
+        return np.sort(np.concatenate(slices))
+
+    def neighbours(self, chunkSize: int = 1024) -> Iterator[List[Tuple[int, np.ndarray, np.ndarray]]]:
+        """
+        Yields, for consecutive chunks of points, the list of (index, neighbours, distances) of every point of the chunk
+        in order. The neighbours of a point are the indices of the other points within maxDist, in ascending order,
+        and distances are their distances to the point.
+
+        :param chunkSize: number of points in a chunk
+        :type chunkSize: int
+        :return: generator of chunks
+        :rtype: generator
+        """
+        for start in range(0, len(self.points), chunkSize):
+            stop = min(start + chunkSize, len(self.points))
+            cells, inverse = np.unique(self._cells[start:stop], axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            grouped = np.argsort(inverse, kind='stable')
+            bounds = np.searchsorted(inverse[grouped], np.arange(len(cells) + 1))
+            chunk = [None] * (stop - start)
+            for group in range(len(cells)):
+                members = grouped[bounds[group]:bounds[group + 1]] + start
+                candidates = self._candidates(cells[group])
+                step = max(1, self._blockSize // len(candidates))
+                for first in range(0, len(members), step):
+                    rows = members[first:first + step]
+                    distances = self._distances(rows, candidates)
+                    within = (distances <= self.maxDist) & (candidates[None, :] != rows[:, None])
+                    for row, index in enumerate(rows.tolist()):
+                        chunk[index - start] = (index, candidates[within[row]], distances[row][within[row]])
+            yield chunk
@@ -0,0 +1,242 @@
+# Pattern sinks receive the patterns of a miner while they are being discovered, so that the complete set of patterns never has to be kept in memory.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.patternSinks import FileSink, CallbackSink, QueueSink, CountingSink
+#
+#     from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#     obj = alg.FPGrowth('sampleDB.txt', 10)
+#
+#     obj.setSink(FileSink('patterns.txt'))  # patterns are written to the file while mining
+#
+#     obj.mine()
+#
+#     counter = CountingSink()
+#
+#     obj.setSink(counter)  # only the number of patterns is kept
+#
+#     obj.mine()
+#
+#     print("Total number of Frequent Patterns:", len(counter))
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+from typing import Any, Callable
+import queue as _queue
+
+
+class PatternSink(_ABC):
+    """
+    :Description:   Base class of the sinks that receive the patterns of a miner. The miners store a pattern with
+                    ``self._finalPatterns[pattern] = value``; a sink takes the place of that dictionary and handles every
+                    pattern as soon as it is stored instead of keeping it. Subclasses implement ``write``.
+
+                    The patterns handed to a sink are not kept, so they cannot be read back: ``getPatterns()`` is only
+                    available with the in-memory sink, and the dictionary methods raise a TypeError.
+
+    :Methods:
+
+        open()
+            Called by the miner when a mining process starts, resets the number of patterns received
+        write(pattern, value)
+            Handles one pattern
+        update(patterns)
+            Handles every pattern of a dictionary
+        close()
+            Called by the miner once the mining process is complete
+        __len__()
+            Number of patterns received
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+
+    def __setitem__(self, pattern, value) -> None:
+        self._count += 1
+        self.write(pattern, value)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def open(self) -> None:
+        """
+        Called by the miner when a mining process starts, so that a sink reused across runs only counts the patterns
+        of the current run
+        """
+        self._count = 0
+
+    @_abstractmethod
+    def write(self, pattern, value) -> None:
+        """
+        Handles one pattern. Sinks implement this function.
+
+        :param pattern: the pattern
+        :type pattern: tuple or str
+        :param value: support of the pattern, or the list of measures of the pattern
+        :type value: int or float or list
+        """
+        pass
+
+    def update(self, patterns) -> None:
+        """
+        Handles every pattern of a dictionary
+
+        :param patterns: patterns and their values
+        :type patterns: dict
+        """
+        for pattern, value in patterns.items():
+            self[pattern] = value
+
+    def close(self) -> None:
+        """
+        Called by the miner once the mining process is complete
+        """
+        pass
+
+    def _unavailable(self, *args, **kwargs):
+        raise TypeError("The patterns were sent to a " + type(self).__name__ +
+                        "; they can only be read back with the in-memory sink")
+
+    __getitem__ = __iter__ = __contains__ = items = keys = values = _unavailable
+
+
+class MemorySink(dict):
+    """
+    :Description:   The default sink. It keeps every pattern in a dictionary, which is what ``getPatterns()`` returns.
+    """
+
+    def open(self) -> None:
+        """
+        Called by the miner when a mining process starts, drops the patterns of the previous run
+        """
+        self.clear()
+
+    def close(self) -> None:
+        """
+        Called by the miner once the mining process is complete
+        """
+        pass
+
+
+class FileSink(PatternSink):
+    """
+    :Description:   Writes every pattern to a file as soon as it is found, in the format of the save() methods of the
+                    miners: the items separated by ``sep``, followed by ``:`` and the support. Patterns with several
+                    measures have every measure appended after a ``:``.
+
+    :Attributes:
+
+        oFile : str
+            Name of the output file. It is created, or truncated, when the first pattern is written
+        sep : str
+            Separator written between the items of a pattern
+    """
+
+    def __init__(self, oFile, sep='\t') -> None:
+        """
+        :param oFile: name of the output file
+        :type oFile: str
+        :param sep: separator written between the items of a pattern
+        :type sep: str
+        """
+        super().__init__()
+        self.oFile = oFile
+        self.sep = sep
+        self._file = None
+
+    def write(self, pattern, value) -> None:
+        if self._file is None:
+            self._file = open(self.oFile, 'w')
+        if not isinstance(pattern, str):
+            pattern = self.sep.join([str(item) for item in pattern])
+        if isinstance(value, (list, tuple)):
+            value = ":".join([str(measure) for measure in value])
+        self._file.write(pattern + ":" + str(value) + "\n")
+
+    def close(self) -> None:
+        if self._file is None:
+            # an empty result still produces an empty file, as save() does
+            self._file = open(self.oFile, 'w')
+        self._file.close()
+        self._file = None
+
+
+class CallbackSink(PatternSink):
+    """
+    :Description:   Calls a function with every pattern as soon as it is found
+
+    :Attributes:
+
+        callback : function
+            Called as callback(pattern, value)
+    """
+
+    def __init__(self, callback: Callable[[Any, Any], None]) -> None:
+        """
+        :param callback: function called as callback(pattern, value)
+        :type callback: function
+        """
+        super().__init__()
+        self.callback = callback
+
+    def write(self, pattern, value) -> None:
+        self.callback(pattern, value)
+
+
+class QueueSink(PatternSink):
+    """
+    :Description:   Puts every pattern as a (pattern, value) tuple on a bounded queue. The miner waits while the queue is
+                    full, so a slow consumer holds the miner back instead of letting the patterns pile up in memory.
+                    ``None`` is put on the queue once the mining process is complete.
+
+    :Attributes:
+
+        queue : queue.Queue
+            The queue the patterns are put on. It can be given, for example a multiprocessing queue, or is created
+            with the given maximum size
+    """
+
+    def __init__(self, queue=None, maxsize=10000) -> None:
+        """
+        :param queue: the queue to use. By default, a queue.Queue of the given maximum size is created
+        :type queue: queue.Queue or multiprocessing.Queue
+        :param maxsize: maximum number of patterns waiting in the created queue
+        :type maxsize: int
+        """
+        super().__init__()
+        self.queue = _queue.Queue(maxsize) if queue is None else queue
+
+    def write(self, pattern, value) -> None:
+        self.queue.put((pattern, value))
+
+    def close(self) -> None:
+        self.queue.put(None)
+
+
+class CountingSink(PatternSink):
+    """
+    :Description:   Only counts the patterns. ``len(sink)`` is the number of patterns found.
+    """
+
+    def write(self, pattern, value) -> None:
+        pass
@@ -0,0 +1,260 @@
+# periodicTidLists computes the periodic measures of patterns from their timestamp lists, kept as sorted integer arrays.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import periodicTidLists as ptl
+#
+#     a = ptl.tidList([1, 3, 4, 7, 9])
+#
+#     values, offsets = ptl.pack([[1, 4, 9], [3, 7, 9], [2, 5]])
+#
+#     values, offsets = ptl.intersectMany(a, values, offsets)  # a & [1, 4, 9], a & [3, 7, 9] and a & [2, 5]
+#
+#     print(ptl.supports(offsets))  # [3 3 0]
+#
+#     print(ptl.maxPeriodicities(values, offsets, 10))  # [5 4 10]
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List, Tuple
+import numpy as _np
+
+# A batch of tidlists is stored like the transactions of an EncodedDatabase: the sorted timestamps of all lists are
+# concatenated in one int64 values array, and list i is values[offsets[i]:offsets[i + 1]]. Every measure below is
+# computed for all lists of a batch at once, typically for all siblings of a prefix in the search space.
+
+
+def tidList(timestamps) -> _np.ndarray:
+    """
+    Converts the timestamps of a pattern into a sorted int64 array without duplicates
+
+    :param timestamps: the timestamps, in any order
+    :type timestamps: Iterable[int]
+    :return: the sorted timestamps
+    :rtype: numpy.ndarray
+    """
+    if isinstance(timestamps, (set, frozenset)):
+        timestamps = list(timestamps)
+    return _np.unique(_np.asarray(timestamps, dtype=_np.int64))
+
+
+def pack(tidLists, assumeSorted=False) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Concatenates several tidlists into one batch, sorting every list unless assumeSorted is set
+
+    :param tidLists: the timestamps of every pattern
+    :type tidLists: List[Iterable[int]]
+    :param assumeSorted: set when every list is already sorted, for example when it was built by this module
+    :type assumeSorted: bool
+    :return: the values and offsets arrays of the batch
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    tidLists = [list(t) if isinstance(t, (set, frozenset)) else t for t in tidLists]
+    lengths = _np.fromiter((len(t) for t in tidLists), dtype=_np.int64, count=len(tidLists))
+    offsets = _np.zeros(len(tidLists) + 1, dtype=_np.int64)
+    _np.cumsum(lengths, out=offsets[1:])
+    if offsets[-1] == 0:
+        return _np.zeros(0, dtype=_np.int64), offsets
+    values = _np.concatenate([_np.asarray(t, dtype=_np.int64) for t in tidLists])
+    if not assumeSorted:
+        descending = _np.diff(values) < 0
+        # a smaller value at the start of the next list is not a descent
+        boundaries = offsets[1:-1]
+        descending[boundaries[(boundaries > 0) & (boundaries < len(values))] - 1] = False
+        if descending.any():
+            segments = _np.repeat(_np.arange(len(tidLists)), lengths)
+            values = values[_np.lexsort((values, segments))]
+    return values, offsets
+
+
+def unpack(values, offsets) -> List[_np.ndarray]:
+    """
+    Splits a batch into one array per tidlist. The arrays are views of values.
+
+    :param values: the values of the batch
+    :type values: numpy.ndarray
+    :param offsets: the offsets of the batch
+    :type offsets: numpy.ndarray
+    :return: the tidlists
+    :rtype: List[numpy.ndarray]
+    """
+    bounds = offsets.tolist()
+    return [values[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+def intersect(a, b) -> _np.ndarray:
+    """
+    Intersection of two sorted tidlists. Every element of the shorter list is located in the longer one by binary
+    search, so the result is sorted without sorting it.
+
+    :param a: sorted timestamps
+    :type a: numpy.ndarray
+    :param b: sorted timestamps
+    :type b: numpy.ndarray
+    :return: the sorted common timestamps
+    :rtype: numpy.ndarray
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if len(a) == 0:
+        return a[:0]
+    index = _np.searchsorted(b, a)
+    _np.minimum(index, len(b) - 1, out=index)
+    return a[b[index] == a]
+
+
+def intersectMany(a, values, offsets) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Intersects one sorted tidlist with every tidlist of a batch in a single pass
+
+    :param a: sorted timestamps, usually those of the prefix
+    :type a: numpy.ndarray
+    :param values: the values of the batch
+    :type values: numpy.ndarray
+    :param offsets: the offsets of the batch
+    :type offsets: numpy.ndarray
+    :return: the values and offsets of the intersections
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    if len(a) == 0 or len(values) == 0:
+        return values[:0], _np.zeros_like(offsets)
+    index = _np.searchsorted(a, values)
+    _np.minimum(index, len(a) - 1, out=index)
+    hit = a[index] == values
+    kept = _np.zeros(len(values) + 1, dtype=_np.int64)
+    _np.cumsum(hit, out=kept[1:])
+    return values[hit], kept[offsets]
+
+
+def supports(offsets) -> _np.ndarray:
+    """
+    Support, the number of timestamps, of every tidlist of a batch
+
+    :param offsets: the offsets of the batch
+    :type offsets: numpy.ndarray
+    :return: the supports
+    :rtype: numpy.ndarray
+    """
+    return _np.diff(offsets)
+
+
+def _periods(values, offsets, last) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    The periods of every tidlist: the first timestamp, the differences of consecutive timestamps and last minus the
+    final timestamp. A tidlist of n timestamps has n + 1 periods, so the batch of periods has one more element per
+    tidlist than the batch of timestamps.
+
+    :return: the values and offsets of the periods
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    count = len(offsets) - 1
+    lengths = _np.diff(offsets)
+    previous = _np.empty_like(values)
+    if len(values):
+        previous[1:] = values[:-1]
+        previous[offsets[:-1][lengths > 0]] = 0
+    finals = _np.zeros(count, dtype=_np.int64)
+    finals[lengths > 0] = values[offsets[1:][lengths > 0] - 1]
+    segments = _np.repeat(_np.arange(count), lengths)
+    periods = _np.empty(len(values) + count, dtype=_np.int64)
+    periods[_np.arange(len(values)) + segments] = values - previous
+    periods[offsets[1:] + _np.arange(count)] = last - finals
+    return periods, offsets + _np.arange(count + 1)
+
+
+def maxPeriodicities(values, offsets, last) -> _np.ndarray:
+    """
+    Maximum periodicity of every tidlist of a batch: the largest of its periods, where the first period is measured from
+    0 and the final period up to last
+
+    :param values: the values of the batch
+    :type values: numpy.ndarray
+    :param offsets: the offsets of the batch
+    :type offsets: numpy.ndarray
+    :param last: the final timestamp of the database
+    :type last: int
+    :return: the maximum periodicities
+    :rtype: numpy.ndarray
+    """
+    if len(offsets) < 2:
+        return _np.zeros(0, dtype=_np.int64)
+    periods, periodOffsets = _periods(values, offsets, last)
+    return _np.maximum.reduceat(periods, periodOffsets[:-1])
+
+
+def periodicSupports(values, offsets, period) -> _np.ndarray:
+    """
+    Periodic-support of every tidlist of a batch: the number of consecutive timestamps at most period apart
+
+    :param values: the values of the batch
+    :type values: numpy.ndarray
+    :param offsets: the offsets of the batch
+    :type offsets: numpy.ndarray
+    :param period: the period
+    :type period: int or float
+    :return: the periodic-supports
+    :rtype: numpy.ndarray
+    """
+    periodic = _np.zeros(len(values) + 1, dtype=_np.int64)
+    if len(values):
+        _np.cumsum(_np.diff(values) <= period, out=periodic[1:len(values)])
+        periodic[-1] = periodic[-2]
+    # the pairs of list i are the differences offsets[i] .. offsets[i + 1] - 2
+    ends = _np.maximum(offsets[1:] - 1, offsets[:-1])
+    return periodic[ends] - periodic[offsets[:-1]]
+
+
+def maxLiabilities(values, offsets, maxPer, last) -> _np.ndarray:
+    """
+    Maximum liability (la) of every tidlist of a batch, as used by the stable periodic-frequent miners. The liability
+    grows by every period exceeding maxPer and shrinks by every period below it, never going under zero:
+    la(i) = max(0, la(i - 1) + period(i) - maxPer). It is computed without a loop as the prefix sums of
+    period - maxPer minus their running minimum.
+
+    :param values: the values of the batch
+    :type values: numpy.ndarray
+    :param offsets: the offsets of the batch
+    :type offsets: numpy.ndarray
+    :param maxPer: the maximum periodicity
+    :type maxPer: int or float
+    :param last: the final timestamp of the database
+    :type last: int
+    :return: the maximum liabilities
+    :rtype: numpy.ndarray
+    """
+    count = len(offsets) - 1
+    if count < 1:
+        return _np.zeros(0)
+    periods, periodOffsets = _periods(values, offsets, last)
+    excess = periods - maxPer
+    sums = _np.cumsum(excess)
+    starts = periodOffsets[:-1]
+    segments = _np.repeat(_np.arange(count), _np.diff(periodOffsets))
+    # prefix sums restarted at every tidlist
+    sums = sums - (sums[starts] - excess[starts])[segments]
+    # shifting every tidlist below all earlier ones keeps the running minimum from crossing into the next tidlist
+    shift = 2 * _np.abs(excess).sum() + 1
+    if shift * count < 2 ** 62:
+        lowest = _np.minimum.accumulate(sums - segments * shift) + segments * shift
+    else:
+        lowest = _np.concatenate([_np.minimum.accumulate(sums[periodOffsets[i]:periodOffsets[i + 1]])
+                                  for i in range(count)])
+    return _np.maximum.reduceat(sums - _np.minimum(lowest, 0), starts)
@@ -0,0 +1,235 @@
+# ProbabilityTidList is the vertical layout of an uncertain transactional database: for every item, the sorted ids of
+# the transactions that contain it and the existential probabilities of the item in those transactions, stored as two
+# aligned NumPy arrays. Intersecting two tidlists is a vectorized sorted merge that multiplies the probabilities and
+# computes the expected support of the joined pattern in the same pass.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.probabilityTidLists import ProbabilityTidList
+#
+#     transactions = [[('a', 0.8), ('b', 0.5)], [('a', 0.4)], [('a', 0.9), ('b', 0.6)]]
+#
+#     tidLists = ProbabilityTidList.fromTransactions(transactions)
+#
+#     ab = tidLists['a'].intersect(tidLists['b'])
+#
+#     print(ab.tids, ab.probabilities, ab.expectedSupport)
+#
+#     from PAMI.extras.probabilityTidLists import expectedSupports
+#
+#     supports = expectedSupports(transactions, {('a',): 2.1, ('a', 'b'): 0.7}, chunkSize=2)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as _np
+from PAMI.extras import valueTidLists as _vtl
+
+_workerCandidates = []
+
+
+class ProbabilityTidList:
+    """
+    :Description:   ProbabilityTidList stores the transactions of a pattern in an uncertain database as two aligned
+                    arrays, the sorted transaction ids and the existential probability of the pattern in each of them.
+                    The probability of a pattern in a transaction is the product of the probabilities of its items, so
+                    the tidlist of a longer pattern is obtained by intersecting the tidlists of its parts.
+
+    :Attributes:
+
+        tids : numpy.ndarray
+            int64 array of the sorted ids of the transactions that contain the pattern
+        probabilities : numpy.ndarray
+            float64 array with the probability of the pattern in each transaction of tids
+        expectedSupport : float
+            Sum of the probabilities, which is the expected support of the pattern
+
+    :Methods:
+
+        intersect(other)
+            Tidlist of the union of the two patterns, with its expected support
+        fromTransactions(transactions)
+            Tidlists of all items of an uncertain database
+        intersectAll(tidLists)
+            Tidlist of the union of several patterns
+    """
+
+    __slots__ = ['tids', 'probabilities', 'expectedSupport']
+
+    def __init__(self, tids, probabilities, expectedSupport: float = None) -> None:
+        """
+        :param tids: sorted transaction ids without duplicates
+        :type tids: numpy.ndarray or list
+        :param probabilities: probability of the pattern in each transaction of tids
+        :type probabilities: numpy.ndarray or list
+        :param expectedSupport: sum of the probabilities, computed when it is not given
+        :type expectedSupport: float
+        """
+        self.tids = _np.asarray(tids, dtype=_np.int64)
+        self.probabilities = _np.asarray(probabilities, dtype=_np.float64)
+        if expectedSupport is None:
+            expectedSupport = _vtl.orderedSum(self.probabilities)
+        self.expectedSupport = expectedSupport
+
+    def __len__(self) -> int:
+        return len(self.tids)
+
+    def intersect(self, other: 'ProbabilityTidList') -> 'ProbabilityTidList':
+        """
+        Joins two tidlists with a sorted merge: the tids of the shorter list are located in the longer one with a
+        binary search, and the probabilities of the common transactions are multiplied
+
+        :param other: tidlist of the other pattern
+        :type other: ProbabilityTidList
+        :return: tidlist of the joined pattern
+        :rtype: ProbabilityTidList
+        """
+        shorter, longer = (self, other) if len(self) <= len(other) else (other, self)
+        if len(shorter) == 0 or len(longer) == 0:
+            return ProbabilityTidList(shorter.tids[:0], shorter.probabilities[:0], 0.0)
+        positions = _np.searchsorted(longer.tids, shorter.tids)
+        _np.minimum(positions, len(longer) - 1, out=positions)
+        common = longer.tids[positions] == shorter.tids
+        positions = positions[common]
+        probabilities = self.probabilities[common] * other.probabilities[positions] if shorter is self \
+            else self.probabilities[positions] * other.probabilities[common]
+        return ProbabilityTidList(shorter.tids[common], probabilities)
+
+    @staticmethod
+    def intersectAll(tidLists: Iterable['ProbabilityTidList']) -> 'ProbabilityTidList':
+        """
+        Joins several tidlists in the given order
+
+        :param tidLists: tidlists of the patterns to join
+        :type tidLists: list
+        :return: tidlist of the joined pattern
+        :rtype: ProbabilityTidList
+        """
+        tidLists = iter(tidLists)
+        joined = next(tidLists)
+        for tidList in tidLists:
+            if len(joined) == 0:
+                break
+            joined = joined.intersect(tidList)
+        return joined
+
+    @staticmethod
+    def fromTransactions(transactions: Iterable[Iterable[Tuple[str, float]]], start: int = 0) -> Dict[str, 'ProbabilityTidList']:
+        """
+        Builds the tidlist of every item. When an item occurs twice in a transaction its last probability is kept.
+
+        :param transactions: transactions given as lists of (item, probability) pairs
+        :type transactions: list
+        :param start: id of the first transaction
+        :type start: int
+        :return: tidlist of every item, in the order of the first appearance of the items
+        :rtype: dict
+        """
+        tids, probabilities = _vtl.itemColumns(transactions, start)
+        return {item: ProbabilityTidList(tids[item], probabilities[item]) for item in tids}
+
+
+def _shardSupports(start: int, transactions: list, candidates: list) -> List[Optional[Tuple[int, float]]]:
+    """
+    Expected supports of the candidates in one shard of the database, computed from an inverted index of the shard
+
+    :param start: id of the first transaction of the shard
+    :type start: int
+    :param transactions: transactions of the shard as lists of (item, probability) pairs
+    :type transactions: list
+    :param candidates: patterns to count
+    :type candidates: list
+    :return: for every candidate, the first tid and the expected support in the shard, or None when no transaction contains it
+    :rtype: list
+    """
+    tidLists = ProbabilityTidList.fromTransactions(transactions, start)
+    supports = []
+    for candidate in candidates:
+        if all(item in tidLists for item in candidate):
+            tidList = ProbabilityTidList.intersectAll(tidLists[item] for item in candidate)
+            if len(tidList) > 0:
+                supports.append((int(tidList.tids[0]), tidList.expectedSupport))
+                continue
+        supports.append(None)
+    return supports
+
+
+def _initWorker(candidates: list) -> None:
+    """
+    Receives the candidates once per worker process, so that only the shards are sent with the tasks
+    """
+    global _workerCandidates
+    _workerCandidates = candidates
+
+
+def _workerSupports(shard: Tuple[int, list]) -> List[Optional[Tuple[int, float]]]:
+    """
+    Counts the candidates of the worker in a shard
+    """
+    return _shardSupports(shard[0], shard[1], _workerCandidates)
+
+
+def expectedSupports(transactions: list, candidates: dict, chunkSize: int = None, workers: int = 1) -> dict:
+    """
+    Verifies the candidates of a tree based miner with their exact expected supports. The database is split in shards
+    of chunkSize transactions, and every candidate is counted by intersecting the tidlists of its items in each shard,
+    so that the database is read once for all candidates. Patterns of a single item keep the support they are given,
+    since the trees count items exactly.
+
+    :param transactions: transactions as lists of (item, probability) pairs
+    :type transactions: list
+    :param candidates: candidate patterns, as tuples of items, with the support estimated by the miner
+    :type candidates: dict
+    :param chunkSize: number of transactions indexed at once, the whole database when None
+    :type chunkSize: int
+    :param workers: number of processes counting the shards
+    :type workers: int
+    :return: support of every pattern contained by some transaction, in the order of the first transaction containing it
+    :rtype: dict
+    """
+    patterns = list(candidates)
+    longer = [pattern for pattern in patterns if len(pattern) > 1]
+    chunkSize = int(chunkSize) if chunkSize else max(len(transactions), 1)
+    shards = [(start, transactions[start:start + chunkSize]) for start in range(0, len(transactions), chunkSize)]
+    if workers is not None and int(workers) > 1 and len(shards) > 1 and longer:
+        with _ProcessPoolExecutor(int(workers), initializer=_initWorker, initargs=(longer,)) as pool:
+            results = list(pool.map(_workerSupports, shards))
+    else:
+        results = (_shardSupports(start, shard, longer) for start, shard in shards)
+    first, total = {}, {}
+    for result in results:
+        for pattern, support in zip(longer, result):
+            if support is None:
+                continue
+            if pattern in first:
+                total[pattern] += support[1]
+            else:
+                first[pattern], total[pattern] = support
+    ordered = []
+    for index, pattern in enumerate(patterns):
+        if len(pattern) == 1:
+            if len(transactions) > 0:
+                ordered.append((0, index, pattern, candidates[pattern]))
+        elif pattern in first:
+            ordered.append((first[pattern], index, pattern, total[pattern]))
+    ordered.sort(key=lambda support: support[:2])
+    return {pattern: support for _, _, pattern, support in ordered}
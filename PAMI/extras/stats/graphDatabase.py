@@ -1,5 +1,6 @@
 import networkx as nx
 import matplotlib.pyplot as plt
+from PAMI.extras.encodedGraphDatabase import EncodedGraphDatabase as _EncodedGraphDatabase
 
 class graphDatabase:
 
@@ -10,6 +11,14 @@ class graphDatabase:
         self.edges_per_graph = None
         self.nodes_per_graph = None
 
+        if _EncodedGraphDatabase.isEncoded(iFile):
+            # a database converted with PAMI.extras.encodedGraphDatabase
+            for graph in _EncodedGraphDatabase.fromInput(iFile).graphs():
+                if graph['vertices'] or graph['edges']:
+                    self.graphs.append({'vertices': [(v, int(label)) for v, label in graph['vertices']],
+                                        'edges': [(v1, v2, int(label)) for v1, v2, label in graph['edges']]})
+            return
+
         with open(iFile, 'r') as file:
             for line in file:
                 if line.startswith('t #'):
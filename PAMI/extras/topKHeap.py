@@ -0,0 +1,151 @@
+# TopKHeap keeps the k best patterns found so far by the top-k miners, and the score a new pattern has to beat to get in.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.topKHeap import TopKHeap
+#
+#     heap = TopKHeap(2, floor=1)
+#
+#     heap.push('a', 10)
+#
+#     heap.push('b', 7)
+#
+#     heap.push('c', 8)  # evicts 'b'
+#
+#     print(heap.threshold())  # 8
+#
+#     print(heap.patterns())  # {'a': 10, 'c': 8}
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Any, Dict
+import heapq as _heapq
+
+
+class TopKHeap:
+    """
+    :Description:   The frontier of a top-k miner. The k best patterns are kept in a min-heap ordered by score, so that the
+                    worst of them is always on top: a pattern is admitted or rejected in O(log k) time, and the score the
+                    next pattern has to beat is available right after every insertion.
+
+                    Patterns that are evicted or pushed again with a new value are not searched for in the heap. Their
+                    heap entries become stale and are skipped when they reach the top (lazy deletion), and the heap is
+                    rebuilt once stale entries make up most of it.
+
+    :Attributes:
+
+        k : int
+            Number of patterns to keep
+        floor : float
+            Returned by threshold() while fewer than k patterns are kept
+
+    :Methods:
+
+        push(pattern, value, score)
+            Offers a pattern to the frontier
+        threshold()
+            Score of the worst kept pattern once k patterns are kept
+        patterns()
+            The kept patterns, best first
+    """
+
+    def __init__(self, k, floor=float('-inf')) -> None:
+        """
+        :param k: number of patterns to keep
+        :type k: int
+        :param floor: score returned by threshold() while fewer than k patterns are kept
+        :type floor: int or float
+        """
+        self.k = int(k)
+        self.floor = floor
+        self._heap = []
+        self._live = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, pattern) -> bool:
+        return pattern in self._live
+
+    def _clean(self) -> None:
+        """
+        Removes the stale entries from the top of the heap
+        """
+        heap = self._heap
+        while heap and self._live.get(heap[0][2], (None,))[0] != heap[0][1]:
+            _heapq.heappop(heap)
+
+    def push(self, pattern, value, score=None) -> bool:
+        """
+        Offers a pattern to the frontier. While fewer than k patterns are kept it is always admitted; afterwards it is
+        admitted only if its score is larger than the worst kept score, and the worst pattern is evicted. A pattern that
+        is already kept gets the new value and score.
+
+        :param pattern: the pattern
+        :type pattern: tuple or str
+        :param value: the value stored for the pattern, for example its support or a list of measures
+        :type value: Any
+        :param score: the number the patterns are ranked by, larger is better. It defaults to the value. Tuples of
+                      numbers can be used to break the ties of the first number
+        :type score: int or float or tuple
+        :return: True if the pattern is kept
+        :rtype: bool
+        """
+        if score is None:
+            score = value
+        if pattern not in self._live and len(self._live) >= self.k:
+            self._clean()
+            if self.k == 0 or score <= self._heap[0][0]:
+                return False
+            worst = _heapq.heappop(self._heap)
+            del self._live[worst[2]]
+        self._sequence += 1
+        self._live[pattern] = (self._sequence, value, score)
+        _heapq.heappush(self._heap, (score, self._sequence, pattern))
+        if len(self._heap) > 2 * len(self._live) + 16:
+            self._heap = [(score, sequence, pattern) for pattern, (sequence, value, score) in self._live.items()]
+            _heapq.heapify(self._heap)
+        return True
+
+    def threshold(self):
+        """
+        The score a pattern has to beat to be admitted: the worst kept score once k patterns are kept, and the floor
+        before that. As the kept scores only grow, so does the threshold.
+
+        :return: the current threshold
+        :rtype: int or float
+        """
+        if len(self._live) < self.k or self.k == 0:
+            return self.floor
+        self._clean()
+        return self._heap[0][0]
+
+    def patterns(self) -> Dict[Any, Any]:
+        """
+        The kept patterns and their values, best first. Patterns with the same score are listed in the order they were
+        admitted.
+
+        :return: dictionary of the kept patterns
+        :rtype: dict
+        """
+        ranked = sorted(self._live.items(), key=lambda x: (x[1][2], -x[1][0]), reverse=True)
+        return {pattern: value for pattern, (sequence, value, score) in ranked}
@@ -0,0 +1,78 @@
+# valueTidLists holds the parts shared by the tidlists whose transactions carry a value for the pattern, such as the
+# existential probabilities of ProbabilityTidList and the fuzzy values of FuzzyTidList: the per-item columns of tids and
+# values read from a database, and the sum of the values in tid order.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras import valueTidLists as vtl
+#
+#     tids, values = vtl.itemColumns([[('a', 0.75), ('b', 0.5)], [('a', 0.5)]])
+#
+#     print(tids['a'], values['a'])  # [0, 1] [0.75, 0.5]
+#
+#     print(vtl.orderedSum(values['a']))  # 1.25
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+import numpy as _np
+
+
+def orderedSum(values) -> float:
+    """
+    Adds the values in tid order with a float64 accumulator, as a scan of the database does, so that a support does
+    not depend on the summation order NumPy picks for sum()
+
+    :param values: values of a pattern in its transactions
+    :type values: numpy.ndarray
+    :return: sum of the values
+    :rtype: float
+    """
+    if len(values) == 0:
+        return 0.0
+    return float(_np.cumsum(values, dtype=_np.float64)[-1])
+
+
+def itemColumns(transactions: Iterable[Iterable[Tuple[str, float]]],
+                start: int = 0) -> Tuple[Dict[str, List[int]], Dict[str, List[float]]]:
+    """
+    Reads the tids and the values of every item. When an item occurs twice in a transaction its last value is kept.
+
+    :param transactions: transactions given as lists of (item, value) pairs
+    :type transactions: list
+    :param start: id of the first transaction
+    :type start: int
+    :return: the sorted tids and the aligned values of every item, in the order of the first appearance of the items
+    :rtype: tuple
+    """
+    tids, values = {}, {}
+    for tid, transaction in enumerate(transactions, start):
+        for item, value in transaction:
+            itemTids = tids.get(item)
+            if itemTids is None:
+                tids[item] = [tid]
+                values[item] = [value]
+            elif itemTids[-1] == tid:
+                values[item][-1] = value
+            else:
+                itemTids.append(tid)
+                values[item].append(value)
+    return tids, values
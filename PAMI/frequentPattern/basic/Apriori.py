@@ -152,7 +152,9 @@ class Apriori(_ab._frequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if isinstance(self._iFile, _ab._EncodedDatabase) or _ab._usesCache(self._iFile):
+            self._Database = _ab._EncodedDatabase.load(self._iFile, self._sep)
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             #temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -162,7 +164,7 @@ class Apriori(_ab._frequentPatterns):
                 self._Database = [x.split(self._sep) for x in self._Database]
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -223,20 +225,25 @@ class Apriori(_ab._frequentPatterns):
         """
         self._Database = []
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._newPatterns()
 
         self._creatingItemSets()
 
         self._minSup = self._convert(self._minSup)
 
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
+        if isinstance(self._Database, _ab._EncodedDatabase):
+            items = {tuple([k]): v for k, v in self._Database.tidLists().items()}
+            index = len(self._Database)
+        else:
+            items = {}
+            index = 0
+            for line in self._Database:
+                for item in line:
+                    if tuple([item]) in items:
+                        items[tuple([item])].append(index)
+                    else:
+                        items[tuple([item])] = [index]
+                index += 1
 
         # sort by length in descending order
         items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
@@ -294,6 +301,7 @@ class Apriori(_ab._frequentPatterns):
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
+        self._closeSink()
         print("Frequent patterns were generated successfully using Apriori algorithm ")
 
     def getMemoryUSS(self) -> float:
@@ -383,13 +391,13 @@ class Apriori(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._patternsInMemory()
 
     def printResults(self) -> None:
         """
         This function is used to print the result
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
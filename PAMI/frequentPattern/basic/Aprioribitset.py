@@ -176,7 +176,9 @@ class Aprioribitset(_ab._frequentPatterns):
         """
         self._Database = []
         self._mapSupport = {}
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if isinstance(self._iFile, _ab._EncodedDatabase) or _ab._usesCache(self._iFile):
+            self._Database = _ab._EncodedDatabase.load(self._iFile, self._sep)
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             #temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -187,7 +189,7 @@ class Aprioribitset(_ab._frequentPatterns):
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
 
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -233,20 +235,25 @@ class Aprioribitset(_ab._frequentPatterns):
         Frequent pattern mining process will start from here
         """
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._newPatterns()
 
         self._Database = []
 
         self._creatingItemSets()
 
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
+        if isinstance(self._Database, _ab._EncodedDatabase):
+            items = {tuple([k]): v for k, v in self._Database.tidLists().items()}
+            index = len(self._Database)
+        else:
+            items = {}
+            index = 0
+            for line in self._Database:
+                for item in line:
+                    if tuple([item]) in items:
+                        items[tuple([item])].append(index)
+                    else:
+                        items[tuple([item])] = [index]
+                index += 1
 
         # sort by length in descending order
         items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
@@ -305,6 +312,7 @@ class Aprioribitset(_ab._frequentPatterns):
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
+        self._closeSink()
         print("Frequent patterns were generated successfully using Apriori algorithm ")
 
     def getMemoryUSS(self):
@@ -388,13 +396,13 @@ class Aprioribitset(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._patternsInMemory()
 
     def printResults(self):
         """
         This function is used to print the result
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
@@ -153,7 +153,9 @@ class ECLAT(_ab._frequentPatterns):
         :rtype: float
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if isinstance(self._iFile, _ab._EncodedDatabase) or _ab._usesCache(self._iFile):
+            self._Database = _ab._EncodedDatabase.load(self._iFile, self._sep)
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -162,7 +164,7 @@ class ECLAT(_ab._frequentPatterns):
                 self._Database = [x.split(self._sep) for x in self._Database]
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -257,6 +259,7 @@ class ECLAT(_ab._frequentPatterns):
         """
 
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._newPatterns()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
@@ -266,14 +269,17 @@ class ECLAT(_ab._frequentPatterns):
         self._minSup = self._convert(self._minSup)
 
     
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if item not in items:
-                    items[item] = []
-                items[item].append(index)
-            index += 1
+        if isinstance(self._Database, _ab._EncodedDatabase):
+            items = self._Database.tidLists()
+        else:
+            items = {}
+            index = 0
+            for line in self._Database:
+                for item in line:
+                    if item not in items:
+                        items[item] = []
+                    items[item].append(index)
+                index += 1
         
         items = {tuple([k]): set(v) for k, v in items.items() if len(v) >= self._minSup}
         items = {k: v for k, v in sorted(items.items(), key=lambda item_: len(item_[1]), reverse=False)}
@@ -291,6 +297,7 @@ class ECLAT(_ab._frequentPatterns):
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
+        self._closeSink()
         print("Frequent patterns were generated successfully using ECLAT algorithm")
 
     def getMemoryUSS(self) -> float:
@@ -377,13 +384,13 @@ class ECLAT(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._patternsInMemory()
 
     def printResults(self) -> None:
         """
         Function used to print the results
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:",  self.getRuntime())
@@ -158,7 +158,9 @@ class ECLATDiffset(_ab._frequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if isinstance(self._iFile, _ab._EncodedDatabase) or _ab._usesCache(self._iFile):
+            self._Database = _ab._EncodedDatabase.load(self._iFile, self._sep)
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -167,7 +169,7 @@ class ECLATDiffset(_ab._frequentPatterns):
                 self._Database = [x.split(self._sep) for x in self._Database]
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -247,7 +249,7 @@ class ECLATDiffset(_ab._frequentPatterns):
 
         self._startTime = _ab._time.time()
         self._Database = []
-        self._finalPatterns = {}
+        self._finalPatterns = self._newPatterns()
         self._diffSets = {}
         self._trans_set = set()
 
@@ -261,12 +263,15 @@ class ECLATDiffset(_ab._frequentPatterns):
 
         items = {}
         db = set([i for i in range(len(self._Database))])
-        for i in range(len(self._Database)):
-            for item in self._Database[i]:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(i)
-                else:
-                    items[tuple([item])] = [i]
+        if isinstance(self._Database, _ab._EncodedDatabase):
+            items = {tuple([k]): v for k, v in self._Database.tidLists().items()}
+        else:
+            for i in range(len(self._Database)):
+                for item in self._Database[i]:
+                    if tuple([item]) in items:
+                        items[tuple([item])].append(i)
+                    else:
+                        items[tuple([item])] = [i]
         
         items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
 
@@ -291,6 +296,7 @@ class ECLATDiffset(_ab._frequentPatterns):
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
+        self._closeSink()
         print("Frequent patterns were generated successfully using ECLAT Diffset algorithm")
 
     def getMemoryUSS(self):
@@ -375,13 +381,13 @@ class ECLATDiffset(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._patternsInMemory()
 
     def printResults(self):
         """
         This function is used to print the results.
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:",  self.getRuntime())
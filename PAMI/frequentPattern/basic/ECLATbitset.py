@@ -53,6 +53,35 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _ab
 from deprecated import deprecated
+from itertools import chain as _chain
+import numpy as _np
+
+
+if hasattr(_np, 'bitwise_count'):
+    def _popcount(bits):
+        """
+        Number of set bits in every row of a 2-D uint64 bitset matrix
+
+        :param bits: bitset matrix
+        :type bits: numpy.ndarray
+        :return: the number of set bits of every row
+        :rtype: numpy.ndarray
+        """
+        return _np.bitwise_count(bits).sum(axis=1, dtype=_np.int64)
+else:
+    _bitsInByte = _np.array([bin(i).count('1') for i in range(256)], dtype=_np.uint8)
+
+    def _popcount(bits):
+        """
+        Number of set bits in every row of a 2-D uint64 bitset matrix
+
+        :param bits: bitset matrix
+        :type bits: numpy.ndarray
+        :return: the number of set bits of every row
+        :rtype: numpy.ndarray
+        """
+        bytes_ = _np.ascontiguousarray(bits).view(_np.uint8)
+        return _bitsInByte[bytes_].sum(axis=1, dtype=_np.int64)
 
 
 class ECLATbitset(_ab._frequentPatterns):
@@ -174,7 +203,9 @@ class ECLATbitset(_ab._frequentPatterns):
         """
         self._Database = []
         self._mapSupport = {}
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if isinstance(self._iFile, _ab._EncodedDatabase) or _ab._usesCache(self._iFile):
+            self._Database = _ab._EncodedDatabase.load(self._iFile, self._sep)
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -184,7 +215,7 @@ class ECLATbitset(_ab._frequentPatterns):
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
 
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -230,6 +261,59 @@ class ECLATbitset(_ab._frequentPatterns):
             packed_bits |= 1 << (maxIndex - i)
 
         return packed_bits
+
+    def _packTidLists(self, tidLists, numberOfTransactions):
+        """
+
+        Packs the tid lists of the items into a 2-D uint64 matrix holding one bitset per row. Transaction t is bit t % 64 of
+        word t // 64.
+
+        :param tidLists: the transactions containing every item
+        :type tidLists: list
+        :param numberOfTransactions: number of transactions in the database
+        :type numberOfTransactions: int
+        :return: bitset matrix with one row per item
+        :rtype: numpy.ndarray
+        """
+        words = max(1, (numberOfTransactions + 63) // 64)
+        bits = _np.zeros((len(tidLists), words), dtype=_np.uint64)
+        lengths = [len(tids) for tids in tidLists]
+        rows = _np.repeat(_np.arange(len(tidLists)), lengths)
+        tids = _np.fromiter(_chain.from_iterable(tidLists), dtype=_np.int64, count=sum(lengths))
+        masks = _np.left_shift(_np.uint64(1), (tids & 63).astype(_np.uint64))
+        _np.bitwise_or.at(bits, (rows, tids >> 6), masks)
+        return bits
+
+    def __recursiveNumpy(self, cands, bits):
+        """
+
+        Vectorized ECLAT search. Row i of bits is the bitset of cands[i]; all extensions of cands[i] with its right siblings
+        are intersected and counted with one 2-D operation, and the surviving rows become the bitsets of the next level, so
+        the prefix intersection is never recomputed. Words that are zero in the prefix bitset are dropped from the next level.
+
+        :param cands: candidate itemsets sharing the same prefix
+        :type cands: list
+        :param bits: bitset matrix of the candidates
+        :type bits: numpy.ndarray
+        :return: None
+        """
+        for i in range(len(cands) - 1):
+            prefix = bits[i]
+            siblings = bits[i + 1:]
+            nonZero = _np.flatnonzero(prefix)
+            if 2 * len(nonZero) <= len(prefix):
+                prefix = prefix[nonZero]
+                siblings = siblings[:, nonZero]
+            extensions = siblings & prefix
+            counts = _popcount(extensions)
+            keep = _np.flatnonzero(counts >= self._minSup)
+            if len(keep) == 0:
+                continue
+            newCands = [cands[i] + tuple([cands[i + 1 + j][-1]]) for j in keep.tolist()]
+            for newCand, count in zip(newCands, counts[keep].tolist()):
+                self._finalPatterns[newCand] = count
+            if len(newCands) > 1:
+                self.__recursiveNumpy(newCands, extensions[keep])
     
     def __recursive(self, items, cands, memorySaver):
         """
@@ -271,26 +355,42 @@ class ECLATbitset(_ab._frequentPatterns):
                 if len(newCands) > 1:
                     self.__recursive(items, newCands, memorySaver)
 
-    def mine(self, memorySaver = True) -> None:
+    def mine(self, memorySaver = True, engine = "numpy") -> None:
         """
         Frequent pattern mining process will start from here
         # Bitset implementation
+
+        :param memorySaver: used by the "bigint" engine. If enabled, the intersection of every candidate is computed from
+                            the bitsets of its items instead of storing the bitsets of all discovered patterns.
+        :type memorySaver: bool
+        :param engine: "numpy" stores the bitsets in contiguous uint64 arrays and intersects all siblings of a prefix in
+                       one vectorized operation. "bigint" stores one Python integer per bitset. Both engines return the
+                       same patterns.
+        :type engine: str
+        :return: None
         """
+        if engine not in ["numpy", "bigint"]:
+            raise ValueError("engine should be either numpy or bigint")
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._newPatterns()
 
         self._Database = []
 
         self._creatingItemSets()
 
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
+        if isinstance(self._Database, _ab._EncodedDatabase):
+            items = {tuple([k]): v for k, v in self._Database.tidLists().items()}
+            index = len(self._Database)
+        else:
+            items = {}
+            index = 0
+            for line in self._Database:
+                for item in line:
+                    if tuple([item]) in items:
+                        items[tuple([item])].append(index)
+                    else:
+                        items[tuple([item])] = [index]
+                index += 1
 
         # sort by length in descending order
         items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
@@ -299,12 +399,17 @@ class ECLATbitset(_ab._frequentPatterns):
             if len(items[key]) >= self._minSup:
                 self._finalPatterns[key] = len(items[key])
                 cands.append(key)
-                items[key] = self._bitPacker(items[key], index)
+                if engine != "numpy":
+                    items[key] = self._bitPacker(items[key], index)
             else:
                 break
 
-
-        self.__recursive(items, cands, memorySaver)
+        if engine == "numpy":
+            bits = self._packTidLists([items[key] for key in cands], index)
+            del items
+            self.__recursiveNumpy(cands, bits)
+        else:
+            self.__recursive(items, cands, memorySaver)
         
 
         self._endTime = _ab._time.time()
@@ -313,6 +418,7 @@ class ECLATbitset(_ab._frequentPatterns):
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
+        self._closeSink()
         print("Frequent patterns were generated successfully using ECLAT algorithm ")
 
     def getMemoryUSS(self):
@@ -397,13 +503,13 @@ class ECLATbitset(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._patternsInMemory()
 
     def printResults(self):
         """
         This function is used to print the result
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
@@ -52,65 +52,157 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.basic import abstract as _fp
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple
 from deprecated import deprecated
 from itertools import combinations
 from collections import Counter
+from array import array as _array
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor, wait as _wait, FIRST_COMPLETED as _FIRST_COMPLETED
+import heapq as _heapq
+import numpy as _np
 
 _minSup = str()
 _fp._sys.setrecursionlimit(20000)
+_workerMiner = None
 
 
-class _Node:
+def _initWorker(itemNames, sep) -> None:
     """
-    A class used to represent the node of frequentPatternTree
+    Creates the miner used by a worker process of the parallel mode
+
+    :param itemNames: original item of every FP-tree id
+    :type itemNames: List
+    :param sep: separator of the items
+    :type sep: str
+    """
+    global _workerMiner
+    _workerMiner = FPGrowth(None, 0, sep)
+    _workerMiner._itemNames = itemNames
 
-    :**Attributes**:    - **itemId** (*int*) -- *storing item of a node.*
-                        - **counter** (*int*) -- *To maintain the support of node.*
-                        - **parent** (*node*) -- *To maintain the parent of node.*
-                        - **children** (*list*) -- *To maintain the children of node.*
 
-    :**Methods**:   - **addChild(node)** -- *Updates the nodes children list and parent for the given node.*
+def _mineGroup(bases, minSup) -> Dict[Tuple[str, ...], int]:
+    """
+    Mines a group of header items in a worker process
+
+    :param bases: item, support and conditional pattern base of every header item of the group
+    :type bases: List
+    :param minSup: The minimum support threshold.
+    :type minSup: int
+    :return: the patterns of the group
+    :rtype: dict
     """
+    _workerMiner._finalPatterns = {}
+    for item, support, items, offsets, counts in bases:
+        _workerMiner._mineBase([item], support, items, offsets, counts, minSup)
+    return _workerMiner._finalPatterns
 
-    def __init__(self, item, count, parent) -> None:
-        self.item = item
-        self.count = count
-        self.parent = parent
-        self.children = {}
 
-    def addChild(self, item, count = 1) -> Any:
-        """
+class _FPTree:
+    """
+    An FP-tree whose nodes live in parallel integer arrays. Node 0 is the root and every other node n stores
+
+    :**Attributes**:    - **item** (*array*) -- *item id of node n.*
+                        - **count** (*array*) -- *support of the path ending at node n.*
+                        - **parent** (*array*) -- *parent node of node n.*
+                        - **child** (*array*) -- *first child of node n, or -1.*
+                        - **sibling** (*array*) -- *next sibling of node n, or -1.*
+                        - **link** (*array*) -- *next node holding the same item, or -1.*
+                        - **header** (*dict*) -- *item id to the first node of its node-link chain.*
+                        - **support** (*dict*) -- *item id to its support in the tree, in the order the items were first inserted.*
+
+    :**Methods**:   - **insert(transaction, count)** -- *Inserts a sorted transaction with the given count.*
+                    - **path(node)** -- *Returns the items on the path from the root to the parent of a node.*
+                    - **conditionalBase(item)** -- *Returns the conditional pattern base of an item as flat arrays.*
+    """
 
-        Adds a child node to the current node with the specified item and count.
+    __slots__ = ['item', 'count', 'parent', 'child', 'sibling', 'link', 'header', 'support', '_children']
 
-        :param item: The item associated with the child node.
-        :type item: List
-        :param count: The count or support of the item. Default is 1.
+    def __init__(self) -> None:
+        self.item = _array('i', [-1])
+        self.count = _array('q', [0])
+        self.parent = _array('i', [-1])
+        self.child = _array('i', [-1])
+        self.sibling = _array('i', [-1])
+        self.link = _array('i', [-1])
+        self.header = {}
+        self.support = {}
+        # (node, item) -> child lookup used while the tree is being built
+        self._children = {}
+
+    def insert(self, transaction, count) -> None:
+        """
+        Adds a transaction to the tree, sharing the prefix it has in common with the transactions added before.
+
+        :param transaction: item ids of the transaction, sorted in the order of the tree
+        :type transaction: Iterable[int]
+        :param count: number of times the transaction occurs
         :type count: int
-        :return: The child node added.
-        :rtype: List
         """
-        if item not in self.children:
-            self.children[item] = _Node(item, count, self)
-        else:
-            self.children[item].count += count
-        return self.children[item]
-    
-    def traverse(self) -> Tuple[List[int], int]:
+        node = 0
+        for item in transaction:
+            key = (node << 32) | item
+            child = self._children.get(key)
+            if child is None:
+                child = len(self.item)
+                self._children[key] = child
+                self.item.append(item)
+                self.count.append(count)
+                self.parent.append(node)
+                self.child.append(-1)
+                self.sibling.append(self.child[node])
+                self.child[node] = child
+                self.link.append(self.header.get(item, -1))
+                self.header[item] = child
+            else:
+                self.count[child] += count
+            self.support[item] = self.support.get(item, 0) + count
+            node = child
+
+    def finish(self) -> None:
+        """
+        Releases the lookup table used while inserting transactions
         """
-        Traversing the tree to get the transaction
+        self._children = {}
 
-        :return: transaction and count of each item in transaction
-        :rtype: Tuple, List and int
+    def path(self, node) -> List[int]:
         """
-        transaction = []
-        count = self.count
-        node = self.parent
-        while node.parent is not None:
-            transaction.append(node.item)
-            node = node.parent
-        return transaction[::-1], count
+        Items on the path from the root down to the parent of a node
+
+        :param node: index of the node
+        :type node: int
+        :return: item ids ordered from the root
+        :rtype: list
+        """
+        path = []
+        node = self.parent[node]
+        while node > 0:
+            path.append(self.item[node])
+            node = self.parent[node]
+        path.reverse()
+        return path
+
+    def conditionalBase(self, item) -> Tuple[_array, List[int], List[int]]:
+        """
+        Conditional pattern base of an item. The prefix paths of all nodes of the item are stored one after another in a
+        single array, so that path i is the slice items[offsets[i]:offsets[i + 1]] and occurs counts[i] times.
+
+        :param item: item id
+        :type item: int
+        :return: the flat items array, the offsets of the paths and their counts
+        :rtype: Tuple[array, List, List]
+        """
+        items = _array('i')
+        offsets = [0]
+        counts = []
+        node = self.header[item]
+        while node != -1:
+            path = self.path(node)
+            if path:
+                items.extend(path)
+                offsets.append(len(items))
+                counts.append(self.count[node])
+            node = self.link[node]
+        return items, offsets, counts
 
 
 class FPGrowth(_fp._frequentPatterns):
@@ -126,6 +218,7 @@ class FPGrowth(_fp._frequentPatterns):
                         - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
                         - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **workers** (*int*) -- *Number of processes that mine the header items. The default of 1 mines in the calling process and None uses all cores.*
 
     :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
                         - **endTime** (*float*) -- *To record the completion time of the mining process.*
@@ -210,15 +303,20 @@ class FPGrowth(_fp._frequentPatterns):
     __rank = {}
     __rankDup = {}
 
-    def __init__(self, iFile, minSup, sep='\t') -> None:
+    def __init__(self, iFile, minSup, sep='\t', workers=1) -> None:
         super().__init__(iFile, minSup, sep)
+        self._workers = _fp._os.cpu_count() if workers is None else int(workers)
+        if self._workers < 1:
+            raise ValueError("workers should be a positive integer")
 
     def __creatingItemSets(self) -> None:
         """
         Storing the complete transactions of the database/input file in a database variable
         """
         self.__Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
+        if isinstance(self._iFile, _fp._EncodedDatabase) or _fp._usesCache(self._iFile):
+            self.__Database = _fp._EncodedDatabase.load(self._iFile, self._sep)
+        elif isinstance(self._iFile, _fp._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -230,7 +328,7 @@ class FPGrowth(_fp._frequentPatterns):
                 
 
             #print(self.Database)
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _fp._validators.url(self._iFile):
                 data = _fp._urlopen(self._iFile)
                 for line in data:
@@ -274,34 +372,66 @@ class FPGrowth(_fp._frequentPatterns):
     
     def _construct(self, items, data, minSup):
         """
-        Constructs the FP-tree from the given transactions.
+        Constructs the FP-tree from the given transactions. The frequent items get integer ids in decreasing order of
+        support, ties keeping the order of first appearance, and every transaction is inserted sorted by id so that all
+        transactions follow the same item order.
 
         :param items: A dictionary containing item frequencies.
         :type items: Dict
-        :param data: A list of transactions.
-        :type data: List
+        :param data: A list of transactions or an EncodedDatabase.
+        :type data: List or EncodedDatabase
         :param minSup: The minimum support threshold.
         :type minSup: int
-        :return: The root node of the constructed FP-tree and a dictionary containing information about nodes associated with each item.
-        :rtype: Tuple[_Node, Dict]
+        :return: The constructed FP-tree.
+        :rtype: _FPTree
         """
 
-        items = {k: v for k, v in items.items() if v >= minSup}
+        self._itemNames = sorted([k for k, v in items.items() if v >= minSup], key=lambda x: items[x], reverse=True)
+        rank = {item: index for index, item in enumerate(self._itemNames)}
 
-        root = _Node([], 0, None)
-        itemNodes = {}
-        for line in data:
-            currNode = root
-            line = sorted([item for item in line if item in items], key = lambda x: items[x], reverse = True)
-            for item in line:
-                currNode = currNode.addChild(item)
-                if item in itemNodes:
-                    itemNodes[item][0].add(currNode)
-                    itemNodes[item][1] += 1
-                else:
-                    itemNodes[item] = [set([currNode]), 1]
-
-        return root, itemNodes
+        tree = _FPTree()
+        if isinstance(data, _fp._EncodedDatabase):
+            for transactions in self._encodedTransactions(data, rank):
+                for transaction in transactions:
+                    if transaction:
+                        tree.insert(transaction, 1)
+        else:
+            for line in data:
+                transaction = sorted([rank[item] for item in line if item in rank])
+                if transaction:
+                    tree.insert(transaction, 1)
+        tree.finish()
+        return tree
+
+    def _encodedTransactions(self, data, rank, chunkSize=100000):
+        """
+        Translates the item ids of an EncodedDatabase into FP-tree ids, dropping infrequent items and sorting every
+        transaction with array operations. Transactions are produced in chunks to bound the memory of the Python lists.
+
+        :param data: the encoded database
+        :type data: EncodedDatabase
+        :param rank: FP-tree id of every frequent item
+        :type rank: Dict
+        :param chunkSize: number of transactions converted at once
+        :type chunkSize: int
+        :return: generator over lists of sorted transactions
+        :rtype: Iterator[List[List[int]]]
+        """
+        ranks = _np.full(len(data.itemNames), len(rank), dtype=_np.int64)
+        for item, index in rank.items():
+            ranks[data.itemId(item)] = index
+        for first in range(0, len(data), chunkSize):
+            last = min(first + chunkSize, len(data))
+            offsets = data.offsets[first:last + 1]
+            mapped = ranks[data.items[offsets[0]:offsets[-1]]]
+            tids = _np.repeat(_np.arange(last - first), _np.diff(offsets))
+            # sorting by (transaction, id) pushes the infrequent items, mapped to len(rank), to the end of each transaction
+            order = _np.lexsort((mapped, tids))
+            mapped = mapped[order]
+            keep = mapped < len(rank)
+            bounds = _np.concatenate(([0], _np.cumsum(_np.bincount(tids[order][keep], minlength=last - first)))).tolist()
+            mapped = mapped[keep].tolist()
+            yield [mapped[bounds[i]:bounds[i + 1]] for i in range(last - first)]
 
     def _all_combinations(self, arr):
         """
@@ -318,87 +448,146 @@ class FPGrowth(_fp._frequentPatterns):
         for r in range(1, len(arr) + 1):
             all_combinations_list.extend(combinations(arr, r))
         return all_combinations_list
-    
-    def _recursive(self, root, itemNode, minSup, patterns):
+
+    def _savePattern(self, pattern, support):
+        """
+        Stores a pattern of FP-tree ids under its original items
+
+        :param pattern: FP-tree ids of the pattern
+        :type pattern: List
+        :param support: support of the pattern
+        :type support: int
+        """
+        self._finalPatterns[tuple([self._itemNames[i] for i in pattern])] = support
+
+    def _treeFromBase(self, items, offsets, counts, minSup):
+        """
+        Builds an FP-tree from a conditional pattern base.
+
+        :param items: the flat items array of the pattern base
+        :type items: array
+        :param offsets: offsets of the paths in items
+        :type offsets: List
+        :param counts: counts of the paths
+        :type counts: List
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        :return: the conditional FP-tree, or None if no item of the pattern base is frequent
+        :rtype: _FPTree or None
+        """
+        itemCount = {}
+        for i in range(len(counts)):
+            count = counts[i]
+            for x in items[offsets[i]:offsets[i + 1]]:
+                itemCount[x] = itemCount.get(x, 0) + count
+        itemCount = {k: v for k, v in itemCount.items() if v >= minSup}
+        if len(itemCount) == 0:
+            return None
+
+        newTree = _FPTree()
+        for i in range(len(counts)):
+            transaction = [x for x in items[offsets[i]:offsets[i + 1]] if x in itemCount]
+            if transaction:
+                transaction.sort(key=lambda x: (-itemCount[x], x))
+                newTree.insert(transaction, counts[i])
+        newTree.finish()
+        return newTree
+
+    def _mineBase(self, pattern, support, items, offsets, counts, minSup):
+        """
+        Mines a pattern and all its extensions from the conditional pattern base of the pattern.
+
+        :param pattern: FP-tree ids of the pattern
+        :type pattern: List
+        :param support: support of the pattern
+        :type support: int
+        :param items: the flat items array of the pattern base
+        :type items: array
+        :param offsets: offsets of the paths in items
+        :type offsets: List
+        :param counts: counts of the paths
+        :type counts: List
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        """
+        self._savePattern(pattern, support)
+        if len(counts) == 1:
+            # a single path: every combination of it has the count of the path
+            if counts[0] >= minSup:
+                for comb in self._all_combinations(list(items)):
+                    self._savePattern(list(comb) + pattern, counts[0])
+            return
+        newTree = self._treeFromBase(items, offsets, counts, minSup)
+        if newTree is not None:
+            self._recursive(newTree, pattern, minSup)
+
+    def _recursive(self, tree, prefix, minSup):
         """
 
          Recursively explores the FP-tree to generate frequent patterns.
 
-         :param root: The root node of the current subtree.
-         :type root: _Node
-         :param itemNode: A dictionary containing information about the nodes associated with each item.
-         :type itemNode: Dict
+         :param tree: The FP-tree or conditional FP-tree to mine.
+         :type tree: _FPTree
+         :param prefix: FP-tree ids of the pattern whose conditional tree is mined.
+         :type prefix: List
          :param minSup: The minimum support threshold.
          :type minSup: int
-         :param patterns: A dictionary to store the generated frequent patterns.
-         :type patterns: Dict
-        """
-        itemNode = {k: v for k, v in sorted(itemNode.items(), key = lambda x: x[1][1])}
-
-        for item in itemNode:
-            if itemNode[item][1] < self._minSup:
-                break 
-
-            newRoot = _Node(root.item + [item], 0, None)
-            # pat = "\t".join([str(i) for i in newRoot.item])
-            # self.__finalPatterns[pat] = itemNode[item][1]
-            self._finalPatterns[tuple(newRoot.item)] = itemNode[item][1]
-            newItemNode = {}
-
-            if len(itemNode[item][0]) == 1:
-                transaction, count = itemNode[item][0].pop().traverse()
-                if len(transaction) == 0:
-                    continue
-                combination = self._all_combinations(transaction)
-                for comb in combination:
-                    # pat = "\t".join([str(i) for i in comb])
-                    # pat = pat + "\t" + "\t".join([str(i) for i in newRoot.item])
-                    # self.__finalPatterns[pat] = count
-                    self._finalPatterns[tuple(list(comb) + newRoot.item)] = count
-                pass
-
-
-            itemCount = {}
-            transactions = {}
-            for node in itemNode[item][0]:
-                transaction, count = node.traverse()
-                if len(transaction) == 0:
-                    continue
-                if tuple(transaction) in transactions:
-                    transactions[tuple(transaction)] += count
-                else:
-                    transactions[tuple(transaction)] = count
-
-
-                for transaction_item in transaction:
-                    if transaction_item in itemCount:
-                        itemCount[transaction_item] += count
-                    else:
-                        itemCount[transaction_item] = count
-
-
-            # remove items that are below minSup
-            itemCount = {k: v for k, v in itemCount.items() if v >= minSup}
-            if len(itemCount) == 0:
-                continue
-
-            for transaction, count in transactions.items():
-                transaction = sorted([item for item in transaction if item in itemCount], key = lambda x: itemCount[x], reverse = True)
-                currNode = newRoot
-                for item_ in transaction:
-                    currNode = currNode.addChild(item_, count)
-                    if item_ in newItemNode:
-                        newItemNode[item_][0].add(currNode)
-                        newItemNode[item_][1] += count
-                    else:
-                        newItemNode[item_] = [set([currNode]), count]
-
-            if len(newItemNode) < 1:
-                continue
-
-            # mine(newRoot, newItemNode, minSup, patterns)
-            self._recursive(newRoot, newItemNode, minSup, patterns)
-
+        """
+        for item in sorted(tree.support, key=tree.support.get):
+            items, offsets, counts = tree.conditionalBase(item)
+            self._mineBase(prefix + [item], tree.support[item], items, offsets, counts, minSup)
+
+    def _groupItems(self, tree, groups):
+        """
+        Splits the header items of the tree into groups of about the same estimated work. The work of an item is
+        estimated by the size of its conditional pattern base, the sum of the depths of its nodes, and the items are
+        assigned largest first to the group with the least work so far.
+
+        :param tree: the FP-tree to mine
+        :type tree: _FPTree
+        :param groups: number of groups
+        :type groups: int
+        :return: the non-empty groups of item ids, largest estimated work first
+        :rtype: List[List[int]]
+        """
+        depth = [0] * len(tree.item)
+        work = {}
+        for node in range(1, len(tree.item)):
+            # a node is always stored after its parent
+            depth[node] = depth[tree.parent[node]] + 1
+            item = tree.item[node]
+            work[item] = work.get(item, 0) + depth[node]
+        heap = [(0, index, []) for index in range(groups)]
+        for item in sorted(work, key=lambda x: (-work[x], x)):
+            load, index, group = _heapq.heappop(heap)
+            group.append(item)
+            _heapq.heappush(heap, (load + work[item], index, group))
+        return [group for load, index, group in sorted(heap, reverse=True) if group]
+
+    def _parallelRecursive(self, tree, minSup):
+        """
+        Mines the header items of the FP-tree in a pool of worker processes. Every task carries the projected
+        conditional pattern bases of one group of items, and only a few tasks per worker are projected ahead of the
+        workers so that the parent does not hold all conditional pattern bases at once.
+
+        :param tree: The FP-tree to mine.
+        :type tree: _FPTree
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        """
+        groups = self._groupItems(tree, self._workers * 4)
+        with _ProcessPoolExecutor(max_workers=self._workers, initializer=_initWorker,
+                                  initargs=(self._itemNames, self._sep)) as pool:
+            pending = set()
+            for group in groups:
+                bases = [(item, tree.support[item]) + tree.conditionalBase(item) for item in group]
+                pending.add(pool.submit(_mineGroup, bases, minSup))
+                if len(pending) >= 2 * self._workers:
+                    done, pending = _wait(pending, return_when=_FIRST_COMPLETED)
+                    for future in done:
+                        self._finalPatterns.update(future.result())
+            for future in pending:
+                self._finalPatterns.update(future.result())
 
     def mine(self) -> None:
         """
@@ -406,6 +595,7 @@ class FPGrowth(_fp._frequentPatterns):
         """
         global _minSup
         self.__startTime = _fp._time.time()
+        self._finalPatterns = self._newPatterns()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
@@ -415,12 +605,18 @@ class FPGrowth(_fp._frequentPatterns):
         _minSup = self._minSup
 
         itemCount = Counter()
-        for line in self.__Database:
-            itemCount.update(line)
+        if isinstance(self.__Database, _fp._EncodedDatabase):
+            itemCount.update(self.__Database.itemSupports())
+        else:
+            for line in self.__Database:
+                itemCount.update(line)
+
+        tree = self._construct(itemCount, self.__Database, self._minSup)
+        if self._workers > 1 and len(tree.support) > 1:
+            self._parallelRecursive(tree, self._minSup)
+        else:
+            self._recursive(tree, [], self._minSup)
 
-        root, itemNode = self._construct(itemCount, self.__Database, self._minSup)
-        self._recursive(root, itemNode, self._minSup, self.__finalPatterns)
-        
         print("Frequent patterns were generated successfully using frequentPatternGrowth algorithm")
         self.__endTime = _fp._time.time()
         self.__memoryUSS = float()
@@ -428,6 +624,7 @@ class FPGrowth(_fp._frequentPatterns):
         process = _fp._psutil.Process(_fp._os.getpid())
         self.__memoryUSS = process.memory_full_info().uss
         self.__memoryRSS = process.memory_info().rss
+        self._closeSink()
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -513,13 +710,13 @@ class FPGrowth(_fp._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._patternsInMemory()
     
     def printResults(self) -> None:
         """
         This function is used to print the results
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
@@ -29,6 +29,7 @@
 # from abc import ABC as _ABC, abstractmethod as _abstractmethod
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
+import math as _math
 import csv as _csv
 import pandas as _pd
 from collections import defaultdict as _defaultdict
@@ -39,6 +40,9 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.encodedDatabase import EncodedDatabase as _EncodedDatabase
+from PAMI.extras.encodedDatabase import usesCache as _usesCache
+from PAMI.extras.patternSinks import MemorySink as _MemorySink
 import functools as _functools
 
 
@@ -49,8 +53,9 @@ class _frequentPatterns(_ABC):
 
     :Attributes:
 
-        iFile : str
-            Input file name or path of the input file
+        iFile : str or DataFrame or EncodedDatabase
+            Input file name or path of the input file. A database parsed once with
+            PAMI.extras.encodedDatabase.EncodedDatabase can be passed to avoid parsing the file again
         minSup: integer or float or str
             The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
@@ -88,13 +93,19 @@ class _frequentPatterns(_ABC):
             This function outputs the total amount of RSS memory consumed by a mining algorithm
         getRuntime()
             This function outputs the total runtime of a mining algorithm
+        mineSweep(minSups)
+            Mines the patterns of several minSup values with a single mining run
+        getSweepStatistics()
+            The function outputs the number of patterns, runtime and memory of every minSup value of the last sweep
+        setSink(sink)
+            Sends the patterns to a file, a callback, a queue or a counter while they are found
 
     """
 
     def __init__(self, iFile, minSup, sep="\t"):
         """
         :param iFile: Input file name or path of the input file
-        :type iFile: str or DataFrame
+        :type iFile: str or DataFrame or EncodedDatabase
         :param minSup: The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
             Otherwise, it will be treated as float.
@@ -113,6 +124,113 @@ class _frequentPatterns(_ABC):
         self._memoryRSS = float()
         self._startTime = float()
         self._endTime = float()
+        self._sweepStatistics = []
+        self._sink = None
+
+    def setSink(self, sink=None):
+        """
+        Choose where the patterns go while they are found. A sink from PAMI.extras.patternSinks, such as a FileSink,
+        CallbackSink, QueueSink or CountingSink, handles every pattern as soon as it is found instead of keeping it, so
+        that getPatterns() is only available with the default in-memory sink.
+
+        :param sink: the sink, or None for the in-memory sink
+        :type sink: PatternSink or MemorySink
+        """
+        self._sink = sink
+        self._finalPatterns = _MemorySink() if sink is None else sink
+
+    def _newPatterns(self):
+        """
+        The container a mining run stores its patterns in: an empty dictionary, or the chosen sink opened for a new
+        run
+
+        :return: the container of the patterns
+        :rtype: dict or PatternSink
+        """
+        if self._sink is None:
+            return {}
+        self._sink.open()
+        return self._sink
+
+    def _closeSink(self):
+        """
+        Tell the sink that the mining process is complete
+        """
+        if not isinstance(self._finalPatterns, dict):
+            self._finalPatterns.close()
+
+    def _patternsInMemory(self):
+        """
+        The patterns of the last mining run
+
+        :return: the patterns
+        :rtype: dict
+        """
+        if not isinstance(self._finalPatterns, dict):
+            raise TypeError("The patterns were sent to a " + type(self._finalPatterns).__name__ +
+                            "; getPatterns() is only available with the in-memory sink")
+        return self._finalPatterns
+
+    @staticmethod
+    def _sweepThreshold(value, databaseSize):
+        """
+        Convert a user specified minSup value into a support count in the same way as the miners do it
+
+        :param value: user specified minSup value
+        :type value: int or float or str
+        :param databaseSize: number of transactions in the database
+        :type databaseSize: int
+        :return: the minimum support count
+        :rtype: int or float
+        """
+        if type(value) is str:
+            value = float(value) if '.' in value else int(value)
+        if type(value) is float:
+            value = databaseSize * value
+        return value
+
+    def mineSweep(self, minSups):
+        """
+        Mine the patterns of several minSup values with a single mining run. The database is parsed once and mined at the
+        lowest threshold; as support is anti-monotone, the patterns of every higher threshold are obtained by filtering
+        the patterns of the lowest one.
+
+        :param minSups: minSup values, each specified either in count or proportion of database size
+        :type minSups: list
+        :return: dictionary mapping every minSup value to its frequent patterns
+        :rtype: dict
+        """
+        self._patternsInMemory()
+        iFile = self._iFile
+        database = _EncodedDatabase.load(iFile, self._sep)
+        thresholds = [self._sweepThreshold(minSup, len(database)) for minSup in minSups]
+        self._iFile = database
+        self._minSup = int(_math.ceil(min(thresholds)))
+        try:
+            self.mine()
+        finally:
+            self._iFile = iFile
+        miningTime = self.getRuntime()
+        patterns = self._patternsInMemory()
+        process = _psutil.Process(_os.getpid())
+        results = {}
+        self._sweepStatistics = []
+        for minSup, threshold in sorted(zip(minSups, thresholds), key=lambda x: x[1]):
+            startTime = _time.time()
+            results[minSup] = {pattern: support for pattern, support in patterns.items() if support >= threshold}
+            self._sweepStatistics.append([minSup, len(results[minSup]), miningTime + _time.time() - startTime,
+                                          process.memory_full_info().uss, process.memory_info().rss])
+        return results
+
+    def getSweepStatistics(self):
+        """
+        Statistics of the last mineSweep() call. The runtime of a threshold is the time of the shared mining run plus the
+        time taken to filter its patterns, and the memory is measured after its patterns were filtered.
+
+        :return: dataframe with the number of patterns, runtime, USS and RSS memory of every minSup value
+        :rtype: pd.DataFrame
+        """
+        return _pd.DataFrame(self._sweepStatistics, columns=['minSup', 'Patterns', 'Runtime', 'MemoryUSS', 'MemoryRSS'])
 
     @_abstractmethod
     def startMine(self):
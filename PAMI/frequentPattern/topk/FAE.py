@@ -144,6 +144,7 @@ class FAE(_ab._frequentPatterns):
     _Database = []
     _tidList = {}
     _minimum = int()
+    _heap = None
 
     def _creatingItemSets(self):
         """
@@ -197,16 +198,13 @@ class FAE(_ab._frequentPatterns):
                 else:
                     candidate[j] += 1
                     self._tidList[j].append(i)
-        self._finalPatterns = {}
         plist = [key for key, value in sorted(candidate.items(), key=lambda x: x[1], reverse=True)]
         self._tidList = {k: frozenset(v) for k, v in self._tidList.items()}
+        self._heap = _ab._TopKHeap(self._k, floor=1)
         for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = candidate[i]
-        self._minimum = min([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
+            self._heap.push(i, candidate[i])
+        self._minimum = self._heap.threshold()
+        plist = list(self._heap.patterns().keys())
         return plist
 
     def _save(self, prefix, suffix, tidSetI):
@@ -230,21 +228,8 @@ class FAE(_ab._frequentPatterns):
         # for i in prefix:
         #     sample = sample + i + "\t"
         sample = "\t".join(prefix)
-        if len(self._finalPatterns) < self._k:
-            if val > self._minimum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._minimum = min([i for i in self._finalPatterns.values()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x_: x_[1]):
-                if val > y:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[sample] = val
-                    self._finalPatterns = {k: v for k, v in
-                                              sorted(self._finalPatterns.items(), key=lambda item: item[1],
-                                                     reverse=True)}
-                    self._minimum = min([i for i in self._finalPatterns.values()])
-                    return
+        self._heap.push(sample, val)
+        self._minimum = self._heap.threshold()
 
     def _Generation(self, prefix, itemSets, tidSets):
         """
@@ -334,6 +319,7 @@ class FAE(_ab._frequentPatterns):
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = self._heap.patterns()
         print(" TopK frequent patterns were successfully generated using FAE algorithm.")
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
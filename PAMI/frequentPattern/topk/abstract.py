@@ -26,6 +26,7 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.topKHeap import TopKHeap as _TopKHeap
 
 
 class _frequentPatterns(_ABC):
@@ -46,60 +46,51 @@ class _FFList:
 
         item: int
             the item name
+        region: str
+            the region of the item
         sumIUtil: float
             the sum of utilities of a fuzzy item in database
         sumRUtil: float
             the sum of resting values of a fuzzy item in database
-        elements: list
-            a list of elements contain tid,Utility and resting values of element in each transaction
+        tidList: FuzzyTidList
+            aligned arrays of the tids, utilities and resting values of the item in each transaction
 
     :Methods:
 
-        addElement(element)
-            Method to add an element to this fuzzy list and update the sums at the same time.
+        setTidList(tidList)
+            Method to set the fuzzy tidlist of this fuzzy list and update the sums at the same time.
         printElement(e)
-            Method to print elements            
+            Method to print elements
 
     """
 
-    def __init__(self, itemName: str, region: str) -> None:
+    def __init__(self, itemName: str, region: str, tidList: _ab._FuzzyTidList = None) -> None:
         self.item = itemName
         self.region = region
         self.sumIUtil = 0.0
         self.sumRUtil = 0.0
-        self.elements = []
+        self.tidList = None
+        if tidList is not None:
+            self.setTidList(tidList)
 
-    def addElement(self, element: 'Element') -> None:
+    def setTidList(self, tidList: _ab._FuzzyTidList) -> None:
         """
-        A Method that add a new element to FFList
+        A Method that sets the fuzzy tidlist of FFList
 
-        :param element: an element to be added to FFList
-        :param element: Element
+        :param tidList: tids, utilities and resting values of the itemSet
+        :type tidList: FuzzyTidList
+        :return: None
         """
+        self.tidList = tidList
+        self.sumIUtil = tidList.support
+        self.sumRUtil = tidList.remainingSupport
 
-        self.sumIUtil += element.IUtils
-        self.sumRUtil += element.RUtils
-        self.elements.append(element)
-
-
-class Element:
-    """
-    A class represents an Element of a fuzzy list
-
-    :Attributes:
-
-        tid : int
-            keep tact of transaction id
-        IUtils: float
-            the utility of a fuzzy item in the transaction
-        RUtil : float
-            the neighbourhood resting value of a fuzzy item in the transaction
-    """
-
-    def __init__(self, tid: int, IUtil: float, RUtil: float) -> None:
-        self.tid = tid
-        self.IUtils = IUtil
-        self.RUtils = RUtil
+    def printElement(self) -> None:
+        """
+        A Method to Print elements in the FFList
+        """
+        for tid, iUtil, rUtil in zip(self.tidList.tids, self.tidList.values, self.tidList.remaining):
+            print(tid, iUtil, rUtil)
 
 
 class _Regions:
@@ -273,8 +264,6 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
             Method generate FFI from prefix
         construct(px, py)
             A function to construct Fuzzy itemSet from 2 fuzzy itemSets
-        findElementWithTID(uList, tid)
-            To find element with same tid as given
         WriteOut(prefix, prefixLen, item, sumIUtil,ratio)
             To Store the patten      
 
@@ -382,30 +371,6 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
         else:
             return compare
 
-    def _findElementWithTID(self, uList: _FFList, tid: int) -> Element:
-        """
-        To find element with same tid as given
-
-        :param uList: fuzzyList
-        :type uList: FFI-List
-        :param tid: transaction id
-        :type tid: int
-        :return: element eith tid as given
-        :rtype: element if exists or None
-        """
-        List_ = uList.elements
-        first = 0
-        last = len(List_) - 1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List_[mid].tid < tid:
-                first = mid + 1
-            elif List_[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List_[mid]
-        return None
-
     def _convert(self, value: Union[int, float, str]) -> float:
         """
         To convert the given user specified value
@@ -537,6 +502,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
                 mapItemsToFFLIST[item] = fuList
                 listOfFFIList.append(fuList)
         listOfFFIList.sort(key=_ab._functools.cmp_to_key(self._compareItems))
+        columns = {item: ([], [], []) for item in mapItemsToFFLIST}
         tid = 0
         for tr in range(len(self._transactions)):
             items = self._transactions[tr]
@@ -570,10 +536,14 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
                 else:
                     remainingUtility = remainUtil
                 if mapItemsToFFLIST.get(pair.item) is not None:
-                    FFListOfItem = mapItemsToFFLIST[pair.item]
-                    element = Element(tid, pair.quantity, remainingUtility)
-                    FFListOfItem.addElement(element)
+                    tids, iUtils, rUtils = columns[pair.item]
+                    tids.append(tid)
+                    iUtils.append(pair.quantity)
+                    rUtils.append(remainingUtility)
             tid += 1
+        for item, fuList in mapItemsToFFLIST.items():
+            fuList.setTidList(_ab._FuzzyTidList(*columns[item]))
+        del columns
         self._FSFIMining(self._itemSetBuffer, 0, listOfFFIList, self._minSup)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -608,6 +578,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
                     Y = FSFIM[j]
                     exULs.append(self._construct(X, Y))
                     self._joinsCnt += 1
+                X.tidList = None
                 self._itemSetBuffer.insert(prefixLen, X)
                 self._FSFIMining(self._itemSetBuffer, prefixLen + 1, exULs, minSup)
 
@@ -622,14 +593,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
         :return :the itemSet of pxy(px and py)
         :rtype :FFI-List
         """
-        pxyUL = _FFList(py.item, py.region)
-        for ex in px.elements:
-            ey = self._findElementWithTID(py, ex.tid)
-            if ey is None:
-                continue
-            eXY = Element(ex.tid, min([ex.IUtils, ey.IUtils], key=lambda x: float(x)), ey.RUtils)
-            pxyUL.addElement(eXY)
-        return pxyUL
+        return _FFList(py.item, py.region, px.tidList.intersect(py.tidList))
 
     def getMemoryUSS(self) -> float:
         """
@@ -39,6 +39,7 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import functools as _functools
+from PAMI.extras.fuzzyTidLists import FuzzyTidList as _FuzzyTidList
 
 
 class _corelatedFuzzyFrequentPatterns(_ABC):
@@ -92,8 +92,7 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
                      - **convert(value)** -- *To convert the given user specified value.*
                      - **compareItems(o1, o2)** -- *A Function that sort all ffi-list in ascending order of Support.*
                      - **FSFIMining(prefix, prefixLen, FSFIM, minSup)** -- *Method generate ffi from prefix.*
-                     - **construct(px, py)** -- *A function to construct Fuzzy itemSet from 2 fuzzy itemSets.*
-                     - **findElementWithTID(uList, tid)** -- *To find element with same tid as given.*
+                     - **dfs(cands)** -- *Extends the candidates depth-first by intersecting their fuzzy tidlists.*
                      - **WriteOut(prefix, prefixLen, item, sumIUtil)** -- *To Store the pattern.*
 
     **Execution methods**
@@ -249,30 +248,29 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
         Perform depth-first search (DFS) to find frequent patterns in a database.
 
         This method recursively combines candidate patterns and calculates their support
-        in the database, storing frequent patterns and their support counts.
+        by intersecting their fuzzy tidlists, storing frequent patterns and their support counts.
+        The tidlists of a level are only referenced by the recursion, so they are freed as soon as
+        the branch that uses them is explored.
 
-        :param cands: List of candidate patterns represented as tuples.
+        :param cands: List of candidate patterns represented as (pattern tuple, fuzzy tidlist) pairs.
         :type cands: list
         :return: None
 
-        This method does not return anything explicitly, but it updates internal
-        attributes `_finalPatterns` and `_Database` with frequent patterns and their
-        support counts.
+        This method does not return anything explicitly, but it updates the internal
+        attribute `_finalPatterns` with frequent patterns and their support counts.
         """
         for i in range(len(cands)):
+            cand, tidList = cands[i]
+            cands[i] = None
             newCands = []
             for j in range(i + 1, len(cands)):
-                newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                # print(items[cands[i]], items[cands[j]])
-                newCandItems = {}
-                keys = self._Database[cands[i]].keys() & self._Database[cands[j]].keys()
-                for k in keys:
-                    newCandItems[k] = min(self._Database[cands[i]][k], self._Database[cands[j]][k])
-                count = sum(newCandItems.values())
+                newCand = tuple(cand + tuple([cands[j][0][-1]]))
+                newTidList = tidList.intersect(cands[j][1])
+                count = newTidList.support
                 if count >= self._minSup:
-                    newCands.append(newCand)
+                    newCands.append((newCand, newTidList))
                     self._finalPatterns[newCand] = count
-                    self._Database[newCand] = newCandItems
+            del tidList
             if len(newCands) > 1:
                 self.dfs(newCands)
 
@@ -281,31 +279,21 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
         Main() function start from here.
         """
         self._startTime = _ab._time.time()
-        items = {}
-        lineNo = 0
         self._creatingItemsets()
 
         self._dbLen = len(self._transactions)
-        for transactions, fuzzyValues in zip(self._transactions, self._fuzzyValues):
-            for item, fuzzyValue in zip(transactions, fuzzyValues):
-                item = tuple([item])
-                if item not in items:
-                    items[item] = {}
-                items[item][lineNo] = fuzzyValue
-            lineNo += 1
+        items = _ab._FuzzyTidList.fromTransactions(zip(transactions, fuzzyValues)
+                                                   for transactions, fuzzyValues in zip(self._transactions, self._fuzzyValues))
 
         self._minSup = self._convert(self._minSup)
-        self._Database = items.copy()
 
-        supports = {k:sum(v.values()) for k,v in items.items()}
-        supports = {k:v for k,v in supports.items() if v >= self._minSup}
-        self._Database = {k:v for k,v in items.items() if k in supports}
-        self._Database = {k:v for k,v in sorted(self._Database.items(), key=lambda x: sum(x[1].values()), reverse=True)}
+        supports = {tuple([k]): v.support for k, v in items.items() if v.support >= self._minSup}
+        self._Database = {tuple([k]): v for k, v in sorted(items.items(), key=lambda x: x[1].support, reverse=True) if tuple([k]) in supports}
+        del items
 
         self._finalPatterns = supports.copy()
 
-        cands = list(self._Database.keys())
-        self.dfs(cands)
+        self.dfs(list(self._Database.items()))
 
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -406,7 +394,6 @@ if __name__ == "__main__":
         if len(_ab._sys.argv) == 4:
             _ap = FFIMiner(_ab._sys.argv[1], _ab._sys.argv[3])
         _ap.mine()
-        _ap.mine()
         print("Total number of Fuzzy-Frequent Patterns:", len(_ap.getPatterns()))
         _ap.save(_ab._sys.argv[2])
         print("Total Memory in USS:", _ap.getMemoryUSS())
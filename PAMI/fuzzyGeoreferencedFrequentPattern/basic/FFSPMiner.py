@@ -69,62 +69,44 @@ class _FFList:
              the sum of utilities of a fuzzy item in database
          sumRUtil : float
              the sum of resting values of a fuzzy item in database
-         elements : list
-             a list of elements contain tid,Utility and resting values of element in each transaction
+         tidList : FuzzyTidList
+             aligned arrays of the tids, utilities and resting values of the item in each transaction
 
     :Methods:
 
-        addElement(element)
-            Method to add an element to this fuzzy list and update the sums at the same time.
+        setTidList(tidList)
+            Method to set the fuzzy tidlist of this fuzzy list and update the sums at the same time.
         printElement(e)
             Method to print elements
 
     """
 
-    def __init__(self, itemName: str) -> None:
+    def __init__(self, itemName: str, tidList: _ab._FuzzyTidList = None) -> None:
         self.item = itemName
         self.sumIUtil = 0.0
         self.sumRUtil = 0.0
-        self.elements = []
+        self.tidList = None
+        if tidList is not None:
+            self.setTidList(tidList)
 
-    def addElement(self, element) -> None:
+    def setTidList(self, tidList: _ab._FuzzyTidList) -> None:
         """
-        A Method that add a new element to FFList
+        A Method that sets the fuzzy tidlist of FFList
 
-        :param element: an element to be added to FFList
-        :param element: Element
+        :param tidList: tids, utilities and resting values of the itemSet
+        :type tidList: FuzzyTidList
         :return: None
         """
-        self.sumIUtil += element.iUtils
-        self.sumRUtil += element.rUtils
-        self.elements.append(element)
+        self.tidList = tidList
+        self.sumIUtil = tidList.support
+        self.sumRUtil = tidList.remainingSupport
 
     def printElement(self) -> None:
         """
         A Method to Print elements in the FFList
         """
-        for ele in self.elements:
-            print(ele.tid, ele.iUtils, ele.rUtils)
-
-
-class _Element:
-    """
-    A class represents an Element of a fuzzy list
-
-    :Attributes:
-
-        tid : int
-            keep tact of transaction id
-        iUtils : float
-            the utility of a fuzzy item in the transaction
-        rUtils : float
-            the neighbourhood resting value of a fuzzy item in the transaction
-    """
-
-    def __init__(self, tid: int, iUtil: float, rUtil: float) -> None:
-        self.tid = tid
-        self.iUtils = iUtil
-        self.rUtils = rUtil
+        for tid, iUtil, rUtil in zip(self.tidList.tids, self.tidList.values, self.tidList.remaining):
+            print(tid, iUtil, rUtil)
 
 
 class _Pair:
@@ -217,8 +199,6 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
             A function to construct Fuzzy itemSet from 2 fuzzy itemSets
         Intersection(neighbourX,neighbourY)
             Return common neighbours of 2 itemSet Neighbours
-        findElementWithTID(uList, tid)
-            To find element with same tid as given
         WriteOut(prefix, prefixLen, item, sumIUtil,period)
             To Store the patten
 
@@ -456,6 +436,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
                 mapItemsToFFLIST[item] = fuList
                 listOfFFList.append(fuList)
         listOfFFList.sort(key=_ab._functools.cmp_to_key(self._compareItems))
+        columns = {item: ([], [], []) for item in mapItemsToFFLIST}
         tid = 0
         for line in range(len(self._transactions)):
             items = self._transactions[line]
@@ -480,10 +461,14 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
                         remainUtil += revisedTransaction[j].quantity
                 remainingUtility = remainUtil
                 if mapItemsToFFLIST.get(pair.item) is not None:
-                    FFListOfItem = mapItemsToFFLIST[pair.item]
-                    element = _Element(tid, pair.quantity, remainingUtility)
-                    FFListOfItem.addElement(element)
+                    tids, iUtils, rUtils = columns[pair.item]
+                    tids.append(tid)
+                    iUtils.append(pair.quantity)
+                    rUtils.append(remainingUtility)
             tid += 1
+        for item, fuList in mapItemsToFFLIST.items():
+            fuList.setTidList(_ab._FuzzyTidList(*columns[item]))
+        del columns
         itemNeighbours = list(self._mapItemNeighbours.keys())
         self._FSFIMining(self._itemSetBuffer, 0, listOfFFList, self._minSup, itemNeighbours)
         self._endTime = _ab._time.time()
@@ -520,6 +505,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
                     if Y.item[0] in newNeighbours:
                         exULs.append(self._construct(X, Y))
                         self._joinsCnt += 1
+                X.tidList = None
                 self._itemSetBuffer.insert(prefixLen, X.item)
                 self._FSFIMining(self._itemSetBuffer, prefixLen + 1, exULs, minSup, newNeighbours)
 
@@ -581,38 +567,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
         :return: the itemSet of pxy(px and py)
         :rtype: FFI-List
         """
-        pxyUL = _FFList(py.item)
-        for ex in px.elements:
-            ey = self._findElementWithTID(py, ex.tid)
-            if ey is None:
-                continue
-            eXY = _Element(ex.tid, min([ex.iUtils, ey.iUtils], key=lambda x: float(x)), ey.rUtils)
-            pxyUL.addElement(eXY)
-        return pxyUL
-
-    def _findElementWithTID(self, uList: _FFList, tid: int) -> _Element:
-        """
-        To find element with same tid as given
-
-        :param uList: fuzzyList
-        :type uList: FFI-List
-        :param tid: transaction id
-        :type tid: int
-        :return: element tid as given
-        :rtype: element if exist or None
-        """
-        List_ = uList.elements
-        first = 0
-        last = len(List_) - 1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List_[mid].tid < tid:
-                first = mid + 1
-            elif List_[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List_[mid]
-        return None
+        return _FFList(py.item, px.tidList.intersect(py.tidList))
 
     def _WriteOut(self, prefix: List, prefixLen: int, item: int, sumIUtil: float) -> None:
         """
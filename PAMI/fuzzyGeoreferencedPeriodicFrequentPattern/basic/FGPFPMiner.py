@@ -66,65 +66,51 @@ class _FFList:
 
          item : int
              the item name
+         isPeriodic : bool
+             whether the maximum period of the itemSet is within maxPer
          sumIUtil : float
              the sum of utilities of a fuzzy item in database
          sumRUtil : float
              the sum of resting values of a fuzzy item in database
-         elements : list
-             a list of elements contain tid,Utility and resting values of element in each transaction
+         tidList : FuzzyTidList
+             aligned arrays of the tids, utilities and resting values of the item in each transaction
 
     :Methods:
 
-        addElement(element)
-            Method to add an element to this fuzzy list and update the sums at the same time.
+        setTidList(tidList)
+            Method to set the fuzzy tidlist of this fuzzy list and update the sums at the same time.
         printElement(e)
             Method to print elements
+
     """
 
-    def __init__(self, itemName):
+    def __init__(self, itemName, tidList=None):
         self.item = itemName
         self.isPeriodic = False
         self.sumIUtil = 0.0
         self.sumRUtil = 0.0
-        self.elements = []
+        self.tidList = None
+        if tidList is not None:
+            self.setTidList(tidList)
 
-    def addElement(self, element):
+    def setTidList(self, tidList):
         """
-        A Method that add a new element to FFList
+        A Method that sets the fuzzy tidlist of FFList
 
-        :param element: an element to be added to FFList
-        :type element: Element
+        :param tidList: tids, utilities and resting values of the itemSet
+        :type tidList: FuzzyTidList
+        :return: None
         """
-        self.sumIUtil += element.iUtils
-        self.sumRUtil += element.rUtils
-        self.elements.append(element)
+        self.tidList = tidList
+        self.sumIUtil = tidList.support
+        self.sumRUtil = tidList.remainingSupport
 
     def printElement(self):
         """
-        A Method to Print elements in the FFList object
+        A Method to Print elements in the FFList
         """
-        for ele in self.elements:
-            print(ele.tid, ele.iUtils, ele.rUtils)
-
-
-class _Element:
-    """
-    A class represents an Element of a fuzzy list
-
-    :Attributes:
-
-        tid : int
-            keep tact of transaction id
-        iUtils : float
-            the utility of a fuzzy item in the transaction
-        rUtils : float
-            the neighbourhood resting value of a fuzzy item in the transaction
-    """
-
-    def __init__(self, tid, iUtil, rUtil):
-        self.tid = tid
-        self.iUtils = iUtil
-        self.rUtils = rUtil
+        for tid, iUtil, rUtil in zip(self.tidList.tids, self.tidList.values, self.tidList.remaining):
+            print(tid, iUtil, rUtil)
 
 
 class _Pair:
@@ -215,8 +201,6 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
             A function to construct Fuzzy itemSet from 2 fuzzy itemSets
         Intersection(neighbourX,neighbourY)
             Return common neighbours of 2 itemSet Neighbours
-        findElementWithTID(uList, tid)
-            To find element with same tid as given
         WriteOut(prefix, prefixLen, item, sumIUtil,period)
             To Store the patten
 
@@ -478,6 +462,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
         del self._itemSupData
         del self._tidList
         listOfFFList.sort(key=_ab._functools.cmp_to_key(self._compareItems))
+        columns = {item: ([], [], []) for item in mapItemsToFFLIST}
         tid = 0
         for j in range(len(self._transactionsDB)):
             item_list = list(set(self._transactionsDB[j]).intersection(set(self._mapItemSum.keys())))
@@ -502,11 +487,15 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
                     remainUtil += float(qaunt[k])
                 del temp
                 remainingUtility = remainUtil
-                FFListObject = mapItemsToFFLIST[pair.item]
-                element = _Element(tid, pair.quantity, remainingUtility)
-                FFListObject.addElement(element)
+                tids, iUtils, rUtils = columns[pair.item]
+                tids.append(tid)
+                iUtils.append(pair.quantity)
+                rUtils.append(remainingUtility)
             del qaunt
             tid += 1
+        for item, fuList in mapItemsToFFLIST.items():
+            fuList.setTidList(_ab._FuzzyTidList(*columns[item]))
+        del columns
         itemNeighbours = list(self._mapItemNeighbours.keys())
         self._FSFIMining(self._itemSetBuffer, 0, listOfFFList, self._minSup, itemNeighbours)
         self._endTime = _ab._time.time()
@@ -543,6 +532,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
                     if _FFListObject2.item in newNeighbourList:
                         exULs.append(self._construct(_FFListObject1, _FFListObject2))
                         self._joinsCnt += 1
+                _FFListObject1.tidList = None
                 self._itemSetBuffer.insert(prefixLen, _FFListObject1.item)
                 self._FSFIMining(self._itemSetBuffer, prefixLen + 1, exULs, minSup, newNeighbourList)
 
@@ -604,54 +594,14 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
         :return :the itemSet of pxy(px and py)
         :rtype :FFI-List
         """
-        recent_occur, first_occur, tid = 0, 0, 0
-        periodlist = []
-        _newFFListObject = _FFList(_FFListObject2.item)
-        for Ob1Element in _FFListObject1.elements:
-            Ob2Element = self._findElementWithTID(_FFListObject2, Ob1Element.tid)
-            if Ob2Element is None:
-                continue
-            tid = Ob1Element.tid
-            if len(periodlist) == 0:
-                periodlist.append(abs(first_occur - tid))
-                recent_occur = tid
-            else:
-                periodlist.append(tid - recent_occur)
-                recent_occur = tid
-            newElement = _Element(Ob1Element.tid, min([Ob1Element.iUtils, Ob2Element.iUtils], key=lambda x: float(x)),
-                                  Ob2Element.rUtils)
-            _newFFListObject.addElement(newElement)
-
-        if periodlist and int(self._maxPer) >= max(periodlist):
+        _newFFListObject = _FFList(_FFListObject2.item, _FFListObject1.tidList.intersect(_FFListObject2.tidList))
+        periodlist = _newFFListObject.tidList.periods()
+        if len(periodlist) > 0 and int(self._maxPer) >= periodlist.max():
             _newFFListObject.isPeriodic = True
         else:
             _newFFListObject.isPeriodic = False
         return _newFFListObject
 
-    def _findElementWithTID(self, uList, tid):
-        """
-        To find element with same tid as given
-
-        :param uList:fuzzyList
-        :type uList:FFI-List
-        :param tid:transaction id
-        :type tid:int
-        :return:element tid as given
-        :rtype: element if exist or None
-        """
-        List = uList.elements
-        first = 0
-        last = len(List) - 1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List[mid].tid < tid:
-                first = mid + 1
-            elif List[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List[mid]
-        return None
-
     def _WriteOut(self, prefix, prefixLen, _FFListObject, sumIUtil):
         """
         To Store the patten
@@ -72,6 +72,7 @@ from deprecated import deprecated
 class _FFList:
     """
     A class represent a Fuzzy List of an element
+
     :Attributes:
 
         item : int
@@ -80,70 +81,47 @@ class _FFList:
             the sum of utilities of a fuzzy item in database
         sumRUtil : float
             the sum of resting values of a fuzzy item in database
-        elements : list
-            list of elements contain tid,Utility and resting values of element in each transaction
         maxPeriod : int
             it represents the max period of a item
+        tidList : FuzzyTidList
+            aligned arrays of the tids, utilities and resting values of the item in each transaction
 
     :Methods:
 
-        addElement(element)
-            Method to add an element to this fuzzy list and update the sums at the same time.
+        setTidList(tidList)
+            Method to set the fuzzy tidlist of this fuzzy list and update the sums at the same time.
         printElement(e)
             Method to print elements
 
     """
 
-    def __init__(self, itemName: str) -> None:
+    def __init__(self, itemName: str, tidList: _ab._FuzzyTidList = None) -> None:
         self.item = itemName
         self.sumLUtil = 0.0
         self.sumRUtil = 0.0
-        self.elements = []
         self.maxPeriod = 0
+        self.tidList = None
+        if tidList is not None:
+            self.setTidList(tidList)
 
-    def addElement(self, element) -> None:
+    def setTidList(self, tidList: _ab._FuzzyTidList) -> None:
         """
-        A Method that add a new element to FFList
+        A Method that sets the fuzzy tidlist of FFList
 
-        :param element: an element to be added to FFList
-        :type element: Element
+        :param tidList: tids, utilities and resting values of the itemSet
+        :type tidList: FuzzyTidList
         :return: None
         """
-        self.sumLUtil += element.lUtils
-        self.sumRUtil += element.rUtils
-        self.elements.append(element)
-        self.maxPeriod = max(self.maxPeriod, element.period)
+        self.tidList = tidList
+        self.sumLUtil = tidList.support
+        self.sumRUtil = tidList.remainingSupport
 
     def printElement(self) -> None:
         """
         A Method to Print elements in the FFList
-        :return: None
         """
-        for ele in self.elements:
-            print(ele.tid, ele.lUtils, ele.rUtils, ele.period)
-
-
-class _Element:
-    """
-        A class represents an Element of a fuzzy list
-
-        :Attributes:
-
-        tid : int
-            keep tact of transaction id
-        lUtils: float
-            the utility of a fuzzy item in the transaction
-        rUtils : float
-            the resting value of a fuzzy item in the transaction
-        period: int
-            represent the period of the element
-    """
-
-    def __init__(self, tid: int, iUtil: float, rUtil: float, period: int) -> None:
-        self.tid = tid
-        self.lUtils = iUtil
-        self.rUtils = rUtil
-        self.period = period
+        for tid, iUtil, rUtil in zip(self.tidList.tids, self.tidList.values, self.tidList.remaining):
+            print(tid, iUtil, rUtil)
 
 
 class _Pair:
@@ -241,8 +219,6 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
             Method generate FFI from prefix
         construct(px, py)
             A function to construct Fuzzy itemSet from 2 fuzzy itemSets
-        findElementWithTID(UList, tid)
-            To find element with same tid as given
         WriteOut(prefix, prefixLen, item, sumIUtil,period)
             To Store the patten
 
@@ -465,6 +441,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
                 listOfFFIList.append(fUList)
                 lastTIDs[item] = tid
         listOfFFIList.sort(key=_ab._functools.cmp_to_key(self._compareItems))
+        columns = {item: ([], [], []) for item in mapItemsToFFLIST}
         for line in range(len(self._transactions)):
             tid = int(self._ts[line])
             items = self._transactions[line]
@@ -490,16 +467,22 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
                     remainingUtility = remainUtil
                 if mapItemsToFFLIST.get(tuple([pair.item])) is not None:
                     FFListOfItem = mapItemsToFFLIST[tuple([pair.item])]
-                    if len(FFListOfItem.elements) == 0:
-                        element = _Element(tid, pair.quantity, remainingUtility, 0)
+                    tids, lUtils, rUtils = columns[tuple([pair.item])]
+                    if len(tids) == 0:
+                        period = 0
                     else:
                         if lastTIDs[pair.item] == tid:
-                            element = _Element(tid, pair.quantity, remainingUtility, maxTID - tid)
+                            period = maxTID - tid
                         else:
-                            lastTid = FFListOfItem.elements[-1].tid
-                            curPer = tid - lastTid
-                            element = _Element(tid, pair.quantity, remainingUtility, curPer)
-                    FFListOfItem.addElement(element)
+                            lastTid = tids[-1]
+                            period = tid - lastTid
+                    FFListOfItem.maxPeriod = max(FFListOfItem.maxPeriod, period)
+                    tids.append(tid)
+                    lUtils.append(pair.quantity)
+                    rUtils.append(remainingUtility)
+        for item, fUList in mapItemsToFFLIST.items():
+            fUList.setTidList(_ab._FuzzyTidList(*columns[item]))
+        del columns
         self._FPFPMining(self._itemSetBuffer, 0, listOfFFIList)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -530,6 +513,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
                     Y = fsFim[j]
                     exULs.append(self._construct(X, Y))
                     self._joinsCnt += 1
+                X.tidList = None
                 self._itemSetBuffer.insert(prefixLen, X.item)
                 self._FPFPMining(self._itemSetBuffer, prefixLen + 1, exULs)
 
@@ -572,41 +556,11 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
         :return :the item set of pxy(px and py)
         :rtype :FFI-List
         """
-        pxyUL = _FFList(py.item)
-        prev = 0
-        for ex in px.elements:
-            ey = self._findElementWithTID(py, ex.tid)
-            if ey is None:
-                continue
-            eXY = _Element(ex.tid, min([ex.lUtils, ey.lUtils], key=lambda x: float(x)), ey.rUtils, ex.tid - prev)
-            pxyUL.addElement(eXY)
-            prev = ex.tid
+        pxyUL = _FFList(py.item, px.tidList.intersect(py.tidList))
+        if len(pxyUL.tidList) > 0:
+            pxyUL.maxPeriod = max(0, int(pxyUL.tidList.periods().max()))
         return pxyUL
 
-    def _findElementWithTID(self, UList, tid) -> _Element:
-        """
-        To find element with same tid as given
-
-        :param UList: fuzzy list
-        :type UList: FFI-List
-        :param tid:transaction id
-        :type tid: int
-        :return: element eith tid as given
-        :rtype: element if exist or None
-        """
-        List_ = UList.elements
-        first = 0
-        last = len(List_) - 1
-        while first <= last:
-            mid = (first + last) >> 1
-            if List_[mid].tid < tid:
-                first = mid + 1
-            elif List_[mid].tid > tid:
-                last = mid - 1
-            else:
-                return List_[mid]
-        return None
-
     def _WriteOut(self, prefix: List[int], prefixLen: int, item: int, sumLUtil: float, period: int) -> None:
         """
         To Store the patten
@@ -25,6 +25,7 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.neighbourhoodIndex import NeighbourhoodIndex as _NeighbourhoodIndex
 
 
 class _geoReferencedPeriodicFrequentPatterns(_ABC):
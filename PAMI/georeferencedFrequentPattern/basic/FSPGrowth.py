@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.georeferencedFrequentPattern.basic import abstract as _ab
-from typing import List, Dict,Union
+from typing import Union
 from deprecated import deprecated
 
 class _Node:
@@ -153,14 +153,13 @@ class _Tree:
         :param item: Item to check conditional pattern
         :type item: str
         :param neighbour: Neighbour to check conditional pattern
-        :type neighbour: dict
+        :type neighbour: NeighbourhoodIndex
         :return: Tree
         """
         pTree = _Tree()
         for node in self.nodeLink[item]:
-            # print(node.item, neighbour[node.item])
             if node.item in neighbour:
-                node.prefix = [item for item in node.prefix if item in neighbour.get(node.item)]
+                node.prefix = neighbour.select(node.prefix, neighbour.neighbourMask(node.item))
             pTree.createTree(node.prefix, node.count)
         return pTree
 
@@ -213,7 +212,7 @@ class _Tree:
         :param minSup: Minimum Support to get patterns
         :type minSup: int
         :param neighbour: Neighbour item to consider in the pattern
-        :type neighbour: dict
+        :type neighbour: NeighbourhoodIndex
         :return: Pattern list
         :rtype: list
         """
@@ -231,14 +230,14 @@ class _Tree:
             frequentPatterns.extend(pTree.getPattern(i, pattern, minSup, neighbour))
         return frequentPatterns
 
-    def mining(self, minSup: Union[int, float], neighbourhood: Dict[int, List[int]] = None):
+    def mining(self, minSup: Union[int, float], neighbourhood: _ab._NeighbourhoodIndex = None):
         """
         Pattern mining on your own
 
         :param minSup: Minimum Support for your pattern for Mining
         :type minSup: int or float
-        :param neighbourhood: function
-        :type neighbourhood: dict
+        :param neighbourhood: neighbours of the items as bitsets
+        :type neighbourhood: NeighbourhoodIndex
         :return: list
         """
         frequentPatterns = []
@@ -526,7 +525,7 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
         self._getFrequentItems()
         self._sortTransaction()
         _FPTree = self._createFPTree()
-        self._finalPatterns.update(dict(_FPTree.mining(self._minSup, self._neighbourList)))
+        self._finalPatterns.update(dict(_FPTree.mining(self._minSup, _ab._NeighbourhoodIndex(self._neighbourList))))
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -133,8 +133,8 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
             It will generate the combinations of frequent items from a list of items
         convert(value)
             To convert the given user specified value    
-        getNeighbourItems(keySet)
-            A function to get common neighbours of a itemSet
+        getNeighbourMask(keySet)
+            A function to get the common neighbours of a itemSet as a bitset
         mapNeighbours(file)
             A function to map items to their neighbours
 
@@ -204,6 +204,7 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
     def __init__(self, iFile, nFile, minSup, sep="\t"):
         super().__init__(iFile, nFile, minSup, sep)
         self._NeighboursMap = {}
+        self._neighbourhood = None
 
     def _creatingItemSets(self):
         """
@@ -305,10 +306,10 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
         tidList = {}
         key = list(cList.keys())
         for i in range(0, len(key)):
-            NeighboursItems = self._getNeighbourItems(key[i])
+            neighboursMask = self._getNeighbourMask(key[i])
             for j in range(i + 1, len(key)):
                 # print(c[key[i]],c[key[j]])
-                if not key[j] in NeighboursItems:
+                if not self._neighbourhood.contains(neighboursMask, key[j]):
                     continue
                 intersectionList = list(set(cList[key[i]]).intersection(set(cList[key[j]])))
                 itemList = []
@@ -335,9 +336,9 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
         else:
             key = list(tidList.keys())
             for i in range(0, len(key)):
-                NeighboursItems = self._getNeighbourItems(key[i])
+                neighboursMask = self._getNeighbourMask(key[i])
                 for j in range(i + 1, len(key)):
-                    if not key[j] in NeighboursItems:
+                    if not self._neighbourhood.contains(neighboursMask, key[j]):
                         continue
                     intersectionList = list(set(tidList[key[i]]).intersection(set(tidList[key[j]])))
                     itemList = []
@@ -348,27 +349,18 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
 
         return tidList1
 
-    def _getNeighbourItems(self, keySet):
+    def _getNeighbourMask(self, keySet):
         """
-        A function to get Neighbours of a item
+        A function to get the common neighbours of an itemSet as a bitset
 
         :param keySet: itemSet
         :type keySet: str or tuple
-        :return: set of common neighbours
-        :rtype: set
+        :return: bitset of the common neighbours that have neighbours of their own
+        :rtype: int
         """
-        itemNeighbours = self._NeighboursMap.keys()
         if isinstance(keySet, str):
-            if self._NeighboursMap.get(keySet) is None:
-                return []
-            itemNeighbours = list(set(itemNeighbours).intersection(set(self._NeighboursMap.get(keySet))))
-        if isinstance(keySet, tuple):
-            keySet = list(keySet)
-            # print(keySet)
-            for j in range(0, len(keySet)):
-                i = keySet[j]
-                itemNeighbours = list(set(itemNeighbours).intersection(set(self._NeighboursMap.get(i))))
-        return itemNeighbours
+            keySet = (keySet,)
+        return self._neighbourhood.commonMask(keySet)
 
     def _mapNeighbours(self):
         """
@@ -407,6 +399,7 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
                 except IOError:
                     print("File Not Found")
                     quit()
+        self._neighbourhood = _ab._NeighbourhoodIndex(self._NeighboursMap)
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
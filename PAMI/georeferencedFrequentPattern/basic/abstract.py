@@ -39,6 +39,7 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 from collections import OrderedDict as _OrderedDict
+from PAMI.extras.neighbourhoodIndex import NeighbourhoodIndex as _NeighbourhoodIndex
 
 
 class _spatialFrequentPatterns(_ABC):
@@ -118,6 +118,8 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
             To store the datas in same sequence separated by sequence, rownumber, length.
         _NeighboursMap : dict
             To store the neighbors
+        _neighbourhood : NeighbourhoodIndex
+            To store the neighbors of every item as a bitset
         _failPatterns : dict
             To store the failed patterns
 
@@ -233,6 +235,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
     _xLenDatabase = {}
     _xLenDatabaseSame = {}
     _NeighboursMap = {}
+    _neighbourhood = None
     _failPatterns = {}
 
     def _creatingItemSets(self):
@@ -353,6 +356,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
                 except IOError:
                     print("File Not Found")
                     quit()
+        self._neighbourhood = _ab._NeighbourhoodIndex(self._NeighboursMap)
 
     def Prune(self, startline):
         """
@@ -429,8 +433,8 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
             keyNumber += 1
             for key2 in keyList[keyNumber:]:
                 if key1 != key2:
-                    if key1 in self._NeighboursMap.keys() and key2 in self._NeighboursMap.keys():
-                        if key1 in self._NeighboursMap[key2]:
+                    if key1 in self._neighbourhood and key2 in self._neighbourhood:
+                        if self._neighbourhood.isNeighbour(key2, key1):
 
                             if len(self._Database[key1].keys()) >= len(self._Database[key1].keys()):
                                 nextDatabase[key1][key2] = {}
@@ -532,7 +536,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
 
         for latestWord2 in self._xLenDatabase[rowLen][bs].keys():
             if latestWord != latestWord2:
-                if latestWord in self._NeighboursMap[latestWord2]:
+                if self._neighbourhood.isNeighbour(latestWord2, latestWord):
                     nextRow, nextbs, nextlate = self.makeNextRowSame3(bs, latestWord, latestWord2)
                     if self.Prune(list(nextRow)) == 1:
                         self.makeSame(rowLen, bs, latestWord, latestWord2)
@@ -566,7 +570,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
                     self._failPatterns[str(nextRow)] = len(_next)
         if bs in self._xLenDatabaseSame[rowLen]:
             for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
-                if latestWord in self._NeighboursMap[latestWord2]:
+                if self._neighbourhood.isNeighbour(latestWord2, latestWord):
                     nextRow, nextbs = self.makeNextRowSame(bs, latestWord2, latestWord)
                     if self.Prune(nextRow) == 1:
                         self.makeSame2(rowLen, bs, latestWord, latestWord2)
@@ -921,7 +925,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
             self._xLenDatabaseSame[rowLen + 1] = {}
         if bs in self._xLenDatabase[rowLen]:
             for latestWord2 in self._xLenDatabase[rowLen][bs]:
-                if latestWord in self._NeighboursMap[latestWord2]:
+                if self._neighbourhood.isNeighbour(latestWord2, latestWord):
                     nextRow, nextbs = self.makeNextRowSame(bs, latestWord, latestWord2)
                     if self.Prune(nextRow) == 1:
                         self.makeSame2(rowLen, bs, latestWord2, latestWord)
@@ -929,7 +933,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
         if bs in self._xLenDatabaseSame[rowLen]:
             for latestWord2 in self._xLenDatabaseSame[rowLen][bs]:
                 if latestWord2 != latestWord:
-                    if latestWord in self._NeighboursMap[latestWord2]:
+                    if self._neighbourhood.isNeighbour(latestWord2, latestWord):
                         nextRow, nextbs, nextLate = self.makeNextRowSame2(bs, latestWord, latestWord2)
                         if self.Prune(nextRow) == 1:
                             self.makeSame3(rowLen, bs, latestWord, latestWord2)
@@ -132,8 +132,8 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
             Generating one frequent patterns
         convert(value):
             To convert the given user specified value
-        getNeighbourItems(keySet)
-            A function to get common neighbours of a itemSet
+        getNeighbourMask(keySet)
+            A function to get the common neighbours of a itemSet as a bitset
         mapNeighbours(file)
             A function to map items to their neighbours
 
@@ -203,6 +203,7 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
     def __init__(self, iFile, nFile, minPS, maxIAT, sep="\t"):
         super().__init__(iFile, nFile, minPS, maxIAT,  sep)
         self._NeighboursMap = {}
+        self._neighbourhood = None
 
     def _creatingItemSets(self):
         """
@@ -366,26 +367,18 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
             self._Generation(newprefix, classItemSets, classTidSets)
             self._save(prefix, list(set(itemSetX)), tidSetX)
 
-    def _getNeighbourItems(self, keySet):
+    def _getNeighbourMask(self, keySet):
         """
-        A function to get Neighbours of an item
+        A function to get the common neighbours of an itemSet as a bitset
 
         :param keySet: itemSet
         :type keySet: str or tuple
-        :return: set of common neighbours
-        :rtype: set
+        :return: bitset of the common neighbours that have neighbours of their own
+        :rtype: int
         """
-        itemNeighbours = self._NeighboursMap.keys()
         if isinstance(keySet, str):
-            if self._NeighboursMap.get(keySet) is None:
-                return []
-            itemNeighbours = list(set(itemNeighbours).intersection(set(self._NeighboursMap.get(keySet))))
-        if isinstance(keySet, tuple):
-            keySet = list(keySet)
-            for j in range(0, len(keySet)):
-                i = keySet[j]
-                itemNeighbours = list(set(itemNeighbours).intersection(set(self._NeighboursMap.get(i))))
-        return itemNeighbours
+            keySet = (keySet,)
+        return self._neighbourhood.commonMask(keySet)
 
     def mapNeighbours(self):
         """
@@ -421,6 +414,7 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
                 except IOError:
                     print("File Not Found")
                     quit()
+        self._neighbourhood = _ab._NeighbourhoodIndex(self._NeighboursMap)
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -450,9 +444,9 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
             itemSetX = [itemX]
             itemSets = []
             tidSets = []
-            neighboursItems = self._getNeighbourItems(plist[i])
+            neighboursMask = self._getNeighbourMask(plist[i])
             for j in range(i + 1, len(plist)):
-                if not plist[j] in neighboursItems:
+                if not self._neighbourhood.contains(neighboursMask, plist[j]):
                     continue
                 itemJ = plist[j]
                 tidSetJ = self._tidList[itemJ]
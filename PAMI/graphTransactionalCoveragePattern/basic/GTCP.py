@@ -30,13 +30,12 @@
 
 from bitarray import bitarray
 from PAMI.subgraphMining.basic import gspan as gsp
-from PAMI.extras.stats import graphDatabase as gdb
 from PAMI.graphTransactionalCoveragePattern.basic import abstract as _ab
 
 class GTCP:
     def __init__(self,iFile,minsup,minGTC,minGTPC,maxOR=0.2):
         """
-            iFile : input file
+            iFile : input file, or a directory written by PAMI.extras.encodedGraphDatabase
             minsup : Minimum support 
             minGTC : Minimum Graph transaction coverage
             minGTPC : Minimum graph pattern coverage 
@@ -59,10 +58,10 @@ class GTCP:
         self.maxOR=maxOR
         self.minGTC=minGTC 
         self.minGTPC=minGTPC
-        gdb_obj=gdb.graphDatabase(self.iFile)
-        self.numGraphs=len(gdb_obj.graphs)
         gsp_obj = gsp.GSpan(self.iFile, minsup, outputSingleVertices=False, maxNumberOfEdges=float('inf'), outputGraphIds=True)
         gsp_obj.mine()
+        # the graphs are read once, by gSpan, which also accepts a database converted with PAMI.extras.encodedGraphDatabase
+        self.numGraphs=gsp_obj.graphCount
         self.Sf=gsp_obj.getSubgraphGraphMapping()
         self.GetFIDBasedFlatTransactions()
         print("Subgraph mining completed")
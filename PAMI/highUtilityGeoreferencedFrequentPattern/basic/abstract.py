@@ -38,6 +38,7 @@ import os as _os
 import os.path as _ospath
 import psutil as _psutil
 import sys as _sys
+from PAMI.extras.neighbourhoodIndex import NeighbourhoodIndex as _NeighbourhoodIndex
 
 
 class _utilityPatterns(_ABC):
@@ -363,6 +363,10 @@ class EFIM(_ab._utilityPatterns):
             keep only the promising items ie items having local utility values greater than or equal to minUtil
         itemsToExplore: list
             list of items that have subtreeUtility value greater than or equal to minUtil
+        items: array
+            the items of all the transactions, one transaction after the other, in ascending order inside a transaction
+        utilities: array
+            the utilities of the items, at the same positions as in items
 
     :Methods :
 
@@ -380,14 +384,14 @@ class EFIM(_ab._utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        backTrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
+        backTrackingEFIM(starts, ends, prefixUtilities, itemsToKeep, itemsToExplore, prefixLength)
                A method to mine the HUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep)
+        useUtilityBinArraysToCalculateUpperBounds(starts, ends, prefixUtilities, remainingUtilities, j, itemsToKeep)
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method to output a high-utility itemSet to file or memory depending on what the user chose
-        is_equal(transaction1, transaction2)
-               A method to Check if two transaction are identical
+        buildTransactionStore(transactions)
+               A method to store the transactions in flat item and utility arrays
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               A method to calculate the sub tree utility values for single items
         sortDatabase(self, transactions)
@@ -492,6 +496,8 @@ class EFIM(_ab._utilityPatterns):
         self._lno = 0
         self._memoryUSS = float()
         self._memoryRSS = float()
+        self._items = _ab.array('i')
+        self._utilities = _ab.array('q')
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self) -> None:
@@ -534,7 +540,10 @@ class EFIM(_ab._utilityPatterns):
         for item in itemsToKeep:
             if self._utilityBinArraySU[item] >= self._minUtil:
                 itemsToExplore.append(item)
-        self._backTrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        starts, ends = self._buildTransactionStore(self._dataset.getTransactions())
+        self._backTrackingEFIM(starts, ends, [0] * len(starts), itemsToKeep, itemsToExplore, 0)
+        self._items = _ab.array('i')
+        self._utilities = _ab.array('q')
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -543,11 +552,36 @@ class EFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility patterns were generated successfully using EFIM algorithm")
 
-    def _backTrackingEFIM(self, transactionsOfP: list, itemsToKeep: list, itemsToExplore: list, prefixLength: int) -> None:
-        """
-        A method to mine the HUIs Recursively
-        :param transactionsOfP: the list of transactions containing the current prefix P
-        :type transactionsOfP: list
+    def _buildTransactionStore(self, transactions: list) -> Tuple[list, list]:
+        """
+        A method to store the transactions one after the other in flat item and utility arrays
+        :param transactions: the sorted transactions of the database
+        :type transactions: list
+        :return: the start and end position of every transaction in the arrays
+        :rtype: tuple
+        """
+        self._items = _ab.array('i')
+        self._utilities = _ab.array('q')
+        starts = []
+        ends = []
+        for transaction in transactions:
+            starts.append(len(self._items))
+            self._items.extend(transaction.getItems())
+            self._utilities.extend(transaction.getUtilities())
+            ends.append(len(self._items))
+        return starts, ends
+
+    def _backTrackingEFIM(self, starts: list, ends: list, prefixUtilities: list, itemsToKeep: list, itemsToExplore: list, prefixLength: int) -> None:
+        """
+        A method to mine the HUIs Recursively. A projected database is a list of windows over the transaction
+        store. Projected transactions with the same items are merged: the first one is copied to the end of the
+        store, where the utilities of the others are added, and the copies are dropped when backtracking.
+        :param starts: the start position of every transaction containing the current prefix P
+        :type starts: list
+        :param ends: the end position of every transaction containing the current prefix P
+        :type ends: list
+        :param prefixUtilities: the utility of P in every transaction
+        :type prefixUtilities: list
         :param itemsToKeep: the list of secondary items in the p-projected database
         :type itemsToKeep: list
         :param itemsToExplore: the list of primary items in the p-projected database
@@ -556,61 +590,51 @@ class EFIM(_ab._utilityPatterns):
         :type prefixLength: int
         :return: None
         """
+        items, utilities = self._items, self._utilities
         self._candidateCount += len(itemsToExplore)
         for idx, e in enumerate(itemsToExplore):
-            transactionsPe = []
+            mark = len(items)
+            startsPe = []
+            endsPe = []
+            prefixUtilitiesPe = []
+            remainingUtilitiesPe = []
+            positionsOfSuffixes = {}
             utilityPe = 0
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
+            for start, end, prefixUtility in zip(starts, ends, prefixUtilities):
+                positionE = _ab._bisectLeft(items, e, start, end)
+                if positionE == end or items[positionE] != e:
+                    continue
+                prefixUtilityPe = prefixUtility + utilities[positionE]
+                utilityPe += prefixUtilityPe
+                positionE += 1
+                if positionE == end:
+                    continue
+                suffix = items[positionE:end].tobytes()
+                remainingUtility = sum(utilities[positionE:end])
+                k = positionsOfSuffixes.get(suffix)
+                if k is None:
+                    positionsOfSuffixes[suffix] = len(startsPe)
+                    startsPe.append(positionE)
+                    endsPe.append(end)
+                    prefixUtilitiesPe.append(prefixUtilityPe)
+                    remainingUtilitiesPe.append(remainingUtility)
+                    continue
+                target = startsPe[k]
+                if target < mark:
+                    startsPe[k] = len(items)
+                    items.extend(items[target:endsPe[k]])
+                    utilities.extend(utilities[target:endsPe[k]])
+                    endsPe[k] = len(items)
+                    target = startsPe[k]
+                for position in range(positionE, end):
+                    utilities[target] += utilities[position]
+                    target += 1
+                prefixUtilitiesPe[k] += prefixUtilityPe
+                remainingUtilitiesPe[k] += remainingUtility
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil:
                 self._output(prefixLength, utilityPe)
-            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep)
+            self._useUtilityBinArraysToCalculateUpperBounds(startsPe, endsPe, prefixUtilitiesPe, remainingUtilitiesPe, idx, itemsToKeep)
             newItemsToKeep = []
             newItemsToExplore = []
             for l in range(idx + 1, len(itemsToKeep)):
@@ -620,14 +644,22 @@ class EFIM(_ab._utilityPatterns):
                     newItemsToKeep.append(itemK)
                 elif self._utilityBinArrayLU[itemK] >= self._minUtil:
                     newItemsToKeep.append(itemK)
-            if len(transactionsPe) != 0:
-                self._backTrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+            if len(startsPe) != 0:
+                self._backTrackingEFIM(startsPe, endsPe, prefixUtilitiesPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
+            del items[mark:]
+            del utilities[mark:]
 
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: list, j: int, itemsToKeep: list) -> None:
+    def _useUtilityBinArraysToCalculateUpperBounds(self, starts: list, ends: list, prefixUtilities: list, remainingUtilities: list, j: int, itemsToKeep: list) -> None:
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
-        :param transactionsPe: transactions the projected database for P U {e}
-        :type transactionsPe: list
+        :param starts: the start position of every transaction of the projected database for P U {e}
+        :type starts: list
+        :param ends: the end position of every transaction of the projected database for P U {e}
+        :type ends: list
+        :param prefixUtilities: the utility of P U {e} in every transaction
+        :type prefixUtilities: list
+        :param remainingUtilities: the utility of the items after e in every transaction
+        :type remainingUtilities: list
         :param j:the position of j in the list of promising items
         :type j:int
         :param itemsToKeep :the list of promising items
@@ -638,16 +670,18 @@ class EFIM(_ab._utilityPatterns):
             item = itemsToKeep[i]
             self._utilityBinArrayLU[item] = 0
             self._utilityBinArraySU[item] = 0
-        for transaction in transactionsPe:
-            sumRemainingUtility = 0
-            i = len(transaction.getItems()) - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    sumRemainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += sumRemainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
+        keep = set(itemsToKeep)
+        items, utilities = self._items, self._utilities
+        utilityBinArrayLU, utilityBinArraySU = self._utilityBinArrayLU, self._utilityBinArraySU
+        for start, end, prefixUtility, remainingUtility in zip(starts, ends, prefixUtilities, remainingUtilities):
+            sumRemainingUtility = prefixUtility
+            localUtility = remainingUtility + prefixUtility
+            for position in range(end - 1, start - 1, -1):
+                item = items[position]
+                if item in keep:
+                    sumRemainingUtility += utilities[position]
+                    utilityBinArraySU[item] += sumRemainingUtility
+                    utilityBinArrayLU[item] += localUtility
 
     def _output(self, tempPosition: int, utility: int) -> None:
         """
@@ -666,29 +700,6 @@ class EFIM(_ab._utilityPatterns):
                 s1 += "\t"
         self._finalPatterns[s1] = str(utility)
 
-    def _isEqual(self, transaction1: '_Transaction', transaction2: '_Transaction') -> bool:
-        """
-         A method to Check if two transaction are identical
-         :param  transaction1: the first transaction
-         :type  transaction1: Trans
-         :param  transaction2:    the second transaction
-         :type  transaction2: Trans
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
     def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: '_Dataset') -> None:
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
@@ -715,8 +726,8 @@ class EFIM(_ab._utilityPatterns):
         :type transactions: Transaction
         :return: None
         """
-        cmp_items = _ab._functools.cmp_to_key(self.sort_transaction)
-        transactions.sort(key=cmp_items)
+        # the same order as sort_transaction: descending on the items read from the end, a shorter transaction first
+        transactions.sort(key=lambda transaction: tuple(-item for item in reversed(transaction.getItems())))
 
     def sort_transaction(self, trans1: '_Transaction', trans2: '_Transaction') -> int:
         """
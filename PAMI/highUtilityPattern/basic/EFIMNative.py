@@ -0,0 +1,305 @@
+# EFIMNative runs the compiled EFIM search of efim.cpp, and falls back to the python EFIM when the extension is not built.
+#
+# The extension is built with:
+#
+#             python setup.py build_ext --inplace
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.highUtilityPattern.basic import EFIMNative as alg
+#
+#             obj=alg.EFIMNative("input.txt",35)
+#
+#             obj.mine()
+#
+#             Patterns = obj.getPatterns()
+#
+#             print("Total number of high utility Patterns:", len(Patterns))
+#
+#             obj.save("output")
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+from PAMI.highUtilityPattern.basic import abstract as _ab
+from PAMI.highUtilityPattern.basic.EFIM import EFIM as _EFIM
+from deprecated import deprecated
+
+try:
+    from PAMI.highUtilityPattern.basic import _efimNative
+except ImportError:
+    _efimNative = None
+
+
+class EFIMNative(_ab._utilityPatterns):
+    """
+    :Description:   EFIMNative mines High Utility ItemSets with the compiled EFIM of efim.cpp. When the extension is not
+                    built, or the input cannot be read by it, the python EFIM is used instead. Both return the same
+                    patterns.
+
+    :Reference:      Zida, S., Fournier-Viger, P., Lin, J.CW. et al. EFIM: a fast and memory efficient algorithm for
+                    high-utility itemset mining. Knowl Inf Syst 51, 595–625 (2017). https://doi.org/10.1007/s10115-016-0986-0
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of High Utility patterns
+    :param  oFile: str :
+                   Name of the output file to store complete set of High Utility patterns
+    :param minUtil: int :
+                   The user given minUtil value.
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+
+    :Attributes:
+
+        iFile : file
+            Name of the input file to mine complete set of high utility patterns
+        oFile : file
+            Name of the output file to store complete set of high utility patterns
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+        memoryUSS : float
+            To store the total amount of USS memory consumed by the program
+        startTime:float
+            To record the start time of the mining process
+        endTime:float
+            To record the completion time of the mining process
+        minUtil : int
+            The user given minUtil value
+        finalPatterns: dict
+            Storing the complete set of patterns in a dictionary variable
+        native: bool
+            Whether the last mining run used the compiled extension
+
+    :Methods :
+
+        mine()
+                Mining process will start from here
+        getPatterns()
+                Complete set of patterns will be retrieved with this function
+        save(oFile)
+                Complete set of patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+                Complete set of patterns will be loaded in to a dataframe
+        getMemoryUSS()
+                Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+                Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+               Total amount of runtime taken by the mining process will be retrieved from this function
+        isNativeAvailable()
+               Whether the compiled extension is built
+
+    **Executing the code on terminal:**
+    ------------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 EFIMNative.py <inputFile> <outputFile> <minUtil> <sep>
+
+      Example Usage:
+
+      (.venv) $ python3 EFIMNative.py sampleTDB.txt output.txt 35
+
+    Sample run of importing the code:
+    -------------------------------------
+    .. code-block:: python
+
+            from PAMI.highUtilityPattern.basic import EFIMNative as alg
+
+            obj=alg.EFIMNative("input.txt",35)
+
+            obj.mine()
+
+            Patterns = obj.getPatterns()
+
+            print("Total number of high utility Patterns:", len(Patterns))
+
+            obj.save("output")
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+    """
+
+    def __init__(self, iFile, minUtil, sep="\t") -> None:
+        super().__init__(iFile, minUtil, sep)
+        self.oFile = None
+        self.native = False
+        self._finalPatterns = {}
+        self._endTime = float()
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+
+    @staticmethod
+    def isNativeAvailable() -> bool:
+        """
+        Whether the compiled extension is built
+        :return: True if the extension can be imported
+        :rtype: bool
+        """
+        return _efimNative is not None
+
+    def _canUseNative(self) -> bool:
+        """
+        The extension reads local files with a single character separator and needs a positive minUtil
+        :return: whether the extension can mine the input
+        :rtype: bool
+        """
+        return (_efimNative is not None and isinstance(self._iFile, str) and len(self._sep) == 1
+                and not _ab._validators.url(self._iFile) and int(self._minUtil) > 0)
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Start the EFIM algorithm.
+        :return: None
+        """
+        self.mine()
+
+    def mine(self) -> None:
+        """
+        Start the EFIM algorithm.
+        :return: None
+        """
+        self._startTime = _ab._time.time()
+        self._minUtil = int(self._minUtil)
+        self.native = self._canUseNative()
+        if self.native:
+            patterns = _efimNative.mine(self._iFile, self._minUtil, self._sep)
+            # the python EFIM stores the utilities as strings
+            self._finalPatterns = {pattern: str(utility) for pattern, utility in patterns.items()}
+        else:
+            miner = _EFIM(self._iFile, self._minUtil, self._sep)
+            miner.mine()
+            self._finalPatterns = miner.getPatterns()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("High Utility patterns were generated successfully using EFIMNative algorithm")
+
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
+        """
+        Storing final patterns in a dataframe
+        :return: returning patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+        data = []
+        for a, b in self._finalPatterns.items():
+            data.append([a.replace('\t', ' '), b])
+        return _ab._pd.DataFrame(data, columns=['Patterns', 'Utility'])
+
+    def getPatterns(self) -> dict:
+        """
+        Function to send the set of patterns after completion of the mining process
+        :return: returning patterns
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def save(self, outFile: str) -> None:
+        """
+        Complete set of frequent patterns will be loaded in to an output file
+        :param outFile: name of the output file
+        :type outFile: csv file
+        :return: None
+        """
+        self.oFile = outFile
+        with open(self.oFile, 'w+') as writer:
+            for x, y in self._finalPatterns.items():
+                patternsAndSupport = x.strip() + ":" + str(y)
+                writer.write("%s \n" % patternsAndSupport)
+
+    def getMemoryUSS(self) -> float:
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+        return self._endTime - self._startTime
+
+    def printResults(self) -> None:
+        """
+        This function is used to print the results
+        """
+        print("Total number of High Utility Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in seconds:", self.getRuntime())
+
+
+if __name__ == '__main__':
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:    #includes separator
+            _ap = EFIMNative(_ab._sys.argv[1], int(_ab._sys.argv[3]), _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:    #takes "\t" as a separator
+            _ap = EFIMNative(_ab._sys.argv[1], int(_ab._sys.argv[3]))
+        _ap.mine()
+        print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS",  _ap.getMemoryRSS())
+        print("Total ExecutionTime in seconds:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
@@ -0,0 +1,98 @@
+// Python bindings of efim.cpp, built as the optional PAMI.highUtilityPattern.basic._efimNative extension.
+//
+//     python setup.py build_ext --inplace
+//
+// PAMI.highUtilityPattern.basic.EFIMNative uses it when it is available and falls back to the python EFIM otherwise.
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#define EFIM_NO_MAIN
+#include "efim.cpp"
+
+#include <cstring>
+
+static PyObject *efimMine(PyObject *self, PyObject *args)
+{
+    const char *fileName;
+    unsigned long long minutil;
+    const char *separator;
+
+    if (!PyArg_ParseTuple(args, "sKs", &fileName, &minutil, &separator))
+    {
+        return NULL;
+    }
+    if (std::strlen(separator) != 1)
+    {
+        PyErr_SetString(PyExc_ValueError, "the separator should be a single character");
+        return NULL;
+    }
+    {
+        // readFile exits the process on a missing file, so the file is checked here
+        std::ifstream inputFile(fileName);
+        if (!inputFile.is_open())
+        {
+            PyErr_SetFromErrnoWithFilename(PyExc_OSError, fileName);
+            return NULL;
+        }
+    }
+
+    std::vector<std::pair<std::vector<std::string>, uint64_t>> patterns;
+    std::string error;
+    PyThreadState *state = PyEval_SaveThread();
+    try
+    {
+        auto [transactions, primary, secondary, intToString] = readFile(fileName, minutil, separator[0]);
+        search(transactions, std::vector<uint32_t>(), primary, secondary, patterns, minutil, intToString);
+    }
+    catch (const std::exception &e)
+    {
+        error = e.what();
+    }
+    PyEval_RestoreThread(state);
+    if (!error.empty())
+    {
+        PyErr_SetString(PyExc_ValueError, error.c_str());
+        return NULL;
+    }
+
+    PyObject *result = PyDict_New();
+    if (result == NULL)
+    {
+        return NULL;
+    }
+    for (const auto &pattern : patterns)
+    {
+        std::string key;
+        for (size_t i = 0; i < pattern.first.size(); i++)
+        {
+            if (i)
+            {
+                key += '\t';
+            }
+            key += pattern.first[i];
+        }
+        PyObject *utility = PyLong_FromUnsignedLongLong(pattern.second);
+        if (utility == NULL || PyDict_SetItemString(result, key.c_str(), utility) < 0)
+        {
+            Py_XDECREF(utility);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(utility);
+    }
+    return result;
+}
+
+static PyMethodDef efimMethods[] = {
+    {"mine", efimMine, METH_VARARGS,
+     "mine(fileName, minUtil, sep) -> dict of the high utility patterns, tab separated, and their utilities"},
+    {NULL, NULL, 0, NULL}};
+
+static struct PyModuleDef efimModule = {
+    PyModuleDef_HEAD_INIT, "_efimNative", "Compiled EFIM search of efim.cpp", -1, efimMethods};
+
+PyMODINIT_FUNC PyInit__efimNative(void)
+{
+    return PyModule_Create(&efimModule);
+}
@@ -28,6 +28,7 @@ import psutil as _psutil
 from array import *
 import functools as _functools
 import sys as _sys
+from bisect import bisect_left as _bisectLeft
 
 class _utilityPatterns(_ABC):
     """
@@ -14,6 +14,18 @@
 #include <unordered_map>
 #include <unordered_set>
 
+std::string trim(const std::string &str)
+{
+    const char *whitespace = " \t\r\n";
+    size_t first = str.find_first_not_of(whitespace);
+    if (first == std::string::npos)
+    {
+        return "";
+    }
+    return str.substr(first, str.find_last_not_of(whitespace) - first + 1);
+}
+
+// empty fields are skipped, as the python miners do
 std::vector<std::string> charsplit(const std::string &str, char delimiter)
 {
     std::vector<std::string> result;
@@ -21,19 +33,20 @@ std::vector<std::string> charsplit(const std::string &str, char delimiter)
     std::string item;
     while (std::getline(ss, item, delimiter))
     {
-        result.push_back(item);
+        if (!item.empty())
+        {
+            result.push_back(item);
+        }
     }
     return result;
 }
 
-std::vector<uint32_t> intsplit(const std::string &str, char delimiter)
+std::vector<uint64_t> intsplit(const std::string &str, char delimiter)
 {
-    std::vector<uint32_t> result;
-    std::stringstream ss(str);
-    std::string item;
-    while (std::getline(ss, item, delimiter))
+    std::vector<uint64_t> result;
+    for (const std::string &item : charsplit(str, delimiter))
     {
-        result.push_back(std::stoi(item));
+        result.push_back(std::stoull(item));
     }
     return result;
 }
@@ -54,19 +67,22 @@ struct vector_hash
     }
 };
 
+// utilities are 64 bit wide, as the utilities of merged transactions add up
+typedef std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint64_t>, uint64_t>, vector_hash> TransactionMap;
+
 // return std::tuple(finalTransactions, primary, secondary, newintToString);
 
-std::tuple<std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash>,
+std::tuple<TransactionMap,
            std::vector<uint32_t>,
            std::unordered_set<uint32_t>,
            std::unordered_map<uint32_t, std::string>>
-readFile(std::string fileName, uint32_t minutil)
+readFile(std::string fileName, uint64_t minutil, char separator = ' ')
 {
 
-    std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> transactions;
+    TransactionMap transactions;
     std::unordered_map<std::string, uint32_t> stringToInt;
     std::unordered_map<uint32_t, std::string> intToString;
-    std::unordered_map<uint32_t, uint32_t> localutility;
+    std::unordered_map<uint32_t, uint64_t> localutility;
     std::ifstream inputFile(fileName);
     std::string line;
 
@@ -80,12 +96,16 @@ readFile(std::string fileName, uint32_t minutil)
 
     while (std::getline(inputFile, line))
     {
-        std::vector<std::string> lineSplit = charsplit(line, ':');
-        std::vector<std::string> items = charsplit(lineSplit[0], ' ');
+        std::vector<std::string> lineSplit = charsplit(trim(line), ':');
+        if (lineSplit.size() < 3)
+        {
+            continue;
+        }
+        std::vector<std::string> items = charsplit(trim(lineSplit[0]), separator);
 
         std::vector<uint32_t> items2int;
 
-        uint32_t twu = std::stoi(lineSplit[1]);
+        uint64_t twu = std::stoull(lineSplit[1]);
 
         for (std::string &item : items)
         {
@@ -104,7 +124,7 @@ readFile(std::string fileName, uint32_t minutil)
             items2int.push_back(stringToInt[item]);
         }
 
-        std::vector<uint32_t> utilities = intsplit(lineSplit[2], ' ');
+        std::vector<uint64_t> utilities = intsplit(trim(lineSplit[2]), separator);
 
         auto find = transactions.find(items2int);
         if (find == transactions.end())
@@ -124,9 +144,11 @@ readFile(std::string fileName, uint32_t minutil)
     std::unordered_map<uint32_t, std::string> newintToString;
     std::unordered_set<uint32_t> secondary;
 
-    std::vector<std::pair<uint32_t, uint32_t>> sortedLocalutility(localutility.begin(), localutility.end());
+    // ties are broken on the order of first appearance, so that the items of a pattern come in the same order as
+    // in the python EFIM: ascending local utility, the earliest item first
+    std::vector<std::pair<uint32_t, uint64_t>> sortedLocalutility(localutility.begin(), localutility.end());
     std::sort(sortedLocalutility.begin(), sortedLocalutility.end(), [&](const auto &a, const auto &b)
-              { return a.second > b.second; });
+              { return a.second > b.second || (a.second == b.second && a.first > b.first); });
 
     uint32_t newitemCounter = 1;
     for (const auto &item : sortedLocalutility)
@@ -142,12 +164,12 @@ readFile(std::string fileName, uint32_t minutil)
         newitemCounter++;
     }
 
-    std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> finalTransactions;
-    std::unordered_map<uint32_t, uint32_t> subtreeUtility;
+    TransactionMap finalTransactions;
+    std::unordered_map<uint32_t, uint64_t> subtreeUtility;
 
     for (auto &transaction : transactions)
     {
-        std::vector<std::pair<uint32_t, uint32_t>> sortedTransaction;
+        std::vector<std::pair<uint32_t, uint64_t>> sortedTransaction;
 
         for (uint32_t i = 0; i < transaction.second.first.size(); i++)
         {
@@ -162,15 +184,15 @@ readFile(std::string fileName, uint32_t minutil)
             std::sort(sortedTransaction.begin(), sortedTransaction.end(), [&](const auto &a, const auto &b)
                       { return a.first > b.first; });
             std::vector<uint32_t> key;
-            std::vector<uint32_t> utilities;
+            std::vector<uint64_t> utilities;
             for (const auto &item : sortedTransaction)
             {
                 key.push_back(item.first);
                 utilities.push_back(item.second);
             }
 
-            uint32_t subtree = std::accumulate(utilities.begin(), utilities.end(), 0);
-            uint32_t temp = 0;
+            uint64_t subtree = std::accumulate(utilities.begin(), utilities.end(), uint64_t(0));
+            uint64_t temp = 0;
             for (const auto &item : sortedTransaction)
             {
                 subtreeUtility[item.first] += subtree - temp;
@@ -203,7 +225,7 @@ readFile(std::string fileName, uint32_t minutil)
     return std::tuple(finalTransactions, primary, secondary, newintToString);
 }
 
-void outputToFile(std::string outputFileName, std::vector<std::pair<std::vector<std::string>, uint32_t>> patterns)
+void outputToFile(std::string outputFileName, const std::vector<std::pair<std::vector<std::string>, uint64_t>> &patterns)
 {
     std::ofstream outputFile;
     outputFile.open(outputFileName);
@@ -218,11 +240,11 @@ void outputToFile(std::string outputFileName, std::vector<std::pair<std::vector<
     outputFile.close();
 }
 
-void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> transactions,
-            std::vector<uint32_t> prefix,
-            std::vector<uint32_t> primary, std::unordered_set<uint32_t> secondary,
-            std::vector<std::pair<std::vector<std::string>, uint32_t>> &patterns, uint32_t minutil,
-            std::unordered_map<uint32_t, std::string> intToString)
+void search(const TransactionMap &transactions,
+            const std::vector<uint32_t> &prefix,
+            const std::vector<uint32_t> &primary, const std::unordered_set<uint32_t> &secondary,
+            std::vector<std::pair<std::vector<std::string>, uint64_t>> &patterns, uint64_t minutil,
+            const std::unordered_map<uint32_t, std::string> &intToString)
 {
 
     for (const auto &item : primary)
@@ -230,11 +252,11 @@ void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint
         std::vector<uint32_t> newprefix = prefix;
         newprefix.push_back(item);
 
-        std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint32_t>, uint32_t>, vector_hash> projectedTransactions;
-        std::unordered_map<uint32_t, uint32_t> projectedSubtreeUtility;
-        std::unordered_map<uint32_t, uint32_t> projectedLocalutility;
+        TransactionMap projectedTransactions;
+        std::unordered_map<uint32_t, uint64_t> projectedSubtreeUtility;
+        std::unordered_map<uint32_t, uint64_t> projectedLocalutility;
 
-        uint32_t utility = 0;
+        uint64_t utility = 0;
 
         for (const auto &transaction : transactions)
         {
@@ -277,10 +299,10 @@ void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint
             utility += transaction.second.first[index] + transaction.second.second;
 
             std::vector<uint32_t> key;
-            std::vector<uint32_t> utilities;
+            std::vector<uint64_t> utilities;
 
-            // uint32_t sumOfUtils = transaction.second.second + transaction.second.first[index];
-            uint32_t valSum = transaction.second.second + transaction.second.first[index];
+            // uint64_t sumOfUtils = transaction.second.second + transaction.second.first[index];
+            uint64_t valSum = transaction.second.second + transaction.second.first[index];
 
             for (uint32_t i = index + 1; i < transaction.first.size(); i++)
             {
@@ -295,7 +317,7 @@ void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint
             if (!key.size())
                 continue;
 
-            uint32_t temp = 0;
+            uint64_t temp = 0;
 
             for (uint32_t i = 0; i < key.size(); i++)
             {
@@ -324,7 +346,7 @@ void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint
             patterns.push_back(std::make_pair(std::vector<std::string>(), utility));
             for (const auto &item : newprefix)
             {
-                patterns.back().first.push_back(intToString[item]);
+                patterns.back().first.push_back(intToString.at(item));
             }
         }
 
@@ -352,6 +374,7 @@ void search(std::unordered_map<std::vector<uint32_t>, std::pair<std::vector<uint
 
 }
 
+#ifndef EFIM_NO_MAIN
 int main(int argc, char *argv[])
 {
     if (argc != 4)
@@ -361,13 +384,13 @@ int main(int argc, char *argv[])
         exit(EXIT_FAILURE);
     }
     std::string inputFileName;
-    uint32_t minutil;
+    uint64_t minutil;
     std::string outputFileName;
 
     try
     {
         inputFileName = argv[1];
-        minutil = std::stoi(argv[2]);
+        minutil = std::stoull(argv[2]);
         outputFileName = argv[3];
     }
     catch (std::invalid_argument &e)
@@ -381,7 +404,7 @@ int main(int argc, char *argv[])
     clock_t start = clock();
 
     // return std::make_tuple(d_items, d_utilities, d_cost, d_indexesStart, d_indexesEnd, d_secondary, h_primary);
-    std::vector<std::pair<std::vector<std::string>, uint32_t>> patterns;
+    std::vector<std::pair<std::vector<std::string>, uint64_t>> patterns;
     std::vector<uint32_t> prefix = {};
 
     auto [transactions, primary, secondary, intToString] = readFile(inputFileName, minutil);
@@ -400,3 +423,4 @@ int main(int argc, char *argv[])
 
     return 0;
 }
+#endif
@@ -28,6 +28,11 @@ import psutil as _psutil
 from array import *
 import functools as _functools
 import sys as _sys
+import multiprocessing as _multiprocessing
+import queue as _queue
+import tempfile as _tempfile
+from bisect import bisect_left as _bisectLeft
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 
 class _utilityPatterns(_ABC):
     """
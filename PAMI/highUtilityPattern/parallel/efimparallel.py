@@ -28,6 +28,8 @@
 #
 #             print("Total ExecutionTime in seconds:", run)
 #
+#             obj=alg.efimParallel("input.txt", 35, threads=4)  # depth-first search shared by 4 processes
+#
 
 
 
@@ -56,12 +58,68 @@ import os
 import mmap
 import time
 import psutil
-from joblib import Parallel, delayed
 from deprecated import deprecated
 
 
 from PAMI.highUtilityPattern.parallel import abstract as _ab
 
+_workerMiner = None
+
+
+def _initWorker(storePath, sizes, settings, rename, tasks, idle, pending, queued):
+    """
+    Creates the miner used by a worker process of the work-stealing mode. The transaction store is memory-mapped
+    read-only from storePath, and the workers exchange tasks through the tasks queue. idle counts the workers
+    waiting for a task, pending the tasks that are queued or being mined and queued the tasks still in the queue.
+    """
+    global _workerMiner
+    _workerMiner = efimParallel(None, *settings)
+    _workerMiner.rename = rename
+    _workerMiner._mapStore(storePath, sizes)
+    _workerMiner._tasks = tasks
+    _workerMiner._idle = idle
+    _workerMiner._pending = pending
+    _workerMiner._queued = queued
+
+
+def _runWorker():
+    """
+    Mines tasks from the shared queue until every task has been mined, and returns the patterns found by this worker
+    with the number of tasks it donated.
+    """
+    miner = _workerMiner
+    miner.Patterns = {}
+    miner._donations = 0
+    waiting = False
+    while True:
+        try:
+            task = miner._tasks.get(timeout=0.01)
+        except _ab._queue.Empty:
+            if not waiting:
+                waiting = True
+                with miner._idle.get_lock():
+                    miner._idle.value += 1
+            if miner._pending.value == 0:
+                break
+            continue
+        if waiting:
+            waiting = False
+            with miner._idle.get_lock():
+                miner._idle.value -= 1
+        # idle drops before queued, so that a worker which just took a task is not sent another one
+        with miner._queued.get_lock():
+            miner._queued.value -= 1
+        try:
+            miner._mineTask(*task)
+        finally:
+            with miner._pending.get_lock():
+                miner._pending.value -= 1
+    if waiting:
+        with miner._idle.get_lock():
+            miner._idle.value -= 1
+    return miner.Patterns, miner._donations
+
+
 class efimParallel(_ab._utilityPatterns):
     """
     :Description:   EFIM is one of the fastest algorithm to mine High Utility ItemSets from transactional databases.
@@ -79,6 +137,10 @@ class efimParallel(_ab._utilityPatterns):
                    Maximum memory used by this program for running
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  threads: int :
+                   The number of processes used for mining. The default of 1 mines in the calling process.
+    :param  workStealing: bool :
+                   Search depth first and let idle processes take work from busy ones (default). The transactions are kept once in a read-only memory-mapped store and tasks refer to them by offsets. Set it to False for the level-wise search, which passes every projected database to the workers by value.
 
 
     :Attributes:
@@ -91,6 +153,8 @@ class efimParallel(_ab._utilityPatterns):
             The separator used in the input file.
         threads (int):
             The number of threads to use.
+        workStealing (bool):
+            Whether the depth-first work-stealing search is used.
         Patterns (dict):
             A dictionary containing the discovered patterns.
         rename (dict):
@@ -112,6 +176,8 @@ class efimParallel(_ab._utilityPatterns):
             Project the given beta itemset on the given database.
         search(collections):
             Search for high utility itemsets in the given collections.
+        mineTask(prefix, items, tids, starts, utils, secondary):
+            Search depth first for high utility itemsets extending the prefix with the given items.
         mine():
             Start the EFIM algorithm.
         savePatterns(outputFile):
@@ -129,7 +195,7 @@ class efimParallel(_ab._utilityPatterns):
 
     """
 
-    def __init__(self, iFile, minUtil, sep="\t", threads=1):
+    def __init__(self, iFile, minUtil, sep="\t", threads=1, workStealing=True):
         super().__init__(iFile, minUtil, sep)
         # self.runtime = None
         # self.oFile = None
@@ -142,6 +208,16 @@ class efimParallel(_ab._utilityPatterns):
         self.Patterns = {}
         self.rename = {}
         self.threads = threads
+        self.workStealing = workStealing
+        self._offsets = _ab.array('q')
+        self._items = _ab.array('i')
+        self._utilities = _ab.array('q')
+        self._store = None
+        self._tasks = None
+        self._idle = None
+        self._pending = None
+        self._queued = None
+        self._donations = 0
 
     # Read input file
     def _read_file(self):
@@ -355,6 +431,8 @@ class efimParallel(_ab._utilityPatterns):
         """
 
         if self.threads > 1:
+            # joblib is only needed by the level-wise search
+            from joblib import Parallel, delayed
             with Parallel(n_jobs=self.threads) as parallel:
                 while len(collections) > 0:
                     new_collections = []
@@ -389,6 +467,200 @@ class efimParallel(_ab._utilityPatterns):
                 collections = new_collections
 
 
+    def _encodeTransactions(self, fileData):
+        """
+        Stores the filtered transactions once in flat arrays: the items and utilities of all the transactions one
+        after the other, and the offset of every transaction.
+
+        :param fileData: The filtered transactions returned by read_file
+        :type fileData: dict
+        """
+        self._offsets = _ab.array('q', [0])
+        self._items = _ab.array('i')
+        self._utilities = _ab.array('q')
+        for key, val, _ in fileData.values():
+            self._items.extend(key)
+            self._utilities.extend(val)
+            self._offsets.append(len(self._items))
+
+    def _writeStore(self):
+        """
+        Writes the transaction store to a temporary file, which the worker processes map read-only.
+
+        :return: the path of the file and the number of transactions and of items in it
+        :rtype: tuple
+        """
+        descriptor, path = _ab._tempfile.mkstemp(suffix=".efim")
+        with _ab._os.fdopen(descriptor, 'wb') as f:
+            self._offsets.tofile(f)
+            self._utilities.tofile(f)
+            self._items.tofile(f)
+        return path, (len(self._offsets) - 1, len(self._items))
+
+    def _mapStore(self, path, sizes):
+        """
+        Maps the transaction store written by writeStore, and views its arrays without copying them.
+
+        :param path: The path of the store
+        :type path: str
+        :param sizes: The number of transactions and of items in the store
+        :type sizes: tuple
+        """
+        transactions, items = sizes
+        with open(path, 'rb') as f:
+            self._store = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._store)
+        utilitiesStart = 8 * (transactions + 1)
+        itemsStart = utilitiesStart + 8 * items
+        self._offsets = view[:utilitiesStart].cast('q')
+        self._utilities = view[utilitiesStart:itemsStart].cast('q')
+        self._items = view[itemsStart:itemsStart + 4 * items].cast('i')
+
+    def _projectItem(self, item, tids, starts, utils, secondary):
+        """
+        Projects a database, given by offsets into the transaction store, on one more item.
+
+        :param item: The item extending the prefix
+        :type item: int
+        :param tids: The transactions of the projected database
+        :type tids: array
+        :param starts: The position in every transaction after the last item of the prefix
+        :type starts: array
+        :param utils: The utility of the prefix in every transaction
+        :type utils: array
+        :param secondary: The set of secondary items of the prefix
+        :type secondary: set
+        :return:
+            projection (tuple): The transactions, starts and prefix utilities of the projected database.
+            secondary (set): The secondary items of the extended prefix.
+            primary (list): The primary items of the extended prefix.
+            utility (int): The utility of the extended prefix.
+        """
+        items, utilities, offsets = self._items, self._utilities, self._offsets
+        newTids, newStarts, newUtils = _ab.array('i'), _ab.array('q'), _ab.array('q')
+        localUtils = {}
+        subtreeUtils = {}
+        utility = 0
+        for tid, start, prefixUtil in zip(tids, starts, utils):
+            end = offsets[tid + 1]
+            index = _ab._bisectLeft(items, item, start, end)
+            if index == end or items[index] != item:
+                continue
+            curr = utilities[index] + prefixUtil
+            utility += curr
+            rest = [(items[i], utilities[i]) for i in range(index + 1, end) if items[i] in secondary]
+            if not rest:
+                continue
+            remaining = curr + sum(val for _, val in rest)
+            temp = 0
+            for key, val in rest:
+                localUtils[key] = localUtils.get(key, 0) + remaining
+                subtreeUtils[key] = subtreeUtils.get(key, 0) + remaining - temp
+                temp += val
+            newTids.append(tid)
+            newStarts.append(index + 1)
+            newUtils.append(curr)
+        primary = [key for key, val in subtreeUtils.items() if val >= self.minUtil]
+        secondary = {key for key, val in localUtils.items() if val >= self.minUtil}
+        return (newTids, newStarts, newUtils), secondary, primary, utility
+
+    def _donate(self, stack):
+        """
+        Hands half of the pending items of the shallowest frame that has several of them to the task queue, when
+        fewer tasks are queued than workers are waiting. The slot in the queue is reserved under the lock of queued,
+        so that the busy workers together give one task per waiting worker. The task carries only offsets into the
+        shared transaction store.
+
+        :param stack: The frames of the depth-first search of this worker
+        :type stack: list
+        """
+        with self._queued.get_lock():
+            if self._queued.value >= self._idle.value:
+                return
+            self._queued.value += 1
+        for prefix, items, tids, starts, utils, secondary in stack:
+            if len(items) > 1:
+                given = items[:len(items) // 2]
+                del items[:len(items) // 2]
+                with self._pending.get_lock():
+                    self._pending.value += 1
+                self._donations += 1
+                self._tasks.put((prefix, given, tids, starts, utils, secondary))
+                return
+        with self._queued.get_lock():
+            self._queued.value -= 1
+
+    def _mineTask(self, prefix, items, tids, starts, utils, secondary):
+        """
+        Searches depth first for high utility itemsets extending the prefix with each of the given items. Only
+        the projections along the current path are kept, so memory grows with the depth of the search.
+
+        :param prefix: The prefix of the task
+        :type prefix: list
+        :param items: The primary items extending the prefix
+        :type items: list
+        :param tids: The transactions of the projected database of the prefix
+        :type tids: array
+        :param starts: The position in every transaction after the last item of the prefix
+        :type starts: array
+        :param utils: The utility of the prefix in every transaction
+        :type utils: array
+        :param secondary: The set of secondary items of the prefix
+        :type secondary: set
+        """
+        stack = [(prefix, list(items), tids, starts, utils, secondary)]
+        while stack:
+            prefix, items, tids, starts, utils, secondary = stack[-1]
+            if not items:
+                stack.pop()
+                continue
+            if self._idle is not None and self._idle.value > self._queued.value:
+                self._donate(stack)
+            beta = prefix + [items.pop()]
+            projection, nsecondary, nprimary, utility = self._projectItem(beta[-1], tids, starts, utils, secondary)
+            if utility >= self.minUtil:
+                self.Patterns["\t".join([self.rename[x] for x in beta])] = utility
+            if len(nprimary) > 0:
+                stack.append((beta, nprimary, *projection, nsecondary))
+
+    def _stealingSearch(self, fileData, primary, secondary):
+        """
+        Mines the patterns depth first. With several threads, the root task is put in a shared queue and the worker
+        processes split the search between them by taking work from each other.
+
+        :param fileData: The filtered transactions returned by read_file
+        :type fileData: dict
+        :param primary: The primary items
+        :type primary: list
+        :param secondary: The secondary items
+        :type secondary: set
+        """
+        self._encodeTransactions(fileData)
+        tids = _ab.array('i', range(len(self._offsets) - 1))
+        root = ([], list(primary), tids, self._offsets[:-1], _ab.array('q', bytes(8 * len(tids))), secondary)
+        if self.threads <= 1:
+            self._mineTask(*root)
+            return
+        storePath, sizes = self._writeStore()
+        tasks = _ab._multiprocessing.Queue()
+        idle = _ab._multiprocessing.Value('i', 0)
+        pending = _ab._multiprocessing.Value('q', 1)
+        queued = _ab._multiprocessing.Value('i', 1)
+        tasks.put(root)
+        try:
+            with _ab._ProcessPoolExecutor(max_workers=self.threads, initializer=_initWorker,
+                                          initargs=(storePath, sizes, (self.minUtil, self.sep), self.rename,
+                                                    tasks, idle, pending, queued)) as executor:
+                futures = [executor.submit(_runWorker) for _ in range(self.threads)]
+                self._donations = 0
+                for future in futures:
+                    patterns, donations = future.result()
+                    self._donations += donations
+                    for pattern in patterns:
+                        self.Patterns[pattern] = patterns[pattern]
+        finally:
+            _ab._os.remove(storePath)
+
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
         """
@@ -407,10 +679,11 @@ class efimParallel(_ab._utilityPatterns):
         self.start = time.time()
 
         fileData, primary, secondary = self._read_file()
-
-        collection = [[[], fileData, primary, secondary]]
-
-        self._search(collection)
+        if self.workStealing:
+            self._stealingSearch(fileData, primary, secondary)
+        else:
+            collection = [[[], fileData, primary, secondary]]
+            self._search(collection)
 
         self.memoryRSS = ps.memory_info().rss
         self.memoryUSS = ps.memory_full_info().uss
@@ -7,7 +7,7 @@
 # --------------------------------------------------------
 #
 #
-#             from PAMI.highUtilitySpatialPattern.basic import HUPMS as alg
+#             from PAMI.highUtilityPatternsInStreams import HUPMS as alg
 #
 #             obj=alg.HUPMS("input.txt","Neighbours.txt",35)
 #
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 """
 
-import abstract as _hus
+from PAMI.highUtilityPatternsInStreams import abstract as _hus
 import pandas as pd
 from functools import reduce
 from operator import and_ 
@@ -475,6 +475,15 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         mine()
             Starts the mining process
 
+        push(transaction)
+            Adds a transaction of the stream, and mines the window again whenever a pane is complete
+
+        pollPatterns()
+            Returns the patterns of the windows mined since the last poll
+
+        getPaneStatistics()
+            Returns the latency and memory of every mined pane
+
         printTree(root, level)
             Prints the HUS-tree in a readable format
 
@@ -525,7 +534,6 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
     __startTime = float()
     __endTime = float()
     _minUtil = str()
-    __finalPatterns = {}
     _iFile = " "
     _oFile = " "
     _sep = " "
@@ -565,11 +573,11 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
                     line = line.split("\n")[0]
                     parts = line.split(":")
                     items = parts[0].split(self._sep)
-                    self.__transactions.append([x for x in items if x])
+                    self._transactions.append([x for x in items if x])
                     utilities = parts[2].split(self._sep)
                     utilities = [float(x) for x in utilities]
-                    self.__utilities.append(utilities)
-                    self.__utilitySum.append(int(parts[1]))
+                    self._utilities.append(utilities)
+                    self._utilitySum.append(float(parts[1]))
             else:
                 try:
                     with open(self._iFile, 'r', encoding='utf-8') as f:
@@ -685,7 +693,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
      
         return reduce(and_, [i in superset for i in subset])
 
-    def treeGenerations(self, root, netUtil, candidatePattern, curItem = None):
+    def treeGenerations(self, root, netUtil, candidatePattern, curItem=None, items=None):
         """
         Generates the tree of the high utility patterns
 
@@ -704,13 +712,21 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         :param curItem: list of items in the current itemsets
 
         :type curItem: list
+
+        :param items: items to extend curItem with, all items of the header table when None
+
+        :type items: set
         """
 
         if root is None:
             return
 
+        if curItem is None:
+            curItem = []
 
         for item in reversed(root.headerTable.orderedItems):
+            if items is not None and item not in items:
+                continue
             if root.headerTable.table[item][0] >= netUtil:
                 prefixBranches = []
 
@@ -747,6 +763,36 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
                 if len(conditionalTree.headerTable.table) != 0:
                     self.treeGenerations(conditionalTree, netUtil, candidatePattern, newItemset)
 
+    def _createTree(self):
+        """
+        Creates the tree of the sliding window
+
+        :return: tree with a slot for each pane of the window
+
+        :rtype: _HUSTree
+        """
+
+        return _HUSTree(self._windowSize, self._paneSize)
+
+    def _addToTree(self, transaction, utilitySum, utilities):
+        """
+        Adds a transaction of the newest pane to the tree
+
+        :param transaction: list of items in the transaction
+
+        :type transaction: list
+
+        :param utilitySum: Net utility of the transaction
+
+        :type utilitySum: float
+
+        :param utilities: utilities of the items in the transaction
+
+        :type utilities: list
+        """
+
+        self._tree.addTransaction(transaction, utilitySum)
+
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
         """
@@ -758,7 +804,6 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         """
         This function will start the mining process
         """
-        #global _minUtil
         self.__startTime = _hus._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
@@ -768,61 +813,12 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
             raise Exception("Please enter the Window Size")
         if self._paneSize is None:
             raise Exception("Please enter the Pane Size")
-        self.__windowSize = int(self._windowSize)
-        self.__paneSize = int(self._paneSize)
 
         self._createItemsets()
-        self._minUtil = float(self._minUtil)
-        self.__tree = _HUSTree(self.__windowSize, self.__paneSize)
-
-        transactionwiseUtility = []
-
+        self._resetStream()
         for i in range(len(self._transactions)):
-            curTrans = {}
-            for j in range(len(self._transactions[i])):
-                curTrans[self._transactions[i][j]] = self._utilities[i][j]
-            transactionwiseUtility.append(curTrans)
-
-        for i in range(0, self.__windowSize):
-            self.__tree.batchIndex = i
-            for j in range(0, self.__paneSize):
-                self.__tree.addTransaction(self._transactions[i * self.__paneSize + j],
-                                           self._utilitySum[i * self.__paneSize + j])
-
-        startIndex = 0
-        endIndex = self.__windowSize * self.__paneSize
-
-        while endIndex <= len(self._transactions):
-
-            filteredItemsets = {}
-
-            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets)
-
-            results = []
-
-            for itemSetLen in filteredItemsets:
-                for itemSet in filteredItemsets[itemSetLen]:
-                    itemSetUtility = 0
-                    for transId in range(startIndex, endIndex):
-                        if self.contains(list(transactionwiseUtility[transId].keys()), itemSet):
-                            for item in itemSet:
-                                itemSetUtility += transactionwiseUtility[transId][item]
-
-                    if itemSetUtility >= self._minUtil:
-                        results.append([itemSet, itemSetUtility])
-
-            self.__finalPatterns[(startIndex, endIndex)] = results
-
-            if endIndex >= len(self._transactions):
-                break
-
-            self.__tree.removeBatch()
-
-            for i in range(0, self.__paneSize):
-                self.__tree.addTransaction(self._transactions[endIndex + i], self._utilitySum[endIndex + i])
-
-            startIndex += self.__paneSize
-            endIndex += self.__paneSize
+            self.push((self._transactions[i], self._utilitySum[i], self._utilities[i]))
+        self._finalPatterns = self.pollPatterns()
 
         self.__endTime = _hus._time.time()
         self.__memoryUSS = float()
@@ -874,7 +870,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         :return: returning frequent patterns generated by the mining process
         :rtype: dict
         """
-        return self.__finalPatterns
+        return self._finalPatterns
 
     def getPatternsAsDataFrame(self):
         """
@@ -886,7 +882,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
 
         dataframe = {}
         data = []
-        for x, y in self.__finalPatterns.items():
+        for x, y in self._finalPatterns.items():
             for pattern in y:
                 patternString = ' '.join(pattern[0])
                 data.append([x[0], x[1], patternString, pattern[1]])
@@ -919,7 +915,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         """
         print("Output file name", self._oFile)
         writer = open(self._oFile, 'w+')
-        for x, y in self.__finalPatterns.items():
+        for x, y in self._finalPatterns.items():
             writer.write("Window Start Index : %s , End Index : %s \n" % (x[0], x[1]))
             for pattern in y:
                 patternString = '\t'.join(pattern[0])
@@ -935,7 +931,6 @@ if __name__ == "__main__":
         if len(_hus._sys.argv) == 6:
             _ap = HUPMS(_hus._sys.argv[1], _hus._sys.argv[2], _hus._sys.argv[3], _hus._sys.argv[4], _hus._sys.argv[5])
         _ap.mine()
-        _ap.mine()
         print("Total number of Windows Processes:", len( _ap.getPatterns()))
 
         _ap.getPatternsAsDataFrame().to_csv("result.csv", index = False, sep='\t')
@@ -22,7 +22,7 @@
 #
 
 
-import abstract as _hus
+from PAMI.highUtilityPatternsInStreams import abstract as _hus
 import pandas as pd
 from functools import reduce
 from operator import and_
@@ -291,23 +291,19 @@ class _SHUTree:
         :type transaction: list
         :param utility: Net utility of the transaction
         :type utility: int
-        :param itemUtility: item utility
-        :type itemUtility: str
+        :param itemUtility: utilities of the items in the transaction, in the order of transaction
+        :type itemUtility: list
         """
-        # print("Transaction", transaction, itemUtility, self.localTree)
-        transaction.sort(key = lambda x: x[0])
         currentNode = self.root
         self.windowUtility += utility
 
         curUtility = 0
-        for _iter in range(len(transaction)):
-            
-            item = transaction[_iter]
+        for item, utilityOfItem in sorted(zip(transaction, itemUtility), key=lambda x: x[0]):
 
             if self.localTree is False:
-                curUtility += itemUtility[_iter]
+                curUtility += utilityOfItem
             else:
-                curUtility = itemUtility[_iter]
+                curUtility = utilityOfItem
 
             
             if item in currentNode.children:
@@ -495,9 +491,6 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         _createItemsets()
             Storing the complete transactions of the database/input file in a transaction variable with their utilities.
 
-        minPathUtil(nodeIndex, stack)
-            Calculates the minimum utility of the path from the root to the ends of the tree
-
         createPrefixBranch(root)
             Creates the prefix branch of the current SHU-Tree for construction of prefix tree
 
@@ -516,6 +509,15 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         mine()
             Starts the mining process
 
+        push(transaction)
+            Adds a transaction of the stream, and mines the window again whenever a pane is complete
+
+        pollPatterns()
+            Returns the patterns of the windows mined since the last poll
+
+        getPaneStatistics()
+            Returns the latency and memory of every mined pane
+
         printTree(root, level)
             Prints the SHU-tree in a readable format
 
@@ -566,7 +568,6 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
     __startTime = float()
     __endTime = float()
     _minUtil = str()
-    __finalPatterns = {}
     _iFile = " "
     _oFile = " "
     _sep = " "
@@ -606,11 +607,11 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
                     line = line.split("\n")[0]
                     parts = line.split(":")
                     items = parts[0].split(self._sep)
-                    self.__transactions.append([x for x in items if x])
+                    self._transactions.append([x for x in items if x])
                     utilities = parts[2].split(self._sep)
                     utilities = [float(x) for x in utilities]
-                    self.__utilities.append(utilities)
-                    self.__utilitySum.append(int(parts[1]))
+                    self._utilities.append(utilities)
+                    self._utilitySum.append(float(parts[1]))
             else:
                 try:
                     with open(self._iFile, 'r', encoding='utf-8') as f:
@@ -627,32 +628,11 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
                     print("File Not Found")
                     quit()
 
-    def minPathUtil(self, nodeIndex, stack):
-        """
-        Calculates the minimum utility of the path from the root to the ends of the tree
-
-        :param nodeIndex: index of the node in the stack
-
-        :type nodeIndex: int
-
-        :param stack: list of the nodes in the prefix branch
-
-        :type stack: list
-        """
-
-        minUtil = 0
-        activeBatch = [i for i, e in enumerate(stack[0].utility) if e != 0]
-
-        for batch in activeBatch:
-            if stack[nodeIndex + 1].tail is None or stack[nodeIndex + 1].tail[batch] is False:
-                minUtil += (stack[nodeIndex].utility[batch] - stack[nodeIndex + 1].utility[batch])
-            
-        return minUtil
-        
-
     def createPrefixBranch(self, root):
         """
-        Creates the prefix branch of the node
+        Creates the prefix branch of the node. The utility of the node sums the prefix utilities of the transactions
+        that pass through it, which bounds the utility of every itemset made of the node item and its ancestors, so
+        each ancestor of the branch is given that utility.
 
         :param root: pointer to the root node of the sub-tree
 
@@ -665,6 +645,10 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         :return: utility of the prefix branch
 
         :rtype: int
+
+        :return: utilities of the ancestors of the node, from the parent to the child of the root
+
+        :rtype: list
         """
         stack = []
 
@@ -672,20 +656,8 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
             stack.append(root)
             root = root.parent
 
-        chosenItemset = stack[0]
-        lastUtil = sum(chosenItemset.utility)
-        curBacthes = [i for i, e in enumerate(chosenItemset.utility) if e != 0]
-
-        otherUtilites = []
-
-        for i in range(1, len(stack)-1):
-            curItemset = stack[i]
-            epu = lastUtil
-
-            for j in range(i-1, 0, -1):
-                epu -= self.minPathUtil(j, stack)
-            
-            otherUtilites.append(epu)
+        lastUtil = sum(stack[0].utility)
+        otherUtilites = [lastUtil] * (len(stack) - 2)
 
         return stack, lastUtil, otherUtilites
 
@@ -729,11 +701,10 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         """
         
         for transaction in transactions:
-            for item in transaction["transaction"]:
-                if root.headerTable.table[item][0] < minUtil:
-                    itemIndex = transaction["transaction"].index(item)
-                    transaction["transaction"].remove(item)
-                    del transaction["itemwiseUtility"][itemIndex]
+            kept = [_iter for _iter, item in enumerate(transaction["transaction"])
+                    if root.headerTable.table[item][0] >= minUtil]
+            transaction["transaction"] = [transaction["transaction"][_iter] for _iter in kept]
+            transaction["itemwiseUtility"] = [transaction["itemwiseUtility"][_iter] for _iter in kept]
 
         tempTree = _SHUTree(1, 1, True)
         for transaction in transactions:
@@ -762,7 +733,7 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
      
         return reduce(and_, [i in superset for i in subset])
 
-    def treeGenerations(self, root, netUtil, candidatePattern, curItem =None):
+    def treeGenerations(self, root, netUtil, candidatePattern, curItem=None, items=None):
         """
         Generates the tree of the high utility patterns
 
@@ -781,13 +752,21 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         :param curItem: List of items in the current itemsets
 
         :type curItem: list
+
+        :param items: items to extend curItem with, all items of the header table when None
+
+        :type items: set
         """
 
         if root is None:
             return
 
+        if curItem is None:
+            curItem = []
 
         for item in reversed(root.headerTable.orderedItems):
+            if items is not None and item not in items:
+                continue
             if root.headerTable.table[item][0] >= netUtil:
                 prefixBranches = []
 
@@ -826,6 +805,60 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
                 if len(conditionalTree.headerTable.table) != 0:
                     self.treeGenerations(conditionalTree, netUtil, candidatePattern, newItemset)
 
+    def _createTree(self):
+        """
+        Creates the tree of the sliding window
+
+        :return: tree with a slot for each pane of the window
+
+        :rtype: _SHUTree
+        """
+
+        return _SHUTree(self._windowSize, self._paneSize)
+
+    def _addToTree(self, transaction, utilitySum, utilities):
+        """
+        Adds a transaction of the newest pane to the tree
+
+        :param transaction: list of items in the transaction
+
+        :type transaction: list
+
+        :param utilitySum: Net utility of the transaction
+
+        :type utilitySum: float
+
+        :param utilities: utilities of the items in the transaction
+
+        :type utilities: list
+        """
+
+        self._tree.addTransaction(transaction, utilitySum, utilities)
+
+    def _affectedItems(self, touched):
+        """
+        Items whose patterns may change after the window slid. The prefix utilities of a node depend on the
+        utilities of its ancestors, so every item below a branch that an expired or arriving transaction passes
+        through is mined again.
+
+        :param touched: transactions of the expired and the arriving panes
+
+        :type touched: list
+
+        :return: items to mine again
+
+        :rtype: set
+        """
+
+        affected = super()._affectedItems(touched)
+        stack = [self._tree.root.children[key] for key in {transaction[0] for transaction in touched if transaction}
+                 if key in self._tree.root.children]
+        while stack:
+            node = stack.pop()
+            affected.add(node.itemName)
+            stack.extend(node.children.values())
+        return affected
+
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
         """
@@ -837,7 +870,6 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         """
         This function will start the mining process
         """
-        #global _minUtil
         self.__startTime = _hus._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
@@ -847,63 +879,12 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
             raise Exception("Please enter the Window Size")
         if self._paneSize is None:
             raise Exception("Please enter the Pane Size")
-        self.__windowSize = int(self._windowSize)
-        self.__paneSize = int(self._paneSize)
 
         self._createItemsets()
-        self._minUtil = float(self._minUtil)
-        self.__tree = _SHUTree(self.__windowSize, self.__paneSize)
-
-        transactionwiseUtility = []
-
+        self._resetStream()
         for i in range(len(self._transactions)):
-            curTrans = {}
-            for j in range(len(self._transactions[i])):
-                curTrans[self._transactions[i][j]] = self._utilities[i][j]
-            transactionwiseUtility.append(curTrans)
-
-        for i in range(0, self.__windowSize):
-            self.__tree.batchIndex = i
-            for j in range(0, self.__paneSize):
-                self.__tree.addTransaction(self._transactions[i * self.__paneSize + j],
-                                           self._utilitySum[i * self.__paneSize + j],
-                                           self._utilities[i * self.__paneSize + j])
-
-        startIndex = 0
-        endIndex = self.__windowSize * self.__paneSize
-
-        while endIndex <= len(self._transactions):
-
-            filteredItemsets = {}
-
-            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets)
-
-            results = []
-
-            for itemSetLen in filteredItemsets:
-                for itemSet in filteredItemsets[itemSetLen]:
-                    itemSetUtility = 0
-                    for transId in range(startIndex, endIndex):
-                        if self.contains(list(transactionwiseUtility[transId].keys()), itemSet):
-                            for item in itemSet:
-                                itemSetUtility += transactionwiseUtility[transId][item]
-
-                    if itemSetUtility >= self._minUtil:
-                        results.append([itemSet, itemSetUtility])
-
-            self.__finalPatterns[(startIndex, endIndex)] = results
-
-            if endIndex >= len(self._transactions):
-                break
-
-            self.__tree.removeBatch()
-
-            for i in range(0, self.__paneSize):
-                self.__tree.addTransaction(self._transactions[endIndex + i], self._utilitySum[endIndex + i],
-                                           self._utilities[endIndex + i])
-
-            startIndex += self.__paneSize
-            endIndex += self.__paneSize
+            self.push((self._transactions[i], self._utilitySum[i], self._utilities[i]))
+        self._finalPatterns = self.pollPatterns()
 
         self.__endTime = _hus._time.time()
         self.__memoryUSS = float()
@@ -958,7 +939,7 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         :return: returning frequent patterns generated by the mining process
         :rtype: dict
         """
-        return self.__finalPatterns
+        return self._finalPatterns
 
     def getPatternsAsDataFrame(self):
         """
@@ -970,7 +951,7 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
 
         dataframe = {}
         data = []
-        for x, y in self.__finalPatterns.items():
+        for x, y in self._finalPatterns.items():
             for pattern in y:
                 patternString = ' '.join(pattern[0])
                 data.append([x[0], x[1], patternString, pattern[1]])
@@ -1003,7 +984,7 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         """
         print("Output file name", self._oFile)
         writer = open(self._oFile, 'w+')
-        for x, y in self.__finalPatterns.items():
+        for x, y in self._finalPatterns.items():
             writer.write("Window Start Index : %s , End Index : %s \n" % (x[0], x[1]))
             for pattern in y:
                 patternString = '\t'.join(pattern[0])
@@ -1019,7 +1000,6 @@ if __name__ == "__main__":
         if len(_hus._sys.argv) == 6:
             _ap = SHUGrowth(_hus._sys.argv[1], _hus._sys.argv[2], _hus._sys.argv[3], _hus._sys.argv[4], _hus._sys.argv[5])
         _ap.mine()
-        _ap.mine()
         print("Total number of Windows Processes:", len( _ap.getPatterns()))
         _ap.getPatternsAsDataFrame().to_csv("result.csv", index = False, sep='\t')
         _ap.save()
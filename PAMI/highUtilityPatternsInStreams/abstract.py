@@ -56,6 +56,10 @@ class _highUtilityPatternStreamMining(_ABC):
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
             To store the total amount of RSS memory consumed by the program
+        windowSize : int
+            Number of panes in the sliding window
+        paneSize : int
+            Number of transactions in a pane
 
     :Methods:
 
@@ -73,6 +77,12 @@ class _highUtilityPatternStreamMining(_ABC):
             This function outputs the total amount of RSS memory consumed by a mining algorithm
         getRuntime()
             This function outputs the total runtime of a mining algorithm
+        push(transaction)
+            Adds a transaction of the stream, and mines the window whenever a pane is complete
+        pollPatterns()
+            Returns the patterns of the windows mined since the last poll
+        getPaneStatistics()
+            Returns the latency and memory of every mined pane as a data frame
 
     """
 
@@ -98,6 +108,7 @@ class _highUtilityPatternStreamMining(_ABC):
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._finalPatterns = {}
+        self._resetStream()
 
     @_abstractmethod
     def startMine(self):
@@ -141,4 +152,198 @@ class _highUtilityPatternStreamMining(_ABC):
     def getRuntime(self):
         """Total amount of runtime taken by the program will be retrieved from this function"""
 
-        pass
\ No newline at end of file
+        pass
+
+    @_abstractmethod
+    def _createTree(self):
+        """
+        Creates the empty tree of the sliding window. Stream miners implement this function to use their own tree.
+
+        :return: tree of the window
+        """
+
+        pass
+
+    @_abstractmethod
+    def _addToTree(self, transaction, utilitySum, utilities):
+        """
+        Adds a transaction of the newest pane to the tree of the window
+
+        :param transaction: items of the transaction
+        :type transaction: list
+        :param utilitySum: utility of the transaction
+        :type utilitySum: float
+        :param utilities: utilities of the items of the transaction
+        :type utilities: list
+        :return: None
+        """
+
+        pass
+
+    def _affectedItems(self, touched):
+        """
+        Items whose patterns may change after the window slid. By default these are the items of the expired and the
+        arriving transactions, since the patterns of the other items are mined from unchanged nodes.
+
+        :param touched: transactions of the expired and the arriving panes
+        :type touched: list
+        :return: items to mine again
+        :rtype: set
+        """
+
+        return {item for transaction in touched for item in transaction}
+
+    def _resetStream(self):
+        """
+        Empties the sliding window, so that the next transaction pushed starts a new stream
+        """
+
+        self._tree = None
+        self._panes = []
+        self._paneBuffer = []
+        self._windowStart = 0
+        self._itemPatterns = {}
+        self._pendingPatterns = {}
+        self._paneStatistics = []
+
+    def _parseTransaction(self, transaction):
+        """
+        Converts a line of the input format, items:utilitySum:utilities, into the items and utilities of a transaction
+
+        :param transaction: a line of the input file or a tuple of items, utility sum and item utilities
+        :type transaction: str or tuple
+        :return: items, utility sum and item utilities of the transaction
+        :rtype: tuple
+        """
+
+        if not isinstance(transaction, str):
+            items, utilitySum, utilities = transaction
+            return list(items), utilitySum, list(utilities)
+        parts = transaction.split("\n")[0].split(":")
+        items = [x for x in parts[0].split(self._sep) if x]
+        utilities = [float(x) for x in parts[2].split(self._sep)]
+        return items, float(parts[1]), utilities
+
+    def push(self, transaction):
+        """
+        Adds a transaction of the stream. When the current pane is complete it replaces the oldest pane of the tree,
+        and the patterns of the window are mined again for the items the two panes contain.
+
+        :param transaction: a line of the input format, items:utilitySum:utilities, or a tuple of items, utility sum and item utilities
+        :type transaction: str or tuple
+        :return: None
+        """
+
+        if self._tree is None:
+            self._minUtil = float(self._minUtil)
+            self._windowSize = int(self._windowSize)
+            self._paneSize = int(self._paneSize)
+            self._tree = self._createTree()
+        self._paneBuffer.append(self._parseTransaction(transaction))
+        if len(self._paneBuffer) == self._paneSize:
+            self._closePane()
+
+    def _closePane(self):
+        """
+        Slides the window by the buffered pane and mines the patterns of the window once it is full
+        """
+
+        startTime = _time.time()
+        touched = []
+        slid = len(self._panes) == self._windowSize
+        if slid:
+            expired = self._panes.pop(0)
+            self._tree.removeBatch()
+            self._windowStart += self._paneSize
+            touched.extend(expired["transactions"])
+        else:
+            self._tree.batchIndex = len(self._panes)
+
+        pane = {"transactions": [], "utilities": [], "index": {}}
+        for transaction, utilitySum, utilities in self._paneBuffer:
+            itemUtilities = {transaction[j]: utilities[j] for j in range(len(transaction))}
+            for item in itemUtilities:
+                pane["index"].setdefault(item, []).append(len(pane["utilities"]))
+            pane["utilities"].append(itemUtilities)
+            pane["transactions"].append(transaction)
+            self._addToTree(transaction, utilitySum, utilities)
+        self._paneBuffer = []
+        self._panes.append(pane)
+        touched.extend(pane["transactions"])
+        if len(self._panes) < self._windowSize:
+            return
+
+        if slid:
+            affected = self._affectedItems(touched)
+        else:
+            affected = set(self._tree.headerTable.table)
+        orderedItems = self._tree.headerTable.orderedItems
+        self._itemPatterns = {item: patterns for item, patterns in self._itemPatterns.items()
+                              if item in self._tree.headerTable.table and item not in affected}
+        for item in orderedItems:
+            if item in affected:
+                candidates = {}
+                self.treeGenerations(self._tree, self._minUtil, candidates, [], {item})
+                self._itemPatterns[item] = self._verifyCandidates(candidates)
+
+        results = []
+        lengths = sorted({length for patterns in self._itemPatterns.values() for length in patterns})
+        for length in lengths:
+            for item in reversed(orderedItems):
+                results.extend(self._itemPatterns.get(item, {}).get(length, []))
+        windowEnd = self._windowStart + self._windowSize * self._paneSize
+        self._pendingPatterns[(self._windowStart, windowEnd)] = results
+
+        process = _psutil.Process(_os.getpid())
+        self._paneStatistics.append([self._windowStart, windowEnd, _time.time() - startTime,
+                                     process.memory_info().rss, len(affected)])
+
+    def _verifyCandidates(self, candidates):
+        """
+        Keeps the candidate patterns whose utility in the window reaches minUtil
+
+        :param candidates: candidate patterns grouped by their length
+        :type candidates: dict
+        :return: high utility patterns with their utilities grouped by their length
+        :rtype: dict
+        """
+
+        patterns = {}
+        for length in candidates:
+            for itemSet in candidates[length]:
+                itemSetUtility = 0
+                for pane in self._panes:
+                    tidLists = [pane["index"].get(item) for item in itemSet]
+                    if None in tidLists:
+                        continue
+                    tids = set(min(tidLists, key=len)).intersection(*tidLists)
+                    for tid in sorted(tids):
+                        itemUtilities = pane["utilities"][tid]
+                        for item in itemSet:
+                            itemSetUtility += itemUtilities[item]
+                if itemSetUtility >= self._minUtil:
+                    patterns.setdefault(length, []).append([itemSet, itemSetUtility])
+        return patterns
+
+    def pollPatterns(self):
+        """
+        Returns the patterns of every window mined since the last call
+
+        :return: patterns of each window keyed by the start and end index of the window
+        :rtype: dict
+        """
+
+        patterns = self._pendingPatterns
+        self._pendingPatterns = {}
+        return patterns
+
+    def getPaneStatistics(self):
+        """
+        Latency and memory of every pane that completed a window
+
+        :return: dataframe with the window indexes, the latency in seconds, the RSS memory and the number of items mined again
+        :rtype: pandas.DataFrame
+        """
+
+        return _pd.DataFrame(self._paneStatistics, columns=['Window Start Index', 'Window End Index', 'Latency',
+                                                            'Memory RSS', 'Mined Items'])
@@ -370,7 +370,7 @@ class SHUIM(_ab._utilityPatterns):
                A method to return common Neighbours of items
         backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
                A method to mine the SHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodList)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodMask)
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
@@ -444,6 +444,8 @@ class SHUIM(_ab._utilityPatterns):
     _strToInt = {}
     _intToStr = {}
     _Neighbours = {}
+    _neighbourhood = None
+    _neighbourMasks = [0] * 5000
     _temp = [0] * 5000
     _maxMemory = 0
     _startTime = float()
@@ -491,6 +493,7 @@ class SHUIM(_ab._utilityPatterns):
                     lst.append(self._dataset.strToInt.get(line_split[i]))
                 self._Neighbours[item] = lst
         o.close()
+        self._neighbourhood = _ab._NeighbourhoodIndex(self._Neighbours)
         #print(len(self._Neighbours))
         InitialMemory = _ab._psutil.virtual_memory()[3]
         self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
@@ -602,18 +605,18 @@ class SHUIM(_ab._utilityPatterns):
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil:
                 self._output(prefixLength, utilityPe)
-            neighbourhoodList = self._calculateNeighbourIntersection(prefixLength)
-            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+            neighbourhoodMask = self._calculateNeighbourIntersection(prefixLength)
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodMask)
             newItemsToKeep = []
             newItemsToExplore = []
             for l in range(idx + 1, len(itemsToKeep)):
                 itemK = itemsToKeep[l]
                 if self._utilityBinArraySU[itemK] >= self._minUtil:
-                    if itemK in neighbourhoodList:
+                    if self._neighbourhood.contains(neighbourhoodMask, self._newNamesToOldNames[itemK]):
                         newItemsToExplore.append(itemK)
                         newItemsToKeep.append(itemK)
                 elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                    if itemK in neighbourhoodList:
+                    if self._neighbourhood.contains(neighbourhoodMask, self._newNamesToOldNames[itemK]):
                         newItemsToKeep.append(itemK)
             self._backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
             finalMemory = _ab._psutil.virtual_memory()[3]
@@ -621,7 +624,7 @@ class SHUIM(_ab._utilityPatterns):
             if self._maxMemory < memory:
                 self._maxMemory = memory
 
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: List[_Transaction], j: int, itemsToKeep: List[int], neighbourhoodList: List[int]) -> None:
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: List[_Transaction], j: int, itemsToKeep: List[int], neighbourhoodMask: int) -> None:
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -631,10 +634,12 @@ class SHUIM(_ab._utilityPatterns):
         :type j:int
         :param itemsToKeep :the list of promising items
         :type itemsToKeep: list
+        :param neighbourhoodMask: bitset of the common neighbours of P U {e}
+        :type neighbourhoodMask: int
         :return: None
         """
         for i in range(j + 1, len(itemsToKeep)):
-            item = itemsToKeepi
+            item = itemsToKeep[i]
             self._utilityBinArrayLU[item] = 0
             self._utilityBinArraySU[item] = 0
         for transaction in transactionsPe:
@@ -644,11 +649,11 @@ class SHUIM(_ab._utilityPatterns):
                 item = transaction.getItems()[i]
                 if item in itemsToKeep:
                     remainingUtility = 0
-                    if self._newNamesToOldNames[item] in self._Neighbours:
-                        item_neighbours = self._Neighbours[self._newNamesToOldNames[item]]
+                    if self._newNamesToOldNames[item] in self._neighbourhood:
+                        item_neighbours = self._neighbourhood.neighbourMask(self._newNamesToOldNames[item]) & neighbourhoodMask
                         for k in range(i, length):
                             transaction_item = transaction.getItems()[k]
-                            if self._newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhoodList:
+                            if self._neighbourhood.contains(item_neighbours, self._newNamesToOldNames[transaction_item]):
                                 remainingUtility += transaction.getUtilities()[k]
 
                     remainingUtility += transaction.getUtilities()[i]
@@ -656,29 +661,22 @@ class SHUIM(_ab._utilityPatterns):
                     self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
                 i -= 1
 
-    def _calculateNeighbourIntersection(self, prefixLength: int) -> List[int]:
+    def _calculateNeighbourIntersection(self, prefixLength: int) -> int:
         """
-        A method to find common Neighbours
+        A method to find the common Neighbours of the current prefix. The mask of the prefix is the mask of its parent
+        prefix, kept in neighbourMasks by the caller one level up, AND the neighbours of its last item.
 
         :param prefixLength: the prefix itemSet
-
-        :type prefixLength:int
-
-        :return: the common neighbours
-
-        :rtype: list
+        :type prefixLength: int
+        :return: bitset of the common neighbours, indexed by the original names of the items
+        :rtype: int
         """
-        intersectionList = self._Neighbours.get(self._temp[0])
-        for i in range(1, prefixLength + 1):
-            intersectionList = self._intersection(self._Neighbours[self._temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self._oldNamesToNewNames:
-                finalIntersectionList.append(self._oldNamesToNewNames[item])
-        return finalIntersectionList
-    
+        mask = self._neighbourhood.neighbourMask(self._temp[prefixLength])
+        if prefixLength > 0:
+            mask &= self._neighbourMasks[prefixLength - 1]
+        self._neighbourMasks[prefixLength] = mask
+        return mask
+
     def _output(self, tempPosition: int, utility: int) -> None:
         """
         A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -753,13 +751,14 @@ class SHUIM(_ab._utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self._utilityBinArraySU:
                     self._utilityBinArraySU[item] = 0
-                if self._newNamesToOldNames[item] not in self._Neighbours:
+                if self._newNamesToOldNames[item] not in self._neighbourhood:
                     self._utilityBinArraySU[item] += utilities[idx]
                     continue
+                itemNeighbours = self._neighbourhood.neighbourMask(self._newNamesToOldNames[item])
                 i = idx + 1
                 sumSu = utilities[idx]
                 while i < len(items):
-                    if self._newNamesToOldNames[items[i]] in self._Neighbours[self._newNamesToOldNames[item]]:
+                    if self._neighbourhood.contains(itemNeighbours, self._newNamesToOldNames[items[i]]):
                         sumSu += utilities[i]
                     i += 1
                 self._utilityBinArraySU[item] += sumSu
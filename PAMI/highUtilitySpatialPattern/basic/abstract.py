@@ -39,6 +39,7 @@ import os.path as _ospath
 import psutil as _psutil
 import sys as _sys
 import functools as _functools
+from PAMI.extras.neighbourhoodIndex import NeighbourhoodIndex as _NeighbourhoodIndex
 
 
 class _utilityPatterns(_ABC):
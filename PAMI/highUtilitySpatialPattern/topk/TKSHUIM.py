@@ -347,7 +347,7 @@ class TKSHUIM(utilityPatterns):
                A method to return common Neighbours of items
         backtrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
                A method to mine the TKSHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodList)
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep, neighbourhoodMask)
                A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method ave a high-utility itemSet to file or memory depending on what the user chose
@@ -418,6 +418,8 @@ class TKSHUIM(utilityPatterns):
     strToint = {}
     intTostr = {}
     Neighbours = {}
+    neighbourhood = None
+    neighbourMasks = [0] * 5000
     temp = [0] * 5000
     maxMemory = 0
     startTime = float()
@@ -461,6 +463,7 @@ class TKSHUIM(utilityPatterns):
                     lst.append(self.dataset.strToint.get(line_split[i]))
                 self.Neighbours[item] = lst
         o.close()
+        self.neighbourhood = NeighbourhoodIndex(self.Neighbours)
         InitialMemory = psutil.virtual_memory()[3]
         self.useUtilityBinArrayToCalculateLocalUtilityFirstTime(self.dataset)
         itemsToKeep = []
@@ -576,18 +579,18 @@ class TKSHUIM(utilityPatterns):
             self.temp[prefixLength] = self.newNamesToOldNames[e]
             if utilityPe >= self.minUtil:
                 self.output(prefixLength, utilityPe)
-            neighbourhoodList = self.calculateNeighbourIntersection(prefixLength)
-            self.useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodList)
+            neighbourhoodMask = self.calculateNeighbourIntersection(prefixLength)
+            self.useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep, neighbourhoodMask)
             newItemsToKeep = []
             newItemsToExplore = []
             for l in range(idx + 1, len(itemsToKeep)):
                 itemK = itemsToKeep[l]
                 if self.utilityBinArraySU[itemK] >= self.minUtil:
-                    if itemK in neighbourhoodList:
+                    if self.neighbourhood.contains(neighbourhoodMask, self.newNamesToOldNames[itemK]):
                         newItemsToExplore.append(itemK)
                         newItemsToKeep.append(itemK)
                 elif self.utilityBinArrayLU[itemK] >= self.minUtil:
-                    if itemK in neighbourhoodList:
+                    if self.neighbourhood.contains(neighbourhoodMask, self.newNamesToOldNames[itemK]):
                         newItemsToKeep.append(itemK)
             self.backtrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
             finalMemory = psutil.virtual_memory()[3]
@@ -595,7 +598,7 @@ class TKSHUIM(utilityPatterns):
             if self.maxMemory < memory:
                 self.maxMemory = memory
 
-    def useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhoodList):
+    def useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe, j, itemsToKeep, neighbourhoodMask):
         """
         A method to  calculate the sub-tree utility and local utility of all items that can extend itemSet P U {e}
 
@@ -605,8 +608,8 @@ class TKSHUIM(utilityPatterns):
         :type j:int
         :param itemsToKeep :the list of promising items
         :type itemsToKeep: list
-        :param neighbourhoodList: list of neighbourhood elements
-        :type neighbourhoodList: list
+        :param neighbourhoodMask: bitset of the common neighbours of P U {e}
+        :type neighbourhoodMask: int
         """
         for i in range(j + 1, len(itemsToKeep)):
             item = itemsToKeep[i]
@@ -619,11 +622,11 @@ class TKSHUIM(utilityPatterns):
                 item = transaction.getItems()[i]
                 if item in itemsToKeep:
                     remainingUtility = 0
-                    if self.newNamesToOldNames[item] in self.Neighbours:
-                        item_neighbours = self.Neighbours[self.newNamesToOldNames[item]]
+                    if self.newNamesToOldNames[item] in self.neighbourhood:
+                        item_neighbours = self.neighbourhood.neighbourMask(self.newNamesToOldNames[item]) & neighbourhoodMask
                         for k in range(i, length):
                             transaction_item = transaction.getItems()[k]
-                            if self.newNamesToOldNames[transaction_item] in item_neighbours and transaction_item in neighbourhoodList:
+                            if self.neighbourhood.contains(item_neighbours, self.newNamesToOldNames[transaction_item]):
                                 remainingUtility += transaction.getUtilities()[k]
 
                     remainingUtility += transaction.getUtilities()[i]
@@ -633,22 +636,20 @@ class TKSHUIM(utilityPatterns):
 
     def calculateNeighbourIntersection(self, prefixLength):
         """
-        A method to find common Neighbours
+        A method to find the common Neighbours of the current prefix. The mask of the prefix is the mask of its parent
+        prefix, kept in neighbourMasks by the caller one level up, AND the neighbours of its last item.
 
         :param prefixLength: the prefix itemSet
-        :type prefixLength:int
-        """
-        intersectionList = self.Neighbours.get(self.temp[0])
-        for i in range(1, prefixLength+1):
-            intersectionList = self.intersection(self.Neighbours[self.temp[i]], intersectionList)
-        finalIntersectionList = []
-        if intersectionList is None:
-            return finalIntersectionList
-        for item in intersectionList:
-            if item in self.oldNamesToNewNames:
-                finalIntersectionList.append(self.oldNamesToNewNames[item])
-        return finalIntersectionList
-    
+        :type prefixLength: int
+        :return: bitset of the common neighbours, indexed by the original names of the items
+        :rtype: int
+        """
+        mask = self.neighbourhood.neighbourMask(self.temp[prefixLength])
+        if prefixLength > 0:
+            mask &= self.neighbourMasks[prefixLength - 1]
+        self.neighbourMasks[prefixLength] = mask
+        return mask
+
     def output(self, tempPosition, utility):
         """
         A method save all high-utility itemSet to file or memory depending on what the user chose
@@ -718,13 +719,14 @@ class TKSHUIM(utilityPatterns):
             for idx, item in enumerate(items):
                 if item not in self.utilityBinArraySU:
                     self.utilityBinArraySU[item] = 0
-                if self.newNamesToOldNames[item] not in self.Neighbours:
+                if self.newNamesToOldNames[item] not in self.neighbourhood:
                     self.utilityBinArraySU[item] += utilities[idx]
                     continue
+                itemNeighbours = self.neighbourhood.neighbourMask(self.newNamesToOldNames[item])
                 i = idx + 1
                 sumSu = utilities[idx]
                 while i < len(items):
-                    if self.newNamesToOldNames[items[i]] in self.Neighbours[self.newNamesToOldNames[item]]:
+                    if self.neighbourhood.contains(itemNeighbours, self.newNamesToOldNames[items[i]]):
                         sumSu += utilities[i]
                     i += 1
                 self.utilityBinArraySU[item] += sumSu
@@ -39,6 +39,7 @@ import os.path
 import psutil
 import sys
 from urllib.request import urlopen
+from PAMI.extras.neighbourhoodIndex import NeighbourhoodIndex
 
 
 class utilityPatterns(ABC):
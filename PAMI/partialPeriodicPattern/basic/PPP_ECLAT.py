@@ -55,7 +55,6 @@ __copyright__ = """
 from PAMI.partialPeriodicPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
-import numpy as np
 from deprecated import deprecated
 
 class PPP_ECLAT(_ab._partialPeriodicPatterns):
@@ -236,13 +235,8 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         :type timeStamps : list
         :return: list
         """
-        timeStamps.sort()
-        per = 0
-        for i in range(len(timeStamps) - 1):
-            j = i + 1
-            if abs(timeStamps[j] - timeStamps[i]) <= self._period:
-                per += 1
-        return per
+        values, offsets = _ab._periodicTidLists.pack([timeStamps])
+        return int(_ab._periodicTidLists.periodicSupports(values, offsets, self._period)[0])
     
     # def _getPerSup(self, arr):
     #     arr = list(arr)
@@ -311,33 +305,25 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         self.mine()
 
     def _getPerSup(self, arr):
-        arr = list(arr)
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-        locs = len(np.where(arr <= self._period)[0])
+        return self._getPeriodicSupport(arr)
 
-        return locs
-    
     def _recursive(self, cands, items):
+        tidLists = _ab._periodicTidLists
         for i in range(len(cands)):
             newCands = []
             nitems = {}
+            # the sorted timestamps of all later candidates are intersected with those of cands[i] in one batch
+            values, offsets = tidLists.pack([items[cand] for cand in cands[i + 1:]], assumeSorted=True)
+            values, offsets = tidLists.intersectMany(items[cands[i]], values, offsets)
+            perSups = tidLists.periodicSupports(values, offsets, self._period).tolist()
+            timeStamps = tidLists.unpack(values, offsets)
             for j in range(i + 1, len(cands)):
-                intersection = items[cands[i]].intersection(items[cands[j]])
-                perSup = self._getPerSup(intersection)
+                perSup = perSups[j - i - 1]
                 if perSup >= self._minPS:
                     nCand = cands[i] + tuple([cands[j][-1]])
                     newCands.append(nCand)
-                    nitems[nCand] = intersection
+                    nitems[nCand] = timeStamps[j - i - 1]
                     self._finalPatterns[nCand] = perSup
-                # if len(intersection) >= self._min:
-                #     perSup = self._getPerSup(intersection)
-                #     ratio = perSup / (len(intersection) + 1)
-                #     if ratio >= self._partialPeriodicPatterns__minPR:
-                #         nCand = cands[i] + tuple([cands[j][-1]])
-                #         newCands.append(nCand)
-                #         nitems[nCand] = intersection
-                #         self._finalPatterns[nCand] = [len(intersection), ratio]
             if len(newCands) > 1:
                 self._recursive(newCands, nitems)
 
@@ -372,12 +358,15 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         cands = []
         nitems = {}
 
-        for k, v in items.items():
-            perSup = self._getPerSup(v)
-            if perSup >= self._minPS:
-                self._finalPatterns[k] = perSup
+        keys = list(items.keys())
+        values, offsets = _ab._periodicTidLists.pack([items[k] for k in keys])
+        perSups = _ab._periodicTidLists.periodicSupports(values, offsets, self._period).tolist()
+        timeStamps = _ab._periodicTidLists.unpack(values, offsets)
+        for i, k in enumerate(keys):
+            if perSups[i] >= self._minPS:
+                self._finalPatterns[k] = perSups[i]
                 cands.append(k)
-                nitems[k] = v
+                nitems[k] = timeStamps[i]
 
         self._recursive(cands, nitems)
 
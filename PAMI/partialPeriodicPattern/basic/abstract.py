@@ -11,6 +11,7 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras import periodicTidLists as _periodicTidLists
 
 
 class _partialPeriodicPatterns(_ABC):
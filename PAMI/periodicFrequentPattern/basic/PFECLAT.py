@@ -57,7 +57,6 @@ __copyright__ = """
 
 import pandas as pd
 from deprecated import deprecated
-import numpy as np
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 
@@ -203,7 +202,9 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if isinstance(self._iFile, _ab._EncodedDatabase) or _ab._usesCache(self._iFile):
+            self._Database = _ab._EncodedDatabase.load(self._iFile, self._sep, temporal=True)
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -219,7 +220,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
                 else:
                     self._Database.append([str(ts[i])])
 
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -245,11 +246,18 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         self.mine()
 
     def _getMaxPer(self, arr, maxTS):
-        arr = np.append(list(arr), [0, maxTS])
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-
-        return np.max(arr)
+        """
+        Maximum difference between consecutive timestamps, measuring the first one from 0 and the last one up to maxTS
+
+        :param arr: timestamps of a pattern
+        :type arr: set or list or numpy.ndarray
+        :param maxTS: the final timestamp of the database
+        :type maxTS: int
+        :return: the maximum periodicity
+        :rtype: int
+        """
+        values, offsets = _ab._periodicTidLists.pack([arr])
+        return int(_ab._periodicTidLists.maxPeriodicities(values, offsets, maxTS)[0])
 
     def mine(self) -> None:
         """
@@ -262,13 +270,18 @@ class PFECLAT(_ab._periodicFrequentPatterns):
 
         items = {}
         maxTS = 0
-        for line in self._Database:
-            index = int(line[0])
-            maxTS = max(maxTS, index)
-            for item in line[1:]:
-                if tuple([item]) not in items:
-                    items[tuple([item])] = set()
-                items[tuple([item])].add(index)
+        if isinstance(self._Database, _ab._EncodedDatabase):
+            items = {tuple([k]): set(v) for k, v in self._Database.tidLists().items()}
+            if len(self._Database):
+                maxTS = max(maxTS, int(self._Database.timestamps.max()))
+        else:
+            for line in self._Database:
+                index = int(line[0])
+                maxTS = max(maxTS, index)
+                for item in line[1:]:
+                    if tuple([item]) not in items:
+                        items[tuple([item])] = set()
+                    items[tuple([item])].add(index)
 
         self._dbSize = maxTS
 
@@ -281,29 +294,43 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         items = {k: v for k, v in items.items() if len(v) >= minSup}
         items = {k: v for k, v in sorted(items.items(), key = lambda x: len(x[1]), reverse = True)}
 
-        keys = []
-        for item in list(items.keys()):
-            per = self._getMaxPer(items[item], maxTS)
-            if per <= maxPer:
-                keys.append(item)
-                self._finalPatterns[item] = [len(items[item]), per, set(items[item])]
+        tidLists = _ab._periodicTidLists
+        keys = list(items.keys())
+        values, offsets = tidLists.pack([items[item] for item in keys])
+        periodicities = tidLists.maxPeriodicities(values, offsets, maxTS).tolist()
+        timeStamps = tidLists.unpack(values, offsets)
+        items = {}
+        newKeys = []
+        for i, item in enumerate(keys):
+            if periodicities[i] <= maxPer:
+                items[item] = timeStamps[i]
+                newKeys.append(item)
+                self._finalPatterns[item] = [len(timeStamps[i]), periodicities[i], set(timeStamps[i].tolist())]
+        keys = newKeys
 
         while keys:
             newKeys = []
             for i in range(len(keys)):
+                siblings = []
                 for j in range(i + 1, len(keys)):
                     if keys[i][:-1] == keys[j][:-1] and keys[i][-1] != keys[j][-1]:
-                        # print(keys[i], keys[j])
-                        newKey = tuple(keys[i] + (keys[j][-1],))
-                        intersect = items[keys[i]].intersection(items[keys[j]])
-                        per = self._getMaxPer(intersect, maxTS)
-                        sup = len(intersect)
-                        if sup >= minSup and per <= maxPer:
-                            items[newKey] = intersect
-                            newKeys.append(newKey)
-                            self._finalPatterns[newKey] = [sup, per, set(intersect)]
+                        siblings.append(keys[j])
                     else:
                         break
+                if not siblings:
+                    continue
+                # the sorted timestamps of all siblings are intersected with those of keys[i] in one batch
+                values, offsets = tidLists.pack([items[key] for key in siblings], assumeSorted=True)
+                values, offsets = tidLists.intersectMany(items[keys[i]], values, offsets)
+                supports = tidLists.supports(offsets).tolist()
+                periodicities = tidLists.maxPeriodicities(values, offsets, maxTS).tolist()
+                timeStamps = tidLists.unpack(values, offsets)
+                for j, sibling in enumerate(siblings):
+                    if supports[j] >= minSup and periodicities[j] <= maxPer:
+                        newKey = tuple(keys[i] + (sibling[-1],))
+                        items[newKey] = timeStamps[j]
+                        newKeys.append(newKey)
+                        self._finalPatterns[newKey] = [supports[j], periodicities[j], set(timeStamps[j].tolist())]
             keys = newKeys
 
         newPattern = {}
@@ -59,7 +59,6 @@ from PAMI.periodicFrequentPattern.basic import abstract as _ab
 from typing import Dict, Tuple
 import pandas as pd
 from deprecated import deprecated
-import numpy as np
 
 _maxPer = float()
 _minSup = float()
@@ -241,7 +240,9 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if isinstance(self._iFile, _ab._EncodedDatabase) or _ab._usesCache(self._iFile):
+            self._Database = _ab._EncodedDatabase.load(self._iFile, self._sep, temporal=True)
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -257,7 +258,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
                 else:
                     self._Database.append([str(ts[i])])
 
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -303,20 +304,40 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
     def _getMaxPer(self, arr, maxTS):
         """
-        This method appends `0` and `maxTS` to the input array, sorts the array,
-        and then computes the differences between consecutive elements.
+        This method computes the maximum difference between consecutive timestamps of the input array,
+        measuring the first one from `0` and the last one up to `maxTS`.
 
         :param arr: The input array of elements.
         :type arr: numpy.ndarray
         :param maxTS: The maximum timestamp to be appended to the array.
         :type maxTS: int or float
-        :return: None
+        :return: the maximum periodicity
+        :rtype: int
+        """
+        values, offsets = _ab._periodicTidLists.pack([arr])
+        return int(_ab._periodicTidLists.maxPeriodicities(values, offsets, maxTS)[0])
+
+    def _periodicItems(self, itemLocs, minSup, maxPer, maxTS):
         """
-        arr = np.append(arr, [0, maxTS])
-        arr = np.sort(arr)
-        arr = np.diff(arr)
+        Computes the periodicity of all items of a (conditional) database in one batch and keeps the periodic-frequent
+        ones.
 
-        return np.max(arr)
+        :param itemLocs: A dictionary where keys are items and values are lists of timestamps.
+        :type itemLocs: dict
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        :param maxPer: The maximum period threshold.
+        :type maxPer: int or float
+        :param maxTS: The maximum timestamp.
+        :type maxTS: int or float
+        :return: dictionary mapping every periodic-frequent item to its support and periodicity
+        :rtype: dict
+        """
+        frequent = [item for item in itemLocs if len(itemLocs[item]) >= minSup]
+        values, offsets = _ab._periodicTidLists.pack([itemLocs[item] for item in frequent])
+        periodicities = _ab._periodicTidLists.maxPeriodicities(values, offsets, maxTS).tolist()
+        supports = _ab._periodicTidLists.supports(offsets).tolist()
+        return {frequent[i]: [supports[i], periodicities[i]] for i in range(len(frequent)) if periodicities[i] <= maxPer}
 
     def _construct(self, items, data, minSup, maxPer, maxTS, patterns):
 
@@ -345,14 +366,12 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
         # maxPerItems = {k: self.getMaxPer(v, maxTS) for k, v in items.items() if len(v) >= minSup}
 
-        items = {k: v for k, v in items.items() if len(v) >= minSup and self._getMaxPer(v, maxTS) <= maxPer}
+        periodicItems = self._periodicItems(items, minSup, maxPer, maxTS)
+        items = {k: v for k, v in items.items() if k in periodicItems}
 
         #tested ok
-        for item, ts in items.items():
-            # pat = "\t".join(item)
-            # self.patCount += 1
-            # patterns[pat] = (len(ts), self.getMaxPer(ts, maxTS))
-            patterns[tuple([item])] = [len(ts), self._getMaxPer(ts, maxTS)]
+        for item, value in periodicItems.items():
+            patterns[tuple([item])] = value
 
         root = _Node([], None, None)
         itemNodes = {}
@@ -413,18 +432,12 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
                     else:
                         itemLocs[item] = list(locs)
 
-            # Precompute getMaxPer results for itemLocs
-            maxPerResults = {item: self._getMaxPer(itemLocs[item], maxTS) for item in itemLocs if len(itemLocs[item]) >= minSup}
+            # support and periodicity of all items of the conditional database in one batch
+            periodicItems = self._periodicItems(itemLocs, minSup, maxPer, maxTS)
+            itemLocs = {k: v[0] for k, v in periodicItems.items()}
 
-            # Filter itemLocs based on minSup and maxPer
-            itemLocs = {k: len(v) for k, v in itemLocs.items() if k in maxPerResults and maxPerResults[k] <= maxPer}
-
-            # Iterate over filtered itemLocs
-            for item in itemLocs:
-                # pat = "\t".join([str(x) for x in newRoot.item + [item]])
-                # self.patCount += 1
-                # patterns[pat] = [itemLocs[item], maxPerResults[item]]
-                patterns[tuple(newRoot.item + [item])] = [itemLocs[item], maxPerResults[item]]
+            for item, value in periodicItems.items():
+                patterns[tuple(newRoot.item + [item])] = value
             
             if not itemLocs:
                 continue
@@ -475,12 +488,15 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         items = {}
 
         # tested ok
-        for line in self._Database:
-            index = int(line[0])
-            for item in line[1:]:
-                if item not in items:
-                    items[item] = []
-                items[item].append(index)
+        if isinstance(self._Database, _ab._EncodedDatabase):
+            items = self._Database.tidLists()
+        else:
+            for line in self._Database:
+                index = int(line[0])
+                for item in line[1:]:
+                    if item not in items:
+                        items[item] = []
+                    items[item].append(index)
 
         root, itemNodes = self._construct(items, self._Database, _minSup, _maxPer, _lno, self._finalPatterns)
 
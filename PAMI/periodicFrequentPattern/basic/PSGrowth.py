@@ -741,7 +741,9 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if isinstance(self._iFile, _ab._EncodedDatabase) or _ab._usesCache(self._iFile):
+            self._Database = _ab._EncodedDatabase.load(self._iFile, self._sep, temporal=True)
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
             ts, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -757,7 +759,7 @@ class PSGrowth(_ab._periodicFrequentPatterns):
                 else:
                     self._Database.append([str(ts[i])])
 
-        if isinstance(self._iFile, str):
+        elif isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
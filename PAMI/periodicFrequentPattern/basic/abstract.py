@@ -26,6 +26,9 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras import periodicTidLists as _periodicTidLists
+from PAMI.extras.encodedDatabase import EncodedDatabase as _EncodedDatabase
+from PAMI.extras.encodedDatabase import usesCache as _usesCache
 
 
 class _periodicFrequentPatterns(_ABC):
@@ -35,8 +38,9 @@ class _periodicFrequentPatterns(_ABC):
 
     :Attributes:
 
-        iFile : str
-            Input file name or path of the input file
+        iFile : str or DataFrame or EncodedDatabase
+            Input file name or path of the input file. A database parsed once with
+            PAMI.extras.encodedDatabase.EncodedDatabase can be passed to avoid parsing the file again
         minSup : int or float or str
             The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
@@ -84,7 +88,7 @@ class _periodicFrequentPatterns(_ABC):
     def __init__(self, iFile, minSup, maxPer, sep = '\t'):
         """
         :param iFile: Input file name or path of the input file
-        :type iFile: str
+        :type iFile: str or DataFrame or EncodedDatabase
         :param minSup: The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
             Otherwise, it will be treated as float.
@@ -184,6 +184,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
     _lno = int()
     _minimum = int()
     _mapSupport = {}
+    _heap = None
 
     def _creatingItemSets(self):
         """
@@ -273,15 +274,11 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         self._k = self._convert(self._k)
         self._mapSupport = {k: [v[0], v[1]] for k, v in self._mapSupport.items() if v[1] <= self._maxPer}
         plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: (x[1][0], x[0]), reverse=True)]
-        self._finalPatterns = {}
-        #print(len(plist))
+        self._heap = _ab._TopKHeap(self._k, floor=1)
         for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = [self._mapSupport[i][0], self._mapSupport[i][1]]
-        self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
+            self._heap.push(i, [self._mapSupport[i][0], self._mapSupport[i][1]], self._mapSupport[i][0])
+        self._minimum = self._heap.threshold()
+        plist = list(self._heap.patterns().keys())
         return plist
 
     def _getSupportAndPeriod(self, timeStamps):
@@ -324,21 +321,8 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
         sample = str()
         for i in prefix:
             sample = sample + i + " "
-        if len(self._finalPatterns) < self._k:
-            if val[0] >= self._minimum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in
-                                  sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x: x[1][0]):
-                if val[0] > y[0]:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[x] = y
-                    self._finalPatterns = {k: v for k, v in
-                                          sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                    self._minimum = min([self._finalPatterns[i][0] for i in self._finalPatterns.keys()])
-                    return
+        self._heap.push(sample, val, val[0])
+        self._minimum = self._heap.threshold()
 
     def _Generation(self, prefix, itemSets, tidSets):
         """
@@ -404,6 +388,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = self._heap.patterns()
         print("TopK Periodic Frequent patterns were generated successfully")
         self._endTime = _ab._time.time()
         _process = _ab._psutil.Process(_ab._os.getpid())
@@ -438,6 +423,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = self._heap.patterns()
         print("TopK Periodic Frequent patterns were generated successfully")
         self._endTime = _ab._time.time()
         _process = _ab._psutil.Process(_ab._os.getpid())
@@ -184,6 +184,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
     _tidList = {}
     lno = int()
     _maximum = int()
+    _heap = None
 
     def _creatingItemSets(self):
         """
@@ -258,13 +259,12 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         for x, y in self._mapSupport.items():
             self._mapSupport[x][1] = max(self._mapSupport[x][1], abs(n - self._mapSupport[x][2]))
         plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x_: x_[1], reverse=True)]
+        # the heap keeps the largest scores, so the patterns are ranked by their negated periodicity
+        self._heap = _ab._TopKHeap(self._k)
         for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = self._mapSupport[i][1]
-        self._maximum = max([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
+            self._heap.push(i, self._mapSupport[i][1], -self._mapSupport[i][1])
+        self._maximum = -self._heap.threshold()
+        plist = list(self._heap.patterns().keys())
         return plist
 
 
@@ -287,21 +287,8 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         sample = str()
         for i in prefix:
             sample = sample + i + " "
-        if len(self._finalPatterns) < self._k:
-            if val < self._maximum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._maximum = max([i for i in self._finalPatterns.values()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda _x: _x[1], reverse=True):
-                if val < y:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[sample] = val
-                    self._finalPatterns = {k: v for k, v in
-                                              sorted(self._finalPatterns.items(), key=lambda item: item[1],
-                                                     reverse=True)}
-                    self._maximum = max([i for i in self._finalPatterns.values()])
-                    return
+        self._heap.push(sample, val, -val)
+        self._maximum = -self._heap.threshold()
 
     def _Generation(self, prefix, itemSets, tidSets):
         """Equivalence class is followed  and checks for the patterns generated for periodic-frequent patterns.
@@ -331,7 +318,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                 itemJ = itemSets[j]
                 tidSetJ = tidSets[j]
                 y = list(set(tidSetI).intersection(tidSetJ))
-                if self.getPer_Sup(y) <= self._maximum:
+                if y and self.getPer_Sup(y) <= self._maximum:
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
             newPrefix = list(set(itemSetX)) + prefix
@@ -380,10 +367,11 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                 itemJ = plist[j]
                 tidSetJ = self._tidList[itemJ]
                 y1 = list(set(tidSetI).intersection(tidSetJ))
-                if self.getPer_Sup(y1) <= self._maximum:
+                if y1 and self.getPer_Sup(y1) <= self._maximum:
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = self._heap.patterns()
         print("kPFPMiner has successfully generated top-k frequent patterns")
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
@@ -415,10 +403,11 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                 itemJ = plist[j]
                 tidSetJ = self._tidList[itemJ]
                 y1 = list(set(tidSetI).intersection(tidSetJ))
-                if self.getPer_Sup(y1) <= self._maximum:
+                if y1 and self.getPer_Sup(y1) <= self._maximum:
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = self._heap.patterns()
         print("kPFPMiner has successfully generated top-k frequent patterns")
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
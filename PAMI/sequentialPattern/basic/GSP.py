@@ -31,6 +31,8 @@
 #
 #             run = obj.getRuntime()
 #
+#             obj = alg.GSP(iFile, minSup, workers=4)  # the candidates of every level are counted by 4 processes
+#
 
 
 
@@ -53,14 +55,43 @@ __copyright__ = """
      Copyright (C)  2021 Rage Uday Kiran
 
 """
-import collections
 import itertools
+from bisect import bisect_right as _bisect_right, bisect_left as _bisect_left
 import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
 
 _ab._sys.setrecursionlimit(10000)
+_workerMiner = None
+
+
+def _initWorker(index, sepSeq) -> None:
+    """
+    Creates the miner used by a worker process to count the supports of candidates
+
+    :param index: the inverted index of the database, see GSP._buildIndex
+    :type index: dict
+    :param sepSeq: separator of the itemsets of a pattern
+    :type sepSeq: str
+    """
+    global _workerMiner
+    _workerMiner = GSP(None, 0, sepSeq=sepSeq)
+    _workerMiner._index = index
+
+
+def _countBatch(candidates, minSup) -> list:
+    """
+    Counts the supports of a batch of candidates in a worker process
+
+    :param candidates: the candidate patterns
+    :type candidates: list
+    :param minSup: candidates found in fewer sequences than minSup are reported with a support of 0
+    :type minSup: int or float
+    :return: the support of every candidate
+    :rtype: list
+    """
+    return [_workerMiner._support(_workerMiner.list_split(candidate), minSup) for candidate in candidates]
 
 class GSP(_ab._sequentialPatterns):
     """
@@ -81,6 +112,8 @@ class GSP(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  workers: int :
+                   Number of processes that count the supports of the candidates of a level. The default of 1 counts in the calling process and None uses all cores.
 
     :Attributes:
 
@@ -114,6 +147,9 @@ class GSP(_ab._sequentialPatterns):
                 To store the datas in same sequence separated by sequence, rownumber, length.
             _seqSep   :str
                 separator to separate each itemset
+            _index : dict
+                Inverted index of the database. For every item it maps the id of every sequence containing the item
+                to the sorted positions of the itemsets of the sequence that contain the item
 
     :Methods:
 
@@ -135,6 +171,8 @@ class GSP(_ab._sequentialPatterns):
                 Generates frequent patterns from the candidate patterns
             frequentToCandidate(frequentList, length)
                 Generates candidate patterns from the frequent patterns
+            getSup(pattern)
+                Counts the sequences containing a pattern using the inverted index
 
     **Methods to execute code on terminal**
     -------------------------------------------
@@ -202,6 +240,15 @@ class GSP(_ab._sequentialPatterns):
     _Database = []
     _xLenDatabase={}
     _xLenDatabaseSame = {}
+    _index = {}
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1", workers=1):
+        super().__init__(iFile, minSup, sep, sepSeq)
+        self._workers = _ab._os.cpu_count() if workers is None else int(workers)
+        if self._workers < 1:
+            raise ValueError("workers should be a positive integer")
+        self._pool = None
+
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
@@ -279,25 +326,29 @@ class GSP(_ab._sequentialPatterns):
         return value
 
 
+    def _buildIndex(self):
+        """
+        Builds the inverted index of the database in one scan. For every item, the index maps the id of every sequence
+        containing the item to the sorted positions of the itemsets of the sequence that contain it, so that the
+        support of a candidate is counted on the sequences containing all of its items only.
+        """
+        self._index = {}
+        for sid, seq in enumerate(self._Database):
+            for position, itemset in enumerate(seq):
+                for item in set(itemset):
+                    self._index.setdefault(item, {}).setdefault(sid, []).append(position)
+
     def make1LenDatabase(self):
         """
         To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
         """
-
-
-        idDatabase=[]
+        self._buildIndex()
+        # the items are listed in the order of their first appearance, every sequence contributing its items sorted
+        order = {}
         for line in self._Database:
-            x=[]
-            for _ in line:
-                
-                x+=list(itertools.chain.from_iterable(line))
-            
-            idDatabase+=list(sorted(set(x)))
-
-
-        newDatabase=collections.Counter(idDatabase)
-        newDatabase={i:v for i,v in newDatabase.items() if v>=self._minSup}
-        self._finalPatterns={str(i):v for i,v in newDatabase.items()}
+            for item in sorted(set(itertools.chain.from_iterable(line))):
+                order.setdefault(item, None)
+        self._finalPatterns={str(i):len(self._index[i]) for i in order if len(self._index[i])>=self._minSup}
         
     def list_split(self,L):
         """
@@ -336,18 +387,108 @@ class GSP(_ab._sequentialPatterns):
             
             
         
+    def _matchItemset(self, positions, after):
+        """
+        Finds the first itemset after a position that contains all items of an itemset of a pattern
+
+        :param positions: the positions of the itemsets containing every item of the itemset, in one sequence
+        :type positions: list
+        :param after: the position of the itemset matched by the previous itemset of the pattern
+        :type after: int
+        :return: the position of the first matching itemset, or -1 if there is none
+        :rtype: int
+        """
+        first = positions[0]
+        for k in range(_bisect_right(first, after), len(first)):
+            position = first[k]
+            for other in positions[1:]:
+                i = _bisect_left(other, position)
+                if i == len(other) or other[i] != position:
+                    break
+            else:
+                return position
+        return -1
+
+    def _support(self, pattern, minSup=0):
+        """
+        Counts the sequences containing a pattern with the inverted index. Only the sequences containing every item of
+        the pattern are checked, and in each of them the itemsets of the pattern are matched to the earliest possible
+        itemsets, as checkPattern does.
+
+        :param pattern: the pattern, as a list of itemsets
+        :type pattern: list
+        :param minSup: a pattern found in fewer sequences than minSup is reported with a support of 0
+        :type minSup: int or float
+        :return: the support of the pattern
+        :rtype: int
+        """
+        postings = {}
+        for itemset in pattern:
+            for item in itemset:
+                if item not in postings:
+                    if item not in self._index:
+                        return 0
+                    postings[item] = self._index[item]
+        ordered = sorted(postings.values(), key=len)
+        sids = ordered[0].keys()
+        for other in ordered[1:]:
+            if len(sids) < minSup:
+                return 0
+            sids = [sid for sid in sids if sid in other]
+        if len(sids) < minSup:
+            return 0
+        itemsets = [sorted(set(itemset), key=lambda item: len(postings[item])) for itemset in pattern]
+        sup = 0
+        for sid in sids:
+            after = -1
+            for itemset in itemsets:
+                after = self._matchItemset([postings[item][sid] for item in itemset], after)
+                if after < 0:
+                    break
+            else:
+                sup += 1
+        return sup
+
     def getSup(self,pattern):
         """
         count up the support of the pattern
         :param pattern:list the candidate pattern
         :return:  sup:int  the support of the pattern
         """
-        sup=0
-        pattern=self.list_split(pattern)
-        for seq in self._Database:
-            
-            sup+=self.checkPattern(pattern,seq)
-        return sup
+        return self._support(self.list_split(pattern))
+
+    def _countCandidates(self, candidates):
+        """
+        Counts the supports of the candidates of a level, spreading them over the worker processes when workers > 1.
+        Candidates that are not frequent are reported with a support of 0.
+
+        :param candidates: the candidate patterns
+        :type candidates: list
+        :return: the support of every candidate
+        :rtype: list
+        """
+        if self._pool is None or len(candidates) < 2:
+            return [self._support(self.list_split(candidate), self._minSup) for candidate in candidates]
+        size = -(-len(candidates) // (self._workers * 4))
+        batches = [candidates[i:i + size] for i in range(0, len(candidates), size)]
+        return list(itertools.chain.from_iterable(
+            self._pool.map(_countBatch, batches, itertools.repeat(self._minSup))))
+
+    def _addFrequent(self, candidates):
+        """
+        Counts the supports of the candidates of a level and stores the frequent ones
+
+        :param candidates: the candidate patterns
+        :type candidates: list
+        :return: the frequent patterns, in the order of the candidates
+        :rtype: list
+        """
+        nextPatterns = []
+        for pattern, sup in zip(candidates, self._countCandidates(candidates)):
+            if sup >= self._minSup:
+                self._finalPatterns[tuple(pattern)] = sup
+                nextPatterns.append(pattern)
+        return nextPatterns
         
     def make2LenDatabase(self):
         """
@@ -358,32 +499,16 @@ class GSP(_ab._sequentialPatterns):
         self._xLenDatabase = {}
         keyList=[i for i in self._finalPatterns.keys()]
         keyNumber=0
-        nextPatterns=[]
+        candidates=[]
         
         for key1 in keyList:
-            newPattern1=[key1,self._sepSeq,key1]
-            sup=self.getSup(newPattern1)
-            if sup>=self._minSup:
-                self._finalPatterns[tuple(newPattern1)]=sup
-                nextPatterns.append(newPattern1)
+            candidates.append([key1,self._sepSeq,key1])
             keyNumber+=1
             for key2 in keyList[keyNumber:]:
-                newPattern1=[key1,self._sepSeq,key2]
-                sup=self.getSup(newPattern1)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern1)]=sup
-                    nextPatterns.append(newPattern1)
-                newPattern2=[key2,self._sepSeq,key1]
-                sup=self.getSup(newPattern2)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern2)]=sup
-                    nextPatterns.append(newPattern2)
-                newPattern3=list(sorted(set([key1,key2])))
-                sup=self.getSup(newPattern3)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern3)]=sup
-                    nextPatterns.append(newPattern3)
-        return nextPatterns
+                candidates.append([key1,self._sepSeq,key2])
+                candidates.append([key2,self._sepSeq,key1])
+                candidates.append(list(sorted(set([key1,key2]))))
+        return self._addFrequent(candidates)
 
     def makeCandidateDatabase(self,patterns):
         """
@@ -445,14 +570,7 @@ class GSP(_ab._sequentialPatterns):
         :param patterns: patterns
         
         """
-        patterns=self.makeCandidate(patterns)
-        nextPatterns=[]
-        for pattern in patterns:
-                sup=self.getSup(pattern)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(pattern)]=sup
-                    nextPatterns.append(pattern)
-        return nextPatterns
+        return self._addFrequent(self.makeCandidate(patterns))
                     
     def startMine(self) -> None:
         self.mine()
@@ -466,9 +584,17 @@ class GSP(_ab._sequentialPatterns):
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
         self.make1LenDatabase()
-        nextPatterns=self.make2LenDatabase()
-        while len(nextPatterns)>0:
-            nextPatterns= self.makexLenDatabase(nextPatterns)
+        if self._workers > 1 and len(self._finalPatterns) > 1:
+            self._pool = _ab._ProcessPoolExecutor(max_workers=self._workers, initializer=_initWorker,
+                                                  initargs=(self._index, self._sepSeq))
+        try:
+            nextPatterns=self.make2LenDatabase()
+            while len(nextPatterns)>0:
+                nextPatterns= self.makexLenDatabase(nextPatterns)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
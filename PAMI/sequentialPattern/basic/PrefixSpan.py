@@ -60,6 +60,8 @@ from deprecated import deprecated
 from PAMI.sequentialPattern.basic import abstract as _ab
 import copy
 import re
+from array import array as _array
+from bisect import bisect_right as _bisectRight
 _ab._sys.setrecursionlimit(10000)
 
 class PrefixSpan(_ab._sequentialPatterns):
@@ -80,6 +82,8 @@ class PrefixSpan(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  pseudoProjection: bool :
+                   Mine with pseudo-projection (default). The database is encoded once into shared integer arrays and every projected database is a list of (sequence id, offset) pointers into them. Set it to False to use the original copying projections.
 
     :Attributes:
 
@@ -107,6 +111,8 @@ class PrefixSpan(_ab._sequentialPatterns):
             To store the total amount of RSS memory consumed by the program
         Database : list
             To store the transactions of a database in list
+        pseudoProjection : bool
+            Whether projected databases are kept as pointers into the encoded database
 
     :Methods:
 
@@ -193,6 +199,18 @@ class PrefixSpan(_ab._sequentialPatterns):
     _memoryRSS = float()
     _Database = []
     _sepDatabase={}
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1", pseudoProjection=True):
+        super().__init__(iFile, minSup, sep, sepSeq)
+        self._pseudoProjection = pseudoProjection
+        self._itemNames = []
+        self._items = _array('i')
+        self._itemsetOffsets = _array('q')
+        self._sequenceItemsets = _array('q')
+        self._itemsetOf = _array('i')
+        self._occurrences = _array('q')
+        self._occurrenceOffsets = _array('q')
+
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
@@ -503,34 +521,190 @@ class PrefixSpan(_ab._sequentialPatterns):
             self.makeNextSame(seqDatabaseSame,startrow)
 
 
+    def _encodeDatabase(self):
+        """
+        Encodes the database once into flat arrays shared by every projection. The items of all the itemsets are
+        stored one after the other in items, itemsetOffsets gives the start of every itemset, sequenceItemsets the
+        first itemset of every sequence and itemsetOf the itemset of every position. Item ids follow the string
+        order of the items, so the ids inside an itemset are ascending. The positions of every item are kept in
+        occurrences, item by item, so that the next match of an item is found by binary search. Items below minSup
+        are dropped while encoding, as no pattern can contain them.
+        """
+        support = {}
+        for line in self._Database:
+            for item in set(line):
+                if item != ":":
+                    support[item] = support.get(item, 0) + 1
+        self._itemNames = sorted(item for item, count in support.items() if count >= self._minSup)
+        ids = {item: i for i, item in enumerate(self._itemNames)}
+        self._items = _array('i')
+        self._itemsetOffsets = _array('q')
+        self._sequenceItemsets = _array('q', [0])
+        for line in self._Database:
+            itemset = set()
+            for item in list(line) + [":"]:
+                if item != ":":
+                    if item in ids:
+                        itemset.add(ids[item])
+                elif itemset:
+                    self._itemsetOffsets.append(len(self._items))
+                    self._items.extend(sorted(itemset))
+                    itemset = set()
+            self._sequenceItemsets.append(len(self._itemsetOffsets))
+        self._itemsetOffsets.append(len(self._items))
+        self._itemsetOf = _array('i', bytes(4 * len(self._items)))
+        for itemset in range(len(self._itemsetOffsets) - 1):
+            for position in range(self._itemsetOffsets[itemset], self._itemsetOffsets[itemset + 1]):
+                self._itemsetOf[position] = itemset
+        positions = [_array('q') for _ in self._itemNames]
+        for position, item in enumerate(self._items):
+            positions[item].append(position)
+        self._occurrences = _array('q')
+        self._occurrenceOffsets = _array('q', [0])
+        for itemPositions in positions:
+            self._occurrences.extend(itemPositions)
+            self._occurrenceOffsets.append(len(self._occurrences))
+
+    def _countExtensions(self, last, sids, positions):
+        """
+        Counts, once per sequence, the items that extend a prefix with a new itemset and the items that extend
+        the last itemset of the prefix.
+
+        :param last: item ids of the last itemset of the prefix, empty for the empty prefix
+        :type last: list
+        :param sids: sequences of the projected database
+        :type sids: array
+        :param positions: position of the last matched item of the prefix in every sequence
+        :type positions: array
+        :return: supports of the sequence extensions and of the itemset extensions
+        :rtype: tuple
+        """
+        items, starts, firstItemsets = self._items, self._itemsetOffsets, self._sequenceItemsets
+        itemsetOf, occurrences = self._itemsetOf, self._occurrences
+        sCounts, iCounts = {}, {}
+        if last:
+            lastItem, rest = last[-1], last[:-1]
+            low, high = self._occurrenceOffsets[lastItem], self._occurrenceOffsets[lastItem + 1]
+        for sid, pos in zip(sids, positions):
+            following = starts[itemsetOf[pos] + 1] if pos >= 0 else 0
+            end = starts[firstItemsets[sid + 1]]
+            for item in set(items[following:end]):
+                sCounts[item] = sCounts.get(item, 0) + 1
+            if not last:
+                continue
+            iItems = set(items[pos + 1:following])
+            # later itemsets that contain the whole last itemset of the prefix
+            i = _bisectRight(occurrences, following - 1, low, high)
+            while i < high and occurrences[i] < end:
+                match = occurrences[i]
+                itemset = itemsetOf[match]
+                if all(item in items[starts[itemset]:match] for item in rest):
+                    iItems.update(items[match + 1:starts[itemset + 1]])
+                i += 1
+            for item in iItems:
+                iCounts[item] = iCounts.get(item, 0) + 1
+        return sCounts, iCounts
+
+    def _project(self, last, item, sameItemset, sids, positions):
+        """
+        Builds the projected database of an extended prefix as pointers to the earliest match of item.
+
+        :param last: item ids of the last itemset of the prefix
+        :type last: list
+        :param item: id of the item extending the prefix
+        :type item: int
+        :param sameItemset: True if item extends the last itemset, False if it starts a new one
+        :type sameItemset: bool
+        :param sids: sequences of the projected database of the prefix
+        :type sids: array
+        :param positions: position of the last matched item of the prefix in every sequence
+        :type positions: array
+        :return: sequences and positions of the projected database of the extended prefix
+        :rtype: tuple
+        """
+        items, starts, firstItemsets = self._items, self._itemsetOffsets, self._sequenceItemsets
+        itemsetOf, occurrences = self._itemsetOf, self._occurrences
+        low, high = self._occurrenceOffsets[item], self._occurrenceOffsets[item + 1]
+        newSids, newPositions = _array('i'), _array('q')
+        for sid, pos in zip(sids, positions):
+            following = starts[itemsetOf[pos] + 1] if pos >= 0 else 0
+            end = starts[firstItemsets[sid + 1]]
+            i = _bisectRight(occurrences, pos if sameItemset else following - 1, low, high)
+            if not sameItemset:
+                if i < high and occurrences[i] < end:
+                    newSids.append(sid)
+                    newPositions.append(occurrences[i])
+                continue
+            while i < high and occurrences[i] < end:
+                match = occurrences[i]
+                if match < following or all(x in items[starts[itemsetOf[match]]:match] for x in last):
+                    newSids.append(sid)
+                    newPositions.append(match)
+                    break
+                i += 1
+        return newSids, newPositions
+
+    def _growPattern(self, pattern, sids, positions):
+        """
+        Stores the frequent extensions of a prefix and mines their projected databases depth first.
+
+        :param pattern: itemsets of item ids of the prefix
+        :type pattern: list
+        :param sids: sequences of the projected database of the prefix
+        :type sids: array
+        :param positions: position of the last matched item of the prefix in every sequence
+        :type positions: array
+        """
+        last = pattern[-1] if pattern else []
+        sCounts, iCounts = self._countExtensions(last, sids, positions)
+        for sameItemset, counts in ((False, sCounts), (True, iCounts)):
+            for item in sorted(counts):
+                if counts[item] < self._minSup:
+                    continue
+                if sameItemset:
+                    newPattern = pattern[:-1] + [last + [item]]
+                else:
+                    newPattern = pattern + [[item]]
+                key = []
+                for itemset in newPattern:
+                    key.extend(self._itemNames[i] for i in itemset)
+                    key.append(":")
+                self._finalPatterns[str(key)] = counts[item]
+                self._growPattern(newPattern, *self._project(last, item, sameItemset, sids, positions))
+
+    def _pseudoProjectionMine(self):
+        """
+        Mines the patterns with pseudo-projection, starting from the empty prefix positioned before the first
+        item of every sequence. The parsed database is released once it is encoded, so that only the arrays are
+        kept while mining.
+        """
+        self._encodeDatabase()
+        self._Database = []
+        sids = _array('i', range(len(self._sequenceItemsets) - 1))
+        positions = _array('q', (self._itemsetOffsets[self._sequenceItemsets[sid]] - 1 for sid in sids))
+        self._growPattern([], sids, positions)
+
     def startMine(self):
         """
         Frequent pattern mining process will start from here
         """
-        self._Database = []
-        self._startTime = _ab._time.time()
-        self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
-        self._minSup = self._convert(self._minSup)
-        self.makeSeqDatabaseFirst(self._Database)
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using prefixSpan algorithm ")
+        self.mine()
 
     def mine(self):
         """
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
-        self._minSup = self._convert(self._minSup)
-        self.makeSeqDatabaseFirst(self._Database)
+        if self._pseudoProjection:
+            self._minSup = self._convert(self._minSup)
+            self._pseudoProjectionMine()
+        else:
+            self._Database=self.makeSupDatabase(self._Database,"")
+            self._minSup = self._convert(self._minSup)
+            self.makeSeqDatabaseFirst(self._Database)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
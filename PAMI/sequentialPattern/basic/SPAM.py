@@ -55,6 +55,7 @@ __copyright__ = """
 
 
 import pandas as pd
+import numpy as _np
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
@@ -105,7 +106,10 @@ class SPAM(_ab._sequentialPatterns):
             Database : list
                 To store the sequences of a database in list
             _idDatabase : dict
-                To store the sequences of a database by bit map
+                To store the sequences of a database by bit map. Every frequent item maps to the sorted ids of the
+                sequences containing it and a 2-D uint64 array with one row of packed itemset positions per sequence
+            _rank : dict
+                Position of every frequent item in the order of the items, used to order the istep items
             _maxSeqLen:
                 the maximum length of subsequence in sequence.
             _seqSep   :str
@@ -284,39 +288,103 @@ class SPAM(_ab._sequentialPatterns):
 
     def make2BitDatabase(self):
         """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
+        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database.
+        The bitmap of every item holds one row of 64-bit words per sequence containing the item, bit p of the row being
+        set when the p-th itemset of the sequence contains the item.
         """
+        self._idDatabase = {}
+        self._rank = {}
         self._maxSeqLen=max([len(i) for i in self._Database])
-        lineNumber=0
-        idDatabase={}
-        for line in self._Database:
-            seqNumber=1
-            for seq in line:
-
+        self._words = max(1, -(-self._maxSeqLen // 64))
+        itemIds = {}
+        itemNames = []
+        occurrences = []
+        for lineNumber, line in enumerate(self._Database):
+            for position, seq in enumerate(line):
                 for data in seq:
-                    if data in idDatabase:
-                        while lineNumber+1!=len(idDatabase[data]):
-                            idDatabase[data].append(0)
-                        idDatabase[data][lineNumber]+=int(2**(self._maxSeqLen-seqNumber))
-
-                    else:
-                        idDatabase[data]=[]
-                        while lineNumber+1!=len(idDatabase[data]):
-                            idDatabase[data].append(0)
-                        idDatabase[data][lineNumber]+=(int(2 ** (self._maxSeqLen-seqNumber)))
-
-                seqNumber+=1
-            lineNumber+=1
-        for key,val in idDatabase.items():
-
-            sup=self.countSup(val)
-            while lineNumber+1!=len(idDatabase[key]):
-                            idDatabase[key].append(0)
+                    index = itemIds.get(data)
+                    if index is None:
+                        index = itemIds[data] = len(itemNames)
+                        itemNames.append(data)
+                    occurrences.append((index, lineNumber, position))
+        self._rowOf = _np.full(len(self._Database), -1, dtype=_np.int32)
+        if not occurrences:
+            return
+        items, sids, positions = _np.array(occurrences, dtype=_np.int64).T
+        # one entry per item, sequence and word, with the bits of the positions falling into the word
+        keys = (items * len(self._Database) + sids) * self._words + positions // 64
+        bits = _np.left_shift(_np.uint64(1), (positions % 64).astype(_np.uint64))
+        order = _np.argsort(keys, kind='stable')
+        keys, bits = keys[order], bits[order]
+        starts = _np.flatnonzero(_np.concatenate(([True], keys[1:] != keys[:-1])))
+        bits = _np.bitwise_or.reduceat(bits, starts)
+        keys = keys[starts]
+        words = keys % self._words
+        rows = keys // self._words
+        rowStarts = _np.flatnonzero(_np.concatenate(([True], rows[1:] != rows[:-1])))
+        rowOf = _np.cumsum(_np.concatenate(([False], rows[1:] != rows[:-1])))
+        rows = rows[rowStarts]
+        matrix = _np.zeros((len(rows), self._words), dtype=_np.uint64)
+        matrix[rowOf, words] = bits
+        rowItems = rows // len(self._Database)
+        bounds = _np.searchsorted(rowItems, _np.arange(len(itemNames) + 1))
+        for index, key in enumerate(itemNames):
+            first, last = bounds[index], bounds[index + 1]
+            sup = last - first
             if sup>=self._minSup:
-                self._finalPatterns[str(key)+self._sep+"-2"]=sup
-                self._idDatabase[str(key)]=val
+                self._finalPatterns[str(key)+self._sep+"-2"]=int(sup)
+                self._rank[str(key)] = len(self._idDatabase)
+                self._idDatabase[str(key)]=(rows[first:last] % len(self._Database), matrix[first:last])
 
-    def DfsPruning(self,items,sStep,iStep):
+    def _join(self, bitmap, item, rowOf=None):
+        """
+        ANDs the bitmap of a pattern with the bitmap of an item, keeping the sequences that remain non-empty
+
+        :param bitmap: sequence ids and bit rows of the pattern
+        :type bitmap: tuple
+        :param item: the item
+        :type item: str
+        :param rowOf: maps every sequence id to the row of the pattern holding it, or -1, when the pattern has many rows
+        :type rowOf: numpy.ndarray or None
+        :return: sequence ids and bit rows of the extended pattern
+        :rtype: tuple
+        """
+        sids, bits = bitmap
+        itemSids, itemBits = self._idDatabase[item]
+        if rowOf is not None and len(itemSids) <= 16 * len(sids):
+            # look the rows of the item up in the pattern
+            index = rowOf[itemSids]
+            found = index >= 0
+            rows = itemBits[found] & bits[index[found]]
+            keep = rows.any(axis=1)
+            return itemSids[found][keep], rows[keep]
+        index = _np.minimum(_np.searchsorted(itemSids, sids), len(itemSids) - 1)
+        found = itemSids[index] == sids
+        rows = bits[found] & itemBits[index[found]]
+        keep = rows.any(axis=1)
+        return sids[found][keep], rows[keep]
+
+    def _joinAll(self, bitmap, items):
+        """
+        Joins the bitmap of a pattern with the bitmaps of several items
+
+        :param bitmap: sequence ids and bit rows of the pattern
+        :type bitmap: tuple
+        :param items: the items
+        :type items: list
+        :return: the bitmap of the pattern extended with every item
+        :rtype: list
+        """
+        sids = bitmap[0]
+        if len(sids) < 64 or not items:
+            return [self._join(bitmap, i) for i in items]
+        self._rowOf[sids] = _np.arange(len(sids), dtype=_np.int32)
+        try:
+            return [self._join(bitmap, i, self._rowOf) for i in items]
+        finally:
+            self._rowOf[sids] = -1
+
+    def DfsPruning(self,items,sStep,iStep,bitmap=None):
         """
         the main algorithm of spam. This can search sstep and istep items and find next patterns, its sstep, and its istep. And call this function again by using them. Recursion until there are no more items available for exploration.
 
@@ -328,89 +396,64 @@ class SPAM(_ab._sequentialPatterns):
             Items presumed to have "sstep" relationship with "items".(sstep is What appears later like a-b and a-c)
         iStep : list
             Items presumed to have "istep" relationship with "items"(istep is What appears in same time like ab and ac)
-
+        bitmap : tuple
+            sequence ids and bit rows of "items". The bitmap of a single item is taken from the bitmap database when omitted
         """
+        if bitmap is None:
+            bitmap = self._idDatabase[items]
         Snext=[]
         Inext=[]
-        ns = self.Sstep(self._idDatabase[items])
-        for i in sStep:
-            nnext=[]
-            for k in  range(len(self._idDatabase[items])):
-                nandi=ns[k] & self._idDatabase[i][k]
-                nnext.append(nandi)
-
-
-            sup=self.countSup(nnext)
+        ns = (bitmap[0], self.Sstep(bitmap[1]))
+        for i, nnext in zip(sStep, self._joinAll(ns, sStep)):
+            sup=len(nnext[0])
             if sup>=self._minSup:
                 key=items+self._sep+self._sepSeq+self._sep+i
                 self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"]=sup
-                self._idDatabase[key]=nnext
-                Snext.append(i)
-
-        for i in Snext:
+                Snext.append((i, nnext))
+        sItems = [i for i, _ in Snext]
+        for i, nnext in Snext:
             key = items+self._sep+self._sepSeq+self._sep+i
-            self.DfsPruning(key,Snext,[k for k in Snext if self._Database.index(i)<self._Database.index(k)])
-        for i in iStep:
-            nnext = []
-
-            for k in range(len(self._idDatabase[items])):
-                nandi = self._idDatabase[items][k] & self._idDatabase[i][k]
-                nnext.append(nandi)
-            sup=self.countSup(nnext)
+            self.DfsPruning(key,sItems,[k for k in sItems if self._rank[i]<self._rank[k]],nnext)
+        for i, nnext in zip(iStep, self._joinAll(bitmap, iStep)):
+            sup=len(nnext[0])
             if sup>=self._minSup:
                 key=items+self._sep+str(i)
                 self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"]=sup
-                self._idDatabase[key]=nnext
-                Inext.append(i)
-        for i in Inext:
+                Inext.append((i, nnext))
+        iItems = [i for i, _ in Inext]
+        for i, nnext in Inext:
             key = items +self._sep +str(i)
-            self.DfsPruning(key,Snext,[k for k in Inext if self._Database.index(i)<self._Database.index(k)])
+            self.DfsPruning(key,sItems,[k for k in iItems if self._rank[i]<self._rank[k]],nnext)
 
     def Sstep(self,s):
         """
-        To convert bit to Sstep bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
-
-
-        :param s:list
-            to store each bit sequence
-        :return:
-            nextS:list to store the bit sequence converted by sstep
-
+        To convert bit to Sstep bit. The first position with a 1 is set to 0 and all later positions to 1.(like 010101=>001111, 00001001=>00000111)
+        Position p of a row is bit p % 64 of word p // 64, so the transform works on the lowest set bit of the first
+        non-zero word of every row.
+
+        :param s: bit rows of the sequences, one row of 64-bit words per sequence
+        :type s: numpy.ndarray
+        :return: the bit rows converted by sstep
+        :rtype: numpy.ndarray
         """
-        nextS=[]
-        for bins in s:
-            binS=str(bin(bins))
-
-
-            LenNum=2
-            for i in range(len(binS)-2):
-                if binS[LenNum] == "1":
-
-                    binS = binS[:LenNum] + "0" + binS[LenNum + 1:]
-                    while len(binS)-1!=LenNum:
-                        LenNum += 1
-                        binS = binS[:LenNum] + "1" + binS[LenNum + 1:]
-                    break
-                LenNum+=1
-            nextS.append(int(binS, 0))
-
-
+        if s.shape[1] == 1:
+            return ~(s ^ (s - _np.uint64(1)))
+        first = _np.argmax(s != 0, axis=1)
+        rows = _np.arange(len(s))
+        nextS = _np.where(_np.arange(s.shape[1]) > first[:, None], ~_np.uint64(0), _np.uint64(0))
+        word = s[rows, first]
+        nextS[rows, first] = ~(word ^ (word - _np.uint64(1)))
         return nextS
 
     def countSup(self,n):
         """
         count support
 
-        :param n:list
-                to store each bit sequence
-        :return:
-            count: int support of this list
+        :param n: bit rows of the sequences
+        :type n: numpy.ndarray
+        :return: count: int support of this list
         """
-        count=0
-        for i in n:
-            if "1" in str(bin(i)):
-                count+=1
-        return count
+        return int(_np.count_nonzero(_np.asarray(n).any(axis=1)))
 
     def startMine(self) -> None:
         self.mine()
@@ -426,11 +469,7 @@ class SPAM(_ab._sequentialPatterns):
         self.make2BitDatabase()
         self._Database = [i for i in self._idDatabase.keys()]
         for i in self._Database:
-            x=[]
-            for j in self._Database:
-                if self._Database.index(i)<self._Database.index(j):
-                    x.append(j)
-
+            x=[j for j in self._Database if self._rank[i]<self._rank[j]]
             self.DfsPruning(i,self._Database,x)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
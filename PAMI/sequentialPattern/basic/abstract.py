@@ -40,6 +40,7 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import functools as _functools
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 
 
 class _sequentialPatterns(_ABC):
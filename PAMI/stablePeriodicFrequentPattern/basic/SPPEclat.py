@@ -312,22 +312,29 @@ class SPPEclat(_ab._stablePeriodicFrequentPatterns):
             self._SPPList[item][1] = max(la[item], self._SPPList[item][1])
         self._SPPList = {k: v for k, v in self._SPPList.items() if v[0] >= self._minSup and v[1] <= self._maxLa}
         self._SPPList = {k: v for k, v in sorted(self._SPPList.items(), key=lambda x: x[1][0], reverse=True)}
+        keys = list(self._SPPList)
+        self._tsList = dict(zip(keys, _ab._periodicTidLists.unpack(*_ab._periodicTidLists.pack([self._tsList[k] for k in keys]))))
         self._Generation(list(self._SPPList), set())
 
     def _Generation(self, GPPFList, CP):
         """
         To generate the patterns using depth-first search
         """
+        tidLists = _ab._periodicTidLists
+        # the timestamps of every extension of CP, and their liabilities, are computed for all siblings in one batch
+        values, offsets = tidLists.pack([self._tsList[item] for item in GPPFList], assumeSorted=True)
+        if CP != set():
+            values, offsets = tidLists.intersectMany(self._tsList['\t'.join(CP)], values, offsets)
+        supports = tidLists.supports(offsets).tolist()
+        las = tidLists.maxLiabilities(values, offsets, self._maxPer, self._last).tolist()
+        timeStamps = tidLists.unpack(values, offsets)
         for i in range(len(GPPFList)):
             item = GPPFList[i]
             CP1 = CP | {item}
-            if CP != set():
-                self._tsList['\t'.join(CP1)] = list(set(self._tsList['\t'.join(CP)]) & set(self._tsList[item]))
-            la = self._calculateLa(self._tsList['\t'.join(CP1)])
-            support = len(self._tsList['\t'.join(CP1)])
-            if la <= self._maxLa and len(self._tsList['\t'.join(CP1)]) >= self._minSup:
+            if las[i] <= self._maxLa and supports[i] >= self._minSup:
                 #CP = CP1
-                self._finalPatterns['\t'.join(CP1)] = [support, la]
+                self._tsList['\t'.join(CP1)] = timeStamps[i]
+                self._finalPatterns['\t'.join(CP1)] = [supports[i], las[i]]
                 if i+1 < len(GPPFList):
                     self._Generation(GPPFList[i+1:], CP1)
 
@@ -335,19 +342,8 @@ class SPPEclat(_ab._stablePeriodicFrequentPatterns):
         """
         To calculate the liability of a patterns based on its timestamps
         """
-        previous = 0
-        la = 0
-        tsList = sorted(tsList)
-        laList = []
-        for ts in tsList:
-            la = max(0, la + ts - previous - self._maxPer)
-            laList.append(la)
-            previous = ts
-            
-        la = max(0, la + self._last - previous - self._maxPer)
-        laList.append(la)
-        maxla = max(laList)
-        return maxla
+        values, offsets = _ab._periodicTidLists.pack([tsList])
+        return _ab._periodicTidLists.maxLiabilities(values, offsets, self._maxPer, self._last).tolist()[0]
 
     @deprecated("It is recommended to use mine() instead of mine() for mining process")
     def startMine(self):
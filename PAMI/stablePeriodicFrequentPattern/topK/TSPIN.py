@@ -168,12 +168,14 @@ class _Tree(object):
                 currentNode = currentNode.children[transaction[i]]
         currentNode.timeStamps = currentNode.timeStamps + tid
 
-    def getConditionalPatterns(self, alpha):
+    def getConditionalPatterns(self, alpha, minSup=0):
         """
         Generates all the conditional patterns of a respective node
 
         :param alpha: To represent a Node in the tree
         :type alpha: Node
+        :param minSup: minimum support of the items kept in the conditional patterns
+        :type minSup: int
         :return: A tuple consisting of finalPatterns, conditional pattern base and information
         """
         finalPatterns = []
@@ -188,7 +190,7 @@ class _Tree(object):
                 set2.reverse()
                 finalPatterns.append(set2)
                 finalSets.append(set1)
-        finalPatterns, finalSets, info = self.conditionalDatabases(finalPatterns, finalSets)
+        finalPatterns, finalSets, info = self.conditionalDatabases(finalPatterns, finalSets, minSup)
         return finalPatterns, finalSets, info
 
     @staticmethod
@@ -246,7 +248,7 @@ class _Tree(object):
         la = max(0, la + _last - previous - _maxPer)
         return len(timeStamps), la
 
-    def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps) -> tuple:
+    def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps, minSup=0) -> tuple:
         """
         It generates the conditional patterns with periodic-frequent items
 
@@ -254,6 +256,8 @@ class _Tree(object):
         :type conditionalPatterns: list
         :param conditionalTimeStamps: Represents the timestamps of a conditional patterns of a node
         :type conditionalTimeStamps: list
+        :param minSup: minimum support of the items kept in the conditional patterns
+        :type minSup: int
         :returns: Returns conditional transactions by removing non-periodic and non-frequent items
         """
 
@@ -270,7 +274,7 @@ class _Tree(object):
         updatedDictionary = {}
         for m in data1:
             updatedDictionary[m] = self.getSupportAndPeriod(data1[m])
-        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[1] <= _maxLa}
+        updatedDictionary = {k: v for k, v in updatedDictionary.items() if v[1] <= _maxLa and v[0] >= minSup}
         count = 0
         for p in conditionalPatterns:
             p1 = [v for v in p if v in updatedDictionary]
@@ -289,23 +293,17 @@ class _Tree(object):
         :type minSup: float
         :param prefix: Forms the combination of items
         :type prefix: list
-        :param Qk: patterns
-        :returns: yields patterns with their support and periodicity
+        :param Qk: the top-k patterns found so far
+        :type Qk: TopKHeap
         """
 
-        global _k
         for i in sorted(self.summaries, key=lambda x_: (self.info.get(x_)[0], -x_)):
             pattern = prefix[:]
             pattern.append(i)
-            Qk[tuple(pattern)] = self.info[i]
-            if len(Qk) >= _k:
-                minSup = min([v[0] for v in Qk.values()])
-            if len(Qk) > _k:
-                temp = min([v[0] for v in Qk.values()])
-                res = [key for key in Qk if Qk[key] == temp]
-                for j in res:
-                    Qk[j] = None
-            patterns, timeStamps, info = self.getConditionalPatterns(i)
+            Qk.push(tuple(pattern), self.info[i], self.info[i][0])
+            # items whose support is below the k-th best support cannot extend a pattern into the top-k
+            minSup = Qk.threshold()
+            patterns, timeStamps, info = self.getConditionalPatterns(i, minSup)
             conditionalTree = _Tree()
             conditionalTree.info = info.copy()
             for pat in range(len(patterns)):
@@ -516,6 +514,7 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
         global _last
         tidLast = {}
         la = {}
+        self._SPPList = {}
         for transaction in self._Database:
             ts = int(transaction[0])
             for item in transaction[1:]:
@@ -636,10 +635,10 @@ class TSPIN(_ab._stablePeriodicFrequentPatterns):
             self._rankedUp[Y] = X
         info = {self._rank[k]: v for k, v in generatedItems.items()}
         Tree = self._buildTree(updatedDatabases, info)
-        patterns = {}
+        patterns = _ab._TopKHeap(self._k, floor=1)
         Tree.generatePatterns(1, [], patterns)
         self._finalPatterns = {}
-        for X, Y in patterns.items():
+        for X, Y in patterns.patterns().items():
             sample = self._savePeriodic(X)
             self._finalPatterns[sample] = Y
         self._endTime = _ab._time.time()
@@ -6,11 +6,13 @@ from .vertex import Vertex
 from .edge import Edge
 from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
+from PAMI.extras.encodedGraphDatabase import EncodedGraphDatabase as _EncodedGraphDatabase
 import time
 import math
 import matplotlib.pyplot as plt
 import psutil as _psutil
 import os as _os
+from array import array
 
 
 class _gSpan(ABC):
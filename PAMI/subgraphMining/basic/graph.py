@@ -78,6 +78,7 @@ class Graph:
 
         self.vertices = []
         self.neighborCache = {}
+        self.adjacency = {}
         self.mapLabelToVertexIds = {}
         self.edgeCount = 0
 
@@ -105,21 +106,28 @@ class Graph:
 
     def precalculateVertexNeighbors(self):
         """
-        The function precalculates the neighbors of each vertex in a graph and stores them in a cache.
+        The function precalculates the neighbors of each vertex in a graph and stores them in a cache. The
+        adjacency cache holds the same neighbors as (neighbor id, neighbor label, edge label) tuples, so that
+        the embeddings can be extended without looking up vertices and edges.
         """
         self.neighborCache = {}
+        self.adjacency = {}
         self.edgeCount = 0
 
         for vertexId, vertex in self.vMap.items():
             neighbors = []
+            # the label of the first edge to every neighbor, which is the one getEdgeLabel returns
+            edgeLabels = {}
 
             for edge in vertex.getEdgeList():
-                neighborVertex = self.vMap[edge.another(vertexId)]
-                neighbors.append(neighborVertex)
+                neighborId = edge.another(vertexId)
+                neighbors.append(self.vMap[neighborId])
+                edgeLabels.setdefault(neighborId, edge.getEdgeLabel())
 
             neighbors.sort(key=lambda x: x.id)
 
             self.neighborCache[vertexId] = neighbors
+            self.adjacency[vertexId] = [(x.id, x.vLabel, edgeLabels[x.id]) for x in neighbors]
             self.edgeCount += len(neighbors)
 
         self.edgeCount //= 2    
@@ -139,10 +147,7 @@ class Graph:
         """
         self.mapLabelToVertexIds = {}
         for vertex in self.vertices:
-            label = vertex.getLabel()
-            if label not in self.mapLabelToVertexIds:
-                sameIds = [v.getId() for v in self.vertices if v.getLabel() == label]
-                self.mapLabelToVertexIds[label] = sameIds
+            self.mapLabelToVertexIds.setdefault(vertex.getLabel(), []).append(vertex.getId())
 
     def findAllWithLabel(self, targetLabel):
         if targetLabel in self.mapLabelToVertexIds:
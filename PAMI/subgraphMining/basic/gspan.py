@@ -6,6 +6,8 @@
 #
 #             obj = alg.GSpan(iFile, minSupport)
 #
+#             obj = alg.GSpan('graphsDB', minSupport)  # a database converted with PAMI.extras.encodedGraphDatabase
+#
 #             obj.mine()
 #
 #             frequentGraphs = obj.getFrequentSubgraphs()
@@ -159,11 +161,20 @@ class GSpan(_ab._gSpan):
         and edges.
         
         :param path: The `path` parameter in the `readGraphs` method is the file path to the text file
-        containing the graph data that needs to be read and processed.
+        containing the graph data that needs to be read and processed. It can also be a directory written by
+        `PAMI.extras.encodedGraphDatabase`, or an `EncodedGraphDatabase`, whose arrays are used without parsing.
         :return: The `readGraphs` method reads graph data from a file specified by the `path` parameter. It
         parses the data to create a list of graph objects and returns this list. Each graph object contains
         information about vertices and edges within the graph.
         """
+        if _ab._EncodedGraphDatabase.isEncoded(path):
+            db = _ab._EncodedGraphDatabase.fromInput(path)
+            graphDatabase = db.toGraphs(_ab.Graph, _ab.Vertex, _ab.Edge,
+                                        lambda label: int(label) if label.isdigit() else self.get_label(label),
+                                        lambda label: int(label) if label.isdigit() else self.get_edge_label(label))
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
+
         with open(path, 'r') as br:
             graphDatabase = []
             vMap = {}
@@ -274,6 +285,93 @@ class GSpan(_ab._gSpan):
         return isoms
 
     
+    def embeddingsOf(self, c: _ab.DFSCode, g: _ab.Graph):
+        """
+        The function `embeddingsOf` finds all embeddings of a DFS code in a graph with `subgraphIsomorphisms`
+        and stores them in the compact form used while mining: one flat integer array in which embedding k
+        occupies the slots k * w to k * w + w - 1, w being the number of vertices of the DFS code, and slot
+        k * w + i holds the graph vertex that DFS vertex i is mapped to.
+
+        :param c: the DFS code
+        :type c: _ab.DFSCode
+        :param g: the graph
+        :type g: _ab.Graph
+        :return: the embeddings of the DFS code in the graph
+        :rtype: array.array
+        """
+        width = c.getRightMost() + 1
+        embeddings = _ab.array('i')
+        for isom in self.subgraphIsomorphisms(c, g):
+            embeddings.extend([isom[v] for v in range(width)])
+        return embeddings
+
+    def extendEmbeddings(self, c: _ab.DFSCode, g: _ab.Graph, embeddings, backwardTargets=None):
+        """
+        The function `extendEmbeddings` finds the rightmost path extensions of a DFS code in a graph from the
+        embeddings of the DFS code, and extends the embeddings by the edge of every extension at the same
+        time. The embeddings of the extended DFS codes are therefore obtained one edge at a time from those
+        of their parent, instead of being searched again from scratch.
+
+        :param c: the non-empty DFS code
+        :type c: _ab.DFSCode
+        :param g: the graph
+        :type g: _ab.Graph
+        :param embeddings: the embeddings of the DFS code in the graph, as returned by `embeddingsOf`
+        :type embeddings: array.array
+        :param backwardTargets: the result of `backwardTargets(c)`, when the caller extends c in several graphs
+        :type backwardTargets: set
+        :return: a dictionary mapping every extension, as a (v1, v2, vLabel1, vLabel2, edgeLabel) tuple, to
+                 the embeddings of the extended DFS code in the graph
+        :rtype: dict
+        """
+        rightMost = c.getRightMost()
+        rightMostPath = c.getRightMostPath()
+        width = rightMost + 1
+        if backwardTargets is None:
+            backwardTargets = self.backwardTargets(c)
+        adjacency = g.adjacency
+        vMap = g.vMap
+        extensions = {}
+        for start in range(0, len(embeddings), width):
+            isom = embeddings[start:start + width]
+            invertedIsom = {mapped: v for v, mapped in enumerate(isom)}
+            mappedRm = isom[rightMost]
+            mappedRmLabel = vMap[mappedRm].vLabel
+            for x, xLabel, eLabel in adjacency.get(mappedRm, ()):
+                invertedX = invertedIsom.get(x)
+                if invertedX in backwardTargets:
+                    key = (rightMost, invertedX, mappedRmLabel, xLabel, eLabel)
+                    extended = extensions.get(key)
+                    if extended is None:
+                        extended = extensions[key] = _ab.array('i')
+                    extended.extend(isom)
+
+            for v in rightMostPath:
+                mappedV = isom[v]
+                mappedVLabel = vMap[mappedV].vLabel
+                for x, xLabel, eLabel in adjacency.get(mappedV, ()):
+                    if x not in invertedIsom:
+                        key = (v, width, mappedVLabel, xLabel, eLabel)
+                        extended = extensions.get(key)
+                        if extended is None:
+                            extended = extensions[key] = _ab.array('i')
+                        extended.extend(isom)
+                        extended.append(x)
+        return extensions
+
+    def backwardTargets(self, c: _ab.DFSCode):
+        """
+        The vertices of the rightmost path that a backward edge from the rightmost vertex of a DFS code can
+        reach: all of them except the rightmost vertex's predecessor and the vertices it is already connected to.
+
+        :param c: the DFS code
+        :type c: _ab.DFSCode
+        :return: the DFS vertices
+        :rtype: set
+        """
+        rightMost = c.getRightMost()
+        return {v for v in c.getRightMostPath() if c.notPreOfRm(v) and not c.containEdge(rightMost, v)}
+
     def rightMostPathExtensionsFromSingle(self, c: _ab.DFSCode, g: _ab.Graph):
         """
         The function `rightMostPathExtensionsFromSingle` generates extensions for a given DFS code and
@@ -312,28 +410,8 @@ class GSpan(_ab._gSpan):
                     extensions[ee1] = setOfGraphIds
         else:
             # For non-empty DFS code, focus on extending from the rightmost path
-            rightMost = c.getRightMost()
-            isoms = self.subgraphIsomorphisms(c, g)
-
-            # Iterate through all isomorphisms to find valid extensions
-            for isom in isoms:
-                invertedIsom = {v: k for k, v in isom.items()}
-                mappedRm = isom[rightMost]
-                mappedRmLabel = g.getVLabel(mappedRm)
-                for x in g.getAllNeighbors(mappedRm):
-                    invertedX = invertedIsom.get(x.getId())
-                    if invertedX is not None and c.onRightMostPath(invertedX) and c.notPreOfRm(invertedX) and not c.containEdge(rightMost, invertedX):
-                        ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRmLabel, x.getLabel(), g.getEdgeLabel(mappedRm, x.getId()))
-                        extensions.setdefault(ee, set()).add(gid)
-
-                mappedVertices = set(isom.values())
-                for v in c.getRightMostPath():
-                    mappedV = isom[v]
-                    mappedVLabel = g.getVLabel(mappedV)
-                    for x in g.getAllNeighbors(mappedV):
-                        if x.getId() not in mappedVertices:
-                            ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, x.getLabel(), g.getEdgeLabel(mappedV, x.getId()))
-                            extensions.setdefault(ee, set()).add(gid)
+            for key in self.extendEmbeddings(c, g, self.embeddingsOf(c, g)):
+                extensions[_ab.ExtendedEdge(*key)] = {gid}
 
         return extensions
 
@@ -357,7 +435,31 @@ class GSpan(_ab._gSpan):
         :return: The function `rightMostPathExtensions` returns a dictionary `extensions` containing
         extended edges as keys and sets of graph IDs as values.
         """
+        return self.projectedExtensions(c, graphDb, graphIds)[0]
+
+    def projectedExtensions(self, c: _ab.DFSCode, graphDb, graphIds, projection=None):
+        """
+        The function `projectedExtensions` generates the rightmost path extensions of a DFS code in the
+        graph database together with the projection of every extension: the embeddings of the extended DFS
+        code in each graph that supports it. The projection of the DFS code itself is given by the caller;
+        when it is missing, as for the DFS codes of a single edge, the embeddings are searched with
+        `embeddingsOf`.
+
+        :param c: the DFS code
+        :type c: _ab.DFSCode
+        :param graphDb: the graph database
+        :type graphDb: list
+        :param graphIds: the ids of the graphs supporting the DFS code
+        :type graphIds: set
+        :param projection: the embeddings of the DFS code in every graph of graphIds, as returned by
+                           `embeddingsOf`
+        :type projection: dict
+        :return: a dictionary mapping the extended edges to the sets of graph ids supporting them, and a
+                 dictionary mapping the extended edges to their projections
+        :rtype: tuple
+        """
         extensions = {}
+        projections = {}
         if c.isEmpty():
             for iD in graphIds:
                 g = graphDb[iD]
@@ -379,50 +481,30 @@ class GSpan(_ab._gSpan):
                         setOfGraphIds = extensions.get(ee1, set())
                         setOfGraphIds.add(iD)
                         extensions[ee1] = setOfGraphIds
-        else:
-            # For non-empty DFS codes, extend based on the rightmost path of each graph
-            rightMost = c.getRightMost()
-            for iD in graphIds:
-                g = graphDb[iD]
-                if GSpan.edge_count_pruning and c.size >= g.getEdgeCount():
-                    self.pruneByEdgeCount += 1
-                    continue
-                isoms = self.subgraphIsomorphisms(c, g)
-                for isom in isoms:
-                    invertedIsom = {}
-                    for key, value in isom.items():
-                        invertedIsom[value] = key
-                    mappedRM = isom.get(rightMost)
-                    mappedRMLabel = g.getVLabel(mappedRM)
-                    for x in g.getAllNeighbors(mappedRM):
-                        invertedX = invertedIsom.get(x.getId())
-                        if invertedX is not None and c.onRightMostPath(invertedX) and \
-                        c.notPreOfRm(invertedX) and not c.containEdge(rightMost, invertedX):
-                            
-                            ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRMLabel, x.getLabel(),
-                                            g.getEdgeLabel(mappedRM, x.getId()))
-
-                            if ee not in extensions:
-                                extensions[ee] = set()
-                            extensions[ee].add(g.getId())
-
-                    mappedVertices = isom.values()
-                    for v in c.getRightMostPath():
-                        mappedV = isom[v]
-                        mappedVLabel = g.getVLabel(mappedV)
-                        for x in g.getAllNeighbors(mappedV):
-                            if x.getId() not in mappedVertices:
-                                ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, x.getLabel(),
-                                                g.getEdgeLabel(mappedV, x.getId()))
-
-                                if ee not in extensions:
-                                    extensions[ee] = set()
-                                extensions[ee].add(g.getId())
-        return extensions
-
-
-
-    def gspanDFS(self, c: _ab.DFSCode, graphDb, subgraphId):
+            return extensions, projections
+
+        # For non-empty DFS codes, extend the embeddings of each graph along the rightmost path
+        edges = {}
+        backwardTargets = self.backwardTargets(c)
+        for iD in graphIds:
+            g = graphDb[iD]
+            if GSpan.edge_count_pruning and c.size >= g.getEdgeCount():
+                self.pruneByEdgeCount += 1
+                continue
+            embeddings = projection[iD] if projection is not None else self.embeddingsOf(c, g)
+            for key, extended in self.extendEmbeddings(c, g, embeddings, backwardTargets).items():
+                ee = edges.get(key)
+                if ee is None:
+                    ee = edges[key] = _ab.ExtendedEdge(*key)
+                    extensions[ee] = set()
+                    projections[ee] = {}
+                extensions[ee].add(iD)
+                projections[ee][iD] = extended
+        return extensions, projections
+
+
+
+    def gspanDFS(self, c: _ab.DFSCode, graphDb, subgraphId, projection=None):
         """
         The `gspanDFS` function recursively explores graph patterns using the gSpan algorithm to find
         frequent subgraphs in a graph database.
@@ -435,6 +517,8 @@ class GSpan(_ab._gSpan):
         operating on.
         :param subgraphId: The `subgraphId` parameter in the `gspanDFS` method refers to an
         ID represents a specific subgraph within the graph database `graphDb`. 
+        :param projection: the embeddings of `c` in the graphs of `subgraphId`, see `projectedExtensions`
+        :type projection: dict
         :return: The `gspanDFS` method is a recursive function that is called within itself to explore the graph 
         structure and find frequent subgraphs. The function does not have a return value, but it modifies 
         the `self.frequentSubgraphs` list by appending new frequent subgraphs found during the DFS traversal.
@@ -442,10 +526,12 @@ class GSpan(_ab._gSpan):
 
         if c.size == self.maxNumberOfEdges - 1:
             return
-        extensions = self.rightMostPathExtensions(c, graphDb, subgraphId)
+        extensions, projections = self.projectedExtensions(c, graphDb, subgraphId, projection)
 
         for extension, newGraphIds in extensions.items():
             sup = len(newGraphIds)
+            # released as soon as the extension is explored
+            newProjection = projections.pop(extension, None)
             
             if sup >= self.minSup:
                 newC = c.copy()
@@ -455,7 +541,7 @@ class GSpan(_ab._gSpan):
                     subgraph = _ab.FrequentSubgraph(newC, newGraphIds, sup)
                     self.frequentSubgraphs.append(subgraph)
 
-                    self.gspanDFS(newC, graphDb, newGraphIds)
+                    self.gspanDFS(newC, graphDb, newGraphIds, newProjection)
 
 
     def isCanonical(self, c: _ab.DFSCode):
@@ -469,18 +555,28 @@ class GSpan(_ab._gSpan):
         not canonical.
         """
         canC = _ab.DFSCode()
+        g = _ab.Graph(-1, None, c)
+        embeddings = None
         for i in range(c.size):
-            extensions = self.rightMostPathExtensionsFromSingle(canC, _ab.Graph(-1, None, c))
+            if canC.isEmpty():
+                extensions = self.rightMostPathExtensionsFromSingle(canC, g)
+            else:
+                # the minimum code grows one edge at a time, and so do its embeddings in c
+                extensions = {_ab.ExtendedEdge(*key): extended
+                              for key, extended in self.extendEmbeddings(canC, g, embeddings).items()}
             minEe = None
             for ee in extensions.keys():
                 if minEe is None or ee.smallerThan(minEe):
                     minEe = ee
 
-            if minEe is not None and minEe.smallerThan(c.getAt(i)):
+            if minEe is None:
+                break
+
+            if minEe.smallerThan(c.getAt(i)):
                 return False
             
-            if minEe is not None:
-                canC.add(minEe)
+            canC.add(minEe)
+            embeddings = self.embeddingsOf(canC, g) if i == 0 else extensions[minEe]
         return True
     
 
@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
 from .graph import Graph
 from .DFSCode import DfsCode
-from .DFSThread import DfsThread
 from .frequentSubgraph import FrequentSubgraph
 from .vertex import Vertex
 from .edge import Edge
 from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
 from queue import PriorityQueue
+from PAMI.extras.topKHeap import TopKHeap as _TopKHeap
+from PAMI.extras.encodedGraphDatabase import EncodedGraphDatabase as _EncodedGraphDatabase
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+import multiprocessing as _multiprocessing
+import heapq as _heapq
 import time
 import math
 import matplotlib.pyplot as plt
@@ -101,10 +101,7 @@ class Graph:
         """
         self.mapLabelToVertexIds = {}
         for vertex in self.vertices:
-            label = vertex.getLabel()
-            if label not in self.mapLabelToVertexIds:
-                sameIds = [v.getId() for v in self.vertices if v.getLabel() == label]
-                self.mapLabelToVertexIds[label] = sameIds
+            self.mapLabelToVertexIds.setdefault(vertex.getLabel(), []).append(vertex.getId())
 
     def findAllWithLabel(self, targetLabel):
         """
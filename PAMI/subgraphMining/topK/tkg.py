@@ -24,9 +24,41 @@
 
 # print("Minimum support:", minSup)
 
+# obj = alg.TKG(iFile, k, workers=4)  # the candidates are explored by 4 processes, with the same result
+
+# obj = alg.TKG('graphsDB', k)  # a database converted with PAMI.extras.encodedGraphDatabase
+
 
 from PAMI.subgraphMining.topK import abstract as _ab
 
+_workerMiner = None
+
+
+def _initWorker(graphDB, settings, sharedMinSup):
+    """
+    Creates the miner used by a worker process of the parallel mode. It receives the graph database once, and the
+    shared value through which the workers publish and read the support of the current k-th pattern.
+    """
+    global _workerMiner
+    _workerMiner = TKG(None, *settings)
+    _workerMiner._graphDB = graphDB
+    _workerMiner._sharedMinSup = sharedMinSup
+
+
+def _searchShard(candidates):
+    """
+    Explores the search space below a shard of candidates in a worker process, best candidate first, and returns the
+    top-k patterns the worker found there.
+    """
+    miner = _workerMiner
+    miner.kSubgraphs = miner._newHeap()
+    miner.candidates = []
+    miner.minSup = 1
+    for candidate in candidates:
+        miner.registerAsCandidate(candidate)
+    miner.searchCandidates(miner._graphDB)
+    return miner.getSubgraphsList()
+
 
 class TKG(_ab._TKG):
     ELIMINATE_INFREQUENT_VERTICES = True
@@ -34,9 +66,24 @@ class TKG(_ab._TKG):
     ELIMINATE_INFREQUENT_EDGE_LABELS = True
     EDGE_COUNT_PRUNING = True
     DYNAMIC_SEARCH = True
-    THREADED_DYNAMIC_SEARCH = True
 
-    def __init__(self, iFile, k, maxNumberOfEdges=float('inf'), outputSingleVertices=True, outputGraphIds=False):
+    def __init__(self, iFile, k, maxNumberOfEdges=float('inf'), outputSingleVertices=True, outputGraphIds=False,
+                 workers=1):
+        """
+        :param iFile: name of the graph database file, or a directory written by PAMI.extras.encodedGraphDatabase
+        :type iFile: str or EncodedGraphDatabase
+        :param k: number of subgraphs to find
+        :type k: int
+        :param maxNumberOfEdges: maximum number of edges of a subgraph
+        :type maxNumberOfEdges: int
+        :param outputSingleVertices: whether subgraphs of a single vertex are reported
+        :type outputSingleVertices: bool
+        :param outputGraphIds: whether the ids of the supporting graphs are saved
+        :type outputGraphIds: bool
+        :param workers: number of processes exploring the candidates. The default of 1 explores them in the calling
+                        process and None uses all cores. The result does not depend on it.
+        :type workers: int
+        """
         self._memoryRSS = None
         self._memoryUSS = None
         self.runtime = None
@@ -54,7 +101,6 @@ class TKG(_ab._TKG):
         self.infrequentVerticesRemovedCount = 0
         self.infrequentVertexPairsRemovedCount = 0
         self.skipStrategyCount = 0
-        self.threadCount = 1
         self.edgeRemovedByLabel = 0
         self.eliminatedWithMaxSize = 0
         self.emptyGraphsRemoved = 0
@@ -62,6 +108,11 @@ class TKG(_ab._TKG):
         self.label_mapping = {}
         self.reverse_label_mapping = {}
         self.current_label = 0
+        self.workers = _ab._os.cpu_count() if workers is None else int(workers)
+        if self.workers < 1:
+            raise ValueError("workers should be a positive integer")
+        self._sharedMinSup = None
+        self._candidateCount = 0
 
     def mine(self):
         """
@@ -71,8 +122,8 @@ class TKG(_ab._TKG):
         if self.maxNumberOfEdges <= 0:
             return
 
-        self.kSubgraphs = _ab.PriorityQueue()
-        self.candidates = _ab.PriorityQueue()
+        self.kSubgraphs = self._newHeap()
+        self.candidates = []
         
         self.runtime = 0
 
@@ -84,7 +135,7 @@ class TKG(_ab._TKG):
 
         t2 = _ab.time.time()
         self.runtime = t2 - t1
-        self.patternCount = self.getQueueSize(self.kSubgraphs)
+        self.patternCount = len(self.kSubgraphs)
 
         process = _ab._psutil.Process(_ab._os.getpid())
 
@@ -102,8 +153,16 @@ class TKG(_ab._TKG):
         """
         Reads graph data from a file and constructs a list of graphs with vertices and edges.
         Handles character vertex labels by mapping them to unique integers.
-        Edge labels are assumed to be integers.
+        Edge labels are assumed to be integers. The path can also be a directory written by
+        PAMI.extras.encodedGraphDatabase, or an EncodedGraphDatabase, whose arrays are used without parsing.
         """
+        if _ab._EncodedGraphDatabase.isEncoded(path):
+            db = _ab._EncodedGraphDatabase.fromInput(path)
+            graphDatabase = db.toGraphs(_ab.Graph, _ab.Vertex, _ab.Edge,
+                                        lambda label: int(label) if label.isdigit() else self.get_label(label))
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
+
         with open(path, 'r') as br:
             graphDatabase = []
             vMap = {}
@@ -192,16 +251,57 @@ class TKG(_ab._TKG):
                 sb.append("\n\n")
                 bw.write("".join(sb))
 
+    def _newHeap(self):
+        return _ab._TopKHeap(self.k, floor=(1,))
+
+    @staticmethod
+    def rank(subgraph):
+        """
+        The rank of a subgraph among the top-k subgraphs: larger support first, then fewer edges, then the smaller DFS
+        code. As the order is total, the k subgraphs kept do not depend on the order in which the subgraphs are found,
+        which makes the parallel mode return exactly the subgraphs of the sequential one.
+
+        :param subgraph: the subgraph
+        :type subgraph: FrequentSubgraph
+        :return: the rank, larger is better
+        :rtype: tuple
+        """
+        code = subgraph.dfsCode.eeList
+        return (subgraph.support, -len(code),
+                tuple(-x for ee in code for x in (ee.v1, ee.v2, ee.vLabel1, ee.vLabel2, ee.edgeLabel)))
+
     def savePattern(self, subgraph):
-        # previousMinSup = self.minSup
+        """
+        Offers a subgraph to the top-k subgraphs, and raises the minimum support to the support of the k-th subgraph
+        once k subgraphs are kept: a subgraph of lower support can no longer enter.
 
-        self.kSubgraphs.put(subgraph)
-        if self.kSubgraphs.qsize() > self.k:
-            while self.kSubgraphs.qsize() > self.k:
-                lower = self.kSubgraphs.get()
+        :param subgraph: the subgraph
+        :type subgraph: FrequentSubgraph
+        """
+        rank = self.rank(subgraph)
+        if self.kSubgraphs.push(rank[2], subgraph, rank):
+            self.raiseMinSup(self.kSubgraphs.threshold()[0])
 
-                if lower.support > self.minSup:
-                    self.minSup = lower.support
+    def raiseMinSup(self, support):
+        """
+        Raises the minimum support, and publishes it to the other workers in the parallel mode
+        """
+        if support > self.minSup:
+            self.minSup = support
+            shared = self._sharedMinSup
+            if shared is not None:
+                with shared.get_lock():
+                    if shared.value < support:
+                        shared.value = support
+
+    def readSharedMinSup(self):
+        """
+        Raises the minimum support to the largest one published by the workers of the parallel mode. Any worker's k-th
+        support is a lower bound of the final one, so the largest of them is the tightest bound known.
+        """
+        shared = self._sharedMinSup
+        if shared is not None and shared.value > self.minSup:
+            self.minSup = shared.value
 
 
     def getQueueSize(self, queue):
@@ -353,28 +453,45 @@ class TKG(_ab._TKG):
         if not outputFrequentVertices or self.frequentVertexLabels:
             if self.DYNAMIC_SEARCH:
                 self.gspanDynamicDFS(_ab.DfsCode(), graphDB, graphIds)
-                
-                if self.THREADED_DYNAMIC_SEARCH:
-                    self.startThreads(graphDB, self.candidates, self.minSup)
 
+                if self.workers > 1 and len(self.candidates) > 1:
+                    self.parallelSearch(graphDB)
                 else:
-                    while self.candidates:
-                        candidate = self.candidates.pop()
-                        if len(candidate.setOfGraphsIds) < self.minSup:
-                            continue
-                        self.gspanDynamicDFS(candidate.dfsCode, graphDB, candidate.setOfGraphsIds)
+                    self.searchCandidates(graphDB)
             else:
                 self.gspanDfs(_ab.DfsCode(), graphDB, graphIds)
 
-    def startThreads(self, graphDB, candidates, minSup):
-        threads = []
-        for _ in range(self.threadCount):
-            thread = _ab.DfsThread(graphDB, candidates, minSup, self)
-            thread.start()
-            threads.append(thread)
-    
-        for thread in threads:
-            thread.join()
+    def searchCandidates(self, graphDB):
+        """
+        Extends the registered candidates, the candidate of largest support first, until the remaining candidates
+        cannot reach the minimum support
+        """
+        while self.candidates:
+            negativeSupport, _, candidate = _ab._heapq.heappop(self.candidates)
+            self.readSharedMinSup()
+            if -negativeSupport < self.minSup:
+                break
+            self.gspanDynamicDFS(candidate.dfsCode, graphDB, candidate.setOfGraphsIds)
+        self.candidates = []
+
+    def parallelSearch(self, graphDB):
+        """
+        Explores the registered candidates in a pool of worker processes. The candidates are dealt to more shards than
+        workers, in order of support, so that every shard holds a similar mix of promising candidates. The workers
+        share the minimum support through shared memory, so that every worker prunes with the largest k-th support
+        found by any of them, and the top-k subgraphs of the workers are merged into those of this process.
+        """
+        ordered = []
+        while self.candidates:
+            ordered.append(_ab._heapq.heappop(self.candidates)[2])
+        shards = [ordered[i::self.workers * 4] for i in range(min(len(ordered), self.workers * 4))]
+        sharedMinSup = _ab._multiprocessing.Value('q', self.minSup)
+        settings = (self.k, self.maxNumberOfEdges, self.outputSingleVertices, self.outputGraphIds)
+        with _ab._ProcessPoolExecutor(max_workers=self.workers, initializer=_initWorker,
+                                      initargs=(graphDB, settings, sharedMinSup)) as pool:
+            for subgraphs in pool.map(_searchShard, shards):
+                for subgraph in subgraphs:
+                    self.savePattern(subgraph)
 
     def gspanDfs(self, c: _ab.DfsCode, graphDB, subgraphId):
         if c.size == self.maxNumberOfEdges - 1:
@@ -408,7 +525,8 @@ class TKG(_ab._TKG):
                     self.registerAsCandidate(subgraph)
     
     def registerAsCandidate(self, subgraph):
-        self.candidates.put((-subgraph.support, subgraph))
+        self._candidateCount += 1
+        _ab._heapq.heappush(self.candidates, (-subgraph.support, self._candidateCount, subgraph))
 
     
     def isCanonical(self, c: _ab.DfsCode):
@@ -575,8 +693,6 @@ class TKG(_ab._TKG):
 
 
     def getSubgraphsList(self):
-        """Creates a copy of the queue's contents without emptying the original queue."""
-        subgraphsList = list(self.kSubgraphs.queue)
-        subgraphsList.sort(key=lambda sg: sg.support, reverse=True)
-        return subgraphsList
+        """The top-k subgraphs, best first, see rank()."""
+        return list(self.kSubgraphs.patterns().values())
 
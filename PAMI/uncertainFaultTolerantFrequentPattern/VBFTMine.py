@@ -201,6 +201,8 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        self._plist = []
+        seen = set()
         if isinstance(self._iFile, _ab._pd.DataFrame):
             temp = []
             if self._iFile.empty:
@@ -228,7 +230,8 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
                             temp = [i.rstrip() for i in line.split(self._sep)]
                             temp = [x for x in temp if x]
                             for i in temp:
-                                if i not in self._plist:
+                                if i not in seen:
+                                    seen.add(i)
                                     self._plist.append(i)
                             self._Database.append(set(temp))
                 except IOError:
@@ -258,16 +261,12 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
         """
         Count the occurrences of 1s in the given list of transaction IDs.
 
-        :param tids: List of transaction IDs.
-        :type tids: List[int]
+        :param tids: bit vector of the transactions.
+        :type tids: numpy.ndarray
         :return: Count of occurrences of 1s in the list.
         :rtype: int
         """
-        count = 0
-        for i in tids:
-            if i == 1:
-                count += 1
-        return count
+        return int(_np.count_nonzero(tids))
 
     def _save(self, prefix, suffix, tidsetx):
         """
@@ -278,7 +277,7 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
         :param suffix: Suffix part of the pattern.
         :type suffix: list
         :param tidsetx: Transaction IDs associated with the pattern.
-        :type tidsetx: list
+        :type tidsetx: numpy.ndarray
         :return: None
         """
         if prefix == None:
@@ -319,7 +318,7 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
             for j in range(i + 1, len(itemsets)):
                 itemj = itemsets[j]
                 tidsetj = tidsets[j]
-                y = list(_np.array(tidsetx) & _np.array(tidsetj))
+                y = tidsetx & tidsetj
                 total = self._Count(y)
                 if total >= self._minSup:
                     classItemsets.append(itemj)
@@ -333,17 +332,12 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
         """
         To calculate the one Length items
         """
-        Vector = {}
+        Vector = {j: _np.zeros(len(self._Database), dtype=bool) for j in self._plist}
         items = []
-        for i in self._Database:
-            for j in self._plist:
-                count = 0
-                if j in i:
-                    count = 1
+        for tid, i in enumerate(self._Database):
+            for j in i:
                 if j in Vector:
-                    Vector[j].append(count)
-                else:
-                    Vector[j] = [count]
+                    Vector[j][tid] = True
         for x, y in Vector.items():
             v = self._Count(y)
             if v >= self._itemSup:
@@ -379,7 +373,7 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
             for j in range(i + 1, len(plist)):
                 itemj = plist[j]
                 tidsetj = Vector[itemj]
-                y1 = list(_np.array(tidsetx) | _np.array(tidsetj))
+                y1 = tidsetx | tidsetj
                 total = self._Count(y1)
                 if total >= self._minSup:
                     itemsets.append(itemj)
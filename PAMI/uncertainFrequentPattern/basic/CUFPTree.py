@@ -346,6 +346,10 @@ class CUFPTree(_ab._frequentPatterns):
                    minimum support thresholds were tuned to find the appropriate ranges in the limited memory
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  chunkSize: int :
+                   Number of transactions indexed at once when the candidates are verified. The whole database is indexed by default.
+    :param  workers: int :
+                   Number of processes verifying the chunks of the database.
 
 
     :Attributes:
@@ -498,8 +502,8 @@ class CUFPTree(_ab._frequentPatterns):
     _rank = {}
     Database1 = None
 
-    def __init__(self, iFile, minSup, sep='\t') -> None:
-        super().__init__(iFile, minSup, sep)
+    def __init__(self, iFile, minSup, sep='\t', chunkSize=None, workers=1) -> None:
+        super().__init__(iFile, minSup, sep, chunkSize, workers)
 
     def _creatingItemSets(self) -> None:
         """
@@ -621,28 +625,6 @@ class CUFPTree(_ab._frequentPatterns):
                 list1.append(list2)
         return list1
 
-    @staticmethod
-    def _check(i, x) -> int:
-        """
-        To check the presence of item or pattern in transaction
-
-        :param x: it represents the pattern
-        :type x : list
-        :param i : represents the uncertain self.Database
-        :type i : list
-        :return: int
-        """
-
-        # This method taken a transaction as input and returns the tree
-        for m in x:
-            k = 0
-            for n in i:
-                if m == n.item:
-                    k += 1
-            if k == 0:
-                return 0
-        return 1
-
     def _convert(self, value) -> float:
         """
         To convert the type of user specified minSup value
@@ -668,22 +650,8 @@ class CUFPTree(_ab._frequentPatterns):
         :return: patterns with accurate probability
         """
         global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
+        periods = _ab._expectedSupports([[(j.item, j.probability) for j in i] for i in self._Database],
+                                        _finalPatterns, self._chunkSize, self._workers)
         for x, y in periods.items():
             if y >= self._minSup:
                 sample = str()
@@ -708,10 +676,11 @@ class CUFPTree(_ab._frequentPatterns):
         :return: None
         """
 
+        global minSup
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
-        #minSup = self._minSup
+        minSup = self._minSup
         self._finalPatterns = {}
         mapSupport, plist = self._frequentOneItem()
         self.Database1 = self._updateTransactions(mapSupport)
@@ -360,6 +360,10 @@ class TubeP(_fp._frequentPatterns):
         sep : str
             This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
             However, the users can override their default separator.
+        chunkSize : int
+            Number of transactions indexed at once when the candidates are verified, the whole database by default
+        workers : int
+            Number of processes verifying the chunks of the database
         memoryUSS : float
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
@@ -463,8 +467,8 @@ class TubeP(_fp._frequentPatterns):
     _Database = []
     _rank = {}
 
-    def __init__(self, iFile, minSup, sep='\t') -> None:
-        super().__init__(iFile, minSup, sep)
+    def __init__(self, iFile, minSup, sep='\t', chunkSize=None, workers=1) -> None:
+        super().__init__(iFile, minSup, sep, chunkSize, workers)
 
     def _creatingItemSets(self) -> None:
         """
@@ -574,24 +578,6 @@ class TubeP(_fp._frequentPatterns):
                 list1.append(list2)
         return list1
 
-    def _Check(self, i, x) -> int:
-        """
-        To check the presence of item or pattern in transaction
-
-        :param x: it represents the pattern
-        :type x : list
-        :param i : represents the uncertain transactions
-        :type i : list
-        """
-        for m in x:
-            k = 0
-            for n in i:
-                if m == n.item:
-                    k += 1
-            if k == 0:
-                return 0
-        return 1
-
     def _convert(self, value) -> Union[int, float]:
         """
         To convert the type of user specified minSup value
@@ -617,22 +603,8 @@ class TubeP(_fp._frequentPatterns):
         :return: patterns with accurate probability
         """
         global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._Check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
+        periods = _fp._expectedSupports([[(j.item, j.probability) for j in i] for i in self._Database],
+                                        _finalPatterns, self._chunkSize, self._workers)
         for x, y in periods.items():
             if y >= self._minSup:
                 sample = str()
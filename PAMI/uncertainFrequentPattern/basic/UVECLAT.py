@@ -104,6 +104,12 @@ class UVEclat(_ab._frequentPatterns):
             This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
             However, the users can override their default separator.
 
+        chunkSize : int
+            Number of transactions indexed at once when the candidates are verified, the whole database by default
+
+        workers : int
+            Number of processes verifying the chunks of the database
+
         memoryUSS : float
             To store the total amount of USS memory consumed by the program
 
@@ -286,42 +292,12 @@ class UVEclat(_ab._frequentPatterns):
         """
         Takes the self.Database and calculates the support of each item in the dataset and assign the ranks to the items by decreasing support and returns the frequent items list
         """
-        mapSupport = {}
-        k = 0
-        for i in self._Database:
-            k += 1
-            for j in i:
-                if j.item not in mapSupport:
-                    mapSupport[str(j.item)] = j.probability
-                    self._tidList[str(j.item)] = {k: j.probability}
-                else:
-                    mapSupport[str(j.item)] += j.probability
-                    self._tidList[str(j.item)].update({k: j.probability})
-        mapSupport = {k: v for k, v in mapSupport.items() if v >= self._minSup}
+        self._tidList = _ab._ProbabilityTidList.fromTransactions(
+            ([(str(j.item), j.probability) for j in i] for i in self._Database), 1)
+        mapSupport = {k: v.expectedSupport for k, v in self._tidList.items() if v.expectedSupport >= self._minSup}
         plist = dict(sorted(mapSupport.items(), key=_operator.itemgetter(1), reverse=True))
         return list(plist.keys())
 
-    @staticmethod
-    def _check(i, x):
-        """
-        To check the presence of item or pattern in transaction
-
-        :param x: it represents the pattern
-        :type x : list
-        :param i : represents the uncertain self.Database
-        :type i : list
-        """
-
-        # This method taken a transaction as input and returns the tree
-        for m in x:
-            k = 0
-            for n in i:
-                if m == n.item:
-                    k += 1
-            if k == 0:
-                return 0
-        return 1
-
     @staticmethod
     def _convert(value):
         """
@@ -348,22 +324,8 @@ class UVEclat(_ab._frequentPatterns):
         :return: patterns with accurate probability
         """
         global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
+        periods = _ab._expectedSupports([[(j.item, j.probability) for j in i] for i in self._Database],
+                                        _finalPatterns, self._chunkSize, self._workers)
         for x, y in periods.items():
             if y >= self._minSup:
                 sample = str()
@@ -377,29 +339,22 @@ class UVEclat(_ab._frequentPatterns):
         This function is used to find the intersection
 
         :param tidSetx: the timestamp of a patterns
-        :type tidSetx: dict
+        :type tidSetx: ProbabilityTidList
         :param tidSetY: the timestamp of a patterns
-        :type tidSetY: dict
-        """
-        tids = []
-        support = []
-        tidDict = {}
-        for x, y in tidSetx.items():
-            for x1, y1 in tidSetY.items():
-                if x == x1:
-                    tids.append(x)
-                    support.append(y * y1)
-                    tidDict.update({x: y * y1})
-        return tidDict
+        :type tidSetY: ProbabilityTidList
+        :return: transactions of both patterns with the product of their probabilities
+        :rtype: ProbabilityTidList
+        """
+        return tidSetx.intersect(tidSetY)
 
     def _calculateExpSup(self, tidList):
         """
         This function is used to calculate support of tidList
 
         :param tidList: timestamp of a list.
-        :type tidList: List
+        :type tidList: ProbabilityTidList
         """
-        return sum(tidList.values())
+        return tidList.expectedSupport
 
     def _save(self, prefix, suffix, tidSetI):
         """
@@ -410,7 +365,7 @@ class UVEclat(_ab._frequentPatterns):
         :param suffix: the suffix of a patterns
         :type suffix: list
         :param tidSetI: the timestamp of a patterns
-        :type tidSetI: dict
+        :type tidSetI: ProbabilityTidList
         """
 
         global _finalPatterns
@@ -447,8 +402,9 @@ class UVEclat(_ab._frequentPatterns):
             itemSetX = [itemI]
             for j in range(i + 1, len(itemSets)):
                 itemJ = itemSets[j]
-                tidSetJ = tidSets[j]
-                y = self._Intersection(tidSetI, tidSetJ)
+                # tidSets[j] already holds the probabilities of the prefix, so the extension is joined with the
+                # tidlist of itemJ alone to count the prefix only once
+                y = self._Intersection(tidSetI, self._tidList[itemJ])
                 if self._calculateExpSup(y) >= self._minSup:
                     classItemSets.append(itemJ)
                     classTidSets.append(y)
@@ -10,6 +10,7 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.probabilityTidLists import ProbabilityTidList as _ProbabilityTidList, expectedSupports as _expectedSupports
 
 
 class _frequentPatterns(_ABC):
@@ -38,6 +39,10 @@ class _frequentPatterns(_ABC):
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
             To store the total amount of RSS memory consumed by the program
+        chunkSize : int
+            Number of transactions indexed at once when the candidates are verified, the whole database by default
+        workers : int
+            Number of processes verifying the chunks of the database
     :Methods:
         mine()
             Mining process will start from here
@@ -55,7 +60,7 @@ class _frequentPatterns(_ABC):
             Total amount of runtime taken by the program will be retrieved from this function
     """
 
-    def __init__(self, iFile, minSup, sep = '\t'):
+    def __init__(self, iFile, minSup, sep = '\t', chunkSize = None, workers = 1):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str
@@ -66,11 +71,17 @@ class _frequentPatterns(_ABC):
         :type minSup: int or float or str
         :param sep: separator used to distinguish items from each other. The default separator is tab space. However, users can override the default separator
         :type sep: str
+        :param chunkSize: number of transactions indexed at once when the candidates are verified, the whole database when None
+        :type chunkSize: int
+        :param workers: number of processes verifying the chunks of the database
+        :type workers: int
         """
 
         self._iFile = iFile
         self._minSup = minSup
         self._sep = sep
+        self._chunkSize = chunkSize
+        self._workers = workers
         self._oFile = " "
         self._finalPatterns = {}
         self._startTime = float()
@@ -172,13 +172,13 @@ class _Tree(object):
         for i in range(len(transaction)):
             if transaction[i].item not in currentNode.children:
                 newNode = _Node(transaction[i].item, {})
-                nei = _neighbourList.get(transaction[i].item)
+                nei = _neighbourList.neighbourMask(transaction[i].item)
                 l1 = i - 1
                 lp = []
                 while l1 >= 0:
-                    if nei == None:
+                    if nei == 0:
                         break
-                    if transaction[l1].item in nei:
+                    if _neighbourList.contains(nei, transaction[l1].item):
                         lp.append(transaction[l1].probability)
                     l1 -= 1
                 if len(lp) == 0:
@@ -242,14 +242,12 @@ class _Tree(object):
         finalPatterns = []
         sup = []
         for i in self.summaries[alpha]:
-            j = i.item
+            nei = _neighbourList.neighbourMask(i.item)
             s = i.probability
             set2 = []
             while i.parent.item is not None:
-                if _neighbourList.get(j) is not None:
-                    #print(_neighbourList.get(j))
-                    if i.parent.item in _neighbourList[j]:
-                        set2.append(i.parent.item)
+                if _neighbourList.contains(nei, i.parent.item):
+                    set2.append(i.parent.item)
                 i = i.parent
             if len(set2) > 0:
                 set2.reverse()
@@ -611,6 +609,7 @@ class GFPGrowth(_ab._frequentPatterns):
                             _neighbourList[temp[0]] = temp[1:]
                 except IOError:
                     print("File Not Found")
+        _neighbourList = _ab._NeighbourhoodIndex(_neighbourList)
 
     def _frequentOneItem(self):
         """
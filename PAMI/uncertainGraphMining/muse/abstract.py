@@ -3,6 +3,7 @@ from .graph import UncertainGraph
 from .vertex import Vertex
 from .edge import Edge
 from .dfsCode import DFSCode
+from PAMI.extras.encodedGraphDatabase import EncodedGraphDatabase as _EncodedGraphDatabase
 
 import math
 import random
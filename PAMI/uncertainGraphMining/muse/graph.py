@@ -1,6 +1,6 @@
-from vertex import Vertex
-from edge import Edge
-from dfsCode import DFSCode
+from .vertex import Vertex
+from .edge import Edge
+from .dfsCode import DFSCode
 
 class UncertainGraph:
     def __init__(self, iD, vertexMap=None, dfsCode=None):
@@ -9,6 +9,13 @@ class Muse(_ab._MUSE):
 
 
     def readGraph(self, path):
+        if _ab._EncodedGraphDatabase.isEncoded(path):
+            # a database converted with PAMI.extras.encodedGraphDatabase keeps the edge probabilities
+            db = _ab._EncodedGraphDatabase.fromInput(path)
+            graphDatabase = db.toGraphs(_ab.UncertainGraph, _ab.Vertex, _ab.Edge, probabilities=True)
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
+
         with open(path, 'r') as f:
             graphDatabase = []
             vMap = {}
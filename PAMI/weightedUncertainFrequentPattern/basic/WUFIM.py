@@ -656,28 +656,6 @@ class WUFIM(_ab._weightedFrequentPatterns):
                 list1.append(list2)
         return list1
 
-    @staticmethod
-    def _check(i, x) -> int:
-        """
-        To check the presence of item or pattern in transaction
-
-        :param x: it represents the pattern
-        :type x : list
-        :param i : represents the uncertain self.Database
-        :type i : list
-        :return: integer number
-        """
-
-        # This method taken a transaction as input and returns the tree
-        for m in x:
-            k = 0
-            for n in i:
-                if m == n.item:
-                    k += 1
-            if k == 0:
-                return 0
-        return 1
-
     def _convert(self, value) -> float:
         """
         To convert the type of user specified minSup value
@@ -704,22 +682,7 @@ class WUFIM(_ab._weightedFrequentPatterns):
         :return: patterns with accurate probability
         """
         global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
+        periods = _ab._expectedSupports([[(j.item, j.probability) for j in i] for i in self._Database], _finalPatterns)
         for x, y in periods.items():
             weight = 0
             for i in x:
@@ -11,6 +11,7 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.probabilityTidLists import ProbabilityTidList as _ProbabilityTidList, expectedSupports as _expectedSupports
 
 
 class _weightedFrequentPatterns(_ABC):
@@ -12,6 +12,18 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type='text/markdown',
     packages=setuptools.find_packages(),
+    ext_modules=[
+        # optional compiled EFIM, used by PAMI.highUtilityPattern.basic.EFIMNative; the install goes on without it
+        # when no C++17 compiler is available
+        setuptools.Extension(
+            'PAMI.highUtilityPattern.basic._efimNative',
+            sources=['PAMI/highUtilityPattern/basic/_efimNative.cpp'],
+            depends=['PAMI/highUtilityPattern/basic/efim.cpp'],
+            language='c++',
+            extra_compile_args=['-std=c++17', '-O3'],
+            optional=True,
+        ),
+    ],
     url='https://github.com/udayLab/PAMI',
     license='GPLv3',
     install_requires=[            # All necessary packages utilized by our PAMI software
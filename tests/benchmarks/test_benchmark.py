@@ -0,0 +1,56 @@
+import unittest
+import os
+import shutil
+import pandas as pd
+from PAMI.benchmarks.benchmark import Benchmark, compare
+from PAMI.benchmarks.datasets import Dataset
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = os.path.abspath("test_benchmark_data")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_seeded_datasets(self):
+        for kind in ['transactional', 'temporal', 'uncertain', 'utility']:
+            first = Dataset(kind, 50, 4, 20, seed=3).create(os.path.join(self.work_dir, "a"))
+            second = Dataset(kind, 50, 4, 20, seed=3).create(os.path.join(self.work_dir, "b"))
+            other = Dataset(kind, 50, 4, 20, seed=4).create(os.path.join(self.work_dir, "b"))
+            with open(first) as f, open(second) as g, open(other) as h:
+                content = f.read()
+                self.assertEqual(content, g.read())
+                self.assertNotEqual(content, h.read())
+            self.assertEqual(len(content.splitlines()), 50)
+
+    def test_run_and_compare(self):
+        bench = Benchmark(self.work_dir, repeat=2)
+        data = Dataset('transactional', 200, 5, 20, seed=1)
+        bench.add(['frequentPattern.basic.ECLAT', 'frequentPattern.basic.FPGrowth'], data, [0.1, 20])
+        bench.add('frequentPattern.basic.NoSuchMiner', data, [0.1])
+        results = bench.run()
+        self.assertEqual(len(results), 10)
+        completed = results[results['status'] == 'ok']
+        self.assertEqual(len(completed), 8)
+        self.assertTrue((completed['runtime'] > 0).all())
+        # both miners find the same patterns
+        self.assertEqual(completed.groupby('thresholds')['patterns'].nunique().tolist(), [1, 1])
+        self.assertEqual(results[results['status'] == 'error']['algorithm'].unique().tolist(),
+                         ['frequentPattern.basic.NoSuchMiner'])
+
+        baselineFile = os.path.join(self.work_dir, "baseline.csv")
+        bench.save(baselineFile)
+        report = bench.compare(baselineFile)
+        self.assertEqual(len(report), 5)
+        self.assertFalse(report['regression'].any())
+
+        slower = pd.read_csv(baselineFile)
+        slower.loc[slower['algorithm'] == 'frequentPattern.basic.ECLAT', 'runtime'] += 1.0
+        report = compare(slower, bench.getResults())
+        self.assertEqual(report[report['regression']]['algorithm'].unique().tolist(), ['frequentPattern.basic.ECLAT'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from unittest import mock
+import os
+import random
+import shutil
+from PAMI.extras.encodedDatabase import EncodedDatabase, ParseCache
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+class TestEncodedDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_encoded_input.txt"
+        self.temporal_file = "test_encoded_temporal.txt"
+        self.cache_dir = "test_encoded_cache"
+        random.seed(7)
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        with open(self.input_file, 'w') as f:
+            for _ in range(200):
+                f.write("\t".join(random.sample(items, random.randint(1, 8))) + "\n")
+        with open(self.temporal_file, 'w') as f:
+            for ts in range(1, 201):
+                f.write("\t".join([str(ts)] + random.sample(items, random.randint(1, 8))) + "\n")
+
+    def tearDown(self):
+        for path in [self.input_file, self.temporal_file]:
+            if os.path.exists(path):
+                os.remove(path)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_layout(self):
+        db = EncodedDatabase.load(self.input_file)
+        with open(self.input_file) as f:
+            lines = [line.rstrip("\n").split("\t") for line in f]
+        self.assertEqual(len(db), len(lines))
+        self.assertEqual(db.offsets[-1], len(db.items))
+        self.assertEqual([db[i] for i in range(len(db))], lines)
+        self.assertEqual(db[-1], lines[-1])
+        self.assertEqual(sum(db.itemSupports().values()), len(db.items))
+
+    def test_temporal_layout(self):
+        db = EncodedDatabase.load(self.temporal_file, temporal=True)
+        self.assertTrue(db.isTemporal())
+        self.assertEqual(db[0][0], "1")
+        tidLists = db.tidLists()
+        for item, timestamps in tidLists.items():
+            self.assertEqual(timestamps, sorted(timestamps))
+
+    def test_same_patterns_as_file(self):
+        db = EncodedDatabase.load(self.input_file)
+        for alg in [ECLAT, FPGrowth]:
+            fromFile = alg(self.input_file, 10)
+            fromFile.mine()
+            fromDb = alg(db, 10)
+            fromDb.mine()
+            self.assertEqual(fromFile.getPatterns(), fromDb.getPatterns())
+
+    def test_same_periodic_patterns_as_file(self):
+        db = EncodedDatabase.load(self.temporal_file, temporal=True)
+        fromFile = PFPGrowth(self.temporal_file, 10, 20)
+        fromFile.mine()
+        fromDb = PFPGrowth(db, 10, 20)
+        fromDb.mine()
+        self.assertEqual(fromFile.getPatterns(), fromDb.getPatterns())
+
+    def test_parse_cache(self):
+        cache = ParseCache(self.cache_dir)
+        parsed = EncodedDatabase.load(self.input_file, cache=False)
+        first = cache.load(self.input_file)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        second = cache.load(self.input_file)
+        self.assertFalse(second.items.flags.owndata)
+        self.assertEqual(list(second), list(parsed))
+        self.assertEqual(list(first), list(parsed))
+        cache.load(self.input_file, sep=',')
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+        cache.clear()
+        self.assertEqual(cache.getSize(), 0)
+
+    def test_parse_cache_leaves_no_temporary_directories(self):
+        cache = ParseCache(self.cache_dir)
+        with mock.patch.object(EncodedDatabase, 'save', side_effect=RuntimeError("interrupted")):
+            with self.assertRaises(RuntimeError):
+                cache.load(self.input_file)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        os.makedirs(os.path.join(self.cache_dir, ".tmpkilled"))
+        cache.load(self.input_file)
+        cache.clear()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_parse_cache_eviction(self):
+        cache = ParseCache(self.cache_dir)
+        cache.load(self.input_file)
+        temporalSize = EncodedDatabase.load(self.temporal_file, temporal=True, cache=False).getMemory()
+        cache.maxBytes = temporalSize + 4096
+        cache.load(self.temporal_file, temporal=True)
+        self.assertLessEqual(cache.getSize(), cache.maxBytes)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertTrue(cache.load(self.temporal_file, temporal=True).isTemporal())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import os
+import random
+import shutil
+from PAMI.extras.encodedGraphDatabase import EncodedGraphDatabase, convertGraphDatabase
+from PAMI.subgraphMining.basic.gspan import GSpan
+from PAMI.subgraphMining.topK.tkg import TKG
+from PAMI.uncertainGraphMining.muse.muse import Muse
+
+
+class TestEncodedGraphDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_encoded_graphs.txt"
+        self.uncertain_file = "test_encoded_uncertain_graphs.txt"
+        self.directory = "test_encoded_graphs_db"
+        random.seed(5)
+        with open(self.input_file, 'w') as f, open(self.uncertain_file, 'w') as g:
+            for i in range(30):
+                f.write(f"t # {i}\n")
+                g.write(f"t # {i}\n")
+                for v in range(7):
+                    label = random.choice(['C', 'N', '1', '2'])
+                    f.write(f"v {v} {label}\n")
+                    g.write(f"v {v} {random.randint(1, 3)}\n")
+                for v in range(1, 7):
+                    u = random.randrange(v)
+                    f.write(f"e {u} {v} {random.choice(['1', '2', '3'])}\n")
+                    g.write(f"e {u} {v} {random.randint(1, 2)} {round(random.random(), 3)}\n")
+
+    def tearDown(self):
+        for path in [self.input_file, self.uncertain_file]:
+            if os.path.exists(path):
+                os.remove(path)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_layout(self):
+        db = convertGraphDatabase(self.input_file, self.directory)
+        self.assertEqual(len(db), 30)
+        self.assertEqual(db.numberOfVertices(), 210)
+        self.assertEqual(db.numberOfEdges(), 180)
+        self.assertEqual(db.adjacencyOffsets[-1], 2 * db.numberOfEdges())
+        self.assertIsNone(db.edgeProbabilities)
+        mapped = EncodedGraphDatabase.open(self.directory)
+        self.assertTrue(EncodedGraphDatabase.isEncoded(self.directory))
+        self.assertFalse(EncodedGraphDatabase.isEncoded(self.input_file))
+        neighbours, labels = mapped.neighbours(3, 0)
+        first = mapped.edgeOffsets[3]
+        expected = [(mapped.edgeTargets[e], mapped.edgeLabels[e]) for e in range(first, mapped.edgeOffsets[4])
+                    if mapped.edgeSources[e] == 0]
+        self.assertEqual(list(zip(neighbours.tolist(), labels.tolist())), expected)
+        mapped.write(self.input_file + ".out")
+        try:
+            with open(self.input_file) as f, open(self.input_file + ".out") as g:
+                self.assertEqual(f.read().split(), g.read().split())
+        finally:
+            os.remove(self.input_file + ".out")
+
+    def test_miners_read_encoded_database(self):
+        convertGraphDatabase(self.input_file, self.directory)
+
+        def gspan(source):
+            obj = GSpan(source, 0.3, outputGraphIds=True)
+            obj.mine()
+            return [(str(s.dfsCode), s.support, sorted(s.setOfGraphsIds)) for s in obj.frequentSubgraphs]
+
+        def tkg(source):
+            obj = TKG(source, 8)
+            obj.mine()
+            return sorted((str(s.dfsCode), s.support) for s in obj.getSubgraphsList())
+
+        self.assertEqual(gspan(self.input_file), gspan(self.directory))
+        self.assertEqual(tkg(self.input_file), tkg(self.directory))
+
+    def test_uncertain_edges(self):
+        convertGraphDatabase(self.uncertain_file, self.directory)
+
+        def edges(source):
+            return [(g.id, [(v.id, v.getLabel(), [(e.v1, e.v2, e.edgeLabel, e.existenceProbability)
+                                                  for e in v.getEdgeList()])
+                            for v in g.getVertexMap().values()]) for g in Muse(source).graphDatabase]
+
+        self.assertEqual(edges(self.uncertain_file), edges(self.directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
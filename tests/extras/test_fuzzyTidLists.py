@@ -0,0 +1,80 @@
+import unittest
+import os
+import random
+from itertools import combinations
+import numpy as np
+from PAMI.extras.fuzzyTidLists import FuzzyTidList
+from PAMI.fuzzyFrequentPattern.basic.FFIMiner import FFIMiner
+
+
+class TestFuzzyTidLists(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_fuzzy_tidlists.txt"
+        random.seed(7)
+        self.transactions = []
+        for _ in range(300):
+            items = random.sample(['a', 'b', 'c', 'd', 'e', 'f'], random.randint(1, 4))
+            self.transactions.append([(item, random.choice([0.25, 0.5, 0.75, 1.0])) for item in items])
+        with open(self.input_file, 'w') as f:
+            for transaction in self.transactions:
+                f.write("\t".join(item for item, _ in transaction) + ":" +
+                        "\t".join(str(value) for _, value in transaction) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_intersect_matches_dictionary_join(self):
+        tidLists = FuzzyTidList.fromTransactions(self.transactions)
+        dictionaries = {}
+        for tid, transaction in enumerate(self.transactions):
+            for item, value in transaction:
+                dictionaries.setdefault(item, {})[tid] = value
+        for x, y in combinations(sorted(tidLists), 2):
+            joined = tidLists[x].intersect(tidLists[y])
+            expected = {tid: min(v, dictionaries[y][tid]) for tid, v in dictionaries[x].items() if tid in dictionaries[y]}
+            self.assertEqual(joined.values.dtype, np.float32)
+            self.assertEqual(dict(zip(joined.tids.tolist(), joined.values.tolist())), expected)
+            self.assertEqual(joined.support, sum(expected.values()))
+            self.assertIsNone(joined.remaining)
+        empty = FuzzyTidList([], [])
+        self.assertEqual(len(tidLists['a'].intersect(empty)), 0)
+        self.assertEqual(empty.intersect(tidLists['a']).support, 0.0)
+
+    def test_remaining_values_and_periods(self):
+        x = FuzzyTidList([1, 4, 6, 9], [0.5, 1.0, 0.25, 0.75], [2.0, 1.5, 1.0, 3.0])
+        y = FuzzyTidList([4, 5, 9], [0.75, 0.5, 0.5], [0.75, 0.5, 1.25])
+        joined = x.intersect(y)
+        self.assertEqual(joined.tids.tolist(), [4, 9])
+        self.assertEqual(joined.values.tolist(), [0.75, 0.5])
+        self.assertEqual(joined.remaining.tolist(), [0.75, 1.25])
+        self.assertEqual(joined.remainingSupport, 2.0)
+        self.assertEqual(x.periods().tolist(), [1, 3, 2, 3])
+
+    def test_duplicate_items_keep_last_value(self):
+        tidLists = FuzzyTidList.fromTransactions([[('a', 0.5), ('a', 0.25)], [('a', 1.0)]], 1)
+        self.assertEqual(tidLists['a'].tids.tolist(), [1, 2])
+        self.assertEqual(tidLists['a'].values.tolist(), [0.25, 1.0])
+
+    def test_ffiminer_supports(self):
+        obj = FFIMiner(self.input_file, 20)
+        obj.mine()
+        patterns = {frozenset(key): value for key, value in obj.getPatterns().items()}
+        expected = {}
+        for length in range(1, 5):
+            for itemSet in combinations('abcdef', length):
+                support = 0
+                for transaction in self.transactions:
+                    values = dict(transaction)
+                    if all(item in values for item in itemSet):
+                        support += min(values[item] for item in itemSet)
+                if support >= 20:
+                    expected[frozenset(itemSet)] = support
+        self.assertEqual(set(patterns), set(expected))
+        for itemSet, support in expected.items():
+            self.assertAlmostEqual(patterns[itemSet], support)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import os
+import random
+from itertools import combinations
+from PAMI.extras.neighbourhoodIndex import NeighbourhoodIndex
+from PAMI.highUtilitySpatialPattern.basic.SHUIM import SHUIM
+
+
+class TestNeighbourhoodIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_neighbourhood_index.txt"
+        self.neighbour_file = "test_neighbourhood_index_neighbours.txt"
+        random.seed(3)
+        self.items = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+        self.neighbours = {}
+        for x, y in combinations(self.items, 2):
+            if random.random() < 0.6:
+                self.neighbours.setdefault(x, []).append(y)
+                self.neighbours.setdefault(y, []).append(x)
+        with open(self.neighbour_file, 'w') as f:
+            for item, itemNeighbours in self.neighbours.items():
+                f.write("\t".join([item] + itemNeighbours) + "\n")
+        with open(self.input_file, 'w') as f:
+            for _ in range(200):
+                items = random.sample(self.items, random.randint(2, 5))
+                utilities = [random.randint(1, 9) for _ in items]
+                total = sum(utilities)
+                f.write("\t".join(items) + ":" + str(total) + ":" + "\t".join(map(str, utilities)) + ":" +
+                        "\t".join([str(total)] * len(items)) + "\n")
+
+    def tearDown(self):
+        for name in (self.input_file, self.neighbour_file):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def test_masks_match_set_intersections(self):
+        index = NeighbourhoodIndex(self.neighbours)
+        for length in range(1, 4):
+            for itemSet in combinations(self.items, length):
+                expected = set(self.neighbours) & set.intersection(*(set(self.neighbours.get(i, [])) for i in itemSet))
+                mask = index.commonMask(itemSet)
+                self.assertEqual(set(index.members(mask)), expected)
+                for item in self.items:
+                    self.assertEqual(index.contains(mask, item), item in expected)
+        self.assertEqual(index.commonMask(()), index.keysMask)
+        self.assertEqual(index.select(['g', 'a', 'z'], index.keysMask), [i for i in ['g', 'a'] if i in self.neighbours])
+
+    def test_unknown_items_and_cache(self):
+        index = NeighbourhoodIndex({'a': ['b', 'x'], 'b': ['a']}, cacheSize=2)
+        self.assertIn('a', index)
+        self.assertNotIn('x', index)
+        self.assertTrue(index.isNeighbour('a', 'x'))
+        self.assertFalse(index.isNeighbour('x', 'a'))
+        self.assertFalse(index.contains(index.keysMask, 'z'))
+        self.assertEqual(index.neighbourMask('z'), 0)
+        self.assertEqual(index.members(index.commonMask(('a',))), ['b'])
+        self.assertEqual(index.commonMask(('a', 'b')), 0)
+        self.assertEqual(index.commonMask(('b', 'a')), 0)
+        self.assertEqual(index.members(index.commonMask(('b',))), ['a'])
+
+    def test_shuim_patterns_are_neighbourhoods(self):
+        obj = SHUIM(self.input_file, self.neighbour_file, 100)
+        obj.mine()
+        patterns = obj.getPatterns()
+        self.assertGreater(len(patterns), 0)
+        for pattern in patterns:
+            items = pattern.strip().split("\t")
+            for i in range(1, len(items)):
+                for previous in items[:i]:
+                    self.assertIn(items[i], self.neighbours[previous])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import os
+import random
+import threading
+from PAMI.extras.patternSinks import PatternSink, FileSink, CallbackSink, QueueSink, CountingSink
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.Aprioribitset import Aprioribitset
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.ECLATDiffset import ECLATDiffset
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+
+
+class TestPatternSinks(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_sink_input.txt"
+        self.output_file = "test_sink_output.txt"
+        self.saved_file = "test_sink_saved.txt"
+        random.seed(3)
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        with open(self.input_file, 'w') as f:
+            for _ in range(200):
+                f.write("\t".join(random.sample(items, random.randint(1, 8))) + "\n")
+
+    def tearDown(self):
+        for path in [self.input_file, self.output_file, self.saved_file]:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def expected(self, alg):
+        obj = alg(self.input_file, 15)
+        obj.mine()
+        return obj.getPatterns()
+
+    def test_file_sink(self):
+        for alg in [Apriori, ECLATDiffset, FPGrowth]:
+            expected = self.expected(alg)
+            obj = alg(self.input_file, 15)
+            obj.setSink(FileSink(self.output_file))
+            obj.mine()
+            with self.assertRaises(TypeError):
+                obj.getPatterns()
+            reference = alg(self.input_file, 15)
+            reference.mine()
+            reference.save(self.saved_file)
+            with open(self.output_file) as streamed, open(self.saved_file) as saved:
+                self.assertEqual(sorted(streamed.readlines()), sorted(saved.readlines()))
+            self.assertEqual(len(obj._finalPatterns), len(expected))
+
+    def test_callback_and_counting_sinks(self):
+        expected = self.expected(FPGrowth)
+        received = {}
+        obj = FPGrowth(self.input_file, 15)
+        obj.setSink(CallbackSink(received.__setitem__))
+        obj.mine()
+        self.assertEqual(received, expected)
+        counter = CountingSink()
+        obj = FPGrowth(self.input_file, 15)
+        obj.setSink(counter)
+        obj.mine()
+        self.assertEqual(len(counter), len(expected))
+
+    def test_bounded_queue_sink(self):
+        expected = self.expected(ECLATDiffset)
+        sink = QueueSink(maxsize=4)
+        received = {}
+
+        def consume():
+            while True:
+                pattern = sink.queue.get()
+                if pattern is None:
+                    break
+                received[pattern[0]] = pattern[1]
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        obj = ECLATDiffset(self.input_file, 15)
+        obj.setSink(sink)
+        obj.mine()
+        consumer.join()
+        self.assertEqual(received, expected)
+
+    def test_sink_reused_across_runs(self):
+        for alg in [Apriori, Aprioribitset, ECLAT, ECLATbitset, ECLATDiffset, FPGrowth]:
+            expected = self.expected(alg)
+            counter = CountingSink()
+            obj = alg(self.input_file, 15)
+            obj.setSink(counter)
+            obj.mine()
+            obj.mine()
+            self.assertEqual(len(counter), len(expected), alg.__name__)
+
+    def test_sink_must_implement_write(self):
+        with self.assertRaises(TypeError):
+            PatternSink()
+
+        class IncompleteSink(PatternSink):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteSink()
+
+    def test_in_memory_sink(self):
+        obj = FPGrowth(self.input_file, 15)
+        obj.setSink(CountingSink())
+        obj.setSink(None)
+        obj.mine()
+        self.assertEqual(obj.getPatterns(), self.expected(FPGrowth))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import random
+import numpy as np
+from PAMI.extras import periodicTidLists as ptl
+
+
+def maxPer(timeStamps, last):
+    return int(np.max(np.diff(np.sort(np.append(list(timeStamps), [0, last])))))
+
+
+def periodicSupport(timeStamps, period):
+    return int(np.sum(np.diff(np.sort(list(timeStamps))) <= period))
+
+
+def maxLa(timeStamps, per, last):
+    previous, la, laList = 0, 0, []
+    for ts in sorted(timeStamps) + [last]:
+        la = max(0, la + ts - previous - per)
+        laList.append(la)
+        previous = ts
+    return max(laList)
+
+
+class TestPeriodicTidLists(unittest.TestCase):
+
+    def test_measures_match_the_scalar_definitions(self):
+        random.seed(1)
+        for _ in range(200):
+            last = random.randint(1, 60)
+            lists = [random.sample(range(1, last + 1), random.randint(0, min(last, 15)))
+                     for _ in range(random.randint(0, 6))]
+            per = random.choice([1, 3, 5.5, 10])
+            values, offsets = ptl.pack(lists)
+            self.assertEqual(ptl.supports(offsets).tolist(), [len(t) for t in lists])
+            self.assertEqual(ptl.maxPeriodicities(values, offsets, last).tolist(), [maxPer(t, last) for t in lists])
+            self.assertEqual(ptl.periodicSupports(values, offsets, per).tolist(), [periodicSupport(t, per) for t in lists])
+            self.assertEqual(ptl.maxLiabilities(values, offsets, per, last).tolist(), [maxLa(t, per, last) for t in lists])
+
+    def test_intersections(self):
+        random.seed(2)
+        for _ in range(100):
+            prefix = ptl.tidList(random.sample(range(50), random.randint(0, 30)))
+            lists = [random.sample(range(50), random.randint(0, 30)) for _ in range(random.randint(0, 5))]
+            values, offsets = ptl.intersectMany(prefix, *ptl.pack(lists))
+            expected = [sorted(set(t) & set(prefix.tolist())) for t in lists]
+            self.assertEqual([t.tolist() for t in ptl.unpack(values, offsets)], expected)
+            self.assertEqual([ptl.intersect(prefix, ptl.tidList(t)).tolist() for t in lists], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
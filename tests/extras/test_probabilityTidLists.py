@@ -0,0 +1,68 @@
+import unittest
+import os
+import math
+import random
+from itertools import combinations
+from PAMI.extras.probabilityTidLists import ProbabilityTidList
+from PAMI.uncertainFrequentPattern.basic.UVECLAT import UVEclat
+
+
+class TestProbabilityTidLists(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_probability_tidlists.txt"
+        random.seed(4)
+        self.transactions = []
+        for _ in range(300):
+            items = random.sample(['a', 'b', 'c', 'd', 'e', 'f'], random.randint(1, 4))
+            self.transactions.append([(item, round(random.uniform(0.1, 1), 2)) for item in items])
+        with open(self.input_file, 'w') as f:
+            for transaction in self.transactions:
+                f.write("\t".join(item for item, _ in transaction) + ":" +
+                        "\t".join(str(probability) for _, probability in transaction) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_intersect_matches_dictionary_join(self):
+        tidLists = ProbabilityTidList.fromTransactions(self.transactions)
+        dictionaries = {}
+        for tid, transaction in enumerate(self.transactions):
+            for item, probability in transaction:
+                dictionaries.setdefault(item, {})[tid] = probability
+        for x, y in combinations(sorted(tidLists), 2):
+            joined = tidLists[x].intersect(tidLists[y])
+            expected = {tid: p * dictionaries[y][tid] for tid, p in dictionaries[x].items() if tid in dictionaries[y]}
+            self.assertEqual(dict(zip(joined.tids.tolist(), joined.probabilities.tolist())), expected)
+            self.assertEqual(joined.expectedSupport, sum(expected.values()))
+        empty = ProbabilityTidList([], [])
+        self.assertEqual(len(tidLists['a'].intersect(empty)), 0)
+        self.assertEqual(empty.intersect(tidLists['a']).expectedSupport, 0.0)
+
+    def test_duplicate_items_keep_last_probability(self):
+        tidLists = ProbabilityTidList.fromTransactions([[('a', 0.5), ('a', 0.25)], [('a', 1.0)]], 1)
+        self.assertEqual(tidLists['a'].tids.tolist(), [1, 2])
+        self.assertEqual(tidLists['a'].probabilities.tolist(), [0.25, 1.0])
+
+    def test_uveclat_expected_supports(self):
+        obj = UVEclat(self.input_file, 3)
+        obj.mine()
+        patterns = {frozenset(key.split()): value for key, value in obj.getPatterns().items()}
+        expected = {}
+        for length in range(1, 5):
+            for itemSet in combinations('abcdef', length):
+                support = 0
+                for transaction in self.transactions:
+                    probabilities = dict(transaction)
+                    if all(item in probabilities for item in itemSet):
+                        support += math.prod(probabilities[item] for item in itemSet)
+                if support >= 3:
+                    expected[frozenset(itemSet)] = support
+        self.assertEqual(set(patterns), set(expected))
+        for itemSet, support in expected.items():
+            self.assertAlmostEqual(patterns[itemSet], support)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from PAMI.extras.neighbours.spatialGrid import SpatialGrid, haversine
+
+
+class TestSpatialGrid(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.points = rng.integers(0, 50, (400, 2)).astype(float)
+        self.lonLat = np.column_stack((rng.uniform(-180, 180, 400), rng.uniform(-89, 89, 400)))
+
+    def assertMatchesDenseSearch(self, grid, distances, maxDist, chunkSize):
+        seen = []
+        for chunk in grid.neighbours(chunkSize):
+            self.assertLessEqual(len(chunk), chunkSize)
+            for index, neighbours, neighbourDistances in chunk:
+                seen.append(index)
+                expected = np.flatnonzero(distances[index] <= maxDist)
+                expected = expected[expected != index]
+                self.assertEqual(neighbours.tolist(), expected.tolist())
+                np.testing.assert_allclose(neighbourDistances, distances[index][expected])
+        self.assertEqual(seen, list(range(len(distances))))
+
+    def test_euclidean_pairs(self):
+        distances = np.sqrt(((self.points[:, None, :] - self.points[None, :, :]) ** 2).sum(axis=2))
+        for maxDist in (0, 3, 7.5):
+            self.assertMatchesDenseSearch(SpatialGrid(self.points, maxDist), distances, maxDist, 64)
+
+    def test_haversine_pairs(self):
+        distances = haversine(self.lonLat, self.lonLat)
+        for maxDist in (500.0, 2500.0, 30000.0):
+            self.assertMatchesDenseSearch(SpatialGrid(self.lonLat, maxDist, 'haversine'), distances, maxDist, 100)
+        self.assertAlmostEqual(float(haversine(np.array([[0.0, 0.0]]), np.array([[0.0, 1.0]]))[0, 0]), 111.195, places=2)
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(list(SpatialGrid(np.zeros((0, 2)), 1).neighbours()), [])
+        with self.assertRaises(ValueError):
+            SpatialGrid(self.points, 1, 'manhattan')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import os
+import random
+import itertools
+from PAMI.extras.topKHeap import TopKHeap
+from PAMI.frequentPattern.topk.FAE import FAE
+from PAMI.stablePeriodicFrequentPattern.topK.TSPIN import TSPIN
+
+
+class TestTopKHeap(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_topk_input.txt"
+        self.temporal_file = "test_topk_temporal.txt"
+        random.seed(5)
+        items = ["a{}".format(i) for i in range(10)]
+        self.database = [random.sample(items, random.randint(1, 6)) for _ in range(150)]
+        with open(self.input_file, 'w') as f:
+            for transaction in self.database:
+                f.write("\t".join(transaction) + "\n")
+        with open(self.temporal_file, 'w') as f:
+            for ts, transaction in enumerate(self.database, 1):
+                f.write("\t".join([str(ts)] + transaction) + "\n")
+        self.supports = {}
+        for length in range(1, 7):
+            for pattern in itertools.combinations(items, length):
+                timestamps = [ts for ts, t in enumerate(self.database, 1) if set(pattern) <= set(t)]
+                if timestamps:
+                    self.supports[pattern] = timestamps
+
+    def tearDown(self):
+        for path in [self.input_file, self.temporal_file]:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_heap(self):
+        heap = TopKHeap(3, floor=1)
+        self.assertEqual(heap.threshold(), 1)
+        for pattern, value in [('a', 5), ('b', 2), ('c', 7), ('d', 1), ('e', 4), ('c', 3)]:
+            heap.push(pattern, value)
+        self.assertEqual(heap.patterns(), {'a': 5, 'e': 4, 'c': 3})
+        self.assertEqual(heap.threshold(), 3)
+        self.assertFalse(heap.push('f', 3))
+        self.assertTrue(heap.push('g', [9, 0], 9))
+        self.assertEqual(list(heap.patterns()), ['g', 'a', 'e'])
+        for value in range(1000):
+            heap.push('h', value)
+        self.assertLessEqual(len(heap._heap), 2 * len(heap) + 16)
+        self.assertEqual(heap.patterns()['h'], 999)
+
+    def test_fae(self):
+        reference = sorted([len(t) for t in self.supports.values()], reverse=True)
+        for k in [5, 30, 60]:
+            obj = FAE(self.input_file, k)
+            obj.mine()
+            self.assertEqual(sorted(obj.getPatterns().values(), reverse=True), reference[:k])
+
+    def test_tspin(self):
+        def la(timestamps, maxPer):
+            previous, value = 0, 0
+            for ts in timestamps + [len(self.database)]:
+                value = max(0, value + ts - previous - maxPer)
+                previous = ts
+            return value
+        reference = sorted([len(t) for t in self.supports.values() if la(t, 10) <= 15], reverse=True)
+        for k in [5, 30]:
+            obj = TSPIN(self.temporal_file, 10, 15, k)
+            obj.mine()
+            self.assertEqual(sorted([v[0] for v in obj.getPatterns().values()], reverse=True), reference[:k])
+
+
+if __name__ == '__main__':
+    unittest.main()
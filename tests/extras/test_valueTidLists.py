@@ -0,0 +1,33 @@
+import unittest
+import numpy as np
+from PAMI.extras import valueTidLists as vtl
+from PAMI.extras.fuzzyTidLists import FuzzyTidList
+from PAMI.extras.probabilityTidLists import ProbabilityTidList
+
+
+class TestValueTidLists(unittest.TestCase):
+
+    def setUp(self):
+        self.transactions = [[('b', 0.5), ('a', 0.25)], [('a', 0.5), ('a', 0.75)], [], [('b', 1.0)]]
+
+    def test_item_columns(self):
+        tids, values = vtl.itemColumns(self.transactions, 10)
+        self.assertEqual(list(tids), ['b', 'a'])
+        self.assertEqual(tids, {'b': [10, 13], 'a': [10, 11]})
+        self.assertEqual(values, {'b': [0.5, 1.0], 'a': [0.25, 0.75]})
+
+    def test_ordered_sum(self):
+        values = np.full(10000, 0.1, dtype=np.float32)
+        self.assertEqual(vtl.orderedSum(values), float(np.cumsum(values.astype(np.float64))[-1]))
+        self.assertEqual(vtl.orderedSum(values[:0]), 0.0)
+
+    def test_shared_by_both_tidlists(self):
+        fuzzy = FuzzyTidList.fromTransactions(self.transactions)
+        probability = ProbabilityTidList.fromTransactions(self.transactions)
+        for item in ('a', 'b'):
+            self.assertEqual(fuzzy[item].tids.tolist(), probability[item].tids.tolist())
+            self.assertEqual(fuzzy[item].support, probability[item].expectedSupport)
+
+
+if __name__ == '__main__':
+    unittest.main()
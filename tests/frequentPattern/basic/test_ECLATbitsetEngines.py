@@ -0,0 +1,37 @@
+import unittest
+import os
+import random
+import warnings
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+
+warnings.filterwarnings("ignore")
+
+
+class TestECLATbitsetEngines(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_bitset_input.txt"
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        with open(self.input_file, 'w') as f:
+            for _ in range(500):
+                f.write("\t".join(random.sample(items, random.randint(5, 12))) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_engines_return_same_patterns(self):
+        numpyEngine = ECLATbitset(self.input_file, 0.2)
+        numpyEngine.mine(engine="numpy")
+        for memorySaver in [True, False]:
+            bigintEngine = ECLATbitset(self.input_file, 0.2)
+            bigintEngine.mine(memorySaver=memorySaver, engine="bigint")
+            self.assertEqual(numpyEngine.getPatterns(), bigintEngine.getPatterns())
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            ECLATbitset(self.input_file, 0.2).mine(engine="gpu")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import os
+import random
+import warnings
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestFPGrowthTree(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_fptree_input.txt"
+        items = ["item-{}".format(i) for i in range(1, 21)]
+        with open(self.input_file, 'w') as f:
+            for _ in range(400):
+                f.write("\t".join(random.sample(items, random.randint(1, 10))) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_patterns_as_eclat(self):
+        for minSup in [0.2, 0.05, 0.02]:
+            fpgrowth = FPGrowth(self.input_file, minSup)
+            fpgrowth.mine()
+            eclat = ECLAT(self.input_file, minSup)
+            eclat.mine()
+            patterns = {frozenset(k): v for k, v in fpgrowth.getPatterns().items()}
+            self.assertEqual(len(patterns), len(fpgrowth.getPatterns()))
+            self.assertEqual(patterns, {frozenset(k): v for k, v in eclat.getPatterns().items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import os
+import random
+import warnings
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+
+warnings.filterwarnings("ignore")
+
+
+class TestMineSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_sweep_input.txt"
+        items = ["item-{}".format(i) for i in range(1, 21)]
+        with open(self.input_file, 'w') as f:
+            for _ in range(300):
+                f.write("\t".join(random.sample(items, random.randint(1, 10))) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    @staticmethod
+    def unordered(patterns):
+        return {frozenset(pattern): support for pattern, support in patterns.items()}
+
+    def test_sweep_matches_individual_runs(self):
+        minSups = [0.3, 60, 0.1, 45]
+        for alg in [Apriori, ECLATbitset, FPGrowth]:
+            sweep = alg(self.input_file, 0)
+            results = sweep.mineSweep(minSups)
+            for minSup in minSups:
+                single = alg(self.input_file, minSup)
+                single.mine()
+                # Apriori stores file transactions as sets, so the item order of its patterns follows string hashing
+                self.assertEqual(self.unordered(results[minSup]), self.unordered(single.getPatterns()))
+            statistics = sweep.getSweepStatistics()
+            self.assertEqual(len(statistics), len(minSups))
+            self.assertEqual(statistics['Patterns'].tolist(), sorted([len(results[m]) for m in minSups], reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import os
+import random
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+
+
+class TestParallelFPGrowth(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_parallel_fpgrowth_input.txt"
+        random.seed(11)
+        items = ["item-{}".format(i) for i in range(1, 26)]
+        with open(self.input_file, 'w') as f:
+            for _ in range(400):
+                f.write("\t".join(random.sample(items, random.randint(1, 12))) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_patterns_as_sequential(self):
+        sequential = FPGrowth(self.input_file, 20)
+        sequential.mine()
+        parallel = FPGrowth(self.input_file, 20, workers=2)
+        parallel.mine()
+        self.assertEqual(parallel.getPatterns(), sequential.getPatterns())
+
+    def test_groups_cover_every_item(self):
+        miner = FPGrowth(self.input_file, 20)
+        miner.mine()
+        database = [line.rstrip("\n").split("\t") for line in open(self.input_file)]
+        itemCount = {}
+        for line in database:
+            for item in line:
+                itemCount[item] = itemCount.get(item, 0) + 1
+        tree = miner._construct(itemCount, database, 20)
+        groups = miner._groupItems(tree, 4)
+        self.assertLessEqual(len(groups), 4)
+        self.assertEqual(sorted(item for group in groups for item in group), sorted(tree.support))
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            FPGrowth(self.input_file, 20, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+import random
+from PAMI.highUtilityPattern.basic import EFIMNative as native
+from PAMI.highUtilityPattern.basic.EFIM import EFIM
+
+
+class TestEFIMNative(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_efim_native.txt"
+        random.seed(3)
+        with open(self.input_file, 'w') as f:
+            for _ in range(400):
+                items = random.sample(["item{}".format(i) for i in range(12)], random.randint(1, 6))
+                # small utilities give many equal local utilities, which must not change the item order
+                utilities = [random.randint(1, 3) for _ in items]
+                f.write("{}:{}:{}\n".format("\t".join(items), sum(utilities), "\t".join(map(str, utilities))))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def _python(self):
+        obj = EFIM(self.input_file, 120)
+        obj.mine()
+        return obj.getPatterns()
+
+    @unittest.skipUnless(native.EFIMNative.isNativeAvailable(), "the _efimNative extension is not built")
+    def test_native_matches_python(self):
+        obj = native.EFIMNative(self.input_file, 120)
+        obj.mine()
+        self.assertTrue(obj.native)
+        self.assertGreater(len(obj.getPatterns()), 10)
+        self.assertEqual(obj.getPatterns(), self._python())
+
+    def test_fallback_matches_python(self):
+        extension = native._efimNative
+        native._efimNative = None
+        try:
+            obj = native.EFIMNative(self.input_file, 120)
+            obj.mine()
+        finally:
+            native._efimNative = extension
+        self.assertFalse(obj.native)
+        self.assertEqual(obj.getPatterns(), self._python())
+        self.assertEqual(len(obj.getPatternsAsDataFrame()), len(obj.getPatterns()))
+
+
+if __name__ == '__main__':
+    unittest.main()
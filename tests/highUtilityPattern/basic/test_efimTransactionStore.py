@@ -0,0 +1,45 @@
+import unittest
+import os
+import random
+from itertools import combinations
+from PAMI.highUtilityPattern.basic.EFIM import EFIM
+
+
+class TestEfimTransactionStore(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_efim_store.txt"
+        random.seed(12)
+        self.transactions = []
+        with open(self.input_file, 'w') as f:
+            for _ in range(300):
+                items = random.sample(["a", "b", "c", "d", "e", "f", "g", "h"], random.randint(1, 6))
+                utilities = [random.randint(1, 9) for _ in items]
+                # repeated transactions exercise the merging of identical projections
+                for _ in range(random.choice([1, 1, 2])):
+                    self.transactions.append(dict(zip(items, utilities)))
+                    f.write("{}:{}:{}\n".format(" ".join(items), sum(utilities), " ".join(map(str, utilities))))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_patterns_match_exhaustive_search(self):
+        minUtil = 400
+        obj = EFIM(self.input_file, minUtil, " ")
+        obj.mine()
+        expected = {}
+        for length in range(1, 9):
+            for itemset in combinations("abcdefgh", length):
+                utility = sum(sum(t[i] for i in itemset) for t in self.transactions if all(i in t for i in itemset))
+                if utility >= minUtil:
+                    expected[frozenset(itemset)] = str(utility)
+        patterns = {frozenset(pattern.split("\t")): utility for pattern, utility in obj.getPatterns().items()}
+        self.assertEqual(len(patterns), len(obj.getPatterns()))
+        self.assertGreater(len(expected), 10)
+        self.assertEqual(patterns, expected)
+        self.assertEqual(len(obj._items), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import random
+import queue
+import multiprocessing
+from array import array
+from PAMI.highUtilityPattern.parallel.efimparallel import efimParallel
+
+
+class TestEfimWorkStealing(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_efim_work_stealing.txt"
+        random.seed(9)
+        with open(self.input_file, 'w') as f:
+            for _ in range(400):
+                items = random.sample(range(1, 16), random.randint(1, 7))
+                utilities = [random.randint(1, 10) for _ in items]
+                f.write("{}:{}:{}\n".format(" ".join(map(str, items)), sum(utilities), " ".join(map(str, utilities))))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def _mine(self, threads, workStealing):
+        obj = efimParallel(self.input_file, 250, " ", threads, workStealing)
+        obj.mine()
+        return obj.getPatterns()
+
+    def test_depth_first_matches_level_wise(self):
+        levelWise = self._mine(1, False)
+        self.assertGreater(len(levelWise), 20)
+        self.assertEqual(self._mine(1, True), levelWise)
+        self.assertEqual(self._mine(3, True), levelWise)
+
+    def test_utilities_match_database_scan(self):
+        transactions = []
+        with open(self.input_file) as f:
+            for line in f:
+                items, _, utilities = line.strip().split(":")
+                transactions.append(dict(zip(items.split(), map(int, utilities.split()))))
+        for pattern, utility in self._mine(2, True).items():
+            items = pattern.split("\t")
+            self.assertGreaterEqual(utility, 250)
+            self.assertEqual(utility, sum(sum(t[i] for i in items) for t in transactions if all(i in t for i in items)))
+
+    def test_donations_bounded_by_waiting_workers(self):
+        expected = self._mine(1, True)
+        obj = efimParallel(self.input_file, 250, " ", 3, True)
+        fileData, primary, secondary = obj._read_file()
+        obj._encodeTransactions(fileData)
+        tids = array('i', range(len(obj._offsets) - 1))
+        # two workers wait for the whole run and never take a task, as with a slow poll
+        obj._tasks = queue.Queue()
+        obj._idle = multiprocessing.Value('i', 2)
+        obj._pending = multiprocessing.Value('q', 1)
+        obj._queued = multiprocessing.Value('i', 0)
+        obj._mineTask([], list(primary), tids, obj._offsets[:-1], array('q', bytes(8 * len(tids))), secondary)
+        self.assertEqual(obj._donations, 2)
+        self.assertEqual(obj._tasks.qsize(), 2)
+        self.assertEqual(obj._queued.value, 2)
+        obj._idle = None
+        while not obj._tasks.empty():
+            obj._mineTask(*obj._tasks.get())
+        self.assertEqual(obj.getPatterns(), expected)
+
+    def test_parallel_donations_bounded(self):
+        obj = efimParallel(self.input_file, 250, " ", 3, True)
+        obj.mine()
+        self.assertLess(obj._donations, len(obj.getPatterns()))
+
+
+if __name__ == '__main__':
+    unittest.main()
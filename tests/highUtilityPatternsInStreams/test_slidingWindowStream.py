@@ -0,0 +1,62 @@
+import unittest
+import os
+import random
+from itertools import combinations
+from PAMI.highUtilityPatternsInStreams.SHUGrowth import SHUGrowth
+from PAMI.highUtilityPatternsInStreams.HUPMS import HUPMS
+
+
+class TestSlidingWindowStream(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_sliding_window_stream.txt"
+        self.lines = []
+        random.seed(2)
+        for _ in range(240):
+            items = random.sample(['a', 'b', 'c', 'd', 'e', 'f'], random.randint(1, 4))
+            utilities = [random.randint(1, 9) for _ in items]
+            self.lines.append("{}:{}:{}".format(",".join(items), sum(utilities), ",".join(map(str, utilities))))
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join(self.lines) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_push_matches_mine(self):
+        for miner in (SHUGrowth, HUPMS):
+            obj = miner(self.input_file, None, 150, 3, 40)
+            obj.mine()
+            stream = miner(self.input_file, None, 150, 3, 40)
+            polled = {}
+            for line in self.lines:
+                stream.push(line)
+                polled.update(stream.pollPatterns())
+            self.assertEqual(polled, obj.getPatterns())
+            self.assertEqual(stream.pollPatterns(), {})
+            self.assertEqual(list(polled), [(start, start + 120) for start in range(0, 121, 40)])
+            statistics = stream.getPaneStatistics()
+            self.assertEqual(len(statistics), len(polled))
+            self.assertTrue((statistics['Latency'] >= 0).all())
+
+    def test_windows_are_complete(self):
+        transactions = []
+        for line in self.lines:
+            parts = line.split(":")
+            transactions.append(dict(zip(parts[0].split(","), map(float, parts[2].split(",")))))
+        for miner in (SHUGrowth, HUPMS):
+            obj = miner(self.input_file, None, 150, 3, 40)
+            obj.mine()
+            for (start, end), patterns in obj.getPatterns().items():
+                expected = set()
+                for length in range(1, 5):
+                    for itemSet in combinations('abcdef', length):
+                        utility = sum(sum(t[item] for item in itemSet) for t in transactions[start:end]
+                                      if all(item in t for item in itemSet))
+                        if utility >= 150:
+                            expected.add((frozenset(itemSet), utility))
+                self.assertEqual({(frozenset(p), u) for p, u in patterns}, expected, (miner.__name__, start))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import os
+import random
+from PAMI.sequentialPattern.basic.GSP import GSP
+
+
+class TestGSP(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_gsp_sequences.txt"
+        random.seed(4)
+        items = ["item-{}".format(i) for i in range(1, 13)]
+        with open(self.input_file, 'w') as f:
+            for _ in range(300):
+                sequence = []
+                for _ in range(random.randint(1, 5)):
+                    sequence += random.sample(items, random.randint(1, 3)) + ["-1"]
+                f.write(" ".join(sequence) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_supports_match_database_scan(self):
+        obj = GSP(self.input_file, 0.05)
+        obj.mine()
+        patterns = obj.getPatterns()
+        self.assertGreater(len(patterns), 20)
+        for pattern, support in patterns.items():
+            if isinstance(pattern, str):
+                pattern = (pattern,)
+            itemsets = obj.list_split(list(pattern))
+            self.assertEqual(support, sum(obj.checkPattern(itemsets, seq) for seq in obj._Database))
+            self.assertEqual(support, obj.getSup(list(pattern)))
+
+    def test_parallel_matches_sequential(self):
+        sequential = GSP(self.input_file, 0.05)
+        sequential.mine()
+        parallel = GSP(self.input_file, 0.05, workers=2)
+        parallel.mine()
+        self.assertEqual(list(sequential.getPatterns().items()), list(parallel.getPatterns().items()))
+        with self.assertRaises(ValueError):
+            GSP(self.input_file, 0.05, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import random
+import numpy as np
+from PAMI.sequentialPattern.basic.SPAM import SPAM
+
+
+class TestSPAMBitmaps(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_spam_bitmaps.txt"
+        random.seed(6)
+        items = ["item-{}".format(i) for i in range(1, 9)]
+        with open(self.input_file, 'w') as f:
+            for n in range(200):
+                sequence = []
+                # a few sequences longer than one 64-bit word
+                for _ in range(random.randint(65, 80) if n % 50 == 0 else random.randint(1, 6)):
+                    sequence += random.sample(items, random.randint(1, 3)) + ["-1"]
+                f.write(" ".join(sequence) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_supports_match_database_scan(self):
+        obj = SPAM(self.input_file, 0.1)
+        obj.mine()
+        patterns = obj.getPatterns()
+        self.assertGreater(len(patterns), 50)
+        database = SPAM(self.input_file, 0.1)
+        database._creatingItemSets()
+        for pattern, support in patterns.items():
+            itemsets = [[]]
+            for item in pattern.split("\t")[:-1]:
+                if item == "-1":
+                    itemsets.append([])
+                else:
+                    itemsets[-1].append(item)
+            itemsets = [set(itemset) for itemset in itemsets if itemset]
+            count = 0
+            for sequence in database._Database:
+                matched = 0
+                for itemset in sequence:
+                    if matched < len(itemsets) and itemsets[matched].issubset(itemset):
+                        matched += 1
+                count += matched == len(itemsets)
+            self.assertEqual(support, count, pattern)
+
+    def test_sstep(self):
+        obj = SPAM(self.input_file, 0.1)
+        rows = np.array([[0b10100, 0], [0, 0b110], [1 << 63, 1]], dtype=np.uint64)
+        allOnes = np.uint64(0xFFFFFFFFFFFFFFFF)
+        expected = np.array([[allOnes ^ np.uint64(0b111), allOnes], [0, allOnes ^ np.uint64(0b11)], [0, allOnes]],
+                            dtype=np.uint64)
+        self.assertTrue((obj.Sstep(rows) == expected).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
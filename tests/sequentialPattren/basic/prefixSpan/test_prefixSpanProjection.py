@@ -0,0 +1,59 @@
+import unittest
+import os
+import random
+from PAMI.sequentialPattern.basic.PrefixSpan import PrefixSpan
+
+
+class TestPrefixSpanProjection(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_prefixspan_sequences.txt"
+        random.seed(6)
+        items = ["i{}".format(i) for i in range(8)]
+        with open(self.input_file, 'w') as f:
+            for _ in range(150):
+                itemsets = [" ".join(random.sample(items, random.randint(1, 3))) for _ in range(random.randint(1, 4))]
+                f.write(" : ".join(itemsets) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def _support(self, pattern, database):
+        itemsets, current = [], []
+        for item in pattern:
+            if item == ":":
+                itemsets.append(set(current))
+                current = []
+            else:
+                current.append(item)
+        count = 0
+        for line in database:
+            position = 0
+            for itemset in line:
+                if position < len(itemsets) and itemsets[position] <= itemset:
+                    position += 1
+            count += position == len(itemsets)
+        return count
+
+    def test_pseudo_projection_matches_copying_projection(self):
+        pseudo = PrefixSpan(self.input_file, 0.1)
+        pseudo.mine()
+        copying = PrefixSpan(self.input_file, 0.1, pseudoProjection=False)
+        copying.mine()
+        self.assertGreater(len(pseudo.getPatterns()), 20)
+        self.assertEqual(pseudo.getPatterns(), copying.getPatterns())
+        self.assertEqual(pseudo._Database, [])
+
+    def test_supports_match_database_scan(self):
+        obj = PrefixSpan(self.input_file, 10)
+        obj.mine()
+        with open(self.input_file) as f:
+            database = [[set(itemset.split()) for itemset in line.split(":")] for line in f]
+        for pattern, support in obj.getPatterns().items():
+            self.assertGreaterEqual(support, 10)
+            self.assertEqual(support, self._support(eval(pattern), database))
+
+
+if __name__ == '__main__':
+    unittest.main()
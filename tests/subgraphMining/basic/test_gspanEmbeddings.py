@@ -0,0 +1,65 @@
+import unittest
+import os
+import random
+from PAMI.subgraphMining.basic.gspan import GSpan
+from PAMI.subgraphMining.basic import abstract as _ab
+
+
+class TestGSpanEmbeddings(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_gspan_embeddings.txt"
+        random.seed(11)
+        with open(self.input_file, 'w') as f:
+            for i in range(40):
+                f.write(f"t # {i}\n")
+                for v in range(8):
+                    f.write(f"v {v} {random.randint(1, 2)}\n")
+                edges = {(random.randrange(v), v) for v in range(1, 8)}
+                while len(edges) < 10:
+                    edges.add(tuple(sorted(random.sample(range(8), 2))))
+                for v1, v2 in sorted(edges):
+                    f.write(f"e {v1} {v2} {random.randint(1, 2)}\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_incremental_embeddings_match_isomorphisms(self):
+        gspan = GSpan(self.input_file, 0.2)
+        gspan.mine()
+        graphDb = gspan.readGraphs(self.input_file)
+        for g in graphDb:
+            g.precalculateVertexNeighbors()
+        checked = 0
+        for subgraph in gspan.frequentSubgraphs:
+            c = subgraph.dfsCode
+            if c.getEeList()[0].edgeLabel == -1 or c.size > 3:
+                continue
+            for iD in sorted(subgraph.setOfGraphsIds)[:5]:
+                g = graphDb[iD]
+                for key, extended in gspan.extendEmbeddings(c, g, gspan.embeddingsOf(c, g)).items():
+                    newC = c.copy()
+                    newC.add(_ab.ExtendedEdge(*key))
+                    self.assertEqual(extended, gspan.embeddingsOf(newC, g))
+                    checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_patterns_are_canonical_and_supported(self):
+        gspan = GSpan(self.input_file, 0.3)
+        gspan.mine()
+        codes = [str(subgraph.dfsCode) for subgraph in gspan.frequentSubgraphs]
+        self.assertEqual(len(codes), len(set(codes)))
+        graphDb = gspan.readGraphs(self.input_file)
+        for g in graphDb:
+            g.precalculateVertexNeighbors()
+        for subgraph in gspan.frequentSubgraphs:
+            c = subgraph.dfsCode
+            if c.getEeList()[0].edgeLabel == -1:
+                continue
+            supporting = {g.getId() for g in graphDb if gspan.subgraphIsomorphisms(c, g)}
+            self.assertEqual(supporting, subgraph.setOfGraphsIds)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import os
+import random
+from PAMI.subgraphMining.topK.tkg import TKG
+
+
+class TestParallelTKG(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_parallel_tkg.txt"
+        random.seed(5)
+        with open(self.input_file, 'w') as f:
+            for i in range(60):
+                f.write(f"t # {i}\n")
+                for v in range(8):
+                    f.write(f"v {v} {random.randint(1, 3)}\n")
+                edges = {(random.randrange(v), v) for v in range(1, 8)}
+                while len(edges) < 10:
+                    edges.add(tuple(sorted(random.sample(range(8), 2))))
+                for v1, v2 in sorted(edges):
+                    f.write(f"e {v1} {v2} {random.randint(1, 2)}\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def _result(self, tkg):
+        return [(str(s.dfsCode), s.support, sorted(s.setOfGraphsIds)) for s in tkg.getSubgraphsList()]
+
+    def test_parallel_matches_sequential(self):
+        for k in [5, 40]:
+            sequential = TKG(self.input_file, k)
+            sequential.mine()
+            parallel = TKG(self.input_file, k, workers=2)
+            parallel.mine()
+            self.assertEqual(len(self._result(sequential)), k)
+            self.assertEqual(self._result(parallel), self._result(sequential))
+            self.assertEqual(parallel.getMinSupport(), sequential.getMinSupport())
+            self.assertEqual(sequential.getMinSupport(), sequential.getSubgraphsList()[-1].support)
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            TKG(self.input_file, 5, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
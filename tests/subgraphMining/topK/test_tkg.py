@@ -108,7 +108,8 @@ class TestTKG(unittest.TestCase):
         tkg = TKG(iFile=self.input_file, k=4)
         tkg.mine()
         min_support = tkg.getMinSupport()
-        self.assertEqual(min_support, 4)
+        # vertices 1, 4 and 5 and the edge between 4 and 5 occur in all five graphs
+        self.assertEqual(min_support, 5)
 
     def test_get_k_subgraphs(self):
         tkg = TKG(iFile=self.input_file, k=4)
@@ -0,0 +1,64 @@
+import unittest
+import os
+import math
+import random
+from PAMI.extras.probabilityTidLists import expectedSupports
+from PAMI.uncertainFrequentPattern.basic import PUFGrowth as alg
+
+
+class TestExpectedSupports(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_expected_supports.txt"
+        random.seed(6)
+        self.transactions = []
+        for _ in range(400):
+            items = random.sample(['a', 'b', 'c', 'd', 'e', 'f', 'g'], random.randint(1, 5))
+            self.transactions.append([(item, round(random.uniform(0.3, 1), 2)) for item in items])
+        with open(self.input_file, 'w') as f:
+            for transaction in self.transactions:
+                f.write("\t".join(item for item, _ in transaction) + ":" +
+                        "\t".join(str(probability) for _, probability in transaction) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def _scan(self, pattern):
+        support = 0
+        for transaction in self.transactions:
+            probabilities = dict(transaction)
+            if all(item in probabilities for item in pattern):
+                support += math.prod(probabilities[item] for item in pattern)
+        return support
+
+    def test_supports_match_database_scan(self):
+        candidates = {('a',): 7.5, ('b', 'a'): 0, ('c', 'd', 'e'): 0, ('a', 'z'): 0}
+        supports = expectedSupports(self.transactions, candidates)
+        self.assertEqual(supports[('a',)], 7.5)
+        self.assertNotIn(('a', 'z'), supports)
+        for pattern in [('b', 'a'), ('c', 'd', 'e')]:
+            self.assertAlmostEqual(supports[pattern], self._scan(pattern))
+        for chunkSize, workers in [(1, 1), (37, 1), (150, 2)]:
+            sharded = expectedSupports(self.transactions, candidates, chunkSize, workers)
+            self.assertEqual(list(sharded), list(supports))
+            for pattern, support in supports.items():
+                self.assertAlmostEqual(sharded[pattern], support)
+
+    def test_pufgrowth_verification(self):
+        alg._finalPatterns.clear()
+        obj = alg.PUFGrowth(self.input_file, 6)
+        obj.mine()
+        patterns = obj.getPatterns()
+        alg._finalPatterns.clear()
+        sharded = alg.PUFGrowth(self.input_file, 6, chunkSize=90, workers=2)
+        sharded.mine()
+        self.assertEqual(list(sharded.getPatterns()), list(patterns))
+        self.assertTrue(any(len(pattern.split()) > 2 for pattern in patterns))
+        for pattern, support in patterns.items():
+            self.assertAlmostEqual(support, self._scan(pattern.split()))
+            self.assertAlmostEqual(sharded.getPatterns()[pattern], support)
+
+
+if __name__ == '__main__':
+    unittest.main()